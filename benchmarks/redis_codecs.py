@@ -0,0 +1,92 @@
+"""
+Encode/decode throughput and value size of the Redis ticker codecs.
+
+With --redis-url, also stores one key per codec and reports
+MEMORY USAGE for it. FLUSHES that database, point it at a scratch one:
+
+    PYTHONPATH=. python benchmarks/redis_codecs.py --redis-url redis://localhost:6379/15
+"""
+
+import asyncio
+import timeit
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
+import redis.asyncio as redis
+from converter.adapters.outbound.persistence.redis.codec import (
+    BinaryTickerCodec,
+    JsonTickerCodec,
+    TickerCodec,
+)
+from converter.adapters.outbound.persistence.redis.models import RedisTicker
+from converter.shared.logging import configure_logging
+
+CODECS: dict[str, TickerCodec] = {
+    "json": JsonTickerCodec(),
+    "binary": BinaryTickerCodec(),
+}
+
+TICKER = RedisTicker(
+    symbol="BTCUSDT",
+    rate=Decimal("67012.34567891"),
+    timestamp=datetime(2025, 10, 2, 12, 30, 15, 123000, tzinfo=timezone.utc),
+    base_currency="BTC",
+    quote_currency="USDT",
+)
+
+
+def ops_per_second(fn, number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return number / best
+
+
+async def memory_usage(redis_url: str) -> dict[str, Optional[int]]:
+    client = redis.from_url(redis_url, decode_responses=False)
+
+    try:
+        await client.flushdb()
+        usage = {}
+
+        for name, codec in CODECS.items():
+            key = f"bench:codec:{name}"
+            await client.set(key, codec.encode(TICKER))
+            usage[name] = await client.memory_usage(key)
+
+        return usage
+    finally:
+        await client.flushdb()
+        await client.aclose()
+
+
+def main(number: int, redis_url: Optional[str]) -> None:
+    usage = asyncio.run(memory_usage(redis_url)) if redis_url else {}
+
+    print(
+        f"{'codec':<8} {'bytes':>6} {'encode ops/s':>14} {'decode ops/s':>14}"
+        f" {'redis bytes/key':>16}"
+    )
+
+    for name, codec in CODECS.items():
+        payload = codec.encode(TICKER)
+
+        encode = ops_per_second(lambda c=codec: c.encode(TICKER), number)
+        decode = ops_per_second(lambda c=codec, p=payload: c.decode(p), number)
+        memory = usage.get(name)
+
+        print(
+            f"{name:<8} {len(payload):>6} {encode:>14,.0f} {decode:>14,.0f}"
+            f" {memory if memory is not None else '-':>16}"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50_000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    configure_logging(log_level="WARNING", json_logs=False)
+
+    main(args.number, args.redis_url)
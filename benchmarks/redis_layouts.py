@@ -0,0 +1,137 @@
+"""
+Compare the two Redis layouts for latest quotes:
+a key per pair (`keys`) and a single snapshot hash (`hash`).
+
+Measures the writer's batch, single and multi-pair lookups,
+and a full L1 snapshot reload. FLUSHES the target database,
+so point it at a scratch one:
+
+    PYTHONPATH=. python benchmarks/redis_layouts.py --redis-url redis://localhost:6379/15
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from argparse import ArgumentParser
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import redis.asyncio as redis
+from converter.adapters.outbound.persistence.redis.quote_repository import (
+    RedisQuoteRepository,
+)
+from converter.adapters.outbound.persistence.redis.quote_snapshot_cache import (
+    RedisQuoteSnapshotCache,
+)
+from converter.adapters.outbound.persistence.redis.quote_writer import RedisQuoteWriter
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from converter.shared.logging import configure_logging
+
+LAYOUTS = ("keys", "hash")
+
+
+class NoFallback(QuoteRepository):
+    async def get_latest(self, pair):
+        return None
+
+    async def get_latest_before(self, pair, timestamp):
+        return None
+
+
+def make_batch(size: int) -> list[Quote]:
+    timestamp = TimestampUTC(datetime.now(timezone.utc))
+
+    return [
+        Quote(
+            pair=Pair(Currency(f"C{i}"), Currency("USDT")),
+            rate=Rate((Decimal(1000 + i) / 7).quantize(Decimal("0.00000001"))),
+            timestamp=timestamp,
+        )
+        for i in range(size)
+    ]
+
+
+async def timed(op: Callable[[], Awaitable[object]], repeat: int) -> list[float]:
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await op()
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def report(layout: str, name: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+    print(f"{layout:<6} {name:<22} {p50 * 1000:>10.3f} {p99 * 1000:>10.3f}")
+
+
+async def bench_layout(
+    client: redis.Redis, layout: str, size: int, repeat: int
+) -> None:
+    rate_factory = RateFactory(PrecisionService())
+    writer = RedisQuoteWriter(client, rate_factory, ttl_seconds=120, layout=layout)
+    repo = RedisQuoteRepository(client, rate_factory, layout=layout)
+    cache = RedisQuoteSnapshotCache(
+        client, rate_factory, fallback=NoFallback(), layout=layout
+    )
+
+    await client.flushdb()
+
+    batch = make_batch(size)
+    pairs = [quote.pair for quote in batch]
+    sample = random.Random(42)
+
+    report(
+        layout,
+        f"save_batch({size})",
+        await timed(lambda: writer.save_batch(batch), repeat),
+    )
+    report(
+        layout,
+        "get_latest",
+        await timed(lambda: repo.get_latest(sample.choice(pairs)), repeat * 100),
+    )
+    report(
+        layout,
+        "get_latest_many(100)",
+        await timed(
+            lambda: repo.get_latest_many(sample.sample(pairs, 100)), repeat * 10
+        ),
+    )
+    report(layout, "snapshot reload", await timed(cache.refresh, repeat))
+
+
+async def main(redis_url: str, size: int, repeat: int) -> None:
+    client = redis.from_url(redis_url, decode_responses=False)
+
+    print(f"{'layout':<6} {'operation':<22} {'p50 ms':>10} {'p99 ms':>10}")
+
+    try:
+        for layout in LAYOUTS:
+            await bench_layout(client, layout, size, repeat)
+    finally:
+        await client.flushdb()
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--size", type=int, default=3_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_logging(log_level="WARNING", json_logs=False)
+
+    asyncio.run(main(args.redis_url, args.size, args.repeat))
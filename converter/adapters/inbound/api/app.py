@@ -9,7 +9,7 @@ from pydantic import ValidationError
 from starlette import status
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from converter.adapters.inbound.api.routes import conversion, health
+from converter.adapters.inbound.api.routes import candles, conversion, export, health
 from converter.shared.config import get_settings
 from converter.shared.di import cleanup_resources, get_container
 from converter.shared.logging import configure_logging, get_logger
@@ -41,6 +41,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error("redis_connection_failed", error=str(e), exc_info=True)
         raise
 
+    if settings.L1_CACHE_ENABLED:
+        await container.quote_snapshot_cache().start()
+
+    await container.route_index_refresher().start()
+
     yield
 
     logger.info("api_shutting_down")
@@ -66,6 +71,8 @@ if settings.ENABLE_TRACING and settings.OPEN_TELEMETRY_COLLECTOR_ENDPOINT:
     logger.info("tracing_enabled")
 
 app.include_router(conversion.router)
+app.include_router(candles.router)
+app.include_router(export.router)
 app.include_router(health.router)
 
 
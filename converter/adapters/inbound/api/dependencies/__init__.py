@@ -2,7 +2,10 @@ from .container import get_container_dependency
 from .db import get_db_session
 from .services import (
     get_amount_factory,
+    get_batch_conversion_query_handler,
+    get_candles_query_handler,
     get_conversion_query_handler,
+    get_export_quotes_query_handler,
     get_redis_client,
 )
 
@@ -10,6 +13,9 @@ __all__ = [
     "get_container_dependency",
     "get_db_session",
     "get_amount_factory",
+    "get_batch_conversion_query_handler",
+    "get_candles_query_handler",
     "get_conversion_query_handler",
+    "get_export_quotes_query_handler",
     "get_redis_client",
 ]
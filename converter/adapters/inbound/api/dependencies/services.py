@@ -3,6 +3,9 @@ from typing import cast
 import redis.asyncio as redis
 from fastapi import Depends
 
+from converter.app.queries.export_quotes import ExportQuotesQueryHandler
+from converter.app.queries.get_batch_conversion import GetBatchConversionQueryHandler
+from converter.app.queries.get_candles import GetCandlesQueryHandler
 from converter.app.queries.get_conversion import GetConversionQueryHandler
 from converter.domain.services.factory import AmountFactory
 from converter.shared.di import Container
@@ -22,6 +25,24 @@ def get_conversion_query_handler(
     return container.conversion_query_handler()
 
 
+def get_batch_conversion_query_handler(
+    container: Container = Depends(get_container_dependency),
+) -> GetBatchConversionQueryHandler:
+    return container.batch_conversion_query_handler()
+
+
+def get_candles_query_handler(
+    container: Container = Depends(get_container_dependency),
+) -> GetCandlesQueryHandler:
+    return container.candles_query_handler()
+
+
+def get_export_quotes_query_handler(
+    container: Container = Depends(get_container_dependency),
+) -> ExportQuotesQueryHandler:
+    return container.export_quotes_query_handler()
+
+
 def get_redis_client(
     container: Container = Depends(get_container_dependency),
 ) -> redis.Redis:
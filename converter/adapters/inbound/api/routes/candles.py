@@ -0,0 +1,145 @@
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import ValidationError
+from starlette import status
+
+from converter.adapters.inbound.api.dependencies import get_candles_query_handler
+from converter.adapters.inbound.api.schemas.candles import (
+    CandlesQueryMapper,
+    CandlesRequest,
+    CandlesResponse,
+    parse_candles_request,
+)
+from converter.adapters.inbound.api.schemas.error import ErrorResponse
+from converter.app.queries.get_candles import (
+    CandlesPage,
+    GetCandlesQuery,
+    GetCandlesQueryHandler,
+)
+from converter.shared.logging import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/candles", tags=["Candles"])
+
+# Settled candles no longer change, so a page made only of them can be cached for good
+CLOSED_PAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+OPEN_PAGE_CACHE_CONTROL = "no-cache"
+
+
+@router.get(
+    "",
+    response_model=CandlesResponse,
+    response_model_by_alias=True,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Invalid input parameters",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Validation error",
+        },
+    },
+    summary="Get OHLC Candles",
+    description=(
+        "OHLC candles of a pair, aggregated in the database in one pass. "
+        "The range is aligned to bucket boundaries and served in pages, "
+        "follow `next` for the rest. Pages made only of closed candles are immutable."
+    ),
+)
+async def get_candles(
+    request: Request,
+    response: Response,
+    candles_request: CandlesRequest = Depends(parse_candles_request),
+    handler: GetCandlesQueryHandler = Depends(get_candles_query_handler),
+) -> CandlesResponse:
+    start_time = time.time()
+    pair_str = candles_request.pair
+
+    try:
+        query = CandlesQueryMapper.map_request_to_query(candles_request)
+
+        logger.info(
+            "candles_requested",
+            pair=pair_str,
+            interval=candles_request.interval,
+            start=candles_request.from_time.isoformat(),
+            end=candles_request.to_time.isoformat(),
+        )
+
+        page = await handler.handle(query)
+
+        logger.info(
+            "candles_completed",
+            pair=pair_str,
+            interval=page.interval.label,
+            source=page.source.label if page.source else "raw",
+            candles=len(page.candles),
+            closed=page.closed,
+            duration_ms=round((time.time() - start_time) * 1000, 2),
+        )
+
+        response.headers["Cache-Control"] = (
+            CLOSED_PAGE_CACHE_CONTROL if page.closed else OPEN_PAGE_CACHE_CONTROL
+        )
+
+        return CandlesQueryMapper.map_page_to_response(
+            page, _next_url(request, query, page)
+        )
+
+    except ValidationError as e:
+        logger.warning("candles_validation_failed", pair=pair_str, errors=e.errors())
+
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="; ".join(
+                f"{'.'.join(str(x) for x in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ),
+        ) from e
+
+    except ValueError as e:
+        logger.warning("candles_domain_validation_failed", pair=pair_str, error=str(e))
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    except Exception as e:
+        logger.error(
+            "candles_unexpected_error",
+            pair=pair_str,
+            error_type=type(e).__name__,
+            error=str(e),
+            duration_ms=round((time.time() - start_time) * 1000, 2),
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while building candles",
+        ) from e
+
+
+def _next_url(
+    request: Request, query: GetCandlesQuery, page: CandlesPage
+) -> Optional[str]:
+    """
+    Link to the following page with both bounds aligned,
+    so every client walking a range asks for the same cacheable URLs.
+    """
+    if page.next_start is None:
+        return None
+
+    return str(
+        request.url.include_query_params(
+            **{
+                "from": page.next_start.value.isoformat(),
+                "to": query.interval.bucket_end(query.end).value.isoformat(),
+                "interval": page.interval.label,
+            }
+        )
+    )
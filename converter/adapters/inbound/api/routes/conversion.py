@@ -6,16 +6,20 @@ from starlette import status
 
 from converter.adapters.inbound.api.dependencies import (
     get_amount_factory,
+    get_batch_conversion_query_handler,
     get_conversion_query_handler,
 )
 from converter.adapters.inbound.api.error_handler import handle_domain_error
 from converter.adapters.inbound.api.schemas.conversion import (
+    BatchConversionResponse,
+    BatchConvertRequest,
     ConversionQueryMapper,
     ConversionResponse,
     ConvertRequest,
     parse_convert_request,
 )
 from converter.adapters.inbound.api.schemas.error import ErrorResponse
+from converter.app.queries.get_batch_conversion import GetBatchConversionQueryHandler
 from converter.app.queries.get_conversion import GetConversionQueryHandler
 from converter.domain.exceptions.conversion import QuoteNotFoundError, QuoteTooOldError
 from converter.domain.services.factory import AmountFactory
@@ -161,3 +165,95 @@ async def convert_currency(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred during conversion",
         ) from e
+
+
+@router.post(
+    "/batch",
+    response_model=BatchConversionResponse,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Invalid input parameters",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Validation error",
+        },
+    },
+    summary="Convert Many Currency Amounts",
+    description=(
+        "Convert up to 1000 amounts at once using the latest binance rates. "
+        "Quotes for all pairs are fetched in one go; "
+        "items that can't be converted are reported individually."
+    ),
+)
+async def convert_currency_batch(
+    request: BatchConvertRequest,
+    handler: GetBatchConversionQueryHandler = Depends(
+        get_batch_conversion_query_handler
+    ),
+    amount_factory: AmountFactory = Depends(get_amount_factory),
+) -> BatchConversionResponse:
+    start_time = time.time()
+
+    mapper = ConversionQueryMapper(amount_factory=amount_factory)
+
+    try:
+        query = mapper.map_batch_request_to_query(request)
+
+        logger.info("batch_conversion_requested", items=len(query.items))
+
+        results = await handler.handle(query)
+
+        duration = time.time() - start_time
+        failed = sum(1 for r in results if r.error is not None)
+
+        logger.info(
+            "batch_conversion_completed",
+            items=len(results),
+            failed=failed,
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+
+            for r in results:
+                conversion_status = (
+                    "success" if r.error is None else type(r.error).__name__
+                )
+                metrics.conversions_total.labels(
+                    pair=str(r.item.pair), status=conversion_status
+                ).inc()
+
+        return mapper.map_batch_result_to_response(results)
+
+    except ValueError as e:
+        duration = time.time() - start_time
+
+        logger.warning(
+            "batch_conversion_domain_validation_failed",
+            error=str(e),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    except Exception as e:
+        duration = time.time() - start_time
+
+        logger.error(
+            "batch_conversion_unexpected_error",
+            error_type=type(e).__name__,
+            error=str(e),
+            duration_ms=round(duration * 1000, 2),
+            exc_info=True,
+        )
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred during conversion",
+        ) from e
@@ -0,0 +1,90 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette import status
+
+from converter.adapters.inbound.api.dependencies import get_export_quotes_query_handler
+from converter.adapters.inbound.api.schemas.error import ErrorResponse
+from converter.adapters.inbound.api.schemas.export import (
+    MEDIA_TYPES,
+    ExportQuotesRequest,
+    parse_export_request,
+)
+from converter.app.queries.export_quotes import ExportQuotesQueryHandler
+from converter.shared.logging import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get(
+    "/quotes",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+            "description": "Quote history, streamed",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Invalid input parameters",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Validation error",
+        },
+    },
+    summary="Export Quote History",
+    description=(
+        "Stream the stored quotes of a time range as CSV or NDJSON, "
+        "ordered by symbol and time. Rows are read through a server-side cursor "
+        "and sent as they arrive, so any range can be exported."
+    ),
+)
+async def export_quotes(
+    request: ExportQuotesRequest = Depends(parse_export_request),
+    handler: ExportQuotesQueryHandler = Depends(get_export_quotes_query_handler),
+) -> StreamingResponse:
+    try:
+        stream = handler.handle(request.to_query())
+
+    except ValueError as e:
+        logger.warning("export_domain_validation_failed", error=str(e))
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    logger.info(
+        "export_requested",
+        start=request.from_time.isoformat(),
+        end=request.to_time.isoformat(),
+        format=request.export_format.value,
+        symbols=len(request.pairs) or "all",
+    )
+
+    return StreamingResponse(
+        _logged(stream),
+        media_type=MEDIA_TYPES[request.export_format],
+        headers={"Content-Disposition": f'attachment; filename="{request.filename()}"'},
+    )
+
+
+async def _logged(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    The status line is already sent once streaming starts,
+    so a failure can only cut the response short. Make sure it's logged.
+    """
+    try:
+        async for chunk in stream:
+            yield chunk
+    except Exception as e:
+        logger.error(
+            "export_stream_failed",
+            error_type=type(e).__name__,
+            error=str(e),
+            exc_info=True,
+        )
+        raise
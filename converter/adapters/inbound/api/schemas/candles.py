@@ -0,0 +1,161 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core.core_schema import ValidationInfo
+
+from converter.app.queries.get_candles import (
+    MAX_CANDLES_PER_PAGE,
+    CandlesPage,
+    GetCandlesQuery,
+)
+from converter.domain.values import Interval, TimestampUTC
+
+DEFAULT_CANDLES_PER_PAGE = 500
+# Widths that tile a UTC day, so every bucket starts on the same boundaries each day
+MAX_INTERVAL_SECONDS = 86400
+
+
+class CandlesRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    pair: str = Field(
+        min_length=4,
+        max_length=40,
+        description="Symbol of the pair, base currency followed by the quote one.",
+        examples=["BTCUSDT"],
+    )
+    interval: str = Field(
+        description="Candle width: a count followed by s, m, h or d.",
+        examples=["1m"],
+    )
+    from_time: datetime = Field(
+        alias="from",
+        description="Range start, rounded down to a bucket boundary.",
+        examples=["2025-10-02T10:00:00Z"],
+    )
+    to_time: datetime = Field(
+        alias="to",
+        description="Range end (exclusive), rounded up to a bucket boundary.",
+        examples=["2025-10-02T12:00:00Z"],
+    )
+    limit: int = Field(
+        default=DEFAULT_CANDLES_PER_PAGE,
+        ge=1,
+        le=MAX_CANDLES_PER_PAGE,
+        description="Maximum number of buckets per page.",
+    )
+
+    @field_validator("pair")
+    @classmethod
+    def validate_pair(cls, v: str) -> str:
+        if not v.replace("_", "").isalnum():
+            raise ValueError(
+                f"Pair must only contain letters, numbers, and underscores: {v}"
+            )
+        return v.upper()
+
+    @field_validator("interval")
+    @classmethod
+    def validate_interval(cls, v: str) -> str:
+        interval = Interval.parse(v)
+
+        if MAX_INTERVAL_SECONDS % interval.seconds != 0:
+            raise ValueError(f"Interval must evenly divide a day: {v}")
+
+        return interval.label
+
+    @field_validator("from_time", "to_time")
+    @classmethod
+    def validate_timezone(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            raise ValueError("Timestamp must have a timezone")
+        return v
+
+    @field_validator("to_time")
+    @classmethod
+    def validate_range(cls, v: datetime, info: ValidationInfo) -> datetime:
+        if "from_time" in info.data and v <= info.data["from_time"]:
+            raise ValueError("Range end must be after its start")
+        return v
+
+
+class CandleResponse(BaseModel):
+    model_config = ConfigDict(json_encoders={Decimal: str})
+
+    time: datetime = Field(..., description="Start of the bucket.")
+    open: Decimal = Field(..., examples=[12345.67])
+    high: Decimal = Field(..., examples=[12400.0])
+    low: Decimal = Field(..., examples=[12300.5])
+    close: Decimal = Field(..., examples=[12390.1])
+
+
+class CandlesResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    pair: str = Field(..., examples=["BTCUSDT"])
+    interval: str = Field(..., examples=["1m"])
+    from_time: datetime = Field(
+        ..., alias="from", description="Aligned start of this page."
+    )
+    to_time: datetime = Field(
+        ..., alias="to", description="Aligned end (exclusive) of this page."
+    )
+    candles: list[CandleResponse] = Field(
+        ..., description="Buckets that have quotes, oldest first."
+    )
+    next: Optional[str] = Field(
+        None, description="URL of the next page, absent on the last one."
+    )
+
+
+class CandlesQueryMapper:
+    @staticmethod
+    def map_request_to_query(request: CandlesRequest) -> GetCandlesQuery:
+        return GetCandlesQuery(
+            symbol=request.pair,
+            interval=Interval.parse(request.interval),
+            start=TimestampUTC(request.from_time),
+            end=TimestampUTC(request.to_time),
+            limit=request.limit,
+        )
+
+    @staticmethod
+    def map_page_to_response(
+        page: CandlesPage, next_url: Optional[str]
+    ) -> CandlesResponse:
+        return CandlesResponse(
+            pair=page.symbol,
+            interval=page.interval.label,
+            from_time=page.start.value,
+            to_time=page.end.value,
+            candles=[
+                CandleResponse(
+                    time=c.bucket_start.value,
+                    open=c.open.value,
+                    high=c.high.value,
+                    low=c.low.value,
+                    close=c.close.value,
+                )
+                for c in page.candles
+            ],
+            next=next_url,
+        )
+
+
+async def parse_candles_request(
+    pair: str = Query(min_length=4, max_length=40, examples=["BTCUSDT"]),
+    interval: str = Query(examples=["1m"]),
+    from_time: datetime = Query(alias="from", examples=["2025-10-02T10:00:00Z"]),
+    to_time: datetime = Query(alias="to", examples=["2025-10-02T12:00:00Z"]),
+    limit: int = Query(default=DEFAULT_CANDLES_PER_PAGE, ge=1, le=MAX_CANDLES_PER_PAGE),
+) -> CandlesRequest:
+    return CandlesRequest(
+        pair=pair,
+        interval=interval,
+        from_time=from_time,
+        to_time=to_time,
+        limit=limit,
+    )
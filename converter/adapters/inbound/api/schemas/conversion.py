@@ -3,12 +3,31 @@ from decimal import Decimal
 from typing import Optional
 
 from fastapi import Query
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+from converter.adapters.inbound.api.error_handler import handle_domain_error
+from converter.app.queries.get_batch_conversion import (
+    BatchConversionItem,
+    BatchConversionItemResult,
+    GetBatchConversionQuery,
+)
 from converter.app.queries.get_conversion import ConversionResult, GetConversionQuery
 from converter.domain.services.factory import AmountFactory
 from converter.domain.values import Currency, Pair, TimestampUTC
+from converter.shared.config import get_settings
+
+settings = get_settings()
+
+MAX_BATCH_ITEMS = 1000
+
+
+def _validate_currency_code(v: str) -> str:
+    if not v.replace("_", "").isalnum():
+        raise ValueError(
+            f"Currency must only contain letters, numbers, and underscores: {v}"
+        )
+    return v.upper()
 
 
 class ConvertRequest(BaseModel):
@@ -36,11 +55,7 @@ class ConvertRequest(BaseModel):
     @field_validator("from_currency", "to_currency")
     @classmethod
     def validate_currency(cls, v: str) -> str:
-        if not v.replace("_", "").isalnum():
-            raise ValueError(
-                f"Currency must only contain letters, numbers, and underscores: {v}"
-            )
-        return v.upper()
+        return _validate_currency_code(v)
 
     @field_validator("timestamp")
     @classmethod
@@ -56,9 +71,10 @@ class ConvertRequest(BaseModel):
         if v > now:
             raise ValueError("Timestamp cannot be in the future")
 
-        max_age = timedelta(days=7)
-        if v < now - max_age:
-            raise ValueError(f"Timestamp cannot be older than {max_age.days} days")
+        # Whatever the raw quotes, rollups and archive still hold
+        max_age_days = settings.history_max_age_days()
+        if max_age_days is not None and v < now - timedelta(days=max_age_days):
+            raise ValueError(f"Timestamp cannot be older than {max_age_days} days")
 
         return v
 
@@ -89,6 +105,84 @@ class ConversionResponse(BaseModel):
         json_encoders = {Decimal: str}
 
 
+class BatchConvertItemRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    amount: Decimal = Field(
+        gt=0, lt=Decimal("1e15"), description="The amount to convert.", examples=[1.5]
+    )
+    from_currency: str = Field(
+        alias="from",
+        min_length=2,
+        max_length=10,
+        description="Source currency code.",
+        examples=["BTC"],
+    )
+    to_currency: str = Field(
+        alias="to",
+        min_length=2,
+        max_length=10,
+        description="Target currency code.",
+        examples=["USDT"],
+    )
+
+    @field_validator("from_currency", "to_currency")
+    @classmethod
+    def validate_currency(cls, v: str) -> str:
+        return _validate_currency_code(v)
+
+    @field_validator("to_currency")
+    @classmethod
+    def validate_different_currencies(cls, v: str, info: ValidationInfo) -> str:
+        if "from_currency" in info.data and v == info.data["from_currency"]:
+            raise ValueError("Source and target currencies must be different")
+        return v
+
+
+class BatchConvertRequest(BaseModel):
+    items: list[BatchConvertItemRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Conversions to perform using the latest rates.",
+    )
+
+
+class BatchConversionItemResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, json_encoders={Decimal: str})
+
+    from_currency: str = Field(..., alias="from", examples=["BTC"])
+    to_currency: str = Field(..., alias="to", examples=["USDT"])
+    status: int = Field(
+        ...,
+        description="HTTP status the item would get as a single conversion.",
+        examples=[200],
+    )
+    amount: Optional[Decimal] = Field(
+        None,
+        description="The converted amount in the target currency.",
+        examples=[12345.67],
+    )
+    rate: Optional[Decimal] = Field(
+        None, description="The conversion rate used.", examples=[12345.67]
+    )
+    timestamp: Optional[datetime] = Field(
+        None,
+        description="The UTC timestamp of the quote used.",
+        examples=["2025-10-02T10:00:00Z"],
+    )
+    detail: Optional[str] = Field(
+        None,
+        description="Error description if the item could not be converted.",
+        examples=["No quote found for pair BTC/XYZ"],
+    )
+
+
+class BatchConversionResponse(BaseModel):
+    results: list[BatchConversionItemResponse] = Field(
+        ..., description="One result per requested item, in request order."
+    )
+
+
 class ConversionQueryMapper:
     def __init__(
         self,
@@ -110,6 +204,53 @@ class ConversionQueryMapper:
             at_timestamp=timestamp,
         )
 
+    def map_batch_request_to_query(
+        self, request: BatchConvertRequest
+    ) -> GetBatchConversionQuery:
+        return GetBatchConversionQuery(
+            items=[
+                BatchConversionItem(
+                    pair=Pair(Currency(item.from_currency), Currency(item.to_currency)),
+                    amount=self._amount_factory.create(item.amount),
+                )
+                for item in request.items
+            ]
+        )
+
+    @staticmethod
+    def map_batch_result_to_response(
+        results: list[BatchConversionItemResult],
+    ) -> BatchConversionResponse:
+        items = []
+
+        for item_result in results:
+            pair = item_result.item.pair
+            result = item_result.result
+
+            if result is not None:
+                item = BatchConversionItemResponse(
+                    from_currency=pair.base.code,
+                    to_currency=pair.quote.code,
+                    status=200,
+                    amount=result.amount.value,
+                    rate=result.rate.value,
+                    timestamp=result.timestamp.value,
+                )
+            else:
+                error = handle_domain_error(
+                    item_result.error or ValueError("Conversion failed")
+                )
+                item = BatchConversionItemResponse(
+                    from_currency=pair.base.code,
+                    to_currency=pair.quote.code,
+                    status=error.status_code,
+                    detail=error.detail,
+                )
+
+            items.append(item)
+
+        return BatchConversionResponse(results=items)
+
     @staticmethod
     def map_conversion_result_to_response(
         result: ConversionResult,
@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_core.core_schema import ValidationInfo
+
+from converter.app.ports.outbound.quote_exporter import ExportFormat
+from converter.app.queries.export_quotes import ExportQuotesQuery
+from converter.domain.values import TimestampUTC
+
+MAX_EXPORT_SYMBOLS = 1000
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+class ExportQuotesRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    from_time: datetime = Field(
+        alias="from",
+        description="Range start (inclusive).",
+        examples=["2025-10-01T00:00:00Z"],
+    )
+    to_time: datetime = Field(
+        alias="to",
+        description="Range end (exclusive).",
+        examples=["2025-10-08T00:00:00Z"],
+    )
+    export_format: ExportFormat = Field(
+        default=ExportFormat.CSV,
+        alias="format",
+        description="Output format.",
+    )
+    pairs: list[str] = Field(
+        default_factory=list,
+        alias="pair",
+        max_length=MAX_EXPORT_SYMBOLS,
+        description="Symbols to export, all of them if left out.",
+        examples=[["BTCUSDT", "ETHUSDT"]],
+    )
+
+    @field_validator("pairs")
+    @classmethod
+    def validate_pairs(cls, v: list[str]) -> list[str]:
+        for symbol in v:
+            if not symbol.replace("_", "").isalnum():
+                raise ValueError(
+                    "Pair must only contain letters, numbers, "
+                    f"and underscores: {symbol}"
+                )
+        return [symbol.upper() for symbol in v]
+
+    @field_validator("from_time", "to_time")
+    @classmethod
+    def validate_timezone(cls, v: datetime) -> datetime:
+        if v.tzinfo is None:
+            raise ValueError("Timestamp must have a timezone")
+        return v
+
+    @field_validator("to_time")
+    @classmethod
+    def validate_range(cls, v: datetime, info: ValidationInfo) -> datetime:
+        if "from_time" in info.data and v <= info.data["from_time"]:
+            raise ValueError("Range end must be after its start")
+        return v
+
+    def to_query(self) -> ExportQuotesQuery:
+        return ExportQuotesQuery(
+            start=TimestampUTC(self.from_time),
+            end=TimestampUTC(self.to_time),
+            export_format=self.export_format,
+            symbols=self.pairs,
+        )
+
+    def filename(self) -> str:
+        start = self.from_time.strftime("%Y%m%dT%H%M%S")
+        end = self.to_time.strftime("%Y%m%dT%H%M%S")
+
+        return f"quotes_{start}_{end}.{self.export_format.value}"
+
+
+async def parse_export_request(
+    from_time: datetime = Query(alias="from", examples=["2025-10-01T00:00:00Z"]),
+    to_time: datetime = Query(alias="to", examples=["2025-10-08T00:00:00Z"]),
+    export_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    pairs: Optional[list[str]] = Query(default=None, alias="pair"),
+) -> ExportQuotesRequest:
+    return ExportQuotesRequest(
+        from_time=from_time,
+        to_time=to_time,
+        export_format=export_format,
+        pairs=pairs or [],
+    )
@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 from tenacity import (
     AsyncRetrying,
@@ -9,26 +10,51 @@ from tenacity import (
     wait_exponential,
 )
 
+from converter.adapters.outbound.latest_quote_buffer import LatestQuoteBuffer
 from converter.adapters.outbound.rate_source import RateBatch, RateSource
 from converter.app.commands.store_quotes import (
     StoreQuotesCommand,
     StoreQuotesCommandHandler,
 )
+from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class QuoteConsumer:
+    """
+    Runs as two stages joined by a `LatestQuoteBuffer`: receiving batches from
+    the rate source, and storing them with up to `store_concurrency` batches
+    in flight. Receiving never waits on storing. Whatever arrives while every
+    worker is busy is merged, so a free worker always takes one up-to-date
+    batch rather than a backlog of stale ones.
+
+    Above one concurrent store, batches can finish out of order. PostgreSQL
+    doesn't mind, but Redis briefly serves the older batch if it finishes last.
+    """
+
     def __init__(
         self,
         rate_source: RateSource,
         handler: StoreQuotesCommandHandler,
+        store_concurrency: int = 1,
     ) -> None:
+        """
+        :param store_concurrency: Batches stored at the same time
+        """
         self._rate_source = rate_source
         self._handler = handler
+        self._store_concurrency = store_concurrency
         self._shutdown_event = asyncio.Event()
 
+        self._pending = LatestQuoteBuffer(source="consumer", stage="store")
+        self._storing = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
     async def start(self) -> None:
         logger.info("quote_consumer_starting")
 
@@ -70,6 +96,11 @@ class QuoteConsumer:
             raise
 
     async def _consume_stream(self) -> None:
+        workers = [
+            asyncio.create_task(self._store_stage(), name=f"quote_store_{i}")
+            for i in range(self._store_concurrency)
+        ]
+
         try:
             async for batch in self._rate_source.stream():
                 if self._shutdown_event.is_set():
@@ -80,7 +111,10 @@ class QuoteConsumer:
                     logger.debug("received_empty_batch_skipping")
                     continue
 
-                await self._process_batch(batch)
+                self._hand_off(batch)
+
+            # Whatever was received still gets stored
+            await self._idle.wait()
 
         except asyncio.CancelledError:
             logger.info("consume_stream_cancelled")
@@ -88,6 +122,40 @@ class QuoteConsumer:
         except Exception as e:
             logger.error("consume_stream_unexpected_error", error=str(e), exc_info=True)
             raise
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _hand_off(self, batch: RateBatch) -> None:
+        self._idle.clear()
+        self._pending.offer(batch)
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.pipeline_batches_total.labels(stage="receive").inc()
+
+    async def _store_stage(self) -> None:
+        while True:
+            batch = await self._pending.get()
+            self._storing += 1
+            start_time = time.perf_counter()
+
+            try:
+                await self._process_batch(batch)
+            finally:
+                self._storing -= 1
+
+                if not self._storing and not self._pending:
+                    self._idle.set()
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.pipeline_batches_total.labels(stage="store").inc()
+                    metrics.pipeline_stage_duration_seconds.labels(
+                        stage="store"
+                    ).observe(time.perf_counter() - start_time)
 
     async def stop(self) -> None:
         if self._shutdown_event.is_set():
@@ -1,4 +1,7 @@
 import asyncio
+import hashlib
+import json
+import re
 import time
 from enum import Enum
 from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, Union, cast
@@ -23,6 +26,10 @@ from converter.shared.logging import get_logger
 logger = get_logger(__name__)
 
 
+# exchangeInfo stamps every response with the time it was served
+_SERVER_TIME_FIELD = re.compile(rb'"serverTime"\s*:\s*\d+\s*,?')
+
+
 class BinanceEndpoint(str, Enum):
     TIME = "/api/v3/time"
     TICKER_PRICE = "/api/v3/ticker/price"
@@ -235,6 +242,53 @@ class BinanceAPIClient:
                 "Binance", f"Invalid exchange info response: {e}"
             ) from e
 
+    async def get_exchange_info_if_changed(
+        self, digest: Optional[str] = None
+    ) -> tuple[str, Optional[BinanceExchangeInfo]]:
+        """
+        Get exchange info, unless it's the same as the one `digest` was taken of.
+
+        The raw response is hashed before it's parsed, so an unchanged one
+        costs the download but not the parsing.
+
+        :param digest: Digest returned by the previous call
+        :return: Digest of the response, and its exchange info or None if unchanged
+        :raises QuoteProviderUnavailableError: If request fails
+        """
+        if self._circuit_breaker:
+            body = await self._circuit_breaker.call(
+                self._api_call_raw,
+                endpoint=BinanceEndpoint.EXCHANGE_INFO,
+                description="exchange info",
+            )
+        else:
+            body = await self._api_call_raw(
+                endpoint=BinanceEndpoint.EXCHANGE_INFO, description="exchange info"
+            )
+
+        new_digest = hashlib.blake2b(
+            _SERVER_TIME_FIELD.sub(b"", body), digest_size=16
+        ).hexdigest()
+
+        if new_digest == digest:
+            logger.debug("binance_exchange_info_unchanged", digest=new_digest)
+            return new_digest, None
+
+        try:
+            data = json.loads(body)
+            assert isinstance(data, dict)
+            exchange_info = BinanceExchangeInfo.from_json(data)
+            logger.debug(
+                "binance_exchange_info_fetched",
+                symbol_count=len(exchange_info.symbols),
+                digest=new_digest,
+            )
+            return new_digest, exchange_info
+        except (ValueError, AssertionError) as e:
+            raise QuoteProviderUnavailableError(
+                "Binance", f"Invalid exchange info response: {e}"
+            ) from e
+
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
             connector = aiohttp.TCPConnector(
@@ -304,6 +358,42 @@ class BinanceAPIClient:
                 f"{description} failed after retries: {original_error}",
             ) from original_error
 
+    async def _api_call_raw(
+        self,
+        endpoint: BinanceEndpoint,
+        params: Optional[dict[str, Any]] = None,
+        description: str = "API call",
+    ) -> bytes:
+        """
+        Same as `_api_call`, but returns the response body unparsed.
+
+        :raises QuoteProviderUnavailableError: If request fails after retries
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_exponential(multiplier=1, min=1, max=10),
+                retry=retry_if_exception_type(
+                    (aiohttp.ClientError, asyncio.TimeoutError)
+                ),
+                reraise=True,
+            ):
+                with attempt:
+                    return await self._make_raw_request(endpoint, params, description)
+
+            # To let linter know we're guaranteed to raise an exception by this point
+            raise QuoteProviderUnavailableError(
+                "Binance",
+                f"{description} failed after retries",
+            )
+
+        except RetryError as e:
+            original_error: Optional[BaseException] = e.last_attempt.exception()
+            raise QuoteProviderUnavailableError(
+                "Binance",
+                f"{description} failed after retries: {original_error}",
+            ) from original_error
+
     async def _make_request(
         self,
         endpoint: BinanceEndpoint,
@@ -314,29 +404,7 @@ class BinanceAPIClient:
         url: str = f"{self.BASE_URL}{endpoint.value}"
 
         async with session.get(url, params=params) as response:
-            logger.debug(
-                "binance_api_call",
-                endpoint=endpoint.value,
-                status=response.status,
-            )
-
-            if response.status == 429:
-                retry_after: int = int(response.headers.get("Retry-After", 60))
-                logger.warning(
-                    "binance_rate_limited",
-                    endpoint=endpoint.value,
-                    retry_after=retry_after,
-                )
-                await asyncio.sleep(retry_after)
-
-                raise aiohttp.ClientError(f"Rate limited, retry after {retry_after}s")
-
-            if response.status != 200:
-                error_text: str = await response.text()
-                raise QuoteProviderUnavailableError(
-                    "Binance",
-                    f"{description} failed: HTTP {response.status} - {error_text}",
-                )
+            await self._check_response(response, endpoint, description)
 
             try:
                 data: Any = await response.json()
@@ -346,3 +414,44 @@ class BinanceAPIClient:
                 ) from e
 
             return cast(Union[dict[str, Any], list[dict[str, Any]]], data)
+
+    async def _make_raw_request(
+        self,
+        endpoint: BinanceEndpoint,
+        params: Optional[dict[str, Any]],
+        description: str,
+    ) -> bytes:
+        session: aiohttp.ClientSession = await self._ensure_session()
+        url: str = f"{self.BASE_URL}{endpoint.value}"
+
+        async with session.get(url, params=params) as response:
+            await self._check_response(response, endpoint, description)
+            return await response.read()
+
+    @staticmethod
+    async def _check_response(
+        response: aiohttp.ClientResponse, endpoint: BinanceEndpoint, description: str
+    ) -> None:
+        logger.debug(
+            "binance_api_call",
+            endpoint=endpoint.value,
+            status=response.status,
+        )
+
+        if response.status == 429:
+            retry_after: int = int(response.headers.get("Retry-After", 60))
+            logger.warning(
+                "binance_rate_limited",
+                endpoint=endpoint.value,
+                retry_after=retry_after,
+            )
+            await asyncio.sleep(retry_after)
+
+            raise aiohttp.ClientError(f"Rate limited, retry after {retry_after}s")
+
+        if response.status != 200:
+            error_text: str = await response.text()
+            raise QuoteProviderUnavailableError(
+                "Binance",
+                f"{description} failed: HTTP {response.status} - {error_text}",
+            )
@@ -0,0 +1,215 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from converter.domain.values import TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .client import BinanceAPIClient
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class _Sample:
+    # Local monotonic time halfway through the request
+    midpoint: float
+    # Server time minus local monotonic time, in seconds
+    offset: float
+    round_trip: float
+
+
+@dataclass(frozen=True)
+class ClockEstimate:
+    timestamp: TimestampUTC
+    offset: float
+    uncertainty: float
+
+
+class BinanceClock:
+    """
+    Tells Binance server time from the local monotonic clock, NTP style.
+
+    Each sample asks /api/v3/time and assumes the server read its clock halfway
+    through the round trip, so its error is at most half the round trip.
+    The offset between server and monotonic time is tracked over the last
+    `window` samples, their least-squares slope is taken as the drift.
+    Round-trip jitter dominates the slope over short spans, so it is only fitted
+    once the samples span `min_drift_span_seconds`, and clamped to
+    `max_drift_ppm`, beyond any real oscillator.
+
+    An estimate comes from whichever sample, carried forward with the drift,
+    is least uncertain: half its round trip, plus `drift_tolerance_ppm` and
+    the worst error the round trips allow in the fitted drift, per second since
+    it was taken. Once that exceeds `max_uncertainty_ms`, the server is asked
+    directly instead.
+    """
+
+    def __init__(
+        self,
+        api_client: BinanceAPIClient,
+        max_uncertainty_ms: int = 250,
+        drift_tolerance_ppm: float = 50.0,
+        max_drift_ppm: float = 200.0,
+        min_drift_span_seconds: float = 120.0,
+        window: int = 8,
+    ):
+        """
+        :param max_uncertainty_ms: Ask the server when an estimate is less certain
+        :param drift_tolerance_ppm: Error assumed to build up on top of the drift
+        :param max_drift_ppm: Largest drift believed, the fit is clamped to it
+        :param min_drift_span_seconds: Time the samples must span to fit a drift
+        :param window: Samples kept for picking and for the drift
+        """
+        self._client = api_client
+        self._max_uncertainty = max_uncertainty_ms / 1000
+        self._drift_tolerance = drift_tolerance_ppm / 1_000_000
+        self._max_drift = max_drift_ppm / 1_000_000
+        self._min_drift_span = min_drift_span_seconds
+        self._samples: deque[_Sample] = deque(maxlen=window)
+
+        # Seconds of offset change per second, and how wrong that may be
+        self._drift = 0.0
+        self._drift_error = 0.0
+
+    async def sample(self) -> ClockEstimate:
+        """
+        Asks the server for its time and records the sample.
+
+        :raises QuoteProviderUnavailableError: If the request fails
+        """
+        sent, wall_sent = time.monotonic(), time.time()
+        server_time = await self._client.get_server_time()
+        received, wall_received = time.monotonic(), time.time()
+
+        midpoint = (sent + received) / 2
+        server_seconds = server_time.server_time_ms / 1000
+        sample = _Sample(
+            midpoint=midpoint,
+            offset=server_seconds - midpoint,
+            round_trip=received - sent,
+        )
+
+        self._samples.append(sample)
+        self._drift, self._drift_error = self._estimate_drift()
+
+        estimate = self._estimate(sample, received)
+        self._report(estimate)
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.clock_offset_seconds.labels(provider="binance").set(
+                server_seconds - (wall_sent + wall_received) / 2
+            )
+
+        logger.debug(
+            "binance_clock_sampled",
+            round_trip_ms=round(sample.round_trip * 1000, 2),
+            drift_ppm=round(self._drift * 1_000_000, 3),
+            drift_error_ppm=round(self._drift_error * 1_000_000, 3),
+        )
+
+        return estimate
+
+    def estimate(self, at: Optional[float] = None) -> Optional[ClockEstimate]:
+        """
+        :param at: Local monotonic time to tell the server time at, now by default
+        :return: The best estimate, None if there's no sample yet
+        """
+        at = time.monotonic() if at is None else at
+
+        if not self._samples:
+            return None
+
+        return min(
+            (self._estimate(sample, at) for sample in self._samples),
+            key=lambda estimate: estimate.uncertainty,
+        )
+
+    async def now(self, at: Optional[float] = None) -> TimestampUTC:
+        """
+        Server time, estimated if that's certain enough, asked for otherwise.
+
+        :param at: Local monotonic time to tell the server time at, now by default
+        :raises QuoteProviderUnavailableError: If the server must be asked and can't be
+        """
+        estimate = self.estimate(at)
+
+        if estimate is not None and estimate.uncertainty <= self._max_uncertainty:
+            self._report(estimate)
+            return estimate.timestamp
+
+        logger.info(
+            "binance_clock_uncertain_asking_server",
+            uncertainty_ms=(
+                round(estimate.uncertainty * 1000, 2) if estimate is not None else None
+            ),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.clock_sync_fallbacks_total.labels(provider="binance").inc()
+
+        estimate = await self.sample()
+
+        if at is not None:
+            estimate = self._estimate(self._samples[-1], at)
+
+        return estimate.timestamp
+
+    def _estimate(self, sample: _Sample, at: float) -> ClockEstimate:
+        elapsed = abs(at - sample.midpoint)
+        offset = sample.offset + self._drift * (at - sample.midpoint)
+
+        return ClockEstimate(
+            timestamp=TimestampUTC.from_timestamp(at + offset),
+            offset=offset,
+            uncertainty=(
+                sample.round_trip / 2
+                + (self._drift_tolerance + self._drift_error) * elapsed
+            ),
+        )
+
+    def _estimate_drift(self) -> tuple[float, float]:
+        """
+        :return: Least-squares drift, clamped to the plausible range, and the
+            worst error the samples' round trips allow in it
+        """
+        samples = self._samples
+
+        if len(samples) < 2:
+            return 0.0, 0.0
+
+        if samples[-1].midpoint - samples[0].midpoint < self._min_drift_span:
+            return 0.0, 0.0
+
+        mean_t = sum(s.midpoint for s in samples) / len(samples)
+        mean_o = sum(s.offset for s in samples) / len(samples)
+
+        spread = sum((s.midpoint - mean_t) ** 2 for s in samples)
+
+        if spread == 0:
+            return 0.0, 0.0
+
+        slope = sum((s.midpoint - mean_t) * (s.offset - mean_o) for s in samples)
+        # Each offset is off by at most half its round trip
+        error = sum(abs(s.midpoint - mean_t) * s.round_trip / 2 for s in samples)
+
+        drift = max(-self._max_drift, min(self._max_drift, slope / spread))
+
+        # Clamped, the fit can't be further off than the range is wide
+        return drift, min(error / spread, 2 * self._max_drift)
+
+    def _report(self, estimate: ClockEstimate) -> None:
+        if not settings.ENABLE_METRICS:
+            return
+
+        metrics = get_metrics_registry()
+        metrics.clock_offset_uncertainty_seconds.labels(provider="binance").set(
+            estimate.uncertainty
+        )
+        metrics.clock_drift_ppm.labels(provider="binance").set(self._drift * 1_000_000)
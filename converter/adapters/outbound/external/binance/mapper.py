@@ -1,3 +1,5 @@
+from typing import Mapping
+
 from converter.adapters.outbound.external.binance.models import (
     BinanceServerTime,
     BinanceSymbolInfo,
@@ -23,15 +25,19 @@ class BinanceMapper:
         return Quote(pair=pair, rate=rate, timestamp=timestamp)
 
     def tickers_to_quotes(
-        self, tickers: list[BinanceTicker], pairs: list[Pair], timestamp: TimestampUTC
+        self,
+        tickers: list[BinanceTicker],
+        pairs: Mapping[str, Pair],
+        timestamp: TimestampUTC,
     ) -> list[Quote]:
-        ticker_map = {ticker.symbol: ticker for ticker in tickers}
-        pair_map = {str(pair): pair for pair in pairs}
-
+        """
+        :param pairs: Symbol -> pair of the tracked pairs, other tickers are skipped
+        """
         quotes = []
-        for symbol, pair in pair_map.items():
-            ticker = ticker_map.get(symbol)
-            if ticker is None:
+        for ticker in tickers:
+            symbol = ticker.symbol
+            pair = pairs.get(symbol)
+            if pair is None:
                 continue
 
             if ticker.price <= 0:
@@ -1,4 +1,5 @@
 from .exchange_info import BinanceExchangeInfo
+from .mini_ticker import BinanceMiniTicker
 from .server_time import BinanceServerTime
 from .symbol import BinanceSymbolInfo
 from .ticker import BinanceTicker
@@ -6,6 +7,7 @@ from .ticker import BinanceTicker
 __all__ = [
     "BinanceTicker",
     "BinanceExchangeInfo",
+    "BinanceMiniTicker",
     "BinanceSymbolInfo",
     "BinanceServerTime",
 ]
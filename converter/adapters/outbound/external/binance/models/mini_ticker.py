@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BinanceMiniTicker:
+    """
+    24h rolling mini-ticker from the Binance WebSocket API.
+
+    https://developers.binance.com/docs/binance-spot-api-docs/web-socket-streams
+
+    Stream: !miniTicker@arr, only symbols that changed are sent, about once a second.
+
+    Example frame item::
+        {
+            "e": "24hrMiniTicker",
+            "E": 1672515782136,
+            "s": "BNBBTC",
+            "c": "0.0025",
+            ...
+        }
+    """
+
+    symbol: str
+    close_price: Decimal
+    event_time_ms: int
+
+    def __post_init__(self) -> None:
+        if not self.symbol:
+            raise ValueError("Symbol cannot be empty")
+        if not self.symbol.isupper():
+            raise ValueError(f"Symbol must be uppercase: {self.symbol}")
+
+        if self.close_price < 0:
+            raise ValueError(f"Price must be positive: {self.close_price}")
+
+    @property
+    def event_time(self) -> datetime:
+        return datetime.fromtimestamp(self.event_time_ms / 1000, tz=timezone.utc)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "BinanceMiniTicker":
+        try:
+            return cls(
+                symbol=data["s"],
+                close_price=Decimal(data["c"]),
+                event_time_ms=int(data["E"]),
+            )
+
+        except KeyError as e:
+            raise ValueError(f"Missing required field in mini ticker: {e}") from e
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid mini ticker data: {e}") from e
@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Mapping, Optional
 
 from tenacity import (
     AsyncRetrying,
@@ -10,17 +10,20 @@ from tenacity import (
     wait_exponential,
 )
 
+from converter.adapters.outbound.latest_quote_buffer import LatestQuoteBuffer
 from converter.adapters.outbound.rate_source import RateBatch, RateSource
 from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
-from converter.domain.values import Currency, Pair, TimestampUTC
+from converter.domain.values import Pair, TimestampUTC
 from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
 from converter.shared.observability import get_metrics_registry
 from converter.shared.utils.scheduler import FixedRateScheduler
 
 from .client import BinanceAPIClient
+from .clock import BinanceClock
 from .mapper import BinanceMapper
+from .symbol_registry import BinanceSymbolRegistry
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -33,17 +36,24 @@ class BinanceStreamingRateSource(RateSource):
         rate_factory: RateFactory,
         rates_interval_seconds: int = 30,
         symbols_interval_seconds: int = 60,
-        queue_maxsize: int = 10,
         scheduler: Optional[FixedRateScheduler] = None,
+        clock: Optional[BinanceClock] = None,
+        clock_interval_seconds: int = 60,
+        symbols: Optional[BinanceSymbolRegistry] = None,
     ) -> None:
         self._client = api_client
+        self._symbols = symbols or BinanceSymbolRegistry(api_client)
+        self._clock = clock or BinanceClock(api_client)
+        self._clock_interval = clock_interval_seconds
         self._mapper = BinanceMapper(rate_factory=rate_factory)
 
         self._rates_interval = rates_interval_seconds
         self._symbols_interval = symbols_interval_seconds
 
-        self._queue: asyncio.Queue[RateBatch] = asyncio.Queue(maxsize=queue_maxsize)
-        self._tracked_pairs: list[Pair] = []
+        # Ticks the consumer hasn't taken yet are merged, latest quote wins
+        self._buffer = LatestQuoteBuffer(source="binance", stage="receive")
+        # Live view of the registry, every tick polls whatever it holds by then
+        self._pairs: Mapping[str, Pair] = self._symbols.pairs
 
         self._scheduler = scheduler or FixedRateScheduler()
         self._scheduler_task: Optional[asyncio.Task] = None
@@ -59,6 +69,7 @@ class BinanceStreamingRateSource(RateSource):
             try:
                 logger.info("binance_rate_source_initializing")
                 await self._init_symbols()
+                await self._clock_tick()
                 self._started = True
 
             except Exception as e:
@@ -74,6 +85,9 @@ class BinanceStreamingRateSource(RateSource):
         self._scheduler.schedule(
             self._symbols_tick, int(self._symbols_interval), "binance_symbols_tick"
         )
+        self._scheduler.schedule(
+            self._clock_tick, int(self._clock_interval), "binance_clock_sync"
+        )
 
         self._scheduler_task = asyncio.create_task(
             self._scheduler.run_until_shutdown(), name="binance_scheduler"
@@ -83,12 +97,13 @@ class BinanceStreamingRateSource(RateSource):
             "binance_rate_source_streaming",
             rates_interval_seconds=self._rates_interval,
             symbols_interval_seconds=self._symbols_interval,
+            clock_interval_seconds=self._clock_interval,
         )
 
         try:
             while not self._shutdown.is_set():
                 try:
-                    batch = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                    batch = await asyncio.wait_for(self._buffer.get(), timeout=1.0)
                     yield batch
                 except asyncio.TimeoutError:
                     continue
@@ -126,11 +141,7 @@ class BinanceStreamingRateSource(RateSource):
         except Exception as e:
             logger.warning("binance_client_close_error", error=str(e))
 
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._buffer.clear()
 
         self._started = False
         logger.info("binance_rate_source_closed")
@@ -143,11 +154,10 @@ class BinanceStreamingRateSource(RateSource):
                 retry=retry_if_exception_type(Exception),
             ):
                 with attempt:
-                    pairs = await self._get_latest_pairs()
-                    self._set_tracked_pairs(pairs)
+                    await self._symbols.refresh()
                     logger.info(
                         "binance_symbols_initialized",
-                        pair_count=len(self._tracked_pairs),
+                        pair_count=len(self._pairs),
                     )
 
         except RetryError as e:
@@ -158,67 +168,24 @@ class BinanceStreamingRateSource(RateSource):
             )
             raise
 
-    async def _get_latest_pairs(self) -> list[Pair]:
-        start_time = time.time()
-
-        try:
-            info = await self._client.get_exchange_info()
-            pairs = [
-                Pair(base=Currency(sym.base_asset), quote=Currency(sym.quote_asset))
-                for sym in info.symbols
-            ]
-
-            duration = time.time() - start_time
-
-            logger.debug(
-                "binance_pairs_fetched",
-                pair_count=len(pairs),
-                duration_ms=round(duration * 1000, 2),
-            )
-
-            if settings.ENABLE_METRICS:
-                metrics = get_metrics_registry()
-                metrics.external_api_requests_total.labels(
-                    provider="binance", endpoint="exchangeInfo", status="success"
-                ).inc()
-                metrics.external_api_duration_seconds.labels(
-                    provider="binance", endpoint="exchangeInfo"
-                ).observe(duration)
-
-            return pairs
-
-        except Exception as e:
-            logger.error("binance_pairs_fetch_failed", error=str(e), exc_info=True)
-
-            if settings.ENABLE_METRICS:
-                metrics = get_metrics_registry()
-                metrics.external_api_requests_total.labels(
-                    provider="binance", endpoint="exchangeInfo", status="error"
-                ).inc()
-
-            raise
-
-    def _set_tracked_pairs(self, pairs: list[Pair]) -> None:
-        self._tracked_pairs = pairs
-
     async def _rates_tick(self) -> None:
-        if not self._tracked_pairs:
+        if not self._pairs:
             await self._offer_batch(RateBatch(quotes=[]))
             return
 
         start_time = time.time()
 
         try:
-            server_time, tickers = await asyncio.gather(
-                self._client.get_server_time(),
-                self._client.get_all_ticker_prices(),
-            )
+            sent = time.monotonic()
+            tickers = await self._client.get_all_ticker_prices()
+            received = time.monotonic()
 
-            timestamp: TimestampUTC = self._mapper.to_timestamp(server_time)
+            # Server time halfway through the request, without asking for it
+            timestamp: TimestampUTC = await self._clock.now(at=(sent + received) / 2)
 
             quotes: list[Quote] = self._mapper.tickers_to_quotes(
                 tickers=tickers,
-                pairs=self._tracked_pairs,
+                pairs=self._pairs,
                 timestamp=timestamp,
             )
 
@@ -227,7 +194,7 @@ class BinanceStreamingRateSource(RateSource):
             logger.info(
                 "binance_rates_fetched",
                 quote_count=len(quotes),
-                tracked_pairs=len(self._tracked_pairs),
+                tracked_pairs=len(self._pairs),
                 duration_ms=round(duration * 1000, 2),
             )
 
@@ -240,14 +207,18 @@ class BinanceStreamingRateSource(RateSource):
                 metrics.external_api_duration_seconds.labels(
                     provider="binance", endpoint="ticker/price"
                 ).observe(duration)
+                metrics.pipeline_batches_total.labels(stage="fetch").inc()
+                metrics.pipeline_stage_duration_seconds.labels(stage="fetch").observe(
+                    duration
+                )
 
             if quotes:
                 await self._offer_batch(RateBatch(quotes=quotes))
             else:
                 logger.warning("no_valid_quotes_in_batch")
 
-            if len(quotes) < len(self._tracked_pairs):
-                missing = len(self._tracked_pairs) - len(quotes)
+            if len(quotes) < len(self._pairs):
+                missing = len(self._pairs) - len(quotes)
                 logger.debug(
                     "binance_missing_or_invalid_tickers", missing_count=missing
                 )
@@ -263,21 +234,19 @@ class BinanceStreamingRateSource(RateSource):
 
     async def _symbols_tick(self) -> None:
         try:
-            pairs = await self._get_latest_pairs()
-            self._set_tracked_pairs(pairs)
-
-            logger.info(
-                "binance_symbols_refreshed", pair_count=len(self._tracked_pairs)
-            )
+            await self._symbols.refresh()
         except Exception as e:
             logger.error("binance_symbols_refresh_failed", error=str(e), exc_info=True)
 
+    async def _clock_tick(self) -> None:
+        # Estimates carry on from older samples, a missed one isn't fatal
+        try:
+            await self._clock.sample()
+        except Exception as e:
+            logger.warning("binance_clock_sync_failed", error=str(e))
+
     async def _offer_batch(self, batch: RateBatch) -> None:
         if self._shutdown.is_set():
             return
-        try:
-            self._queue.put_nowait(batch)
-        except asyncio.QueueFull:
-            logger.warning("binance_queue_full_dropping_batch", quote_count=len(batch))
-        except asyncio.CancelledError:
-            pass
+
+        self._buffer.offer(batch)
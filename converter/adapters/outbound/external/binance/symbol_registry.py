@@ -0,0 +1,162 @@
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+from converter.domain.values import Currency, Pair
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .client import BinanceAPIClient
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class SymbolChange:
+    """
+    Pairs listed and delisted between two versions of the registry.
+    """
+
+    version: int
+    added: Mapping[str, Pair]
+    removed: Mapping[str, Pair]
+
+
+SymbolListener = Callable[[SymbolChange], None]
+
+
+class BinanceSymbolRegistry:
+    """
+    Symbol -> pair table of Binance, kept up to date from /api/v3/exchangeInfo.
+
+    A refresh whose response hashes the same as the last one is skipped without
+    parsing it. Otherwise only the symbols that came or went are applied,
+    the version goes up, and subscribers get the `SymbolChange`, so they can
+    update what they derived from the table instead of rebuilding it.
+
+    Keeps state between refreshes, so it must be a single shared instance.
+    """
+
+    def __init__(self, api_client: BinanceAPIClient) -> None:
+        self._client = api_client
+
+        self._pairs: dict[str, Pair] = {}
+        self._digest: Optional[str] = None
+        self._version = 0
+        self._listeners: list[SymbolListener] = []
+
+    @property
+    def pairs(self) -> Mapping[str, Pair]:
+        """
+        Read-only live view of the table, follows refreshes.
+        """
+        return MappingProxyType(self._pairs)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def subscribe(self, listener: SymbolListener) -> None:
+        """
+        :param listener: Called with every change, right after it's applied
+        """
+        self._listeners.append(listener)
+
+    async def refresh(self) -> Optional[SymbolChange]:
+        """
+        :return: The change applied, None if no pair came or went
+        :raises QuoteProviderUnavailableError: If exchange info can't be fetched
+        """
+        start_time = time.time()
+
+        try:
+            digest, info = await self._client.get_exchange_info_if_changed(self._digest)
+
+        except Exception:
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.external_api_requests_total.labels(
+                    provider="binance", endpoint="exchangeInfo", status="error"
+                ).inc()
+
+            raise
+
+        duration = time.time() - start_time
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.external_api_requests_total.labels(
+                provider="binance", endpoint="exchangeInfo", status="success"
+            ).inc()
+            metrics.external_api_duration_seconds.labels(
+                provider="binance", endpoint="exchangeInfo"
+            ).observe(duration)
+            metrics.symbol_registry_refreshes_total.labels(
+                provider="binance",
+                result="unchanged" if info is None else "changed",
+            ).inc()
+
+        if info is None:
+            return None
+
+        self._digest = digest
+
+        listed = {sym.symbol: sym for sym in info.symbols}
+
+        added = {
+            symbol: Pair(Currency(sym.base_asset), Currency(sym.quote_asset))
+            for symbol, sym in listed.items()
+            if symbol not in self._pairs
+        }
+        removed = {
+            symbol: pair for symbol, pair in self._pairs.items() if symbol not in listed
+        }
+
+        # Something else in the response changed, filters or rate limits
+        if not added and not removed:
+            logger.debug("binance_symbols_unchanged", version=self._version)
+            return None
+
+        for symbol in removed:
+            del self._pairs[symbol]
+        self._pairs.update(added)
+        self._version += 1
+
+        change = SymbolChange(version=self._version, added=added, removed=removed)
+
+        logger.info(
+            "binance_symbols_changed",
+            version=self._version,
+            added_count=len(added),
+            removed_count=len(removed),
+            pair_count=len(self._pairs),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.symbol_registry_pairs.labels(provider="binance").set(
+                len(self._pairs)
+            )
+            metrics.symbol_registry_changes_total.labels(
+                provider="binance", change="added"
+            ).inc(len(added))
+            metrics.symbol_registry_changes_total.labels(
+                provider="binance", change="removed"
+            ).inc(len(removed))
+
+        for listener in self._listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error(
+                    "symbol_listener_failed",
+                    version=self._version,
+                    error=str(e),
+                    exc_info=True,
+                )
+
+        return change
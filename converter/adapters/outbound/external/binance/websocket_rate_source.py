@@ -0,0 +1,356 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Mapping, Optional
+
+import aiohttp
+
+from converter.adapters.outbound.latest_quote_buffer import LatestQuoteBuffer
+from converter.adapters.outbound.rate_source import RateBatch, RateSource
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.values import Pair, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .client import BinanceAPIClient
+from .clock import BinanceClock
+from .mapper import BinanceMapper
+from .models import BinanceMiniTicker
+from .symbol_registry import BinanceSymbolRegistry, SymbolChange
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class BinanceWebSocketRateSource(RateSource):
+    """
+    Rate source fed by the all-market mini-ticker stream (!miniTicker@arr).
+
+    Updates are collected per symbol (latest wins) and flushed as a RateBatch
+    every `flush_interval_seconds`, or once `flush_max_quotes` symbols are pending.
+
+    The stream only carries symbols that changed, so every
+    `snapshot_interval_seconds` all known prices are re-emitted, stamped with
+    the latest event time seen on the stream. While disconnected nothing is
+    re-emitted, so quotes still age as they should.
+
+    Known prices are dropped on disconnect, since any of them may have moved
+    during the outage. Each connection reseeds them from /api/v3/ticker/price,
+    which also covers pairs that haven't traded since.
+    """
+
+    STREAM_PATH = "/ws/!miniTicker@arr"
+
+    def __init__(
+        self,
+        api_client: BinanceAPIClient,
+        rate_factory: RateFactory,
+        ws_base_url: str = "wss://stream.binance.com:9443",
+        flush_interval_seconds: float = 1.0,
+        flush_max_quotes: int = 5000,
+        snapshot_interval_seconds: float = 30.0,
+        symbols_interval_seconds: float = 60.0,
+        reconnect_min_delay_seconds: float = 1.0,
+        reconnect_max_delay_seconds: float = 60.0,
+        symbols: Optional[BinanceSymbolRegistry] = None,
+        clock: Optional[BinanceClock] = None,
+    ) -> None:
+        self._client = api_client
+        self._symbols = symbols or BinanceSymbolRegistry(api_client)
+        self._symbols.subscribe(self._on_symbols_changed)
+        self._clock = clock or BinanceClock(api_client)
+        self._rate_factory = rate_factory
+        self._mapper = BinanceMapper(rate_factory=rate_factory)
+
+        self._url = f"{ws_base_url.rstrip('/')}{self.STREAM_PATH}"
+        self._flush_interval = flush_interval_seconds
+        self._flush_max_quotes = flush_max_quotes
+        self._snapshot_interval = snapshot_interval_seconds
+        self._symbols_interval = symbols_interval_seconds
+        self._reconnect_min_delay = reconnect_min_delay_seconds
+        self._reconnect_max_delay = reconnect_max_delay_seconds
+
+        # Flushes the consumer hasn't taken yet are merged, latest quote wins
+        self._buffer = LatestQuoteBuffer(source="binance_ws", stage="receive")
+        self._pairs: Mapping[str, Pair] = self._symbols.pairs
+
+        # symbol -> latest quote, pending until the next flush
+        self._pending: dict[str, Quote] = {}
+        self._known: dict[str, Quote] = {}
+        self._stream_time: Optional[TimestampUTC] = None
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._tasks: list[asyncio.Task] = []
+        self._shutdown = asyncio.Event()
+        self._started = False
+        self._start_lock = asyncio.Lock()
+
+    async def stream(self) -> AsyncIterator[RateBatch]:
+        async with self._start_lock:
+            if self._started:
+                raise RuntimeError("stream() already started")
+
+            try:
+                logger.info("binance_ws_rate_source_initializing", url=self._url)
+                await self._refresh_symbols()
+                self._started = True
+
+            except Exception as e:
+                logger.error(
+                    "binance_ws_rate_source_init_failed", error=str(e), exc_info=True
+                )
+                raise
+
+        self._tasks = [
+            asyncio.create_task(self._read_loop(), name="binance_ws_reader"),
+            asyncio.create_task(self._flush_loop(), name="binance_ws_flusher"),
+            asyncio.create_task(self._snapshot_loop(), name="binance_ws_snapshot"),
+            asyncio.create_task(self._symbols_loop(), name="binance_ws_symbols"),
+        ]
+
+        try:
+            while not self._shutdown.is_set():
+                try:
+                    batch = await asyncio.wait_for(self._buffer.get(), timeout=1.0)
+                    yield batch
+                except asyncio.TimeoutError:
+                    continue
+
+        except asyncio.CancelledError:
+            logger.info("binance_ws_stream_cancelled")
+            raise
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._shutdown.is_set():
+            return
+
+        logger.info("binance_ws_rate_source_closing")
+        self._shutdown.set()
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+        try:
+            await self._client.close()
+        except Exception as e:
+            logger.warning("binance_client_close_error", error=str(e))
+
+        self._buffer.clear()
+
+        self._started = False
+        logger.info("binance_ws_rate_source_closed")
+
+    async def _read_loop(self) -> None:
+        delay = self._reconnect_min_delay
+
+        while not self._shutdown.is_set():
+            try:
+                session = await self._ensure_session()
+
+                async with session.ws_connect(self._url, heartbeat=30.0) as ws:
+                    logger.info("binance_ws_connected", url=self._url)
+                    self._record_connection("connected")
+                    delay = self._reconnect_min_delay
+
+                    await self._seed()
+
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            await self._on_frame(message.data)
+                        elif message.type == aiohttp.WSMsgType.ERROR:
+                            raise ws.exception() or aiohttp.ClientError("ws error")
+
+                logger.warning("binance_ws_closed_by_server", code=ws.close_code)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.warning(
+                    "binance_ws_connection_failed",
+                    error=str(e),
+                    retry_in_seconds=delay,
+                )
+
+            # Prices may move while we're away, only fresh ones get re-emitted
+            self._known.clear()
+            self._record_connection("reconnect")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._reconnect_max_delay)
+
+    async def _on_frame(self, data: str) -> None:
+        try:
+            payload = json.loads(data)
+        except ValueError as e:
+            logger.warning("binance_ws_invalid_frame", error=str(e))
+            return
+
+        if not isinstance(payload, list):
+            logger.debug("binance_ws_unexpected_frame", type=type(payload).__name__)
+            return
+
+        for item in payload:
+            quote = self._to_quote(item)
+
+            if quote is None:
+                continue
+
+            symbol = quote.pair.code()
+            self._pending[symbol] = quote
+            self._known[symbol] = quote
+
+            latest = self._stream_time
+            if latest is None or quote.timestamp.value > latest.value:
+                self._stream_time = quote.timestamp
+
+        if len(self._pending) >= self._flush_max_quotes:
+            await self._flush()
+
+    async def _seed(self) -> None:
+        """
+        Fill in the prices the new connection hasn't streamed yet.
+        Without them, only symbols ticking since the reconnect are re-emitted.
+        """
+        try:
+            sent = time.monotonic()
+            tickers = await self._client.get_all_ticker_prices()
+            received = time.monotonic()
+
+            timestamp = await self._clock.now(at=(sent + received) / 2)
+
+        except Exception as e:
+            logger.warning("binance_ws_seed_failed", error=str(e))
+            return
+
+        quotes = self._mapper.tickers_to_quotes(
+            tickers=tickers, pairs=self._pairs, timestamp=timestamp
+        )
+
+        seeded = 0
+
+        for quote in quotes:
+            symbol = quote.pair.code()
+
+            # Already streamed on this connection, which is at least as recent
+            if symbol in self._known:
+                continue
+
+            self._pending[symbol] = quote
+            self._known[symbol] = quote
+            seeded += 1
+
+        latest = self._stream_time
+        if latest is None or timestamp.value > latest.value:
+            self._stream_time = timestamp
+
+        logger.info("binance_ws_seeded", quote_count=seeded)
+
+    def _to_quote(self, item: Any) -> Optional[Quote]:
+        try:
+            ticker = BinanceMiniTicker.from_json(item)
+        except ValueError as e:
+            logger.debug("binance_ws_ticker_skipped", error=str(e))
+            return None
+
+        pair = self._pairs.get(ticker.symbol)
+
+        if pair is None or ticker.close_price <= 0:
+            return None
+
+        try:
+            return Quote(
+                pair=pair,
+                rate=self._rate_factory.create(ticker.close_price),
+                timestamp=TimestampUTC(ticker.event_time),
+            )
+        except ValueError as e:
+            logger.warning("invalid_ticker_skipped", symbol=ticker.symbol, error=str(e))
+            return None
+
+    async def _flush_loop(self) -> None:
+        while not self._shutdown.is_set():
+            await asyncio.sleep(self._flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        quotes = list(self._pending.values())
+        self._pending = {}
+
+        await self._offer_batch(RateBatch(quotes=quotes))
+
+    async def _snapshot_loop(self) -> None:
+        while not self._shutdown.is_set():
+            await asyncio.sleep(self._snapshot_interval)
+
+            stream_time = self._stream_time
+
+            if stream_time is None or not self._known:
+                continue
+
+            quotes = [
+                Quote(pair=quote.pair, rate=quote.rate, timestamp=stream_time)
+                for quote in self._known.values()
+            ]
+
+            logger.debug("binance_ws_snapshot", quote_count=len(quotes))
+            await self._offer_batch(RateBatch(quotes=quotes))
+
+    async def _symbols_loop(self) -> None:
+        while not self._shutdown.is_set():
+            await asyncio.sleep(self._symbols_interval)
+
+            try:
+                await self._refresh_symbols()
+            except Exception as e:
+                logger.error("binance_symbols_refresh_failed", error=str(e))
+
+    async def _refresh_symbols(self) -> None:
+        await self._symbols.refresh()
+
+    def _on_symbols_changed(self, change: SymbolChange) -> None:
+        # Delisted symbols shouldn't be re-emitted by snapshots forever
+        for symbol in change.removed:
+            self._known.pop(symbol, None)
+            self._pending.pop(symbol, None)
+
+    async def _offer_batch(self, batch: RateBatch) -> None:
+        if self._shutdown.is_set():
+            return
+
+        self._buffer.offer(batch)
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.quotes_fetched_total.labels(source="binance_ws").inc(len(batch))
+            metrics.pipeline_batches_total.labels(stage="fetch").inc()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        return self._session
+
+    @staticmethod
+    def _record_connection(event: str) -> None:
+        if not settings.ENABLE_METRICS:
+            return
+
+        metrics = get_metrics_registry()
+        metrics.external_api_requests_total.labels(
+            provider="binance", endpoint="ws/miniTicker", status=event
+        ).inc()
@@ -0,0 +1,117 @@
+import asyncio
+import time
+from typing import Optional
+
+from converter.adapters.outbound.rate_source import RateBatch
+from converter.domain.models import Quote
+from converter.shared.config import get_settings
+from converter.shared.observability import get_metrics_registry
+
+settings = get_settings()
+
+
+class LatestQuoteBuffer:
+    """
+    Hands batches from a rate source to its consumer, merging whatever the consumer
+    hasn't taken yet into one batch with the newest quote of each symbol.
+
+    A consumer that falls behind gets one up-to-date batch instead of a backlog
+    of stale ones, and the buffer never holds more than a quote per symbol.
+    """
+
+    def __init__(self, source: str, stage: Optional[str] = None):
+        """
+        :param source: Source label in metrics
+        :param stage: Consumer stage taking from the buffer, reports its pipeline
+            queue depth and wait time when set
+        """
+        self._source = source
+        self._stage = stage
+        self._pending: dict[str, Quote] = {}
+        self._ready = asyncio.Event()
+
+        # Batches merged into the pending one, and when the oldest arrived
+        self._batches = 0
+        self._since: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def pending_batches(self) -> int:
+        return self._batches
+
+    def offer(self, batch: RateBatch) -> None:
+        merged = bool(self._pending)
+        overwritten = 0
+
+        for quote in batch.quotes:
+            symbol = quote.pair.code()
+            current = self._pending.get(symbol)
+
+            if current is not None:
+                overwritten += 1
+
+                # Either way one of the two is gone, keep the newer
+                if quote.timestamp.value < current.timestamp.value:
+                    continue
+
+            self._pending[symbol] = quote
+
+        if self._pending:
+            self._batches += 1
+            if self._since is None:
+                self._since = time.perf_counter()
+
+            self._ready.set()
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            if self._stage is not None:
+                metrics.pipeline_queue_batches.labels(stage=self._stage).set(
+                    self._batches
+                )
+
+            metrics.quote_buffer_pending_quotes.labels(source=self._source).set(
+                len(self._pending)
+            )
+
+            if merged:
+                metrics.quote_buffer_merges_total.labels(source=self._source).inc()
+            if overwritten:
+                metrics.quote_buffer_overwritten_total.labels(source=self._source).inc(
+                    overwritten
+                )
+
+    async def get(self) -> RateBatch:
+        """
+        Waits for quotes and takes all of them.
+        Safe to await from several tasks, each batch goes to one of them.
+        """
+        # Another getter woken by the same offer may have taken them already
+        while not self._pending:
+            await self._ready.wait()
+
+        quotes = list(self._pending.values())
+        since = self._since
+        self.clear()
+
+        if settings.ENABLE_METRICS and self._stage is not None and since is not None:
+            metrics = get_metrics_registry()
+            metrics.pipeline_stall_seconds_total.labels(stage=self._stage).inc(
+                time.perf_counter() - since
+            )
+
+        return RateBatch(quotes=quotes)
+
+    def clear(self) -> None:
+        self._pending = {}
+        self._batches = 0
+        self._since = None
+        self._ready.clear()
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.quote_buffer_pending_quotes.labels(source=self._source).set(0)
+            if self._stage is not None:
+                metrics.pipeline_queue_batches.labels(stage=self._stage).set(0)
@@ -0,0 +1,266 @@
+import asyncio
+import csv
+import io
+import json
+import re
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Optional
+
+import asyncpg
+
+from converter.app.ports.outbound.quote_archive import (
+    ArchiveBatch,
+    QuoteHistorySource,
+    QuotePartition,
+)
+from converter.app.ports.outbound.quote_exporter import ExportFormat, QuoteExporter
+from converter.domain.values import TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+EXPORT_COLUMNS = ("symbol", "base_currency", "quote_currency", "rate", "timestamp")
+
+# Quotes only carry the symbol id, the names come from `symbols`.
+# Ordered by id, the primary key order, so the index serves it without a sort.
+EXPORT_ALL_SQL = """
+SELECT s.symbol, s.base_currency, s.quote_currency, q.rate, q.quote_timestamp
+FROM quotes q
+JOIN symbols s ON s.id = q.symbol_id
+WHERE q.quote_timestamp >= $1 AND q.quote_timestamp < $2
+ORDER BY q.symbol_id, q.quote_timestamp
+"""
+
+EXPORT_SYMBOLS_SQL = """
+SELECT s.symbol, s.base_currency, s.quote_currency, q.rate, q.quote_timestamp
+FROM quotes q
+JOIN symbols s ON s.id = q.symbol_id
+WHERE q.quote_timestamp >= $1 AND q.quote_timestamp < $2
+AND s.symbol = ANY($3::text[])
+ORDER BY q.symbol_id, q.quote_timestamp
+"""
+
+PARTITIONS_SQL = """
+SELECT child.relname AS name, pg_get_expr(child.relpartbound, child.oid) AS bound
+FROM pg_inherits
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE pg_inherits.inhparent = 'quotes'::regclass
+"""
+
+# e.g. FOR VALUES FROM ('2025-10-01 00:00:00+00') TO ('2025-10-02 00:00:00+00'),
+# the default partition and open-ended bounds don't match
+_RANGE_BOUND = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+class AsyncpgQuoteExporter(QuoteExporter, QuoteHistorySource):
+    """
+    Streams quote history through a server-side cursor,
+    encoded for exports or in columns for the archive.
+
+    Records are fetched `fetch_rows` at a time and passed on right away,
+    exports in chunks of about `chunk_bytes`, so memory stays flat
+    however long the range is.
+    Exports are long-running, so they get their own small pool:
+    its size caps how many run at once, further ones wait for a connection.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        max_concurrency: int = 2,
+        fetch_rows: int = 5000,
+        chunk_bytes: int = 64 * 1024,
+    ):
+        """
+        :param dsn: Plain postgresql:// DSN, without the SQLAlchemy driver suffix
+        """
+        self._dsn = dsn
+        self._max_concurrency = max_concurrency
+        self._fetch_rows = fetch_rows
+        self._chunk_bytes = chunk_bytes
+
+        self._pool: Optional[Any] = None
+        self._pool_lock = asyncio.Lock()
+
+    async def export(
+        self,
+        symbols: list[str],
+        start: TimestampUTC,
+        end: TimestampUTC,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        query, args = self.export_query(symbols, start, end)
+
+        start_time = time.time()
+        rows = 0
+        exported_bytes = 0
+
+        buffer = io.StringIO()
+        write_row = _row_writer(export_format, buffer)
+
+        async for records in self._fetch_batches(query, args):
+            for record in records:
+                write_row(record)
+                rows += 1
+
+                if buffer.tell() >= self._chunk_bytes:
+                    chunk = _drain(buffer)
+                    exported_bytes += len(chunk)
+                    yield chunk
+
+        if buffer.tell():
+            chunk = _drain(buffer)
+            exported_bytes += len(chunk)
+            yield chunk
+
+        duration = time.time() - start_time
+
+        logger.info(
+            "quotes_exported",
+            format=export_format.value,
+            symbols=len(symbols) or "all",
+            rows=rows,
+            bytes=exported_bytes,
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.db_queries_total.labels(operation="export", table="quotes").inc()
+            metrics.db_query_duration_seconds.labels(
+                operation="export", table="quotes"
+            ).observe(duration)
+            metrics.quotes_exported_total.labels(format=export_format.value).inc(rows)
+
+    async def list_partitions(self) -> list[QuotePartition]:
+        pool = await self._get_pool()
+        records = await pool.fetch(PARTITIONS_SQL)
+
+        partitions = []
+
+        for record in records:
+            match = _RANGE_BOUND.search(record["bound"])
+
+            if match is None:
+                continue
+
+            start, end = (datetime.fromisoformat(v) for v in match.groups())
+            partitions.append(
+                QuotePartition(
+                    name=record["name"],
+                    start=TimestampUTC(start),
+                    end=TimestampUTC(end),
+                )
+            )
+
+        return sorted(partitions, key=lambda p: p.start.value)
+
+    async def stream_batches(
+        self, start: TimestampUTC, end: TimestampUTC
+    ) -> AsyncIterator[ArchiveBatch]:
+        query, args = self.export_query([], start, end)
+
+        async for records in self._fetch_batches(query, args):
+            yield ArchiveBatch(
+                symbols=[r["symbol"] for r in records],
+                base_currencies=[r["base_currency"] for r in records],
+                quote_currencies=[r["quote_currency"] for r in records],
+                rates=[r["rate"] for r in records],
+                timestamps=[r["quote_timestamp"] for r in records],
+            )
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+
+        await self._pool.close()
+        self._pool = None
+
+        logger.info("export_pool_closed")
+
+    @staticmethod
+    def export_query(
+        symbols: list[str], start: TimestampUTC, end: TimestampUTC
+    ) -> tuple[str, tuple[Any, ...]]:
+        if symbols:
+            return EXPORT_SYMBOLS_SQL, (start.value, end.value, symbols)
+
+        return EXPORT_ALL_SQL, (start.value, end.value)
+
+    async def _fetch_batches(
+        self, query: str, args: tuple[Any, ...]
+    ) -> AsyncIterator[list[Any]]:
+        pool = await self._get_pool()
+
+        async with pool.acquire() as conn, conn.transaction(readonly=True):
+            cursor = await conn.cursor(query, *args)
+
+            while records := await cursor.fetch(self._fetch_rows):
+                yield records
+
+    async def _get_pool(self) -> Any:
+        if self._pool is not None:
+            return self._pool
+
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    self._dsn,
+                    min_size=0,
+                    max_size=self._max_concurrency,
+                )
+                logger.info("export_pool_created", max_size=self._max_concurrency)
+
+        return self._pool
+
+
+def _row_writer(
+    export_format: ExportFormat, buffer: io.StringIO
+) -> Callable[[Any], Any]:
+    """
+    Returns a function appending one record to the buffer,
+    after writing the header if the format has one.
+    """
+    if export_format is ExportFormat.NDJSON:
+
+        def write_json(record: Any) -> None:
+            buffer.write(
+                json.dumps(
+                    {
+                        "symbol": record["symbol"],
+                        "base_currency": record["base_currency"],
+                        "quote_currency": record["quote_currency"],
+                        "rate": str(record["rate"]),
+                        "timestamp": record["quote_timestamp"].isoformat(),
+                    },
+                    separators=(",", ":"),
+                )
+            )
+            buffer.write("\n")
+
+        return write_json
+
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+
+    return lambda record: writer.writerow(
+        (
+            record["symbol"],
+            record["base_currency"],
+            record["quote_currency"],
+            record["rate"],
+            record["quote_timestamp"].isoformat(),
+        )
+    )
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+
+    return chunk
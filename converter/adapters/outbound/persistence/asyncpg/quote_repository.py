@@ -0,0 +1,177 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+import asyncpg
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Pair, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+LATEST_SQL = """
+SELECT rate, quote_timestamp FROM quotes_latest
+WHERE symbol = $1
+"""
+
+LATEST_BEFORE_SQL = """
+SELECT rate, quote_timestamp FROM quotes
+WHERE symbol_id = (SELECT id FROM symbols WHERE symbol = $1)
+AND quote_timestamp <= $2 AND quote_timestamp >= $3
+ORDER BY quote_timestamp DESC
+LIMIT 1
+"""
+
+LATEST_MANY_SQL = """
+SELECT symbol, rate, quote_timestamp FROM quotes_latest
+WHERE symbol = ANY($1::text[])
+"""
+
+
+class AsyncpgQuoteRepository(QuoteRepository):
+    """
+    Read-only fast path over a raw asyncpg pool.
+
+    Selects just (rate, quote_timestamp) and builds the Quote straight from
+    the record, the pair is already known. Queries are fixed strings, so each
+    pooled connection prepares them once and reuses them from its statement cache.
+
+    Behind pgbouncer in transaction mode this needs `max_prepared_statements` > 0
+    (pgbouncer 1.21+), or `statement_cache_size=0`.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        rate_factory: RateFactory,
+        min_pool_size: int = 1,
+        max_pool_size: int = 10,
+        statement_cache_size: int = 100,
+        freshness_policy: Optional[FreshnessPolicy] = None,
+    ):
+        """
+        :param dsn: Plain postgresql:// DSN, without the SQLAlchemy driver suffix
+        :param freshness_policy: Lower bound for historical lookups,
+            same as PostgresQuoteRepository
+        """
+        self._dsn = dsn
+        self._rate_factory = rate_factory
+        self._min_pool_size = min_pool_size
+        self._max_pool_size = max_pool_size
+        self._statement_cache_size = statement_cache_size
+        self._freshness_policy = freshness_policy or FreshnessPolicy()
+
+        self._pool: Optional[Any] = None
+        self._pool_lock = asyncio.Lock()
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        record = await self._fetchrow(
+            "get_latest", "quotes_latest", LATEST_SQL, pair.code()
+        )
+
+        return self._to_quote(pair, record) if record else None
+
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        requested_pairs = {pair.code(): pair for pair in pairs}
+
+        if not requested_pairs:
+            return {}
+
+        start_time = time.time()
+        pool = await self._get_pool()
+
+        records = await pool.fetch(LATEST_MANY_SQL, list(requested_pairs))
+
+        self._record_query("get_latest_many", "quotes_latest", time.time() - start_time)
+
+        return {
+            requested_pairs[record["symbol"]]: self._to_quote(
+                requested_pairs[record["symbol"]], record
+            )
+            for record in records
+        }
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        record = await self._fetchrow(
+            "get_latest_before",
+            "quotes",
+            LATEST_BEFORE_SQL,
+            pair.code(),
+            timestamp.value,
+            self._freshness_policy.oldest_acceptable(timestamp).value,
+        )
+
+        return self._to_quote(pair, record) if record else None
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+
+        await self._pool.close()
+        self._pool = None
+
+        logger.info("asyncpg_pool_closed")
+
+    async def _fetchrow(
+        self, operation: str, table: str, query: str, *args: Any
+    ) -> Optional[Any]:
+        start_time = time.time()
+        pool = await self._get_pool()
+
+        record = await pool.fetchrow(query, *args)
+
+        self._record_query(operation, table, time.time() - start_time)
+
+        return record
+
+    async def _get_pool(self) -> Any:
+        if self._pool is not None:
+            return self._pool
+
+        async with self._pool_lock:
+            if self._pool is None:
+                self._pool = await asyncpg.create_pool(
+                    self._dsn,
+                    min_size=self._min_pool_size,
+                    max_size=self._max_pool_size,
+                    statement_cache_size=self._statement_cache_size,
+                )
+                logger.info(
+                    "asyncpg_pool_created",
+                    min_size=self._min_pool_size,
+                    max_size=self._max_pool_size,
+                )
+
+        return self._pool
+
+    def _to_quote(self, pair: Pair, record: Any) -> Quote:
+        return Quote(
+            pair=pair,
+            rate=self._rate_factory.create(record["rate"]),
+            timestamp=TimestampUTC(record["quote_timestamp"]),
+        )
+
+    @staticmethod
+    def _record_query(operation: str, table: str, duration: float) -> None:
+        logger.debug(
+            "postgres_query",
+            operation=operation,
+            driver="asyncpg",
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.db_queries_total.labels(operation=operation, table=table).inc()
+            metrics.db_query_duration_seconds.labels(
+                operation=operation, table=table
+            ).observe(duration)
@@ -0,0 +1,73 @@
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+import pyarrow as pa
+
+from converter.app.ports.outbound.quote_archive import QuotePartition
+from converter.domain.values import TimestampUTC
+
+# Sorted by symbol, then time, which is what makes row-group pruning work
+ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.dictionary(pa.int32(), pa.string())),
+        ("base_currency", pa.dictionary(pa.int32(), pa.string())),
+        ("quote_currency", pa.dictionary(pa.int32(), pa.string())),
+        ("rate", pa.decimal128(36, 18)),
+        ("quote_timestamp", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+SYMBOL_COLUMN = ARCHIVE_SCHEMA.get_field_index("symbol")
+TIMESTAMP_COLUMN = ARCHIVE_SCHEMA.get_field_index("quote_timestamp")
+
+_BOUND_FORMAT = "%Y%m%dT%H%M%SZ"
+_FILE_NAME = re.compile(r"^quotes_(\d{8}T\d{6}Z)_(\d{8}T\d{6}Z)\.parquet$")
+
+
+def archive_path(directory: str, partition: QuotePartition) -> str:
+    """
+    One file per partition, named after its bounds so readers can pick
+    the files of a time range from the listing alone.
+    """
+    start = partition.start.value.strftime(_BOUND_FORMAT)
+    end = partition.end.value.strftime(_BOUND_FORMAT)
+
+    return os.path.join(directory, f"quotes_{start}_{end}.parquet")
+
+
+def archived_ranges(directory: str) -> list[tuple[TimestampUTC, TimestampUTC, str]]:
+    """Lists the archived files as (start, end, path), oldest first."""
+    if not os.path.isdir(directory):
+        return []
+
+    ranges = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = _FILE_NAME.match(entry.name)
+
+            if match is None:
+                continue
+
+            start, end = (_parse_bound(v) for v in match.groups())
+            ranges.append((start, end, entry.path))
+
+    return sorted(ranges, key=lambda r: r[0].value)
+
+
+def column_range(row_group: Any, column: int) -> tuple[Any, Any] | None:
+    """Min and max of a column within a row group, None without statistics."""
+    statistics = row_group.column(column).statistics
+
+    if statistics is None or not statistics.has_min_max:
+        return None
+
+    return statistics.min, statistics.max
+
+
+def _parse_bound(value: str) -> TimestampUTC:
+    return TimestampUTC(
+        datetime.strptime(value, _BOUND_FORMAT).replace(tzinfo=timezone.utc)
+    )
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Pair, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .files import SYMBOL_COLUMN, TIMESTAMP_COLUMN, archived_ranges, column_range
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class ParquetQuoteRepository(QuoteRepository):
+    """
+    Answers historical lookups from the Parquet archive.
+
+    Files are picked by the range in their name, row groups by their
+    symbol and timestamp statistics, so a lookup reads only the row groups
+    that can hold the pair within the freshness window.
+
+    The archive only has history, so latest lookups never find anything.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        rate_factory: RateFactory,
+        freshness_policy: Optional[FreshnessPolicy] = None,
+    ):
+        self._directory = directory
+        self._rate_factory = rate_factory
+        self._freshness_policy = freshness_policy or FreshnessPolicy()
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        return None
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        oldest = self._freshness_policy.oldest_acceptable(timestamp)
+
+        # Parquet reads are blocking file IO
+        found = await asyncio.to_thread(
+            self._find, pair.code(), oldest.value, timestamp.value
+        )
+
+        if found is None:
+            return None
+
+        rate, quote_timestamp = found
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.historical_lookups_total.labels(resolution="archive").inc()
+
+        return Quote(
+            pair=pair,
+            rate=self._rate_factory.create(rate),
+            timestamp=TimestampUTC(quote_timestamp),
+        )
+
+    def _find(
+        self, symbol: str, oldest: datetime, newest: datetime
+    ) -> Optional[tuple[Decimal, datetime]]:
+        start_time = time.time()
+
+        files = [
+            path
+            for start, end, path in archived_ranges(self._directory)
+            if start.value <= newest and end.value > oldest
+        ]
+
+        # Newest file first, the ranges don't overlap
+        for path in reversed(files):
+            parquet_file = pq.ParquetFile(path)
+            metadata = parquet_file.metadata
+
+            row_groups = [
+                i
+                for i in range(metadata.num_row_groups)
+                if self._may_contain(metadata.row_group(i), symbol, oldest, newest)
+            ]
+
+            logger.debug(
+                "archive_lookup",
+                path=path,
+                symbol=symbol,
+                row_groups_read=len(row_groups),
+                row_groups_total=metadata.num_row_groups,
+            )
+
+            if not row_groups:
+                continue
+
+            table = parquet_file.read_row_groups(
+                row_groups, columns=["symbol", "rate", "quote_timestamp"]
+            )
+            timestamps = table["quote_timestamp"]
+            matching = table.filter(
+                pc.and_(
+                    pc.equal(table["symbol"], symbol),
+                    pc.and_(
+                        pc.greater_equal(timestamps, oldest),
+                        pc.less_equal(timestamps, newest),
+                    ),
+                )
+            )
+
+            if matching.num_rows:
+                # Row groups are read in file order, which is by symbol, then time
+                last = matching.num_rows - 1
+
+                logger.debug(
+                    "archive_lookup_found",
+                    symbol=symbol,
+                    duration_ms=round((time.time() - start_time) * 1000, 2),
+                )
+
+                return (
+                    matching["rate"][last].as_py(),
+                    matching["quote_timestamp"][last].as_py(),
+                )
+
+        return None
+
+    @staticmethod
+    def _may_contain(
+        row_group: object, symbol: str, oldest: datetime, newest: datetime
+    ) -> bool:
+        symbols = column_range(row_group, SYMBOL_COLUMN)
+
+        if symbols is not None and not symbols[0] <= symbol <= symbols[1]:
+            return False
+
+        timestamps = column_range(row_group, TIMESTAMP_COLUMN)
+
+        if timestamps is None:
+            return True
+
+        return bool(timestamps[0] <= newest and timestamps[1] >= oldest)
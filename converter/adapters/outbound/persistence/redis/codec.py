@@ -0,0 +1,158 @@
+import json
+import struct
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from decimal import MAX_PREC, Context, Decimal
+
+from .models import RedisTicker
+
+# Moving the decimal point must never round
+_EXACT = Context(prec=MAX_PREC)
+
+# First byte of a payload tells the format apart.
+# Legacy JSON entries always start with "{", binary ones with their version.
+JSON_MARKER = ord("{")
+BINARY_V1 = 0x01
+
+# version, epoch millis, rate exponent, rate coefficient length
+_BINARY_V1_HEADER = struct.Struct(">BqbB")
+
+
+class TickerCodec(ABC):
+    """
+    Serializes tickers for Redis values.
+
+    Decoding doesn't depend on the codec that is configured, every known format
+    is recognised by its first byte, so entries written before a switch stay readable.
+    """
+
+    @abstractmethod
+    def encode(self, ticker: RedisTicker) -> bytes:
+        raise NotImplementedError()
+
+    def decode(self, data: bytes | str) -> RedisTicker:
+        """
+        :raises ValueError: If the payload is empty, malformed or of an unknown version
+        """
+        raw = data.encode() if isinstance(data, str) else data
+
+        if not raw:
+            raise ValueError("Empty ticker payload")
+
+        if raw[0] == JSON_MARKER:
+            return self._decode_json(raw)
+        if raw[0] == BINARY_V1:
+            return self._decode_binary_v1(raw)
+
+        raise ValueError(f"Unknown ticker payload version: {raw[0]}")
+
+    @staticmethod
+    def _decode_json(raw: bytes) -> RedisTicker:
+        try:
+            payload = json.loads(raw)
+        except ValueError as e:
+            raise ValueError(f"Invalid ticker JSON: {e}") from e
+
+        if not isinstance(payload, dict):
+            raise ValueError("Ticker JSON must be an object")
+
+        return RedisTicker.from_dict(payload)
+
+    @staticmethod
+    def _decode_binary_v1(raw: bytes) -> RedisTicker:
+        try:
+            _, millis, exponent, coefficient_len = _BINARY_V1_HEADER.unpack_from(raw)
+            offset = _BINARY_V1_HEADER.size
+
+            coefficient = int.from_bytes(
+                raw[offset : offset + coefficient_len], "big", signed=True
+            )
+            offset += coefficient_len
+
+            base, offset = _unpack_str(raw, offset)
+            quote, offset = _unpack_str(raw, offset)
+
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid binary ticker: {e}") from e
+
+        if offset != len(raw):
+            raise ValueError("Invalid binary ticker: trailing bytes")
+
+        return RedisTicker(
+            # Entries without currencies only carry their symbol, in the quote slot
+            symbol=base + quote,
+            rate=Decimal(f"{coefficient}E{exponent}"),
+            timestamp=datetime.fromtimestamp(millis / 1000, tz=timezone.utc),
+            base_currency=base or None,
+            quote_currency=quote if base else None,
+        )
+
+
+class JsonTickerCodec(TickerCodec):
+    """
+    The original format, `RedisTicker.to_dict` as JSON.
+    """
+
+    def encode(self, ticker: RedisTicker) -> bytes:
+        return json.dumps(ticker.to_dict()).encode()
+
+
+class BinaryTickerCodec(TickerCodec):
+    """
+    Packed format, version 1:
+
+        u8 version | i64 epoch millis | i8 rate exponent
+        | u8 n + n bytes signed rate coefficient
+        | u8 n + base currency | u8 n + quote currency
+
+    The rate is exact (Decimal coefficient and exponent), the timestamp
+    is cut to milliseconds, which is what Binance gives us anyway.
+    """
+
+    def encode(self, ticker: RedisTicker) -> bytes:
+        exponent = ticker.rate.as_tuple().exponent
+
+        if not isinstance(exponent, int):
+            raise ValueError(f"Rate must be finite: {ticker.rate}")
+
+        coefficient = int(ticker.rate.scaleb(-exponent, context=_EXACT))
+        coefficient_bytes = coefficient.to_bytes(
+            coefficient.bit_length() // 8 + 1, "big", signed=True
+        )
+
+        millis = round(ticker.timestamp.timestamp() * 1000)
+
+        if ticker.base_currency and ticker.quote_currency:
+            base, quote = ticker.base_currency, ticker.quote_currency
+        else:
+            base, quote = "", ticker.symbol
+
+        try:
+            return b"".join(
+                (
+                    _BINARY_V1_HEADER.pack(
+                        BINARY_V1, millis, exponent, len(coefficient_bytes)
+                    ),
+                    coefficient_bytes,
+                    _pack_str(base),
+                    _pack_str(quote),
+                )
+            )
+        except (struct.error, OverflowError) as e:
+            raise ValueError(f"Ticker doesn't fit the binary format: {e}") from e
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode()
+
+    return bytes((len(encoded),)) + encoded
+
+
+def _unpack_str(raw: bytes, offset: int) -> tuple[str, int]:
+    length = raw[offset]
+    end = offset + 1 + length
+
+    if end > len(raw):
+        raise IndexError("string runs past the end of the payload")
+
+    return raw[offset + 1 : end].decode(), end
@@ -0,0 +1,23 @@
+LATEST_QUOTE_KEY_PREFIX = "quote:latest:"
+
+# Hash layout: the full latest snapshot in one hash (symbol -> payload).
+# Each batch is built under the staging key and RENAMEd over the live one,
+# so readers always see one complete generation.
+QUOTE_SNAPSHOT_KEY = "quote:snapshot"
+QUOTE_SNAPSHOT_STAGING_KEY = "quote:snapshot:staging"
+
+# Per-pair sorted sets of recent quotes, scored by quote timestamp (unix seconds)
+QUOTE_HISTORY_KEY_PREFIX = "quote:history:"
+
+# Bumped by the writer after every stored batch,
+# and announced on the channel below so readers know when to reload.
+QUOTE_GENERATION_KEY = "quote:generation"
+QUOTE_GENERATION_CHANNEL = "quote:generations"
+
+
+def latest_quote_key(symbol: str) -> str:
+    return f"{LATEST_QUOTE_KEY_PREFIX}{symbol}"
+
+
+def quote_history_key(symbol: str) -> str:
+    return f"{QUOTE_HISTORY_KEY_PREFIX}{symbol}"
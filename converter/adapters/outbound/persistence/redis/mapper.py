@@ -1,7 +1,9 @@
+from typing import Optional
+
 from converter.adapters.outbound.persistence.redis.models import RedisTicker
 from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
-from converter.domain.values import Pair, TimestampUTC
+from converter.domain.values import Currency, Pair, TimestampUTC
 
 
 class RedisMapper:
@@ -18,10 +20,25 @@ class RedisMapper:
             pair=pair,
         )
 
+    def map_self_describing_ticker(self, ticker: RedisTicker) -> Optional[Quote]:
+        """
+        Map a ticker that carries its own base/quote currencies.
+        Entries written before these fields existed can't be mapped without
+        knowing the pair upfront, so None is returned for them.
+        """
+        if not ticker.base_currency or not ticker.quote_currency:
+            return None
+
+        pair = Pair(Currency(ticker.base_currency), Currency(ticker.quote_currency))
+
+        return self.map_ticker_to_quote(ticker, pair)
+
     @staticmethod
     def map_quote_to_ticker(quote: Quote) -> RedisTicker:
         return RedisTicker(
             timestamp=quote.timestamp.value,
             rate=quote.rate.value,
             symbol=quote.pair.code(),
+            base_currency=quote.pair.base.code,
+            quote_currency=quote.pair.quote.code,
         )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from typing import Optional
 
 
 @dataclass(frozen=True)
@@ -8,6 +9,8 @@ class RedisTicker:
     symbol: str
     rate: Decimal
     timestamp: datetime
+    base_currency: Optional[str] = None
+    quote_currency: Optional[str] = None
 
     def __post_init__(self) -> None:
         if not self.symbol:
@@ -27,7 +30,13 @@ class RedisTicker:
 
             rate = Decimal(price_str)
 
-            return cls(symbol=symbol, rate=rate, timestamp=timestamp)
+            return cls(
+                symbol=symbol,
+                rate=rate,
+                timestamp=timestamp,
+                base_currency=data.get("base_currency"),
+                quote_currency=data.get("quote_currency"),
+            )
 
         except KeyError as e:
             raise ValueError(f"Missing required field in ticker response: {e}") from e
@@ -37,11 +46,17 @@ class RedisTicker:
             raise ValueError(f"Invalid rate data: {e}") from e
 
     def to_dict(self) -> dict:
-        return {
+        data = {
             "symbol": str(self.symbol),
             "rate": str(self.rate),
             "timestamp": self.timestamp.isoformat(),
         }
 
+        if self.base_currency and self.quote_currency:
+            data["base_currency"] = self.base_currency
+            data["quote_currency"] = self.quote_currency
+
+        return data
+
     def __str__(self) -> str:
         return f"{self.symbol}: {self.rate}"
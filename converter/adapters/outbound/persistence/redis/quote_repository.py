@@ -1,5 +1,4 @@
-import json
-from typing import Optional
+from typing import Iterable, Optional
 
 import redis.asyncio as redis
 
@@ -11,8 +10,14 @@ from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
 from converter.shared.observability import get_metrics_registry
 
+from .codec import JsonTickerCodec, TickerCodec
+from .keys import (
+    LATEST_QUOTE_KEY_PREFIX,
+    QUOTE_SNAPSHOT_KEY,
+    latest_quote_key,
+    quote_history_key,
+)
 from .mapper import RedisMapper
-from .models import RedisTicker
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -25,15 +30,31 @@ class RedisQuoteRepository(QuoteRepository):
         self,
         redis_client: redis.Redis,
         rate_factory: RateFactory,
+        layout: str = "keys",
+        codec: Optional[TickerCodec] = None,
+        scan_batch_size: int = 1000,
     ):
+        """
+        :param layout: Must match the writer's, "keys" or "hash"
+        :param codec: Reads every known value format, whichever one is given
+        :param scan_batch_size: Keys per SCAN/MGET round-trip in `get_tracked_pairs`
+        """
         self._redis = redis_client
         self._mapper = RedisMapper(rate_factory)
+        self._layout = layout
+        self._codec = codec or JsonTickerCodec()
+        self._scan_batch_size = scan_batch_size
 
     async def get_latest(self, pair: Pair) -> Optional[Quote]:
         key = self._make_key(pair)
 
         try:
-            data = await self._redis.get(key)
+            if self._layout == "hash":
+                data = await self._redis.hget(  # type: ignore [misc]
+                    QUOTE_SNAPSHOT_KEY, pair.code()
+                )
+            else:
+                data = await self._redis.get(key)
 
             if not data:
                 logger.debug("redis_cache_miss", key=key)
@@ -44,8 +65,7 @@ class RedisQuoteRepository(QuoteRepository):
 
                 return None
 
-            payload = json.loads(data)
-            ticker = RedisTicker.from_dict(payload)
+            ticker = self._codec.decode(data)
             quote = self._mapper.map_ticker_to_quote(ticker=ticker, pair=pair)
 
             logger.debug("redis_cache_hit", key=key)
@@ -60,17 +80,138 @@ class RedisQuoteRepository(QuoteRepository):
             logger.warning("redis_get_failed", key=key, error=str(e))
             return None
 
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        unique_pairs = list(dict.fromkeys(pairs))
+
+        if not unique_pairs:
+            return {}
+
+        try:
+            if self._layout == "hash":
+                values = await self._redis.hmget(  # type: ignore [misc]
+                    QUOTE_SNAPSHOT_KEY, [pair.code() for pair in unique_pairs]
+                )
+            else:
+                values = await self._redis.mget(
+                    [self._make_key(pair) for pair in unique_pairs]
+                )
+        except Exception as e:
+            logger.warning(
+                "redis_mget_failed", key_count=len(unique_pairs), error=str(e)
+            )
+            return {}
+
+        quotes: dict[Pair, Quote] = {}
+
+        for pair, data in zip(unique_pairs, values):
+            if not data:
+                continue
+
+            try:
+                ticker = self._codec.decode(data)
+                quotes[pair] = self._mapper.map_ticker_to_quote(
+                    ticker=ticker, pair=pair
+                )
+            except ValueError as e:
+                logger.warning("redis_entry_invalid", pair=str(pair), error=str(e))
+
+        logger.debug("redis_cache_mget", requested=len(unique_pairs), found=len(quotes))
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.cache_hits_total.labels(cache_type="redis").inc(len(quotes))
+            metrics.cache_misses_total.labels(cache_type="redis").inc(
+                len(unique_pairs) - len(quotes)
+            )
+
+        return quotes
+
     async def get_latest_before(
         self, pair: Pair, timestamp: TimestampUTC
     ) -> Optional[Quote]:
-        """Historical queries are not supported by this repo"""
-        logger.debug(
-            "redis_historical_query_unsupported",
-            pair=str(pair),
-            timestamp=str(timestamp),
-        )
-        return None
-
-    @staticmethod
-    def _make_key(pair: Pair) -> str:
-        return f"quote:latest:{pair}"
+        """
+        Served from the per-pair history, which only covers the writer's window.
+        Anything older is a miss.
+        """
+        key = quote_history_key(pair.code())
+
+        try:
+            entries = await self._redis.zrevrangebyscore(
+                key, max=timestamp.value.timestamp(), min="-inf", start=0, num=1
+            )
+
+            if not entries:
+                logger.debug("redis_history_miss", key=key, timestamp=str(timestamp))
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.cache_misses_total.labels(cache_type="redis_history").inc()
+
+                return None
+
+            ticker = self._codec.decode(entries[0])
+            quote = self._mapper.map_ticker_to_quote(ticker=ticker, pair=pair)
+
+            logger.debug("redis_history_hit", key=key, timestamp=str(timestamp))
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.cache_hits_total.labels(cache_type="redis_history").inc()
+
+            return quote
+
+        except Exception as e:
+            logger.warning("redis_history_get_failed", key=key, error=str(e))
+            return None
+
+    async def get_tracked_pairs(self) -> list[Pair]:
+        """
+        Pairs that currently have a latest quote, expired ones drop out with their TTL.
+
+        :raises redis.RedisError: Unlike the lookups, failures aren't swallowed,
+            so callers can tell an empty cache from an unreachable one
+        """
+        if self._layout == "hash":
+            entries = await self._redis.hgetall(QUOTE_SNAPSHOT_KEY)  # type: ignore [misc]
+            return self._decode_pairs(entries.values())
+
+        keys: list[bytes] = [
+            key
+            async for key in self._redis.scan_iter(
+                match=f"{LATEST_QUOTE_KEY_PREFIX}*", count=self._scan_batch_size
+            )
+        ]
+
+        pairs: list[Pair] = []
+
+        for offset in range(0, len(keys), self._scan_batch_size):
+            chunk = keys[offset : offset + self._scan_batch_size]
+            pairs.extend(self._decode_pairs(await self._redis.mget(chunk)))
+
+        return pairs
+
+    def _decode_pairs(self, values: Iterable[Optional[bytes]]) -> list[Pair]:
+        pairs: list[Pair] = []
+
+        for value in values:
+            if not value:
+                continue
+
+            try:
+                quote = self._mapper.map_self_describing_ticker(
+                    self._codec.decode(value)
+                )
+            except ValueError as e:
+                logger.debug("redis_entry_skipped", error=str(e))
+                continue
+
+            if quote is not None:
+                pairs.append(quote.pair)
+
+        return pairs
+
+    def _make_key(self, pair: Pair) -> str:
+        if self._layout == "hash":
+            return f"{QUOTE_SNAPSHOT_KEY}[{pair.code()}]"
+
+        return latest_quote_key(pair.code())
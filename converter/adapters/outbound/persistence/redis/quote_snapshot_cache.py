@@ -0,0 +1,267 @@
+import asyncio
+import time
+from typing import Iterable, Optional
+
+import redis.asyncio as redis
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.values import Pair, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .codec import JsonTickerCodec, TickerCodec
+from .keys import (
+    LATEST_QUOTE_KEY_PREFIX,
+    QUOTE_GENERATION_CHANNEL,
+    QUOTE_SNAPSHOT_KEY,
+)
+from .mapper import RedisMapper
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class RedisQuoteSnapshotCache(QuoteRepository):
+    """
+    Per-process (L1) snapshot of all latest quotes.
+
+    The whole snapshot is reloaded from Redis every time the writer announces
+    a new generation, so `get_latest` is served from memory without a round-trip.
+    Anything the snapshot can't answer goes to the fallback repository.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        rate_factory: RateFactory,
+        fallback: QuoteRepository,
+        max_staleness_seconds: float = 45.0,
+        scan_batch_size: int = 1000,
+        layout: str = "keys",
+        codec: Optional[TickerCodec] = None,
+    ):
+        self._redis = redis_client
+        self._mapper = RedisMapper(rate_factory)
+        self._fallback = fallback
+        self._max_staleness = max_staleness_seconds
+        self._scan_batch_size = scan_batch_size
+        self._layout = layout
+        self._codec = codec or JsonTickerCodec()
+
+        self._snapshot: dict[str, Quote] = {}
+        self._generation: Optional[int] = None
+        self._refreshed_at: Optional[float] = None
+
+        self._refresh_lock = asyncio.Lock()
+        self._listener_task: Optional[asyncio.Task] = None
+
+    @property
+    def generation(self) -> Optional[int]:
+        return self._generation
+
+    async def start(self) -> None:
+        if self._listener_task is not None:
+            return
+
+        await self.refresh()
+
+        self._listener_task = asyncio.create_task(
+            self._listen(), name="quote_snapshot_listener"
+        )
+        logger.info("quote_snapshot_cache_started", size=len(self._snapshot))
+
+    async def stop(self) -> None:
+        if self._listener_task is None:
+            return
+
+        self._listener_task.cancel()
+        await asyncio.gather(self._listener_task, return_exceptions=True)
+        self._listener_task = None
+
+        logger.info("quote_snapshot_cache_stopped")
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        if self.is_stale():
+            self._record_lookup("miss")
+            logger.debug("l1_cache_stale", pair=str(pair))
+            return await self._fallback.get_latest(pair)
+
+        quote = self._snapshot.get(pair.code())
+
+        if quote is not None:
+            self._record_lookup("hit")
+            return quote
+
+        self._record_lookup("miss")
+        return await self._fallback.get_latest(pair)
+
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        unique_pairs = list(dict.fromkeys(pairs))
+
+        if self.is_stale():
+            self._record_lookup("miss", len(unique_pairs))
+            return await self._fallback.get_latest_many(unique_pairs)
+
+        quotes: dict[Pair, Quote] = {}
+        missing: list[Pair] = []
+
+        for pair in unique_pairs:
+            quote = self._snapshot.get(pair.code())
+
+            if quote is not None:
+                quotes[pair] = quote
+            else:
+                missing.append(pair)
+
+        self._record_lookup("hit", len(quotes))
+        self._record_lookup("miss", len(missing))
+
+        if missing:
+            quotes.update(await self._fallback.get_latest_many(missing))
+
+        return quotes
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        return await self._fallback.get_latest_before(pair, timestamp)
+
+    def is_stale(self) -> bool:
+        if self._refreshed_at is None:
+            return True
+
+        return time.monotonic() - self._refreshed_at > self._max_staleness
+
+    async def refresh(self, generation: Optional[int] = None) -> None:
+        """
+        Reload the full snapshot from Redis and swap it in at once.
+        Failures keep the previous snapshot, which then ages into staleness.
+        """
+        async with self._refresh_lock:
+            start_time = time.time()
+
+            try:
+                snapshot = await self._load_snapshot()
+            except Exception as e:
+                logger.warning("l1_cache_refresh_failed", error=str(e))
+                return
+
+            self._snapshot = snapshot
+            self._refreshed_at = time.monotonic()
+
+            if generation is not None:
+                self._generation = generation
+
+            duration = time.time() - start_time
+
+            logger.debug(
+                "l1_cache_refreshed",
+                size=len(snapshot),
+                generation=self._generation,
+                duration_ms=round(duration * 1000, 2),
+            )
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.cache_snapshot_entries.labels(cache_type="l1").set(
+                    len(snapshot)
+                )
+                metrics.cache_snapshot_refreshed_timestamp_seconds.labels(
+                    cache_type="l1"
+                ).set(time.time())
+
+    async def _load_snapshot(self) -> dict[str, Quote]:
+        if self._layout == "hash":
+            entries = await self._redis.hgetall(QUOTE_SNAPSHOT_KEY)  # type: ignore [misc]
+            return self._decode_all(entries.values())
+
+        keys: list[bytes] = [
+            key
+            async for key in self._redis.scan_iter(
+                match=f"{LATEST_QUOTE_KEY_PREFIX}*", count=self._scan_batch_size
+            )
+        ]
+
+        snapshot: dict[str, Quote] = {}
+
+        for offset in range(0, len(keys), self._scan_batch_size):
+            chunk = keys[offset : offset + self._scan_batch_size]
+            snapshot.update(self._decode_all(await self._redis.mget(chunk)))
+
+        return snapshot
+
+    def _decode_all(self, values: Iterable[Optional[bytes]]) -> dict[str, Quote]:
+        snapshot: dict[str, Quote] = {}
+
+        for value in values:
+            if not value:
+                continue
+
+            quote = self._decode(value)
+
+            if quote is not None:
+                snapshot[quote.pair.code()] = quote
+
+        return snapshot
+
+    def _decode(self, value: bytes) -> Optional[Quote]:
+        try:
+            ticker = self._codec.decode(value)
+            return self._mapper.map_self_describing_ticker(ticker)
+        except ValueError as e:
+            logger.debug("l1_cache_entry_skipped", error=str(e))
+            return None
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(QUOTE_GENERATION_CHANNEL)
+
+                    # Anything published while we weren't subscribed is lost
+                    await self.refresh()
+                    backoff = 1.0
+
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1.0
+                        )
+
+                        if message is not None:
+                            await self.refresh(self._parse_generation(message))
+                        elif self.is_stale():
+                            await self.refresh()
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                logger.warning(
+                    "l1_cache_listener_failed", error=str(e), retry_in_seconds=backoff
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    @staticmethod
+    def _parse_generation(message: dict) -> Optional[int]:
+        try:
+            return int(message["data"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _record_lookup(outcome: str, count: int = 1) -> None:
+        if not settings.ENABLE_METRICS or count == 0:
+            return
+
+        metrics = get_metrics_registry()
+
+        if outcome == "hit":
+            metrics.cache_hits_total.labels(cache_type="l1").inc(count)
+        else:
+            metrics.cache_misses_total.labels(cache_type="l1").inc(count)
@@ -1,4 +1,5 @@
-import json
+import time
+from typing import Optional
 
 import redis.asyncio as redis
 
@@ -9,6 +10,15 @@ from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
 from converter.shared.observability import get_metrics_registry
 
+from .codec import JsonTickerCodec, TickerCodec
+from .keys import (
+    QUOTE_GENERATION_CHANNEL,
+    QUOTE_GENERATION_KEY,
+    QUOTE_SNAPSHOT_KEY,
+    QUOTE_SNAPSHOT_STAGING_KEY,
+    latest_quote_key,
+    quote_history_key,
+)
 from .mapper import RedisMapper
 
 logger = get_logger(__name__)
@@ -21,10 +31,27 @@ class RedisQuoteWriter(QuoteWriter):
         redis_client: redis.Redis,
         rate_factory: RateFactory,
         ttl_seconds: int = 60,
+        history_window_seconds: int = 0,
+        layout: str = "keys",
+        codec: Optional[TickerCodec] = None,
     ):
+        """
+        :param history_window_seconds: How far back per-pair history is kept
+                                       for historical lookups (0 disables it)
+        :param layout: "keys" for a key per pair, "hash" for a single snapshot hash.
+                       With "hash" the writer keeps the snapshot in memory,
+                       so it must be a single shared instance.
+        :param codec: Value format, JSON by default
+        """
         self._redis = redis_client
         self._mapper = RedisMapper(rate_factory)
         self._ttl = ttl_seconds
+        self._history_window = history_window_seconds
+        self._layout = layout
+        self._codec = codec or JsonTickerCodec()
+
+        # symbol -> (written at, payload), rewritten as a whole every batch
+        self._snapshot: Optional[dict[str, tuple[float, bytes]]] = None
 
     async def save_batch(self, quotes: list[Quote]) -> None:
         if not quotes:
@@ -48,23 +75,53 @@ class RedisQuoteWriter(QuoteWriter):
             return
 
         try:
-            async with self._redis.pipeline(transaction=False) as pipe:
-                for quote in quotes:
-                    key = self._make_key(quote)
-                    payload = self._mapper.map_quote_to_ticker(quote).to_dict()
+            payloads = [
+                self._codec.encode(self._mapper.map_quote_to_ticker(quote))
+                for quote in quotes
+            ]
+
+            if self._layout == "hash" and self._snapshot is None:
+                self._snapshot = await self._load_snapshot()
+
+            # MULTI for the hash layout: the swap and generation bump land together
+            async with self._redis.pipeline(transaction=self._layout == "hash") as pipe:
+                if self._layout == "hash":
+                    await self._swap_snapshot(pipe, quotes, payloads)
+                else:
+                    for quote, payload in zip(quotes, payloads):
+                        await pipe.setex(self._make_key(quote), self._ttl, payload)
+
+                if self._history_window > 0:
+                    for quote, payload in zip(quotes, payloads):
+                        await self._append_history(pipe, quote, payload)
+
+                await pipe.incr(QUOTE_GENERATION_KEY)
+
+                results = await pipe.execute()
 
-                    await pipe.setex(key, self._ttl, json.dumps(payload))
+            generation = int(results[-1])
 
-                await pipe.execute()
+            # Lets in-process snapshot caches know there's a new batch to pick up
+            await self._redis.publish(QUOTE_GENERATION_CHANNEL, generation)
 
             logger.debug(
-                "redis_batch_cached", quote_count=len(quotes), ttl_seconds=self._ttl
+                "redis_batch_cached",
+                quote_count=len(quotes),
+                ttl_seconds=self._ttl,
+                layout=self._layout,
+                generation=generation,
             )
 
             if settings.ENABLE_METRICS:
                 metrics = get_metrics_registry()
                 metrics.quotes_stored_total.labels(storage="redis").inc(len(quotes))
 
+                # Servable from here on, latest lookups only read Redis
+                newest = max(quotes, key=lambda quote: quote.timestamp.value)
+                metrics.quote_servable_latency_seconds.observe(
+                    newest.timestamp.age_seconds()
+                )
+
         except Exception as e:
             # Yep, we're silencing them.
             # It's just a cache layer anyway, it's fine if it fails.
@@ -75,6 +132,68 @@ class RedisQuoteWriter(QuoteWriter):
                 exc_info=True,
             )
 
+    async def _swap_snapshot(
+        self, pipe: redis.client.Pipeline, quotes: list[Quote], payloads: list[bytes]
+    ) -> None:
+        snapshot = self._snapshot if self._snapshot is not None else {}
+        now = time.monotonic()
+
+        for quote, payload in zip(quotes, payloads):
+            snapshot[quote.pair.code()] = (now, payload)
+
+        # Pairs that stop coming drop out after the TTL, as their own keys would
+        expired_before = now - self._ttl
+
+        for symbol in [s for s, (ts, _) in snapshot.items() if ts < expired_before]:
+            del snapshot[symbol]
+
+        self._snapshot = snapshot
+
+        if not snapshot:
+            await pipe.delete(QUOTE_SNAPSHOT_KEY)
+            return
+
+        await pipe.delete(QUOTE_SNAPSHOT_STAGING_KEY)
+        await pipe.hset(  # type: ignore [misc]
+            QUOTE_SNAPSHOT_STAGING_KEY,
+            mapping={symbol: payload for symbol, (_, payload) in snapshot.items()},
+        )
+        await pipe.expire(QUOTE_SNAPSHOT_STAGING_KEY, self._ttl)
+        await pipe.rename(QUOTE_SNAPSHOT_STAGING_KEY, QUOTE_SNAPSHOT_KEY)
+
+    async def _load_snapshot(self) -> dict[str, tuple[float, bytes]]:
+        """
+        Seed the in-memory snapshot from whatever the previous writer left,
+        so a partial first batch doesn't wipe the other pairs.
+        """
+        entries = await self._redis.hgetall(QUOTE_SNAPSHOT_KEY)  # type: ignore [misc]
+        now = time.monotonic()
+
+        return {
+            self._as_str(field): (now, self._as_bytes(value))
+            for field, value in entries.items()
+        }
+
+    @staticmethod
+    def _as_str(value: bytes | str) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    @staticmethod
+    def _as_bytes(value: bytes | str) -> bytes:
+        return value.encode() if isinstance(value, str) else value
+
+    async def _append_history(
+        self, pipe: redis.client.Pipeline, quote: Quote, payload: bytes
+    ) -> None:
+        key = quote_history_key(quote.pair.code())
+        score = quote.timestamp.value.timestamp()
+
+        # Payload carries the timestamp, so re-sending a quote doesn't duplicate it
+        await pipe.zadd(key, {payload: score})
+        await pipe.zremrangebyscore(key, "-inf", f"({score - self._history_window}")
+        # Pairs that stop trading don't leave their history behind forever
+        await pipe.expire(key, self._history_window + self._ttl)
+
     @staticmethod
     def _make_key(quote: Quote) -> str:
-        return f"quote:latest:{quote.pair}"
+        return latest_quote_key(quote.pair.code())
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Optional
+
+from converter.domain.services import RouteIndex
+from converter.shared.logging import get_logger
+
+from .quote_repository import RedisQuoteRepository
+
+logger = get_logger(__name__)
+
+
+class RouteIndexRefresher:
+    """
+    Keeps the route index in line with the pairs that have a quote in Redis.
+
+    Runs on its own interval, so cross-rate routing works whether or not
+    the L1 snapshot cache is enabled. Failed refreshes keep the previous index.
+    """
+
+    def __init__(
+        self,
+        repository: RedisQuoteRepository,
+        route_index: RouteIndex,
+        interval_seconds: float = 30.0,
+    ):
+        self._repository = repository
+        self._route_index = route_index
+        self._interval = interval_seconds
+
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.refresh()
+
+        self._task = asyncio.create_task(self._run(), name="route_index_refresher")
+        logger.info(
+            "route_index_refresher_started",
+            pair_count=self._route_index.size,
+            interval_seconds=self._interval,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        logger.info("route_index_refresher_stopped")
+
+    async def refresh(self) -> bool:
+        """
+        :return: Whether the index changed
+        """
+        try:
+            pairs = await self._repository.get_tracked_pairs()
+        except Exception as e:
+            logger.warning("route_index_refresh_failed", error=str(e))
+            return False
+
+        if not self._route_index.rebuild(pairs):
+            return False
+
+        logger.info("route_index_rebuilt", pair_count=self._route_index.size)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.refresh()
@@ -0,0 +1,105 @@
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.values import Rate, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class ChangeDetectingQuoteWriter(QuoteWriter):
+    """
+    Forwards only quotes whose rate moved since the last successful write.
+
+    An unchanged quote is skipped only while the next tick, `interval_seconds`
+    later, would still land within `max_gap_seconds` of its last written row
+    (by quote time). Set to the freshness window, historical lookups keep
+    finding a row within it. `heartbeat_seconds` caps the gap further.
+
+    Only history is deduplicated: the quotes skipped are handed to `latest`,
+    so the latest price keeps moving forward in time.
+
+    Keeps state between batches, so it must be a single shared instance.
+    """
+
+    def __init__(
+        self,
+        inner: QuoteWriter,
+        heartbeat_seconds: int = 300,
+        max_gap_seconds: float = 60.0,
+        interval_seconds: float = 30.0,
+        storage: str = "postgres",
+        latest: Optional[QuoteWriter] = None,
+    ):
+        """
+        :param heartbeat_seconds: Write unchanged quotes at least this often
+                                  (0 writes every quote, i.e. no change detection)
+        :param max_gap_seconds: Longest two rows of an unchanged quote may be apart
+        :param interval_seconds: Time between two batches of the rate source
+        :param storage: Label for the skipped-quotes metric
+        :param latest: Takes the skipped quotes, to keep the latest price current
+        """
+        self._inner = inner
+        self._latest = latest
+        self._heartbeat = heartbeat_seconds
+        self._max_gap = max_gap_seconds
+        self._interval = interval_seconds
+        self._storage = storage
+
+        # symbol -> (rate, timestamp) of the last row written
+        self._last_written: dict[str, tuple[Rate, TimestampUTC]] = {}
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        changed: list[Quote] = []
+        unchanged: list[Quote] = []
+
+        for quote in quotes:
+            (changed if self._should_write(quote) else unchanged).append(quote)
+
+        skipped = len(unchanged)
+
+        if changed:
+            await self._inner.save_batch(changed)
+
+        if unchanged and self._latest is not None:
+            await self._latest.save_batch(unchanged)
+
+        # Only after a successful write, a failed batch must be retried in full
+        for quote in changed:
+            self._last_written[quote.pair.code()] = (quote.rate, quote.timestamp)
+
+        logger.debug(
+            "unchanged_quotes_skipped",
+            storage=self._storage,
+            written=len(changed),
+            skipped=skipped,
+        )
+
+        if settings.ENABLE_METRICS and skipped:
+            metrics = get_metrics_registry()
+            metrics.quotes_unchanged_skipped_total.labels(storage=self._storage).inc(
+                skipped
+            )
+
+    def _should_write(self, quote: Quote) -> bool:
+        last = self._last_written.get(quote.pair.code())
+
+        if last is None or self._heartbeat <= 0:
+            return True
+
+        rate, timestamp = last
+
+        if quote.rate.value != rate.value:
+            return True
+
+        elapsed = (quote.timestamp.value - timestamp.value).total_seconds()
+
+        if elapsed >= self._heartbeat:
+            return True
+
+        # Skipped now, the next row comes a tick later at the earliest
+        return elapsed + self._interval > self._max_gap
@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.values import Pair, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+LookupKey = tuple[Pair, Optional[TimestampUTC]]
+
+
+class CoalescingQuoteRepository(QuoteRepository):
+    """
+    Single-flight decorator: concurrent lookups of the same
+    (pair, timestamp-or-latest) share one call to the inner repository.
+
+    Must be a single shared instance to be of any use.
+    """
+
+    def __init__(self, inner: QuoteRepository):
+        self._inner = inner
+        self._in_flight: dict[LookupKey, asyncio.Future[Optional[Quote]]] = {}
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        return await self._coalesce(
+            (pair, None), partial(self._inner.get_latest, pair), "get_latest"
+        )
+
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        waiting: dict[Pair, asyncio.Future[Optional[Quote]]] = {}
+        missing: list[Pair] = []
+
+        for pair in dict.fromkeys(pairs):
+            future = self._in_flight.get((pair, None))
+
+            if future is not None:
+                waiting[pair] = future
+            else:
+                missing.append(pair)
+
+        self._record_coalesced("get_latest_many", len(waiting))
+
+        if missing:
+            waiting.update(self._start_batch(missing))
+
+        results = await asyncio.shield(asyncio.gather(*waiting.values()))
+
+        return {
+            pair: quote
+            for pair, quote in zip(waiting, results, strict=True)
+            if quote is not None
+        }
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        return await self._coalesce(
+            (pair, timestamp),
+            partial(self._inner.get_latest_before, pair, timestamp),
+            "get_latest_before",
+        )
+
+    async def _coalesce(
+        self,
+        key: LookupKey,
+        fetch: Callable[[], Awaitable[Optional[Quote]]],
+        operation: str,
+    ) -> Optional[Quote]:
+        future = self._in_flight.get(key)
+
+        if future is not None:
+            self._record_coalesced(operation)
+        else:
+            future = asyncio.ensure_future(fetch())
+            self._track(key, future)
+
+        # A cancelled caller must not cancel the lookup the others are waiting on
+        return await asyncio.shield(future)
+
+    def _start_batch(
+        self, pairs: list[Pair]
+    ) -> dict[Pair, asyncio.Future[Optional[Quote]]]:
+        loop = asyncio.get_running_loop()
+        futures: dict[Pair, asyncio.Future[Optional[Quote]]] = {}
+
+        for pair in pairs:
+            future: asyncio.Future[Optional[Quote]] = loop.create_future()
+            self._track((pair, None), future)
+            futures[pair] = future
+
+        batch = asyncio.ensure_future(self._inner.get_latest_many(pairs))
+        batch.add_done_callback(partial(self._resolve_batch, futures))
+
+        return futures
+
+    def _track(self, key: LookupKey, future: asyncio.Future[Optional[Quote]]) -> None:
+        self._in_flight[key] = future
+        future.add_done_callback(partial(self._forget, key))
+
+    def _forget(self, key: LookupKey, future: asyncio.Future[Optional[Quote]]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+        # Every caller may have been cancelled, don't let the error go unobserved
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug("coalesced_lookup_failed", error=str(future.exception()))
+
+    @staticmethod
+    def _resolve_batch(
+        futures: dict[Pair, asyncio.Future[Optional[Quote]]],
+        batch: asyncio.Future[dict[Pair, Quote]],
+    ) -> None:
+        error = None if batch.cancelled() else batch.exception()
+
+        for pair, future in futures.items():
+            if future.done():
+                continue
+
+            if batch.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch.result().get(pair))
+
+    @staticmethod
+    def _record_coalesced(operation: str, count: int = 1) -> None:
+        if not settings.ENABLE_METRICS or count == 0:
+            return
+
+        metrics = get_metrics_registry()
+        metrics.quote_lookups_coalesced_total.labels(operation=operation).inc(count)
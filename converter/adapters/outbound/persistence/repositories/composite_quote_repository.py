@@ -6,9 +6,19 @@ from converter.domain.values import Pair, TimestampUTC
 
 
 class CompositeQuoteRepository(QuoteRepository):
-    def __init__(self, primary: QuoteRepository, fallback: QuoteRepository):
+    def __init__(
+        self,
+        primary: QuoteRepository,
+        fallback: QuoteRepository,
+        primary_history_window_seconds: int = 0,
+    ):
+        """
+        :param primary_history_window_seconds: How far back the primary can answer
+                                               historical lookups (0 means it can't)
+        """
         self._primary = primary
         self._fallback = fallback
+        self._primary_history_window = primary_history_window_seconds
 
     async def get_latest(self, pair: Pair) -> Optional[Quote]:
         quote = await self._primary.get_latest(pair)
@@ -18,7 +28,29 @@ class CompositeQuoteRepository(QuoteRepository):
 
         return await self._fallback.get_latest(pair)
 
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        quotes = await self._primary.get_latest_many(pairs)
+
+        missing = [pair for pair in dict.fromkeys(pairs) if pair not in quotes]
+
+        if missing:
+            quotes.update(await self._fallback.get_latest_many(missing))
+
+        return quotes
+
     async def get_latest_before(
         self, pair: Pair, timestamp: TimestampUTC
     ) -> Optional[Quote]:
+        if self._in_primary_history(timestamp):
+            quote = await self._primary.get_latest_before(pair, timestamp)
+
+            if quote:
+                return quote
+
         return await self._fallback.get_latest_before(pair, timestamp)
+
+    def _in_primary_history(self, timestamp: TimestampUTC) -> bool:
+        if self._primary_history_window <= 0:
+            return False
+
+        return timestamp.age_seconds() < self._primary_history_window
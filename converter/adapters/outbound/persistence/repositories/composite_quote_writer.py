@@ -13,9 +13,14 @@ class CompositeQuoteWriter(QuoteWriter):
         self,
         primary: QuoteWriter,
         secondary: QuoteWriter,
+        secondary_storage: str = "redis",
     ):
+        """
+        :param secondary_storage: Storage label of the secondary in error metrics
+        """
         self._primary = primary
         self._secondary = secondary
+        self._secondary_storage = secondary_storage
 
     async def save_batch(self, quotes: list[Quote]) -> None:
         await self._primary.save_batch(quotes)
@@ -25,6 +30,7 @@ class CompositeQuoteWriter(QuoteWriter):
         except Exception as e:
             logger.error(
                 "secondary_writer_failed",
+                storage=self._secondary_storage,
                 error=str(e),
                 quote_count=len(quotes),
                 exc_info=True,
@@ -35,6 +41,6 @@ class CompositeQuoteWriter(QuoteWriter):
             # But I don't have enough time to do that.
             if settings.ENABLE_METRICS:
                 metrics = get_metrics_registry()
-                metrics.quotes_stored_total.labels(storage="redis", status="error").inc(
-                    len(quotes)
-                )
+                metrics.quotes_store_failed_total.labels(
+                    storage=self._secondary_storage
+                ).inc(len(quotes))
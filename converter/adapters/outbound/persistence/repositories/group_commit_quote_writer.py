@@ -0,0 +1,185 @@
+import asyncio
+import time
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class GroupCommitQuoteWriter(QuoteWriter):
+    """
+    Collects batches from concurrent callers and hands them to the inner writer
+    together, so they share one transaction and one commit.
+
+    A group is flushed `max_delay_ms` after its first batch arrived, or as soon as
+    it holds `max_rows` quotes or `max_batches` batches. Groups are flushed one
+    at a time, in order, and whatever arrives during a flush goes into the next one.
+
+    Every caller still gets the outcome of its own batch. When a group fails,
+    its batches are retried one by one, so one bad batch doesn't fail the rest.
+
+    Holds batches not yet committed, so it must be a single shared instance
+    and be closed on shutdown.
+    """
+
+    def __init__(
+        self,
+        inner: QuoteWriter,
+        max_delay_ms: int = 50,
+        max_rows: int = 20000,
+        max_batches: Optional[int] = None,
+        storage: str = "postgres",
+    ):
+        """
+        :param max_delay_ms: Longest a batch waits for others to join its group
+        :param max_rows: Flush a group as soon as it holds this many quotes
+        :param max_batches: Most callers writing at once. Once they've all joined,
+            nobody else can, so the group is flushed without waiting out the delay
+        :param storage: Storage label in metrics
+        """
+        self._inner = inner
+        self._max_delay = max_delay_ms / 1000
+        self._max_rows = max_rows
+        self._max_batches = max_batches
+        self._storage = storage
+
+        # (batch, caller's future, enqueued at)
+        self._pending: list[tuple[list[Quote], asyncio.Future[None], float]] = []
+        self._pending_rows = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Flushes take turns in the order they were started
+        self._flush_lock = asyncio.Lock()
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if not quotes:
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        self._pending.append((quotes, future, time.perf_counter()))
+        self._pending_rows += len(quotes)
+
+        if self._pending_rows >= self._max_rows or self._is_full():
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._start_flush)
+
+        # A cancelled caller doesn't take its batch out of the group
+        await asyncio.shield(future)
+
+    async def close(self, timeout_seconds: float = 10.0) -> None:
+        """
+        Flushes the open group and waits up to `timeout_seconds` for every flush.
+        """
+        self._start_flush()
+
+        if not self._flushes:
+            return
+
+        _, pending = await asyncio.wait(set(self._flushes), timeout=timeout_seconds)
+
+        if pending:
+            logger.warning(
+                "group_commit_flush_abandoned",
+                storage=self._storage,
+                flushes=len(pending),
+            )
+
+    def _is_full(self) -> bool:
+        return self._max_batches is not None and len(self._pending) >= self._max_batches
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        group, self._pending, self._pending_rows = self._pending, [], 0
+
+        task = asyncio.create_task(self._flush(group), name="group_commit_flush")
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self, group: list[tuple[list[Quote], asyncio.Future[None], float]]
+    ) -> None:
+        async with self._flush_lock:
+            quotes = [quote for batch, _, _ in group for quote in batch]
+            start_time = time.perf_counter()
+
+            try:
+                await self._inner.save_batch(quotes)
+
+            except Exception as e:
+                if len(group) == 1:
+                    self._resolve(group[0][1], e)
+                    return
+
+                logger.warning(
+                    "group_commit_failed_retrying_batches",
+                    storage=self._storage,
+                    batch_count=len(group),
+                    error=str(e),
+                )
+
+                for batch, future, _ in group:
+                    try:
+                        await self._inner.save_batch(batch)
+                        self._resolve(future)
+                    except Exception as batch_error:
+                        self._resolve(future, batch_error)
+
+                return
+
+            flushed_at = time.perf_counter()
+
+            for _, future, _ in group:
+                self._resolve(future)
+
+            logger.debug(
+                "group_committed",
+                storage=self._storage,
+                batch_count=len(group),
+                quote_count=len(quotes),
+                duration_ms=round((flushed_at - start_time) * 1000, 2),
+            )
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.group_commit_batches.labels(storage=self._storage).observe(
+                    len(group)
+                )
+                metrics.group_commit_rows.labels(storage=self._storage).observe(
+                    len(quotes)
+                )
+                metrics.group_commit_duration_seconds.labels(
+                    storage=self._storage
+                ).observe(flushed_at - start_time)
+
+                for _, _, enqueued_at in group:
+                    metrics.group_commit_latency_seconds.labels(
+                        storage=self._storage
+                    ).observe(flushed_at - enqueued_at)
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future[None], error: Optional[Exception] = None
+    ) -> None:
+        if future.done():
+            return
+
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
@@ -0,0 +1,99 @@
+from typing import Optional
+
+from converter.app.ports.outbound.candle_repository import CandleRepository
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Pair, Resolution, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class RollupQuoteRepository(QuoteRepository):
+    """
+    Answers historical lookups older than the raw retention from the OHLC
+    rollups, using the coarsest resolution that still fits the freshness window.
+
+    Within the retention raw quotes are read first: a candle only knows its open
+    and close, so for a time inside its bucket it answers with the open, up to
+    a bucket older than the raw row. Rollups answer there only when raw quotes
+    have nothing, and raw quotes answer beyond it when no resolution fits
+    or the rollups have nothing (e.g. history from before they were introduced).
+
+    Latest lookups go straight to the inner repository.
+    """
+
+    def __init__(
+        self,
+        inner: QuoteRepository,
+        candle_repository: CandleRepository,
+        freshness_policy: Optional[FreshnessPolicy] = None,
+        raw_retention_days: int = 7,
+    ):
+        """
+        :param raw_retention_days: How long raw quotes are kept in the inner repository
+        """
+        self._inner = inner
+        self._raw_retention_seconds = raw_retention_days * 86400
+        self._candles = candle_repository
+        self._freshness_policy = freshness_policy or FreshnessPolicy()
+        self._resolution = Resolution.coarsest_within(
+            self._freshness_policy.max_age_seconds
+        )
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        return await self._inner.get_latest(pair)
+
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        return await self._inner.get_latest_many(pairs)
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        if timestamp.age_seconds() < self._raw_retention_seconds:
+            quote = await self._inner.get_latest_before(pair, timestamp)
+
+            if quote is not None or self._resolution is None:
+                self._record_lookup("raw")
+                return quote
+
+            quote = await self._from_candles(pair, timestamp, self._resolution)
+            self._record_lookup(self._resolution.label)
+            return quote
+
+        if self._resolution is not None:
+            quote = await self._from_candles(pair, timestamp, self._resolution)
+
+            if quote is not None:
+                self._record_lookup(self._resolution.label)
+                return quote
+
+        self._record_lookup("raw")
+        return await self._inner.get_latest_before(pair, timestamp)
+
+    async def _from_candles(
+        self, pair: Pair, timestamp: TimestampUTC, resolution: Resolution
+    ) -> Optional[Quote]:
+        oldest = self._freshness_policy.oldest_acceptable(timestamp)
+
+        candles = await self._candles.get_candles(
+            pair, resolution, resolution.bucket_start(oldest), timestamp
+        )
+
+        for candle in reversed(candles):
+            quote = candle.latest_quote_before(timestamp)
+
+            if quote is not None:
+                return quote
+
+        return None
+
+    @staticmethod
+    def _record_lookup(resolution: str) -> None:
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.historical_lookups_total.labels(resolution=resolution).inc()
@@ -0,0 +1,122 @@
+import asyncio
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services import CrossRateService, RouteIndex
+from converter.domain.values import Pair, Route, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class RoutingQuoteRepository(QuoteRepository):
+    """
+    Resolves pairs that aren't listed directly (USDT->BTC, SOL->EUR)
+    through the route index and composes their rate from the legs.
+
+    Listed pairs, and anything the index doesn't know about,
+    go straight to the inner repository as before.
+    """
+
+    def __init__(
+        self,
+        inner: QuoteRepository,
+        route_index: RouteIndex,
+        cross_rate_service: CrossRateService,
+    ):
+        self._inner = inner
+        self._index = route_index
+        self._cross_rates = cross_rate_service
+
+    async def get_latest(self, pair: Pair) -> Optional[Quote]:
+        route = self._index.find(pair)
+        self._record_route(route)
+
+        if route is None or route.is_direct:
+            return await self._inner.get_latest(pair)
+
+        quotes = await self._inner.get_latest_many(route.leg_pairs())
+
+        return self._compose(route, quotes)
+
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        routes: dict[Pair, Optional[Route]] = {}
+        leg_pairs: dict[Pair, None] = {}
+
+        for pair in dict.fromkeys(pairs):
+            route = self._index.find(pair)
+            self._record_route(route)
+            routes[pair] = route
+
+            if route is None:
+                leg_pairs[pair] = None
+            else:
+                leg_pairs.update(dict.fromkeys(route.leg_pairs()))
+
+        # All legs of all routes in a single lookup
+        leg_quotes = await self._inner.get_latest_many(list(leg_pairs))
+
+        quotes: dict[Pair, Quote] = {}
+
+        for pair, route in routes.items():
+            if route is None:
+                quote = leg_quotes.get(pair)
+            else:
+                quote = self._compose(route, leg_quotes)
+
+            if quote is not None:
+                quotes[pair] = quote
+
+        return quotes
+
+    async def get_latest_before(
+        self, pair: Pair, timestamp: TimestampUTC
+    ) -> Optional[Quote]:
+        route = self._index.find(pair)
+        self._record_route(route)
+
+        if route is None or route.is_direct:
+            return await self._inner.get_latest_before(pair, timestamp)
+
+        leg_pairs = route.leg_pairs()
+        leg_quotes = await asyncio.gather(
+            *(
+                self._inner.get_latest_before(leg_pair, timestamp)
+                for leg_pair in leg_pairs
+            )
+        )
+        quotes = {
+            leg_pair: quote
+            for leg_pair, quote in zip(leg_pairs, leg_quotes)
+            if quote is not None
+        }
+
+        return self._compose(route, quotes)
+
+    def _compose(self, route: Route, quotes: dict[Pair, Quote]) -> Optional[Quote]:
+        quote = self._cross_rates.compose(route, quotes)
+
+        if quote is None:
+            logger.debug("route_leg_missing", pair=str(route.pair), route=str(route))
+
+        return quote
+
+    @staticmethod
+    def _record_route(route: Optional[Route]) -> None:
+        if not settings.ENABLE_METRICS:
+            return
+
+        if route is None:
+            route_type = "none"
+        elif route.is_direct:
+            route_type = "direct"
+        elif len(route.legs) == 1:
+            route_type = "inverse"
+        else:
+            route_type = "cross"
+
+        get_metrics_registry().quote_routes_total.labels(route_type=route_type).inc()
@@ -0,0 +1,182 @@
+import asyncio
+from contextlib import suppress
+from typing import Optional
+
+from converter.adapters.outbound.persistence.spool.quote_spool import QuoteSpool
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class SpoolingQuoteWriter(QuoteWriter):
+    """
+    Keeps batches the inner writer can't store because its storage is unavailable
+    in a durable spool, instead of failing them, and replays them in order
+    once the storage is back.
+
+    While anything is spooled, new batches are appended behind it without trying
+    the inner writer, so they keep their order and callers don't wait on
+    a database that is down. A background task retries the oldest batch with
+    backoff, and the inner writer gets new batches directly again once it drained.
+
+    Replay is at least once, a batch stored just before a crash is stored again
+    on restart. The inner writers are idempotent, so that's harmless.
+
+    Writers wrap driver errors in their own, so an error counts as unavailable
+    when it or anything in its `__cause__` chain is in `unavailable_errors`.
+    Other errors mean the batch itself was rejected.
+    They're raised as before, and a spooled batch failing with one is dropped,
+    so it can't hold up the ones behind it forever.
+
+    Keeps state between batches, so it must be a single shared instance.
+    """
+
+    def __init__(
+        self,
+        inner: QuoteWriter,
+        spool: QuoteSpool,
+        unavailable_errors: tuple[type[Exception], ...] = (Exception,),
+        retry_seconds: float = 1.0,
+        max_retry_seconds: float = 30.0,
+    ):
+        """
+        :param unavailable_errors: Errors meaning the storage couldn't be reached
+        :param retry_seconds: First delay between replay attempts,
+                              doubled on each failure
+        :param max_retry_seconds: Cap on the replay delay
+        """
+        self._inner = inner
+        self._spool = spool
+        self._unavailable_errors = unavailable_errors
+        self._retry_seconds = retry_seconds
+        self._max_retry_seconds = max_retry_seconds
+
+        # Guards the spool, the inner writer is never called under it
+        self._lock = asyncio.Lock()
+        self._replay_task: Optional[asyncio.Task[None]] = None
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if self._spool.is_empty:
+            try:
+                await self._inner.save_batch(quotes)
+                return
+            except Exception as e:
+                if not self._is_unavailable(e):
+                    raise
+
+                logger.warning(
+                    "storage_unavailable_spooling",
+                    error=str(e),
+                    quote_count=len(quotes),
+                )
+
+        async with self._lock:
+            dropped = await asyncio.to_thread(self._spool.append, quotes)
+
+        logger.info(
+            "quote_batch_spooled",
+            quote_count=len(quotes),
+            spooled_batches=self._spool.batches,
+            dropped=dropped,
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.quotes_spooled_total.inc(len(quotes))
+
+            if dropped:
+                metrics.quotes_spool_dropped_total.labels(reason="full").inc(dropped)
+
+        self._update_gauges()
+        self._ensure_replaying()
+
+    async def close(self) -> None:
+        """
+        Stops replaying. Whatever is still spooled is replayed after the next start.
+        """
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self._replay_task
+
+            self._replay_task = None
+
+    def _ensure_replaying(self) -> None:
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(
+                self._replay(), name="quote_spool_replay"
+            )
+
+    async def _replay(self) -> None:
+        delay = self._retry_seconds
+        replayed = 0
+
+        while True:
+            async with self._lock:
+                batch = await asyncio.to_thread(self._spool.peek)
+
+                if batch is None:
+                    # Under the lock, so any later append starts a new replay
+                    self._replay_task = None
+                    break
+
+            try:
+                await self._inner.save_batch(batch.quotes)
+
+            except Exception as e:
+                if self._is_unavailable(e):
+                    logger.warning("spool_replay_failed", error=str(e), retry_in=delay)
+
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_retry_seconds)
+                    continue
+
+                logger.error(
+                    "spooled_batch_rejected",
+                    error=str(e),
+                    quote_count=len(batch.quotes),
+                    exc_info=True,
+                )
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.quotes_spool_dropped_total.labels(reason="rejected").inc(
+                        len(batch.quotes)
+                    )
+
+            else:
+                replayed += 1
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.quotes_spool_replayed_total.inc(len(batch.quotes))
+
+            async with self._lock:
+                await asyncio.to_thread(self._spool.commit, batch)
+
+            delay = self._retry_seconds
+            self._update_gauges()
+
+        logger.info("spool_drained", replayed_batches=replayed)
+
+    def _is_unavailable(self, error: BaseException) -> bool:
+        cause: Optional[BaseException] = error
+
+        while cause is not None:
+            if isinstance(cause, self._unavailable_errors):
+                return True
+            cause = cause.__cause__
+
+        return False
+
+    def _update_gauges(self) -> None:
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.quote_spool_batches.set(self._spool.batches)
+            metrics.quote_spool_bytes.set(self._spool.size_bytes)
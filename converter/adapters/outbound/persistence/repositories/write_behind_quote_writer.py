@@ -0,0 +1,142 @@
+import asyncio
+import time
+from contextlib import suppress
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class WriteBehindQuoteWriter(QuoteWriter):
+    """
+    Publishes batches to the fast writer right away and leaves the durable
+    write to a background task, so quotes are servable without waiting
+    on the database commit.
+
+    Batches wait for the durable writer in a queue of `queue_size`, written one
+    at a time in the order they came. When it's full, `save_batch` waits for room,
+    so a durable writer that can't keep up slows the producer down rather than
+    buffering without bound.
+
+    A failed durable write is logged and counted, not raised, the batch was
+    already published. Put a `SpoolingQuoteWriter` in front of the database
+    to keep those batches.
+
+    Owns the queue and the task, so it must be a single shared instance.
+    """
+
+    def __init__(
+        self,
+        fast: QuoteWriter,
+        durable: QuoteWriter,
+        queue_size: int = 32,
+        durable_storage: str = "postgres",
+    ):
+        """
+        :param queue_size: Batches that may wait for the durable writer
+        :param durable_storage: Storage label of the durable writer in metrics
+        """
+        self._fast = fast
+        self._durable = durable
+        self._durable_storage = durable_storage
+
+        # (batch, enqueued at)
+        self._queue: asyncio.Queue[tuple[list[Quote], float]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        await self._fast.save_batch(quotes)
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(
+                self._write_behind(), name="durable_quote_writer"
+            )
+
+        start_time = time.perf_counter()
+
+        if self._queue.full():
+            logger.warning(
+                "durable_write_backpressure",
+                storage=self._durable_storage,
+                queued_batches=self._queue.qsize(),
+            )
+
+        await self._queue.put((quotes, time.perf_counter()))
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.durable_write_backpressure_seconds.labels(
+                storage=self._durable_storage
+            ).observe(time.perf_counter() - start_time)
+            metrics.durable_write_queue_batches.labels(
+                storage=self._durable_storage
+            ).set(self._queue.qsize())
+
+    async def close(self, timeout_seconds: float = 10.0) -> None:
+        """
+        Waits up to `timeout_seconds` for the queued batches to be written, then stops.
+        """
+        if self._worker is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                "durable_write_queue_abandoned",
+                storage=self._durable_storage,
+                queued_batches=self._queue.qsize(),
+            )
+
+        self._worker.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._worker
+
+        self._worker = None
+
+    async def _write_behind(self) -> None:
+        while True:
+            quotes, enqueued_at = await self._queue.get()
+
+            try:
+                await self._durable.save_batch(quotes)
+
+            except Exception as e:
+                logger.error(
+                    "durable_write_failed",
+                    storage=self._durable_storage,
+                    error=str(e),
+                    quote_count=len(quotes),
+                    exc_info=True,
+                )
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.quotes_store_failed_total.labels(
+                        storage=self._durable_storage
+                    ).inc(len(quotes))
+
+            else:
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.durable_write_lag_seconds.labels(
+                        storage=self._durable_storage
+                    ).observe(time.perf_counter() - enqueued_at)
+
+            finally:
+                self._queue.task_done()
+
+                if settings.ENABLE_METRICS:
+                    metrics = get_metrics_registry()
+                    metrics.durable_write_queue_batches.labels(
+                        storage=self._durable_storage
+                    ).set(self._queue.qsize())
@@ -0,0 +1,126 @@
+import struct
+from datetime import datetime, timedelta, timezone
+from decimal import MAX_PREC, Context, Decimal
+
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+# Moving the decimal point must never round
+_EXACT = Context(prec=MAX_PREC)
+
+BATCH_V1 = 0x01
+
+# version, quote count
+_BATCH_HEADER = struct.Struct(">BI")
+
+# epoch micros, rate exponent, rate coefficient length
+_QUOTE_HEADER = struct.Struct(">qbB")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_batch(quotes: list[Quote]) -> bytes:
+    """
+    Packs a batch, version 1:
+
+        u8 version | u32 quote count, then per quote
+        i64 epoch micros | i8 rate exponent | u8 n + n bytes signed rate coefficient
+        | u8 n + base currency | u8 n + quote currency
+
+    Rates and timestamps come back exactly as they went in.
+
+    :raises ValueError: If a quote doesn't fit the format
+    """
+    parts = [_BATCH_HEADER.pack(BATCH_V1, len(quotes))]
+
+    try:
+        for quote in quotes:
+            exponent = quote.rate.value.as_tuple().exponent
+
+            if not isinstance(exponent, int):
+                raise ValueError(f"Rate must be finite: {quote.rate}")
+
+            coefficient = int(quote.rate.value.scaleb(-exponent, context=_EXACT))
+            coefficient_bytes = coefficient.to_bytes(
+                coefficient.bit_length() // 8 + 1, "big", signed=True
+            )
+            micros = (quote.timestamp.value - _EPOCH) // _MICROSECOND
+
+            parts.append(_QUOTE_HEADER.pack(micros, exponent, len(coefficient_bytes)))
+            parts.append(coefficient_bytes)
+            parts.append(_pack_str(quote.pair.base.code))
+            parts.append(_pack_str(quote.pair.quote.code))
+
+    except (struct.error, OverflowError) as e:
+        raise ValueError(f"Quote doesn't fit the spool format: {e}") from e
+
+    return b"".join(parts)
+
+
+def decode_batch(raw: bytes) -> list[Quote]:
+    """
+    :raises ValueError: If the payload is malformed or of an unknown version
+    """
+    try:
+        version, count = _BATCH_HEADER.unpack_from(raw)
+
+        if version != BATCH_V1:
+            raise ValueError(f"Unknown spooled batch version: {version}")
+
+        offset = _BATCH_HEADER.size
+        quotes = []
+
+        for _ in range(count):
+            micros, exponent, coefficient_len = _QUOTE_HEADER.unpack_from(raw, offset)
+            offset += _QUOTE_HEADER.size
+
+            coefficient = int.from_bytes(
+                raw[offset : offset + coefficient_len], "big", signed=True
+            )
+            offset += coefficient_len
+
+            base, offset = _unpack_str(raw, offset)
+            quote, offset = _unpack_str(raw, offset)
+
+            quotes.append(
+                Quote(
+                    pair=Pair(Currency(base), Currency(quote)),
+                    rate=Rate(Decimal(f"{coefficient}E{exponent}")),
+                    timestamp=TimestampUTC(_EPOCH + micros * _MICROSECOND),
+                )
+            )
+
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid spooled batch: {e}") from e
+
+    if offset != len(raw):
+        raise ValueError("Invalid spooled batch: trailing bytes")
+
+    return quotes
+
+
+def batch_size(raw: bytes) -> int:
+    """
+    :return: Number of quotes in an encoded batch, without decoding it
+    """
+    try:
+        return int(_BATCH_HEADER.unpack_from(raw)[1])
+    except struct.error as e:
+        raise ValueError(f"Invalid spooled batch: {e}") from e
+
+
+def _pack_str(value: str) -> bytes:
+    encoded = value.encode()
+
+    return bytes((len(encoded),)) + encoded
+
+
+def _unpack_str(raw: bytes, offset: int) -> tuple[str, int]:
+    length = raw[offset]
+    end = offset + 1 + length
+
+    if end > len(raw):
+        raise IndexError("string runs past the end of the payload")
+
+    return raw[offset + 1 : end].decode(), end
@@ -0,0 +1,249 @@
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+from converter.domain.models import Quote
+from converter.shared.logging import get_logger
+
+from .codec import batch_size, decode_batch, encode_batch
+
+logger = get_logger(__name__)
+
+# payload length, payload crc32
+_RECORD_HEADER = struct.Struct(">II")
+
+_SEGMENT_NAME = re.compile(r"^(\d{12})\.spool$")
+
+
+@dataclass(frozen=True)
+class SpooledBatch:
+    """
+    A batch read from the spool, with where it was read from, so it can be
+    committed once stored.
+    """
+
+    segment: int
+    offset: int
+    end: int
+    quotes: list[Quote]
+
+
+@dataclass
+class _Segment:
+    sequence: int
+    path: str
+    size: int
+    batches: int
+    quotes: int
+
+
+class QuoteSpool:
+    """
+    Append-only, on-disk queue of quote batches.
+
+    Batches are length-prefixed, checksummed records in numbered segment files,
+    a new segment is started once the current one reaches `segment_bytes`.
+    Every append is fsynced. A record cut short by a crash fails its checksum
+    and is truncated away on the next start, along with anything after it.
+
+    Batches are read oldest first. Committing one moves the read position past it
+    and removes its segment once it has been read to the end, so only what's left
+    to replay stays on disk.
+
+    When an append would take the spool over `max_bytes`, whole segments are dropped,
+    oldest first. Recent quotes are worth more than old ones.
+
+    Blocking file IO, and not safe for concurrent use.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, segment_bytes: int):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._segment_bytes = segment_bytes
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._segments = self._recover()
+        self._next_sequence = self._segments[-1].sequence + 1 if self._segments else 1
+
+        # Read position in the oldest segment
+        self._read_offset = 0
+        self._read_batches = 0
+        self._read_quotes = 0
+
+        if self._segments:
+            logger.info(
+                "spool_recovered",
+                directory=directory,
+                segments=len(self._segments),
+                batches=self.batches,
+                size_bytes=self.size_bytes,
+            )
+
+    @property
+    def is_empty(self) -> bool:
+        # Fully read segments are removed, so any segment left has unread batches
+        return not self._segments
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(segment.size for segment in self._segments)
+
+    @property
+    def batches(self) -> int:
+        return sum(segment.batches for segment in self._segments) - self._read_batches
+
+    def append(self, quotes: list[Quote]) -> int:
+        """
+        :return: Number of quotes dropped to make room
+        :raises ValueError: If a quote doesn't fit the spool format
+        """
+        payload = encode_batch(quotes)
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+        dropped = 0
+
+        while self._segments and self.size_bytes + len(record) > self._max_bytes:
+            dropped += self._drop_oldest()
+
+        if not self._segments or self._segments[-1].size >= self._segment_bytes:
+            self._segments.append(self._new_segment())
+
+        segment = self._segments[-1]
+
+        with open(segment.path, "ab") as f:
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+
+        segment.size += len(record)
+        segment.batches += 1
+        segment.quotes += len(quotes)
+
+        return dropped
+
+    def peek(self) -> Optional[SpooledBatch]:
+        """
+        :return: The oldest batch not yet committed, None if there's none
+        """
+        if not self._segments:
+            return None
+
+        segment = self._segments[0]
+
+        with open(segment.path, "rb") as f:
+            f.seek(self._read_offset)
+            length, _ = _RECORD_HEADER.unpack(f.read(_RECORD_HEADER.size))
+            payload = f.read(length)
+
+        return SpooledBatch(
+            segment=segment.sequence,
+            offset=self._read_offset,
+            end=self._read_offset + _RECORD_HEADER.size + length,
+            quotes=decode_batch(payload),
+        )
+
+    def commit(self, batch: SpooledBatch) -> None:
+        """
+        Marks a peeked batch as stored.
+        A batch whose segment was dropped in the meantime is ignored.
+        """
+        if not self._segments:
+            return
+
+        segment = self._segments[0]
+
+        if (segment.sequence, self._read_offset) != (batch.segment, batch.offset):
+            return
+
+        self._read_offset = batch.end
+        self._read_batches += 1
+        self._read_quotes += len(batch.quotes)
+
+        if self._read_offset >= segment.size:
+            self._remove_oldest()
+
+    def _drop_oldest(self) -> int:
+        segment = self._segments[0]
+        dropped = segment.quotes - self._read_quotes
+
+        logger.warning(
+            "spool_segment_dropped",
+            path=segment.path,
+            batches=segment.batches - self._read_batches,
+            quotes=dropped,
+        )
+
+        self._remove_oldest()
+
+        return dropped
+
+    def _remove_oldest(self) -> None:
+        segment = self._segments.pop(0)
+        os.remove(segment.path)
+
+        self._read_offset = 0
+        self._read_batches = 0
+        self._read_quotes = 0
+
+    def _new_segment(self) -> _Segment:
+        sequence = self._next_sequence
+        self._next_sequence += 1
+
+        path = os.path.join(self._directory, f"{sequence:012d}.spool")
+        open(path, "xb").close()
+
+        return _Segment(sequence=sequence, path=path, size=0, batches=0, quotes=0)
+
+    def _recover(self) -> list[_Segment]:
+        segments = []
+
+        for name in sorted(os.listdir(self._directory)):
+            match = _SEGMENT_NAME.match(name)
+
+            if match is None:
+                continue
+
+            segment = self._scan(
+                int(match.group(1)), os.path.join(self._directory, name)
+            )
+
+            if segment.size:
+                segments.append(segment)
+            else:
+                os.remove(segment.path)
+
+        return segments
+
+    @staticmethod
+    def _scan(sequence: int, path: str) -> _Segment:
+        segment = _Segment(sequence=sequence, path=path, size=0, batches=0, quotes=0)
+
+        with open(path, "r+b") as f:
+            while header := f.read(_RECORD_HEADER.size):
+                if len(header) < _RECORD_HEADER.size:
+                    break
+
+                length, checksum = _RECORD_HEADER.unpack(header)
+                payload = f.read(length)
+
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+
+                segment.size += _RECORD_HEADER.size + length
+                segment.batches += 1
+                segment.quotes += batch_size(payload)
+
+            if f.seek(0, os.SEEK_END) > segment.size:
+                logger.warning(
+                    "spool_segment_truncated",
+                    path=path,
+                    valid_bytes=segment.size,
+                    discarded_bytes=f.tell() - segment.size,
+                )
+                f.truncate(segment.size)
+
+        return segment
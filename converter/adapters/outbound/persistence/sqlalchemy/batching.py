@@ -0,0 +1,18 @@
+from typing import Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# PostgreSQL's wire protocol counts bind parameters in an Int16
+MAX_BIND_PARAMS = 32767
+
+
+def chunked(rows: Sequence[T], params_per_row: int) -> Iterator[Sequence[T]]:
+    """
+    Splits rows into slices small enough for one statement each.
+
+    :param params_per_row: Bind parameters a single row takes
+    """
+    size = max(1, MAX_BIND_PARAMS // params_per_row)
+
+    for offset in range(0, len(rows), size):
+        yield rows[offset : offset + size]
@@ -0,0 +1,204 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Select, func, join, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import INTERVAL, TIMESTAMP, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from converter.app.ports.outbound.candle_repository import CandleRepository
+from converter.domain.models import Candle
+from converter.domain.services.factory import RateFactory
+from converter.domain.values import Interval, Pair, Resolution, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .candle_writer import CANDLE_MODELS
+from .mapper import SQLAlchemyMapper
+from .models import QuoteModel, SymbolModel
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Same origin as Interval.bucket_start, so buckets line up with the rollups
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class PostgresCandleRepository(CandleRepository):
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        rate_factory: RateFactory,
+    ):
+        self._session_factory = session_factory
+        self._mapper = SQLAlchemyMapper(rate_factory)
+
+    async def get_candles(
+        self,
+        pair: Pair,
+        resolution: Resolution,
+        start: TimestampUTC,
+        end: TimestampUTC,
+    ) -> list[Candle]:
+        model = CANDLE_MODELS[resolution]
+        table = model.__tablename__
+        start_time = time.time()
+
+        # Resolved once, before the index scan, like the raw lookups
+        symbol_id = (
+            select(SymbolModel.id)
+            .where(SymbolModel.symbol == pair.code())
+            .scalar_subquery()
+        )
+
+        # Bounded on the partition key on both sides, like the raw lookups
+        stmt = (
+            select(model)
+            .where(
+                model.symbol_id == symbol_id,
+                model.bucket_start >= start.value,
+                model.bucket_start <= end.value,
+            )
+            .order_by(model.bucket_start)
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            models = result.scalars().all()
+
+        duration = time.time() - start_time
+
+        logger.debug(
+            "postgres_query",
+            operation="get_candles",
+            pair=str(pair),
+            resolution=resolution.label,
+            found=len(models),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.db_queries_total.labels(operation="get_candles", table=table).inc()
+            metrics.db_query_duration_seconds.labels(
+                operation="get_candles", table=table
+            ).observe(duration)
+
+        return [self._mapper.db_model_to_candle(pair, m, resolution) for m in models]
+
+    async def get_binned_candles(
+        self,
+        symbol: str,
+        interval: Interval,
+        source: Optional[Resolution],
+        start: TimestampUTC,
+        end: TimestampUTC,
+    ) -> list[Candle]:
+        table = "quotes" if source is None else CANDLE_MODELS[source].__tablename__
+        start_time = time.time()
+
+        stmt = self.binned_statement(symbol, interval, source, start, end)
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        duration = time.time() - start_time
+
+        logger.debug(
+            "postgres_query",
+            operation="get_binned_candles",
+            symbol=symbol,
+            interval=interval.label,
+            source=table,
+            found=len(rows),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.db_queries_total.labels(
+                operation="get_binned_candles", table=table
+            ).inc()
+            metrics.db_query_duration_seconds.labels(
+                operation="get_binned_candles", table=table
+            ).observe(duration)
+
+        return [self._mapper.binned_row_to_candle(row, interval) for row in rows]
+
+    @staticmethod
+    def binned_statement(
+        symbol: str,
+        interval: Interval,
+        source: Optional[Resolution],
+        start: TimestampUTC,
+        end: TimestampUTC,
+    ) -> Select[Any]:
+        """
+        One GROUP BY over `date_bin` buckets. Open and close are the first and last
+        values by time, which folds rollups the same way as raw quotes.
+        The range is on the partition key, so only the partitions it covers are read.
+        """
+        columns: dict[str, Any]
+
+        if source is None:
+            q = QuoteModel
+            time_column = q.quote_timestamp
+            columns = {
+                "open": q.rate,
+                "high": q.rate,
+                "low": q.rate,
+                "close": q.rate,
+                "open_time": q.quote_timestamp,
+                "close_time": q.quote_timestamp,
+            }
+            table: Any = q
+        else:
+            c = CANDLE_MODELS[source]
+            time_column = c.bucket_start
+            columns = {
+                "open": c.open,
+                "high": c.high,
+                "low": c.low,
+                "close": c.close,
+                "open_time": c.open_time,
+                "close_time": c.close_time,
+            }
+            table = c
+
+        bucket = func.date_bin(
+            literal(interval.duration, INTERVAL),
+            time_column,
+            literal(EPOCH, TIMESTAMP(timezone=True)),
+        )
+        first_open = func.array_agg(
+            aggregate_order_by(columns["open"], columns["open_time"].asc())
+        )[1]
+        last_close = func.array_agg(
+            aggregate_order_by(columns["close"], columns["close_time"].desc())
+        )[1]
+
+        return (
+            select(
+                bucket.label("bucket"),
+                func.min(SymbolModel.base_currency).label("base_currency"),
+                func.min(SymbolModel.quote_currency).label("quote_currency"),
+                first_open.label("open"),
+                func.max(columns["high"]).label("high"),
+                func.min(columns["low"]).label("low"),
+                last_close.label("close"),
+                func.min(columns["open_time"]).label("open_time"),
+                func.max(columns["close_time"]).label("close_time"),
+            )
+            # Both only carry the symbol id, the names come from `symbols`
+            .select_from(join(table, SymbolModel, SymbolModel.id == table.symbol_id))
+            .where(
+                SymbolModel.symbol == symbol,
+                time_column >= start.value,
+                time_column < end.value,
+            )
+            # By output name, a repeated date_bin() would get its own parameters
+            .group_by(literal_column("bucket"))
+            .order_by(literal_column("bucket"))
+        )
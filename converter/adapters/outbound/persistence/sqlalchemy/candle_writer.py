@@ -0,0 +1,152 @@
+import time
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.exceptions.quote import QuoteStorageError
+from converter.domain.models import Candle, Quote
+from converter.domain.values import Resolution
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+from .batching import chunked
+from .mapper import SQLAlchemyMapper
+from .models import CandleColumns, CandleHourModel, CandleMinuteModel
+from .symbol_registry import SymbolRegistry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+CANDLE_MODELS: dict[Resolution, type[CandleColumns]] = {
+    Resolution.MINUTE: CandleMinuteModel,
+    Resolution.HOUR: CandleHourModel,
+}
+
+
+class PostgresCandleWriter(QuoteWriter):
+    """
+    Keeps the 1m and 1h OHLC rollups up to date from every stored batch.
+
+    Each batch is folded into one candle per symbol and bucket, then merged
+    into the stored row. The merge is idempotent, so a retried batch
+    doesn't skew anything.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        resolutions: tuple[Resolution, ...] = tuple(Resolution),
+        symbol_registry: Optional[SymbolRegistry] = None,
+    ):
+        """
+        :param symbol_registry: Shared with the quote writers, so symbol ids
+            are cached once per process
+        """
+        self._session_factory = session_factory
+        self._resolutions = resolutions
+        self._symbol_registry = symbol_registry or SymbolRegistry(session_factory)
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if not quotes:
+            return
+
+        start_time = time.time()
+
+        try:
+            symbol_ids = await self._symbol_registry.ids(q.pair for q in quotes)
+
+            statements = [
+                stmt
+                for r in self._resolutions
+                for stmt in self._upserts(r, quotes, symbol_ids)
+            ]
+
+            async with self._session_factory() as session, session.begin():
+                for stmt in statements:
+                    await session.execute(stmt)
+
+            duration = time.time() - start_time
+
+            logger.debug(
+                "postgres_candles_saved",
+                quote_count=len(quotes),
+                resolutions=[r.label for r in self._resolutions],
+                duration_ms=round(duration * 1000, 2),
+            )
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.db_queries_total.labels(
+                    operation="upsert_candles", table="candles"
+                ).inc(len(statements))
+                metrics.db_query_duration_seconds.labels(
+                    operation="upsert_candles", table="candles"
+                ).observe(duration)
+
+        except Exception as e:
+            logger.error(
+                "postgres_candles_save_failed",
+                quote_count=len(quotes),
+                error=str(e),
+                exc_info=True,
+            )
+            raise QuoteStorageError(operation="save_candles", reason=str(e)) from e
+
+    @staticmethod
+    def aggregate(quotes: list[Quote], resolution: Resolution) -> list[Candle]:
+        """
+        Fold quotes into one candle per symbol and bucket, sorted by symbol
+        and bucket so concurrent writers lock rows in the same order.
+        """
+        candles: dict[tuple[str, float], Candle] = {}
+
+        for quote in quotes:
+            candle = Candle.from_quote(quote, resolution)
+            key = (quote.pair.code(), candle.bucket_start.value.timestamp())
+
+            current = candles.get(key)
+            candles[key] = candle if current is None else current.merge(candle)
+
+        return [candles[key] for key in sorted(candles)]
+
+    def _upserts(
+        self, resolution: Resolution, quotes: list[Quote], symbol_ids: dict[str, int]
+    ) -> list[Insert]:
+        rows = [
+            SQLAlchemyMapper.candle_to_row(c, symbol_ids[c.pair.code()])
+            for c in self.aggregate(quotes, resolution)
+        ]
+
+        # Chunks keep the sort order, so the lock order holds across them
+        return [
+            self._upsert(resolution, chunk)
+            for chunk in chunked(rows, params_per_row=len(rows[0]))
+        ]
+
+    @staticmethod
+    def _upsert(resolution: Resolution, rows: Sequence[dict[str, Any]]) -> Insert:
+        model = CANDLE_MODELS[resolution]
+
+        stmt = insert(model).values(list(rows))
+        new = stmt.excluded
+
+        return stmt.on_conflict_do_update(
+            index_elements=["symbol_id", "bucket_start"],
+            set_={
+                "open": case(
+                    (new.open_time < model.open_time, new.open), else_=model.open
+                ),
+                "open_time": func.least(model.open_time, new.open_time),
+                "high": func.greatest(model.high, new.high),
+                "low": func.least(model.low, new.low),
+                "close": case(
+                    (new.close_time >= model.close_time, new.close),
+                    else_=model.close,
+                ),
+                "close_time": func.greatest(model.close_time, new.close_time),
+            },
+        )
@@ -0,0 +1,137 @@
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.exceptions.quote import QuoteStorageError
+from converter.domain.models import Quote
+from converter.shared.config import get_settings
+from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+STAGING_TABLE = "quotes_staging"
+COLUMNS = ("symbol_id", "quote_timestamp", "rate")
+
+# Dropped at commit, so it's safe behind pgbouncer in transaction mode
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    symbol_id SMALLINT NOT NULL,
+    quote_timestamp TIMESTAMPTZ NOT NULL,
+    rate NUMERIC(24, 8) NOT NULL
+) ON COMMIT DROP
+"""
+
+MERGE_SQL = f"""
+INSERT INTO quotes ({", ".join(COLUMNS)})
+SELECT {", ".join(COLUMNS)} FROM {STAGING_TABLE}
+ON CONFLICT (symbol_id, quote_timestamp) DO NOTHING
+"""
+
+# Same rules as PostgresQuoteWriter: one row per symbol, sorted, never backwards.
+# quotes_latest keeps the symbol strings, it's a row per symbol and read by name.
+LATEST_UPSERT_SQL = f"""
+INSERT INTO quotes_latest (symbol, quote_timestamp, base_currency, quote_currency, rate)
+SELECT s.symbol, staged.quote_timestamp, s.base_currency, s.quote_currency, staged.rate
+FROM (
+    SELECT DISTINCT ON (symbol_id) symbol_id, quote_timestamp, rate
+    FROM {STAGING_TABLE}
+    ORDER BY symbol_id, quote_timestamp DESC
+) staged
+JOIN symbols s ON s.id = staged.symbol_id
+ORDER BY s.symbol
+ON CONFLICT (symbol) DO UPDATE SET
+    quote_timestamp = excluded.quote_timestamp,
+    base_currency = excluded.base_currency,
+    quote_currency = excluded.quote_currency,
+    rate = excluded.rate,
+    updated_at = now()
+WHERE quotes_latest.quote_timestamp < excluded.quote_timestamp
+"""
+
+
+class PostgresCopyQuoteWriter(QuoteWriter):
+    """
+    Bulk writer: binary COPY into a temporary staging table,
+    then a single INSERT ... SELECT into `quotes` and one upsert into `quotes_latest`.
+
+    Same conflict semantics as PostgresQuoteWriter, but nothing
+    goes through the SQLAlchemy compiler, and rows aren't bound one parameter at a time.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        symbol_registry: Optional[SymbolRegistry] = None,
+    ):
+        self._session_factory = session_factory
+        self._symbol_registry = symbol_registry or SymbolRegistry(session_factory)
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if not quotes:
+            return
+
+        start_time = time.time()
+
+        try:
+            symbol_ids = await self._symbol_registry.ids(q.pair for q in quotes)
+            records = [self._to_record(q, symbol_ids) for q in quotes]
+
+            async with self._session_factory() as session, session.begin():
+                connection = await self._driver_connection(session)
+
+                await connection.execute(CREATE_STAGING_SQL)
+                await connection.copy_records_to_table(
+                    STAGING_TABLE, records=records, columns=COLUMNS
+                )
+                status = await connection.execute(MERGE_SQL)
+                await connection.execute(LATEST_UPSERT_SQL)
+
+            duration = time.time() - start_time
+
+            logger.debug(
+                "postgres_batch_copied",
+                quote_count=len(quotes),
+                status=status,
+                duration_ms=round(duration * 1000, 2),
+            )
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.quotes_stored_total.labels(storage="postgres").inc(len(quotes))
+                metrics.db_queries_total.labels(
+                    operation="copy_batch", table="quotes"
+                ).inc()
+                metrics.db_query_duration_seconds.labels(
+                    operation="copy_batch", table="quotes"
+                ).observe(duration)
+
+        except Exception as e:
+            logger.error(
+                "postgres_batch_copy_failed",
+                quote_count=len(quotes),
+                error=str(e),
+                exc_info=True,
+            )
+            raise QuoteStorageError(operation="save_batch", reason=str(e)) from e
+
+    @staticmethod
+    async def _driver_connection(session: AsyncSession) -> Any:
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+
+        return raw.driver_connection
+
+    @staticmethod
+    def _to_record(quote: Quote, symbol_ids: dict[str, int]) -> tuple[Any, ...]:
+        return (
+            symbol_ids[quote.pair.code()],
+            quote.timestamp.value,
+            quote.rate.value,
+        )
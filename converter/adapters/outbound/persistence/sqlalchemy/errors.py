@@ -0,0 +1,14 @@
+import asyncpg
+from sqlalchemy import exc
+
+# PostgreSQL couldn't be reached or dropped the connection,
+# as opposed to rejecting what was sent. Raw asyncpg errors come from COPY.
+UNAVAILABLE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    TimeoutError,
+    exc.OperationalError,
+    exc.InterfaceError,
+    exc.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.exceptions.OperatorInterventionError,
+)
@@ -1,17 +1,30 @@
 import datetime
 from decimal import Decimal
+from typing import Any
 
-from converter.adapters.outbound.persistence.sqlalchemy.models import QuoteModel
-from converter.domain.models import Quote
+from sqlalchemy import Row
+
+from converter.adapters.outbound.persistence.sqlalchemy.models import (
+    CandleColumns,
+    QuoteLatestModel,
+    QuoteModel,
+)
+from converter.domain.models import Candle, Quote
 from converter.domain.services.factory import RateFactory
-from converter.domain.values import Currency, Pair, TimestampUTC
+from converter.domain.values import (
+    Currency,
+    Interval,
+    Pair,
+    Resolution,
+    TimestampUTC,
+)
 
 
 class SQLAlchemyMapper:
     def __init__(self, rate_factory: RateFactory) -> None:
         self._rate_factory = rate_factory
 
-    def db_model_to_quote(self, db_model: QuoteModel) -> Quote:
+    def db_model_to_quote(self, db_model: QuoteLatestModel) -> Quote:
         # These fields are always present, but mypy things otherwise
         base_symbol = Currency(db_model.base_currency)  # type: ignore [arg-type]
         quote_symbol = Currency(db_model.quote_currency)  # type: ignore [arg-type]
@@ -26,6 +39,14 @@ class SQLAlchemyMapper:
             rate=rate,
         )
 
+    def row_to_quote(self, pair: Pair, row: Row[Any]) -> Quote:
+        """Maps a (rate, quote_timestamp) row of `quotes`, the pair is already known."""
+        return Quote(
+            pair=pair,
+            timestamp=TimestampUTC(row.quote_timestamp),
+            rate=self._rate_factory.from_string(str(row.rate)),
+        )
+
     @staticmethod
     def quote_to_dict(quote: Quote) -> dict[str, str | Decimal | datetime.datetime]:
         symbol = quote.pair.code()
@@ -39,13 +60,64 @@ class SQLAlchemyMapper:
         }
 
     @staticmethod
-    def quote_to_db_model(quote: Quote) -> QuoteModel:
-        symbol = quote.pair.code()
+    def quote_to_row(
+        quote: Quote, symbol_id: int
+    ) -> dict[str, int | Decimal | datetime.datetime]:
+        return {
+            "symbol_id": symbol_id,
+            "quote_timestamp": quote.timestamp.value,
+            "rate": quote.rate.value,
+        }
 
+    @staticmethod
+    def quote_to_db_model(quote: Quote, symbol_id: int) -> QuoteModel:
         return QuoteModel(
-            symbol=symbol,
+            symbol_id=symbol_id,
             quote_timestamp=quote.timestamp.value,
-            base_currency=quote.pair.base.code,
-            quote_currency=quote.pair.quote.code,
             rate=quote.rate.value,  # type: ignore [arg-type]
         )
+
+    def db_model_to_candle(
+        self, pair: Pair, db_model: CandleColumns, resolution: Resolution
+    ) -> Candle:
+        """Candles only carry the symbol id, the pair is already known."""
+        return Candle(
+            pair=pair,
+            interval=resolution.interval,
+            bucket_start=TimestampUTC(db_model.bucket_start),  # type: ignore [arg-type]
+            open=self._rate_factory.from_string(str(db_model.open)),
+            high=self._rate_factory.from_string(str(db_model.high)),
+            low=self._rate_factory.from_string(str(db_model.low)),
+            close=self._rate_factory.from_string(str(db_model.close)),
+            open_time=TimestampUTC(db_model.open_time),  # type: ignore [arg-type]
+            close_time=TimestampUTC(db_model.close_time),  # type: ignore [arg-type]
+        )
+
+    def binned_row_to_candle(self, row: Row[Any], interval: Interval) -> Candle:
+        """Maps a row of the `date_bin` aggregation, labelled like candle columns."""
+        return Candle(
+            pair=Pair(Currency(row.base_currency), Currency(row.quote_currency)),
+            interval=interval,
+            bucket_start=TimestampUTC(row.bucket),
+            open=self._rate_factory.from_string(str(row.open)),
+            high=self._rate_factory.from_string(str(row.high)),
+            low=self._rate_factory.from_string(str(row.low)),
+            close=self._rate_factory.from_string(str(row.close)),
+            open_time=TimestampUTC(row.open_time),
+            close_time=TimestampUTC(row.close_time),
+        )
+
+    @staticmethod
+    def candle_to_row(
+        candle: Candle, symbol_id: int
+    ) -> dict[str, int | Decimal | datetime.datetime]:
+        return {
+            "symbol_id": symbol_id,
+            "bucket_start": candle.bucket_start.value,
+            "open": candle.open.value,
+            "high": candle.high.value,
+            "low": candle.low.value,
+            "close": candle.close.value,
+            "open_time": candle.open_time.value,
+            "close_time": candle.close_time.value,
+        }
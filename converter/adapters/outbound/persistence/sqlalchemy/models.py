@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Numeric, String
+from sqlalchemy import Column, Identity, Numeric, SmallInteger, String
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
@@ -6,19 +6,90 @@ from sqlalchemy.sql import func
 Base = declarative_base()
 
 
+class SymbolModel(Base):
+    """
+    Every symbol ever stored, numbered so quotes can carry a 2-byte id
+    instead of the symbol and its currencies.
+    """
+
+    __tablename__ = "symbols"
+
+    id = Column(SmallInteger, Identity(), primary_key=True)
+    symbol = Column(String(40), nullable=False, unique=True)
+
+    base_currency = Column(String(20), nullable=False)
+    quote_currency = Column(String(20), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<Symbol {self.id}: {self.symbol}>"
+
+
 class QuoteModel(Base):
     __tablename__ = "quotes"
 
     __table_args__ = {"postgresql_partition_by": "RANGE (quote_timestamp)"}
 
-    symbol = Column(String(40), primary_key=True)
+    symbol_id = Column(SmallInteger, primary_key=True)
     quote_timestamp = Column(TIMESTAMP(timezone=True), primary_key=True)
 
+    rate = Column(Numeric(24, 8), nullable=False)
+
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<Quote {self.symbol_id} @ {self.quote_timestamp}: {self.rate}>"
+
+
+class QuoteLatestModel(Base):
+    """
+    One row per symbol, the latest quote written to `quotes`.
+
+    Keeps the symbol and its currencies rather than an id: it never grows past
+    a row per symbol, and latest lookups stay a primary key probe by name.
+    """
+
+    __tablename__ = "quotes_latest"
+
+    symbol = Column(String(40), primary_key=True)
+    quote_timestamp = Column(TIMESTAMP(timezone=True), nullable=False)
+
     base_currency = Column(String(20), nullable=False)
     quote_currency = Column(String(20), nullable=False)
-    rate = Column(Numeric(36, 8), nullable=False)
+    rate = Column(Numeric(24, 8), nullable=False)
 
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     def __repr__(self) -> str:
-        return f"<Quote {self.symbol} @ {self.quote_timestamp}: {self.rate}>"
+        return f"<LatestQuote {self.symbol} @ {self.quote_timestamp}: {self.rate}>"
+
+
+class CandleColumns:
+    """
+    Shared columns of the OHLC rollup tables, one row per symbol and bucket.
+    Keyed and sized like `quotes`, their prices are stored rates.
+    """
+
+    __tablename__: str
+
+    symbol_id = Column(SmallInteger, primary_key=True)
+    bucket_start = Column(TIMESTAMP(timezone=True), primary_key=True)
+
+    open = Column(Numeric(24, 8), nullable=False)
+    high = Column(Numeric(24, 8), nullable=False)
+    low = Column(Numeric(24, 8), nullable=False)
+    close = Column(Numeric(24, 8), nullable=False)
+
+    open_time = Column(TIMESTAMP(timezone=True), nullable=False)
+    close_time = Column(TIMESTAMP(timezone=True), nullable=False)
+
+
+class CandleMinuteModel(CandleColumns, Base):
+    __tablename__ = "candles_1m"
+
+    __table_args__ = {"postgresql_partition_by": "RANGE (bucket_start)"}
+
+
+class CandleHourModel(CandleColumns, Base):
+    __tablename__ = "candles_1h"
+
+    __table_args__ = {"postgresql_partition_by": "RANGE (bucket_start)"}
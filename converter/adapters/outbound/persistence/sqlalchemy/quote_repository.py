@@ -7,13 +7,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from converter.app.ports.outbound.quote_repository import QuoteRepository
 from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
 from converter.domain.values import Pair, TimestampUTC
 from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
 from converter.shared.observability import get_metrics_registry
 
 from .mapper import SQLAlchemyMapper
-from .models import QuoteModel
+from .models import QuoteLatestModel, QuoteModel, SymbolModel
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -24,19 +25,23 @@ class PostgresQuoteRepository(QuoteRepository):
         self,
         session_factory: Callable[[], AsyncSession],
         rate_factory: RateFactory,
+        freshness_policy: Optional[FreshnessPolicy] = None,
     ):
+        """
+        :param freshness_policy: Bounds historical lookups from below,
+            quotes it would reject aren't worth a scan
+        """
         self._session_factory = session_factory
         self._mapper = SQLAlchemyMapper(rate_factory)
+        self._freshness_policy = freshness_policy or FreshnessPolicy()
 
     async def get_latest(self, pair: Pair) -> Optional[Quote]:
         start_time = time.time()
 
         async with self._session_factory() as session:
-            stmt = (
-                select(QuoteModel)
-                .where(QuoteModel.symbol == str(pair))
-                .order_by(QuoteModel.quote_timestamp.desc())
-                .limit(1)
+            # Primary key lookup, no partitions to plan over
+            stmt = select(QuoteLatestModel).where(
+                QuoteLatestModel.symbol == pair.code()
             )
 
             result = await session.execute(stmt)
@@ -55,32 +60,84 @@ class PostgresQuoteRepository(QuoteRepository):
         if settings.ENABLE_METRICS:
             metrics = get_metrics_registry()
             metrics.db_queries_total.labels(
-                operation="get_latest", table="quotes"
+                operation="get_latest", table="quotes_latest"
             ).inc()
             metrics.db_query_duration_seconds.labels(
-                operation="get_latest", table="quotes"
+                operation="get_latest", table="quotes_latest"
             ).observe(duration)
 
         return self._mapper.db_model_to_quote(model) if model else None
 
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        requested_pairs = {pair.code(): pair for pair in pairs}
+
+        if not requested_pairs:
+            return {}
+
+        start_time = time.time()
+
+        stmt = select(QuoteLatestModel).where(
+            QuoteLatestModel.symbol.in_(list(requested_pairs))
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            models = result.scalars().all()
+
+        duration = time.time() - start_time
+
+        logger.debug(
+            "postgres_query",
+            operation="get_latest_many",
+            requested=len(requested_pairs),
+            found=len(models),
+            duration_ms=round(duration * 1000, 2),
+        )
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.db_queries_total.labels(
+                operation="get_latest_many", table="quotes_latest"
+            ).inc()
+            metrics.db_query_duration_seconds.labels(
+                operation="get_latest_many", table="quotes_latest"
+            ).observe(duration)
+
+        quotes: dict[Pair, Quote] = {}
+
+        for model in models:
+            quote = self._mapper.db_model_to_quote(model)
+            quotes[requested_pairs.get(quote.pair.code(), quote.pair)] = quote
+
+        return quotes
+
     async def get_latest_before(
         self, pair: Pair, timestamp: TimestampUTC
     ) -> Optional[Quote]:
         start_time = time.time()
+        oldest = self._freshness_policy.oldest_acceptable(timestamp)
 
         async with self._session_factory() as session:
+            # The id is resolved once up front, then both bounds on the partition
+            # key, so only a partition or two is scanned
+            symbol_id = (
+                select(SymbolModel.id)
+                .where(SymbolModel.symbol == pair.code())
+                .scalar_subquery()
+            )
             stmt = (
-                select(QuoteModel)
+                select(QuoteModel.rate, QuoteModel.quote_timestamp)
                 .where(
-                    QuoteModel.symbol == str(pair),
+                    QuoteModel.symbol_id == symbol_id,
                     QuoteModel.quote_timestamp <= timestamp.value,
+                    QuoteModel.quote_timestamp >= oldest.value,
                 )
                 .order_by(QuoteModel.quote_timestamp.desc())
                 .limit(1)
             )
 
             result = await session.execute(stmt)
-            model = result.scalar_one_or_none()
+            row = result.one_or_none()
 
         duration = time.time() - start_time
 
@@ -89,7 +146,7 @@ class PostgresQuoteRepository(QuoteRepository):
             operation="get_latest_before",
             pair=str(pair),
             timestamp=str(timestamp),
-            found=model is not None,
+            found=row is not None,
             duration_ms=round(duration * 1000, 2),
         )
 
@@ -102,4 +159,4 @@ class PostgresQuoteRepository(QuoteRepository):
                 operation="get_latest_before", table="quotes"
             ).observe(duration)
 
-        return self._mapper.db_model_to_quote(model) if model else None
+        return self._mapper.row_to_quote(pair, row) if row else None
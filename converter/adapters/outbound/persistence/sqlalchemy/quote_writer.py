@@ -1,11 +1,19 @@
 import time
-from typing import Callable
+from typing import Any, Callable, Optional, Sequence
 
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
 
+from converter.adapters.outbound.persistence.sqlalchemy.batching import chunked
 from converter.adapters.outbound.persistence.sqlalchemy.mapper import SQLAlchemyMapper
-from converter.adapters.outbound.persistence.sqlalchemy.models import QuoteModel
+from converter.adapters.outbound.persistence.sqlalchemy.models import (
+    QuoteLatestModel,
+    QuoteModel,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
 from converter.app.ports.outbound.quote_repository import QuoteWriter
 from converter.domain.exceptions.quote import QuoteStorageError
 from converter.domain.models import Quote
@@ -19,13 +27,24 @@ settings = get_settings()
 
 
 class PostgresQuoteWriter(QuoteWriter):
+    """
+    Inserts the batch into `quotes` and, in the same transaction,
+    moves `quotes_latest` forward for every symbol in it.
+    """
+
     def __init__(
         self,
         session_factory: Callable[[], AsyncSession],
         rate_factory: RateFactory,
+        symbol_registry: Optional[SymbolRegistry] = None,
     ):
+        """
+        :param symbol_registry: Shared with other writers, so symbol ids
+            are cached once per process
+        """
         self._session_factory = session_factory
         self._mapper = SQLAlchemyMapper(rate_factory)
+        self._symbol_registry = symbol_registry or SymbolRegistry(session_factory)
 
     async def save_batch(self, quotes: list[Quote]) -> None:
         if not quotes:
@@ -34,15 +53,23 @@ class PostgresQuoteWriter(QuoteWriter):
         start_time = time.time()
 
         try:
-            values = [self._mapper.quote_to_dict(q) for q in quotes]
-            stmt = insert(QuoteModel).values(values)
+            symbol_ids = await self._symbol_registry.ids(q.pair for q in quotes)
 
-            stmt = stmt.on_conflict_do_nothing(
-                index_elements=["symbol", "quote_timestamp"]
-            )
+            values = [
+                self._mapper.quote_to_row(q, symbol_ids[q.pair.code()]) for q in quotes
+            ]
+            inserts = [
+                insert(QuoteModel)
+                .values(list(chunk))
+                .on_conflict_do_nothing(index_elements=["symbol_id", "quote_timestamp"])
+                for chunk in chunked(values, params_per_row=len(values[0]))
+            ]
 
             async with self._session_factory() as session, session.begin():
-                await session.execute(stmt)
+                for stmt in inserts:
+                    await session.execute(stmt)
+                for stmt in _latest_upserts(self._mapper, quotes):
+                    await session.execute(stmt)
 
             duration = time.time() - start_time
 
@@ -70,3 +97,84 @@ class PostgresQuoteWriter(QuoteWriter):
                 exc_info=True,
             )
             raise QuoteStorageError(operation="save_batch", reason=str(e)) from e
+
+
+class PostgresLatestQuoteWriter(QuoteWriter):
+    """
+    Only moves `quotes_latest` forward, for quotes whose history row
+    change detection skipped. Same upsert as PostgresQuoteWriter.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        rate_factory: RateFactory,
+    ):
+        self._session_factory = session_factory
+        self._mapper = SQLAlchemyMapper(rate_factory)
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if not quotes:
+            return
+
+        start_time = time.time()
+
+        try:
+            async with self._session_factory() as session, session.begin():
+                for stmt in _latest_upserts(self._mapper, quotes):
+                    await session.execute(stmt)
+
+            if settings.ENABLE_METRICS:
+                metrics = get_metrics_registry()
+                metrics.db_queries_total.labels(
+                    operation="upsert_latest", table="quotes_latest"
+                ).inc()
+                metrics.db_query_duration_seconds.labels(
+                    operation="upsert_latest", table="quotes_latest"
+                ).observe(time.time() - start_time)
+
+        except Exception as e:
+            logger.error(
+                "postgres_latest_save_failed",
+                quote_count=len(quotes),
+                error=str(e),
+                exc_info=True,
+            )
+            raise QuoteStorageError(operation="save_latest", reason=str(e)) from e
+
+
+def _latest_upserts(mapper: SQLAlchemyMapper, quotes: list[Quote]) -> list[Insert]:
+    # ON CONFLICT DO UPDATE can't touch the same row twice in one statement
+    latest: dict[str, Quote] = {}
+
+    for quote in quotes:
+        symbol = quote.pair.code()
+        current = latest.get(symbol)
+
+        if current is None or quote.timestamp.value >= current.timestamp.value:
+            latest[symbol] = quote
+
+    # Sorted, so concurrent writers lock the rows in the same order
+    values = [mapper.quote_to_dict(latest[s]) for s in sorted(latest)]
+
+    return [
+        _latest_upsert(chunk)
+        for chunk in chunked(values, params_per_row=len(values[0]))
+    ]
+
+
+def _latest_upsert(values: Sequence[dict[str, Any]]) -> Insert:
+    stmt = insert(QuoteLatestModel).values(list(values))
+
+    # Late or replayed batches must not move a symbol back in time
+    return stmt.on_conflict_do_update(
+        index_elements=["symbol"],
+        set_={
+            "quote_timestamp": stmt.excluded.quote_timestamp,
+            "base_currency": stmt.excluded.base_currency,
+            "quote_currency": stmt.excluded.quote_currency,
+            "rate": stmt.excluded.rate,
+            "updated_at": func.now(),
+        },
+        where=QuoteLatestModel.quote_timestamp < stmt.excluded.quote_timestamp,
+    )
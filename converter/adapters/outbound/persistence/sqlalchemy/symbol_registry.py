@@ -0,0 +1,86 @@
+from typing import Callable, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from converter.domain.values import Pair
+from converter.shared.logging import get_logger
+
+from .batching import chunked
+from .models import SymbolModel
+
+logger = get_logger(__name__)
+
+
+class SymbolRegistry:
+    """
+    Maps symbols to their ids in `symbols`, registering the ones never stored before.
+
+    Ids never change once assigned, so they're cached for the life of the process
+    and only symbols it hasn't seen yet cost a round trip. Those are looked up first
+    and only the new ones inserted, since every attempted insert takes an id
+    from the sequence, conflict or not, and a smallint has few to spare.
+
+    Registration commits on its own, before the quotes referencing it are written,
+    so an id is never cached for a row that was rolled back.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._ids: dict[str, int] = {}
+
+    async def ids(self, pairs: Iterable[Pair]) -> dict[str, int]:
+        """
+        :return: Ids by symbol, covering at least the given pairs
+        """
+        missing = {pair.code(): pair for pair in pairs if pair.code() not in self._ids}
+
+        if missing:
+            self._ids.update(await self._register(missing))
+
+        return self._ids
+
+    async def _register(self, pairs: dict[str, Pair]) -> dict[str, int]:
+        async with self._session_factory() as session, session.begin():
+            ids = await self._lookup(session, list(pairs))
+            new = sorted(symbol for symbol in pairs if symbol not in ids)
+
+            if new:
+                rows = [
+                    {
+                        "symbol": symbol,
+                        "base_currency": pairs[symbol].base.code,
+                        "quote_currency": pairs[symbol].quote.code,
+                    }
+                    for symbol in new
+                ]
+
+                for chunk in chunked(rows, params_per_row=len(rows[0])):
+                    # A concurrent writer registering the same symbol wins the conflict
+                    await session.execute(
+                        insert(SymbolModel)
+                        .values(list(chunk))
+                        .on_conflict_do_nothing(index_elements=["symbol"])
+                    )
+
+                ids.update(await self._lookup(session, new))
+
+                logger.info("symbols_registered", symbols=new)
+
+        return ids
+
+    @staticmethod
+    async def _lookup(session: AsyncSession, symbols: list[str]) -> dict[str, int]:
+        ids: dict[str, int] = {}
+
+        # IN expands to a bind parameter per symbol
+        for chunk in chunked(symbols, params_per_row=1):
+            result = await session.execute(
+                select(SymbolModel.symbol, SymbolModel.id).where(
+                    SymbolModel.symbol.in_(chunk)
+                )
+            )
+            ids.update(result.tuples().all())  # type: ignore [arg-type]
+
+        return ids
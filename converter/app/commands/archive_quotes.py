@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from converter.app.ports.outbound.quote_archive import (
+    QuoteArchive,
+    QuoteHistorySource,
+    QuotePartition,
+)
+from converter.domain.values import TimestampUTC
+from converter.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ArchiveQuotesCommand:
+    """
+    :param settle_seconds: How long past its end a partition is left alone,
+        so late quotes can still land in it before it is archived
+    :param dry_run: Only report what would be archived
+    """
+
+    settle_seconds: int = 3600
+    dry_run: bool = False
+
+
+@dataclass(frozen=True)
+class ArchiveQuotesResult:
+    archived: list[QuotePartition] = field(default_factory=list)
+    skipped: int = 0
+    rows: int = 0
+
+
+class ArchiveQuotesCommandHandler:
+    """
+    Copies closed quote partitions into the archive.
+
+    A partition is archived once it has settled, long before retention
+    drops it, so the archive already holds it by the time Postgres doesn't.
+    Partitions already archived are skipped, which makes reruns cheap.
+    """
+
+    def __init__(self, history_source: QuoteHistorySource, archive: QuoteArchive):
+        self._history_source = history_source
+        self._archive = archive
+
+    async def handle(self, command: ArchiveQuotesCommand) -> ArchiveQuotesResult:
+        closed_before = TimestampUTC.now().value - timedelta(
+            seconds=command.settle_seconds
+        )
+
+        partitions = await self._history_source.list_partitions()
+        due = [
+            p
+            for p in partitions
+            if p.end.value <= closed_before and not self._archive.contains(p)
+        ]
+
+        rows = 0
+
+        for partition in due:
+            if command.dry_run:
+                logger.info("partition_archive_due", partition=partition.name)
+                continue
+
+            rows += await self._archive.write(
+                partition,
+                self._history_source.stream_batches(partition.start, partition.end),
+            )
+
+        logger.info(
+            "quotes_archived",
+            partitions=len(due),
+            skipped=len(partitions) - len(due),
+            rows=rows,
+            dry_run=command.dry_run,
+        )
+
+        return ArchiveQuotesResult(
+            archived=due, skipped=len(partitions) - len(due), rows=rows
+        )
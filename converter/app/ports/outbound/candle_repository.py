@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from converter.domain.models import Candle
+from converter.domain.values import Interval, Pair, Resolution, TimestampUTC
+
+
+class CandleRepository(ABC):
+    @abstractmethod
+    async def get_candles(
+        self,
+        pair: Pair,
+        resolution: Resolution,
+        start: TimestampUTC,
+        end: TimestampUTC,
+    ) -> list[Candle]:
+        """
+        Get the stored candles of a pair whose bucket starts within [start, end],
+        oldest first.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_binned_candles(
+        self,
+        symbol: str,
+        interval: Interval,
+        source: Optional[Resolution],
+        start: TimestampUTC,
+        end: TimestampUTC,
+    ) -> list[Candle]:
+        """
+        Get candles of `interval` width whose bucket starts within [start, end),
+        oldest first, aggregated in one pass from the `source` rollup,
+        or from the raw quotes when `source` is None. Empty buckets are left out.
+        """
+        raise NotImplementedError()
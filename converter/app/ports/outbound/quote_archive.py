@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator
+
+from converter.domain.values import TimestampUTC
+
+
+@dataclass(frozen=True)
+class QuotePartition:
+    """One range partition of the quote history, [start, end)."""
+
+    name: str
+    start: TimestampUTC
+    end: TimestampUTC
+
+
+@dataclass(frozen=True)
+class ArchiveBatch:
+    """
+    Stored quotes in columns, grouped by symbol, ordered by time within it.
+    Archiving moves millions of rows, so they skip the domain objects.
+    """
+
+    symbols: list[str]
+    base_currencies: list[str]
+    quote_currencies: list[str]
+    rates: list[Decimal]
+    timestamps: list[datetime]
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+class QuoteHistorySource(ABC):
+    @abstractmethod
+    async def list_partitions(self) -> list[QuotePartition]:
+        """Get the partitions the quote history currently has, oldest first."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stream_batches(
+        self, start: TimestampUTC, end: TimestampUTC
+    ) -> AsyncIterator[ArchiveBatch]:
+        """
+        Stream the stored quotes within [start, end) in batches,
+        grouped by symbol, ordered by time within it.
+        """
+        raise NotImplementedError()
+
+
+class QuoteArchive(ABC):
+    @abstractmethod
+    def contains(self, partition: QuotePartition) -> bool:
+        """Whether the partition has been archived already."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def write(
+        self, partition: QuotePartition, batches: AsyncIterator[ArchiveBatch]
+    ) -> int:
+        """
+        Archive a partition from its batches. Either the whole partition
+        ends up in the archive or nothing does.
+
+        :return: Number of quotes archived
+        """
+        raise NotImplementedError()
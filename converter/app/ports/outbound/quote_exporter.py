@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import AsyncIterator
+
+from converter.domain.values import TimestampUTC
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class QuoteExporter(ABC):
+    @abstractmethod
+    def export(
+        self,
+        symbols: list[str],
+        start: TimestampUTC,
+        end: TimestampUTC,
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the stored quotes within [start, end), encoded as `export_format`,
+        in chunks. Rows are grouped by symbol and ordered by time within it;
+        an empty `symbols` list means every symbol. Memory use must not depend
+        on the range.
+        """
+        raise NotImplementedError()
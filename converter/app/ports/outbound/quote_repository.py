@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -24,6 +25,23 @@ class QuoteRepository(ABC):
         """
         raise NotImplementedError()
 
+    async def get_latest_many(self, pairs: list[Pair]) -> dict[Pair, Quote]:
+        """
+        Get the most recent quotes for several pairs at once.
+        Pairs without a quote are left out of the result.
+
+        Adapters that can fetch many pairs in one round-trip should override this,
+        the default one just issues a lookup per distinct pair.
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        quotes = await asyncio.gather(*(self.get_latest(p) for p in unique_pairs))
+
+        return {
+            pair: quote
+            for pair, quote in zip(unique_pairs, quotes)
+            if quote is not None
+        }
+
 
 class QuoteWriter(ABC):
     @abstractmethod
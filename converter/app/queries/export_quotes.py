@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from converter.app.ports.outbound.quote_exporter import ExportFormat, QuoteExporter
+from converter.domain.values import TimestampUTC
+
+
+@dataclass(frozen=True)
+class ExportQuotesQuery:
+    start: TimestampUTC
+    end: TimestampUTC
+    export_format: ExportFormat = ExportFormat.CSV
+    symbols: list[str] = field(default_factory=list)
+
+
+class ExportQuotesQueryHandler:
+    def __init__(self, quote_exporter: QuoteExporter):
+        self._exporter = quote_exporter
+
+    def handle(self, query: ExportQuotesQuery) -> AsyncIterator[bytes]:
+        """
+        Validate the export up front, so callers can still report a bad request,
+        then hand back the stream. Nothing is read until it is iterated.
+
+        :param query: Query with the time range, format and optional symbols
+        :return: Encoded quote history, in chunks
+
+        :raises ValueError: If the range is empty
+        """
+        if query.start.value >= query.end.value:
+            raise ValueError(
+                f"Range start {query.start} is not before its end {query.end}"
+            )
+
+        symbols = sorted({s.upper() for s in query.symbols})
+
+        return self._exporter.export(
+            symbols, query.start, query.end, query.export_format
+        )
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.app.queries.get_conversion import ConversionResult
+from converter.domain.exceptions.conversion import (
+    ConversionError,
+    QuoteNotFoundError,
+    QuoteTooOldError,
+)
+from converter.domain.services import ConversionService
+from converter.domain.values import Amount, Pair
+
+
+@dataclass(frozen=True)
+class BatchConversionItem:
+    amount: Amount
+    pair: Pair
+
+
+@dataclass(frozen=True)
+class GetBatchConversionQuery:
+    items: list[BatchConversionItem]
+
+
+@dataclass(frozen=True)
+class BatchConversionItemResult:
+    item: BatchConversionItem
+    result: Optional[ConversionResult] = None
+    error: Optional[ConversionError] = None
+
+
+class GetBatchConversionQueryHandler:
+    def __init__(
+        self,
+        quote_repository: QuoteRepository,
+        conversion_service: ConversionService,
+    ):
+        self._repository = quote_repository
+        self._conversion_service = conversion_service
+
+    async def handle(
+        self, query: GetBatchConversionQuery
+    ) -> list[BatchConversionItemResult]:
+        """
+        Convert many amounts using the latest quotes.
+        Every distinct pair is looked up once, in a single batched repository call.
+
+        :param query: Query with the items to convert
+        :return: One result per item, in the same order.
+                 Items that can't be converted carry
+                 QuoteNotFoundError or QuoteTooOldError instead of a result.
+        """
+        pairs = list(dict.fromkeys(item.pair for item in query.items))
+        quotes = await self._repository.get_latest_many(pairs) if pairs else {}
+
+        results = []
+
+        for item in query.items:
+            quote = quotes.get(item.pair)
+
+            if quote is None:
+                results.append(
+                    BatchConversionItemResult(
+                        item=item, error=QuoteNotFoundError(item.pair)
+                    )
+                )
+                continue
+
+            try:
+                conversion = self._conversion_service.convert(item.amount, quote)
+            except QuoteTooOldError as e:
+                results.append(BatchConversionItemResult(item=item, error=e))
+                continue
+
+            results.append(
+                BatchConversionItemResult(
+                    item=item,
+                    result=ConversionResult(
+                        amount=conversion.converted_amount,
+                        original_amount=conversion.original_amount,
+                        rate=conversion.rate,
+                        timestamp=conversion.timestamp,
+                    ),
+                )
+            )
+
+        return results
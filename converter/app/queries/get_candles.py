@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+
+from converter.app.ports.outbound.candle_repository import CandleRepository
+from converter.domain.models import Candle
+from converter.domain.values import Interval, Resolution, TimestampUTC
+
+MAX_CANDLES_PER_PAGE = 1000
+
+
+@dataclass(frozen=True)
+class GetCandlesQuery:
+    symbol: str
+    interval: Interval
+    start: TimestampUTC
+    end: TimestampUTC
+    limit: int = MAX_CANDLES_PER_PAGE
+
+
+@dataclass(frozen=True)
+class CandlesPage:
+    """
+    One page of candles. `start` and `end` are the bucket-aligned bounds the page
+    covers, `next_start` is where the following page begins, None on the last one.
+    """
+
+    symbol: str
+    interval: Interval
+    source: Optional[Resolution]
+    start: TimestampUTC
+    end: TimestampUTC
+    candles: list[Candle]
+    next_start: Optional[TimestampUTC]
+    closed: bool
+
+
+class GetCandlesQueryHandler:
+    def __init__(
+        self, candle_repository: CandleRepository, settle_seconds: float = 3600.0
+    ):
+        """
+        :param settle_seconds: How long after a bucket ends its quotes may still
+            be written, by late ticks, write-behind lag or spool replays
+        """
+        self._repository = candle_repository
+        self._settle = timedelta(seconds=settle_seconds)
+
+    async def handle(self, query: GetCandlesQuery) -> CandlesPage:
+        """
+        Get a page of OHLC candles of a symbol within [start, end), both widened
+        to bucket boundaries. Candles are aggregated from the coarsest rollup
+        that tiles the interval, or from raw quotes if none does.
+
+        A page spans at most `limit` buckets, so it is keyed by its aligned start
+        alone and every page reads a bounded slice of the partitions.
+
+        :param query: Query with the symbol, interval, time range and page size
+        :return: CandlesPage with its candles, oldest first
+
+        :raises ValueError: If the range is empty or the page size isn't positive
+        """
+        if query.limit <= 0:
+            raise ValueError(f"Page size must be positive: {query.limit}")
+
+        interval = query.interval
+        start = interval.bucket_start(query.start)
+        end = interval.bucket_end(query.end)
+
+        if start.value >= end.value:
+            raise ValueError(
+                f"Range start {query.start} is not before its end {query.end}"
+            )
+
+        page_end = TimestampUTC(
+            min(end.value, start.value + interval.duration * query.limit)
+        )
+        source = Resolution.coarsest_dividing(interval)
+
+        candles = await self._repository.get_binned_candles(
+            query.symbol, interval, source, start, page_end
+        )
+
+        # Only buckets that ended over a settle margin ago won't change anymore
+        settled_until = TimestampUTC.now().value - self._settle
+
+        return CandlesPage(
+            symbol=query.symbol,
+            interval=interval,
+            source=source,
+            start=start,
+            end=page_end,
+            candles=candles,
+            next_start=page_end if page_end.value < end.value else None,
+            closed=page_end.value <= settled_until,
+        )
@@ -1,5 +1,7 @@
+from .candle import Candle
 from .quote import Quote
 
 __all__ = [
     "Quote",
+    "Candle",
 ]
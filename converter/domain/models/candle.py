@@ -0,0 +1,86 @@
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from converter.domain.values import Interval, Pair, Rate, Resolution, TimestampUTC
+
+from .quote import Quote
+
+
+@dataclass(frozen=True)
+class Candle:
+    """
+    OHLC rollup of the quotes of one pair within one bucket of `interval` width.
+
+    Keeps the timestamps of its first and last quote, so the open and close
+    are still usable as point-in-time quotes.
+    """
+
+    pair: Pair
+    interval: Interval
+    bucket_start: TimestampUTC
+    open: Rate
+    high: Rate
+    low: Rate
+    close: Rate
+    open_time: TimestampUTC
+    close_time: TimestampUTC
+
+    @classmethod
+    def from_quote(cls, quote: Quote, resolution: Resolution) -> "Candle":
+        return cls(
+            pair=quote.pair,
+            interval=resolution.interval,
+            bucket_start=resolution.bucket_start(quote.timestamp),
+            open=quote.rate,
+            high=quote.rate,
+            low=quote.rate,
+            close=quote.rate,
+            open_time=quote.timestamp,
+            close_time=quote.timestamp,
+        )
+
+    def merge(self, other: "Candle") -> "Candle":
+        """
+        Combine two candles of the same bucket, in any order.
+        Merging a candle into itself changes nothing, so replays are harmless.
+
+        :raises ValueError: If the candles belong to different buckets
+        """
+        if (self.pair, self.interval, self.bucket_start) != (
+            other.pair,
+            other.interval,
+            other.bucket_start,
+        ):
+            raise ValueError(f"Can't merge candles of different buckets: {other}")
+
+        first = self if self.open_time.value <= other.open_time.value else other
+        last = self if self.close_time.value >= other.close_time.value else other
+
+        return replace(
+            self,
+            open=first.open,
+            open_time=first.open_time,
+            high=max(self.high, other.high, key=lambda r: r.value),
+            low=min(self.low, other.low, key=lambda r: r.value),
+            close=last.close,
+            close_time=last.close_time,
+        )
+
+    def latest_quote_before(self, timestamp: TimestampUTC) -> Optional[Quote]:
+        """
+        The most recent quote this candle knows of at `timestamp`:
+        the close if it's not later than that, otherwise the open.
+        """
+        if self.close_time.value <= timestamp.value:
+            return Quote(pair=self.pair, rate=self.close, timestamp=self.close_time)
+
+        if self.open_time.value <= timestamp.value:
+            return Quote(pair=self.pair, rate=self.open, timestamp=self.open_time)
+
+        return None
+
+    def __str__(self) -> str:
+        return (
+            f"Candle({self.pair} {self.interval} @ {self.bucket_start}, "
+            f"o={self.open} h={self.high} l={self.low} c={self.close})"
+        )
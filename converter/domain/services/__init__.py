@@ -1 +1,3 @@
 from .conversion_service import ConversionResult, ConversionService
+from .cross_rate_service import CrossRateService
+from .route_index import RouteIndex
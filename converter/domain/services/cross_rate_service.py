@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import Optional
+
+from converter.domain.models import Quote
+from converter.domain.values import Pair, Route
+
+from .factory import RateFactory
+
+
+class CrossRateService:
+    def __init__(self, rate_factory: RateFactory):
+        self._rate_factory = rate_factory
+
+    def compose(self, route: Route, quotes: dict[Pair, Quote]) -> Optional[Quote]:
+        """
+        Build a quote for the route's pair out of its legs' quotes.
+        The result is as old as its oldest leg.
+
+        :param route: Route to compose
+        :param quotes: Quotes of the listed pairs, keyed by pair
+        :return: Composed quote, or None if any leg is missing
+        """
+        value = Decimal("1")
+        leg_quotes = []
+
+        for leg in route.legs:
+            quote = quotes.get(leg.pair)
+
+            if quote is None:
+                return None
+
+            rate = quote.rate.inverse() if leg.inverted else quote.rate
+            value *= rate.value
+            leg_quotes.append(quote)
+
+        if route.is_direct:
+            return leg_quotes[0]
+
+        oldest = min(leg_quotes, key=lambda q: q.timestamp.value)
+
+        return Quote(
+            pair=route.pair,
+            rate=self._rate_factory.create(value),
+            timestamp=oldest.timestamp,
+        )
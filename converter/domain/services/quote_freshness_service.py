@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Optional
 
 from converter.domain.exceptions.conversion import QuoteTooOldError
@@ -14,6 +15,15 @@ class FreshnessPolicy:
         if self.max_age_seconds <= 0:
             raise ValueError(f"Max age must be positive: {self.max_age_seconds}")
 
+    def oldest_acceptable(self, reference_time: TimestampUTC) -> TimestampUTC:
+        """
+        Oldest quote timestamp that is still fresh at `reference_time`,
+        anything before it would be rejected anyway.
+        """
+        return TimestampUTC(
+            reference_time.value - timedelta(seconds=self.max_age_seconds)
+        )
+
 
 class QuoteFreshnessService:
     def __init__(self, policy: Optional[FreshnessPolicy] = None) -> None:
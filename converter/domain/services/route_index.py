@@ -0,0 +1,102 @@
+from collections.abc import Iterable, Sequence
+from typing import Optional
+
+from converter.domain.values import Currency, Pair, Route, RouteLeg
+
+# Ordered by how liquid they are as intermediates on Binance
+DEFAULT_HUB_CURRENCIES = ("USDT", "BTC", "ETH", "BNB", "USDC", "FDUSD")
+
+
+class RouteIndex:
+    """
+    Currency graph built from the tracked pairs.
+
+    A route is the listed pair itself, its inverse, or two hops through the
+    most liquid hub both currencies trade against. Lookups check a fixed number
+    of hubs and are memoized, so each (from, to) is solved once per symbol set.
+    """
+
+    def __init__(self, hub_currencies: Sequence[str] = DEFAULT_HUB_CURRENCIES):
+        self._hubs = tuple(Currency(code) for code in hub_currencies)
+
+        self._pairs: frozenset[Pair] = frozenset()
+        self._legs: dict[Currency, dict[Currency, RouteLeg]] = {}
+        self._routes: dict[Pair, Optional[Route]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._pairs)
+
+    def rebuild(self, pairs: Iterable[Pair]) -> bool:
+        """
+        Replace the graph with a new set of listed pairs.
+        Nothing is recomputed if the set hasn't changed.
+
+        :param pairs: Currently tracked pairs
+        :return: Whether the index changed
+        """
+        new_pairs = frozenset(pairs)
+
+        if new_pairs == self._pairs:
+            return False
+
+        legs: dict[Currency, dict[Currency, RouteLeg]] = {}
+
+        for pair in new_pairs:
+            legs.setdefault(pair.base, {})[pair.quote] = RouteLeg(pair)
+
+        for pair in new_pairs:
+            # A listed pair always wins over inverting the opposite one
+            legs.setdefault(pair.quote, {}).setdefault(
+                pair.base, RouteLeg(pair, inverted=True)
+            )
+
+        # Swap everything at once, readers never see a half-built graph
+        self._pairs, self._legs, self._routes = new_pairs, legs, {}
+
+        return True
+
+    def find(self, pair: Pair) -> Optional[Route]:
+        """
+        Get the route for a conversion.
+
+        :param pair: Requested conversion (from -> to)
+        :return: Shortest route, or None if the currencies aren't connected
+        """
+        routes = self._routes
+
+        if pair in routes:
+            return routes[pair]
+
+        legs = self._legs
+        from_legs = legs.get(pair.base)
+        to_legs = legs.get(pair.quote)
+
+        # Unknown currencies aren't memoized, so junk input can't grow the cache
+        if from_legs is None or to_legs is None:
+            return None
+
+        route = self._solve(pair, from_legs, legs)
+        routes[pair] = route
+
+        return route
+
+    def _solve(
+        self,
+        pair: Pair,
+        from_legs: dict[Currency, RouteLeg],
+        legs: dict[Currency, dict[Currency, RouteLeg]],
+    ) -> Optional[Route]:
+        direct = from_legs.get(pair.quote)
+
+        if direct is not None:
+            return Route(pair=pair, legs=(direct,))
+
+        for hub in self._hubs:
+            first = from_legs.get(hub)
+            second = legs.get(hub, {}).get(pair.quote)
+
+            if first is not None and second is not None:
+                return Route(pair=pair, legs=(first, second))
+
+        return None
@@ -1,8 +1,11 @@
 from .amount import Amount
 from .currency import Currency
+from .interval import Interval
 from .pair import Pair
 from .quote_age import QuoteAge
 from .rate import Rate
+from .resolution import Resolution
+from .route import Route, RouteLeg
 from .timestamp_utc import TimestampUTC
 
 # I believe these types to be quite self-explanatory.
@@ -14,4 +17,8 @@ __all__ = [
     "Rate",
     "TimestampUTC",
     "QuoteAge",
+    "Route",
+    "RouteLeg",
+    "Resolution",
+    "Interval",
 ]
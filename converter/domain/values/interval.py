@@ -0,0 +1,65 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from .timestamp_utc import TimestampUTC
+
+_UNITS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+_LABEL = re.compile(r"^([1-9][0-9]*)([smhd])$")
+
+
+@dataclass(frozen=True)
+class Interval:
+    """
+    Fixed width of a candle, in whole seconds.
+    Buckets are aligned to the unix epoch, like Postgres `date_bin` with that origin.
+    """
+
+    seconds: int
+
+    def __post_init__(self) -> None:
+        if self.seconds <= 0:
+            raise ValueError(f"Interval must be positive: {self.seconds}")
+
+    @classmethod
+    def parse(cls, label: str) -> "Interval":
+        """
+        :param label: Width like "30s", "5m", "4h" or "1d"
+        :raises ValueError: If the label isn't a count followed by s, m, h or d
+        """
+        match = _LABEL.match(label.strip().lower())
+
+        if match is None:
+            raise ValueError(f"Invalid interval: {label}")
+
+        return cls(int(match.group(1)) * _UNITS[match.group(2)])
+
+    @property
+    def label(self) -> str:
+        unit = next(u for u, size in _UNITS.items() if self.seconds % size == 0)
+
+        return f"{self.seconds // _UNITS[unit]}{unit}"
+
+    @property
+    def duration(self) -> timedelta:
+        return timedelta(seconds=self.seconds)
+
+    def bucket_start(self, timestamp: TimestampUTC) -> TimestampUTC:
+        """Returns the start of the bucket the timestamp falls into."""
+        epoch = int(timestamp.value.timestamp())
+
+        return TimestampUTC(
+            datetime.fromtimestamp(epoch - epoch % self.seconds, tz=timezone.utc)
+        )
+
+    def bucket_end(self, timestamp: TimestampUTC) -> TimestampUTC:
+        """Returns the first bucket boundary at or after the timestamp."""
+        start = self.bucket_start(timestamp)
+
+        if start.value == timestamp.value:
+            return start
+
+        return TimestampUTC(start.value + self.duration)
+
+    def __str__(self) -> str:
+        return self.label
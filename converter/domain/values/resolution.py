@@ -0,0 +1,50 @@
+from enum import Enum
+from typing import Optional
+
+from .interval import Interval
+from .timestamp_utc import TimestampUTC
+
+
+class Resolution(Enum):
+    """
+    Bucket widths of the stored OHLC rollups, in seconds.
+    """
+
+    MINUTE = 60
+    HOUR = 3600
+
+    @property
+    def seconds(self) -> int:
+        return self.value
+
+    @property
+    def interval(self) -> Interval:
+        return Interval(self.value)
+
+    @property
+    def label(self) -> str:
+        return self.interval.label
+
+    def bucket_start(self, timestamp: TimestampUTC) -> TimestampUTC:
+        """Returns the start of the bucket the timestamp falls into."""
+        return self.interval.bucket_start(timestamp)
+
+    @classmethod
+    def coarsest_within(cls, precision_seconds: float) -> Optional["Resolution"]:
+        """
+        Returns the widest resolution that still satisfies the precision,
+        or None if even the finest one is too coarse.
+        """
+        fitting = [r for r in cls if r.seconds <= precision_seconds]
+
+        return max(fitting, key=lambda r: r.seconds) if fitting else None
+
+    @classmethod
+    def coarsest_dividing(cls, interval: Interval) -> Optional["Resolution"]:
+        """
+        Returns the widest resolution whose buckets tile the interval exactly,
+        or None if candles of that width have to be built from raw quotes.
+        """
+        fitting = [r for r in cls if interval.seconds % r.seconds == 0]
+
+        return max(fitting, key=lambda r: r.seconds) if fitting else None
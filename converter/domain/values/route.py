@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from .pair import Pair
+
+
+@dataclass(frozen=True)
+class RouteLeg:
+    """
+    One hop of a route: a listed pair, optionally traversed in reverse
+    (listed BTC/USDT used to go USDT -> BTC).
+    """
+
+    pair: Pair
+    inverted: bool = False
+
+    def target(self) -> Pair:
+        """Returns the direction this leg converts in."""
+        return self.pair.inverse() if self.inverted else self.pair
+
+
+@dataclass(frozen=True)
+class Route:
+    pair: Pair
+    legs: tuple[RouteLeg, ...]
+
+    def __post_init__(self) -> None:
+        if not self.legs:
+            raise ValueError(f"Route for {self.pair} must have at least one leg")
+
+        if self.legs[0].target().base != self.pair.base:
+            raise ValueError(f"Route for {self.pair} starts at the wrong currency")
+
+        if self.legs[-1].target().quote != self.pair.quote:
+            raise ValueError(f"Route for {self.pair} ends at the wrong currency")
+
+        for prev, nxt in zip(self.legs, self.legs[1:]):
+            if prev.target().quote != nxt.target().base:
+                raise ValueError(f"Route for {self.pair} has disconnected legs")
+
+    def __str__(self) -> str:
+        hops = [str(self.legs[0].target().base)]
+        hops.extend(str(leg.target().quote) for leg in self.legs)
+        return "->".join(hops)
+
+    @property
+    def is_direct(self) -> bool:
+        """True when the route is just the listed pair itself."""
+        return len(self.legs) == 1 and not self.legs[0].inverted
+
+    def leg_pairs(self) -> list[Pair]:
+        """Returns the listed pairs whose quotes are needed for this route."""
+        return [leg.pair for leg in self.legs]
@@ -6,28 +6,97 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from converter.adapters.inbound.consumer.quote_consumer import QuoteConsumer
 from converter.adapters.outbound.external.binance.client import BinanceAPIClient
+from converter.adapters.outbound.external.binance.clock import BinanceClock
 from converter.adapters.outbound.external.binance.rate_source import (
     BinanceStreamingRateSource,
 )
+from converter.adapters.outbound.external.binance.symbol_registry import (
+    BinanceSymbolRegistry,
+)
+from converter.adapters.outbound.external.binance.websocket_rate_source import (
+    BinanceWebSocketRateSource,
+)
+from converter.adapters.outbound.persistence.asyncpg.quote_exporter import (
+    AsyncpgQuoteExporter,
+)
+from converter.adapters.outbound.persistence.asyncpg.quote_repository import (
+    AsyncpgQuoteRepository,
+)
+from converter.adapters.outbound.persistence.parquet.quote_archive import (
+    ParquetQuoteArchive,
+)
+from converter.adapters.outbound.persistence.parquet.quote_repository import (
+    ParquetQuoteRepository,
+)
+from converter.adapters.outbound.persistence.redis.codec import (
+    BinaryTickerCodec,
+    JsonTickerCodec,
+)
 from converter.adapters.outbound.persistence.redis.quote_repository import (
     RedisQuoteRepository,
 )
+from converter.adapters.outbound.persistence.redis.quote_snapshot_cache import (
+    RedisQuoteSnapshotCache,
+)
 from converter.adapters.outbound.persistence.redis.quote_writer import RedisQuoteWriter
+from converter.adapters.outbound.persistence.redis.route_index_refresher import (
+    RouteIndexRefresher,
+)
+from converter.adapters.outbound.persistence.repositories.change_detecting_quote_writer import (
+    ChangeDetectingQuoteWriter,
+)
+from converter.adapters.outbound.persistence.repositories.coalescing_quote_repository import (
+    CoalescingQuoteRepository,
+)
 from converter.adapters.outbound.persistence.repositories.composite_quote_repository import (
     CompositeQuoteRepository,
 )
 from converter.adapters.outbound.persistence.repositories.composite_quote_writer import (
     CompositeQuoteWriter,
 )
+from converter.adapters.outbound.persistence.repositories.group_commit_quote_writer import (
+    GroupCommitQuoteWriter,
+)
+from converter.adapters.outbound.persistence.repositories.rollup_quote_repository import (
+    RollupQuoteRepository,
+)
+from converter.adapters.outbound.persistence.repositories.routing_quote_repository import (
+    RoutingQuoteRepository,
+)
+from converter.adapters.outbound.persistence.repositories.spooling_quote_writer import (
+    SpoolingQuoteWriter,
+)
+from converter.adapters.outbound.persistence.repositories.write_behind_quote_writer import (
+    WriteBehindQuoteWriter,
+)
+from converter.adapters.outbound.persistence.spool.quote_spool import QuoteSpool
+from converter.adapters.outbound.persistence.sqlalchemy.candle_repository import (
+    PostgresCandleRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.candle_writer import (
+    PostgresCandleWriter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.copy_quote_writer import (
+    PostgresCopyQuoteWriter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.errors import UNAVAILABLE_ERRORS
 from converter.adapters.outbound.persistence.sqlalchemy.quote_repository import (
     PostgresQuoteRepository,
 )
 from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
+    PostgresLatestQuoteWriter,
     PostgresQuoteWriter,
 )
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
+from converter.app.commands.archive_quotes import ArchiveQuotesCommandHandler
 from converter.app.commands.store_quotes import StoreQuotesCommandHandler
+from converter.app.queries.export_quotes import ExportQuotesQueryHandler
+from converter.app.queries.get_batch_conversion import GetBatchConversionQueryHandler
+from converter.app.queries.get_candles import GetCandlesQueryHandler
 from converter.app.queries.get_conversion import GetConversionQueryHandler
-from converter.domain.services import ConversionService
+from converter.domain.services import ConversionService, CrossRateService, RouteIndex
 from converter.domain.services.factory import AmountFactory, RateFactory
 from converter.domain.services.precision_service import (
     PrecisionPolicy,
@@ -115,6 +184,13 @@ class Container(containers.DeclarativeContainer):
         freshness_service=freshness_service,
     )
 
+    cross_rate_service = providers.Singleton(
+        CrossRateService,
+        rate_factory=rate_factory,
+    )
+
+    route_index = providers.Singleton(RouteIndex)
+
     binance_api_client = providers.Singleton(
         BinanceAPIClient,
         timeout=config.binance_api_timeout,
@@ -127,74 +203,343 @@ class Container(containers.DeclarativeContainer):
 
     scheduler = providers.Singleton(FixedRateScheduler)
 
-    rate_source = providers.Singleton(
-        BinanceStreamingRateSource,
+    binance_symbol_registry = providers.Singleton(
+        BinanceSymbolRegistry, api_client=binance_api_client
+    )
+
+    binance_clock = providers.Singleton(
+        BinanceClock,
         api_client=binance_api_client,
-        rate_factory=rate_factory,
-        rates_interval_seconds=config.fetch_interval_seconds,
-        symbols_interval_seconds=config.symbol_refresh_interval_seconds,
-        queue_maxsize=10,
-        scheduler=scheduler,
+        max_uncertainty_ms=config.clock_sync_max_uncertainty_ms,
+    )
+
+    rate_source = providers.Selector(
+        config.rate_source,
+        polling=providers.Singleton(
+            BinanceStreamingRateSource,
+            api_client=binance_api_client,
+            rate_factory=rate_factory,
+            rates_interval_seconds=config.fetch_interval_seconds,
+            symbols_interval_seconds=config.symbol_refresh_interval_seconds,
+            scheduler=scheduler,
+            clock=binance_clock,
+            clock_interval_seconds=config.clock_sync_interval_seconds,
+            symbols=binance_symbol_registry,
+        ),
+        websocket=providers.Singleton(
+            BinanceWebSocketRateSource,
+            api_client=binance_api_client,
+            rate_factory=rate_factory,
+            ws_base_url=config.binance_ws_url,
+            flush_interval_seconds=config.ws_flush_interval_seconds,
+            flush_max_quotes=config.ws_flush_max_quotes,
+            snapshot_interval_seconds=config.fetch_interval_seconds,
+            symbols_interval_seconds=config.symbol_refresh_interval_seconds,
+            symbols=binance_symbol_registry,
+            clock=binance_clock,
+        ),
+    )
+
+    redis_ticker_codec = providers.Selector(
+        config.redis_codec,
+        json=providers.Singleton(JsonTickerCodec),
+        binary=providers.Singleton(BinaryTickerCodec),
     )
 
     redis_quote_repository = providers.Factory(
         RedisQuoteRepository,
         redis_client=redis_client,
         rate_factory=rate_factory,
+        layout=config.redis_layout,
+        codec=redis_ticker_codec,
     )
 
-    redis_quote_writer = providers.Factory(
+    # Singleton, owns the background task that keeps route_index current
+    route_index_refresher = providers.Singleton(
+        RouteIndexRefresher,
+        repository=redis_quote_repository,
+        route_index=route_index,
+        interval_seconds=config.route_index_refresh_seconds,
+    )
+
+    # Singleton, the hash layout keeps the full snapshot between batches
+    redis_quote_writer = providers.Singleton(
         RedisQuoteWriter,
         redis_client=redis_client,
         rate_factory=rate_factory,
         ttl_seconds=config.redis_quote_ttl_seconds,
+        history_window_seconds=config.redis_history_window_seconds,
+        layout=config.redis_layout,
+        codec=redis_ticker_codec,
     )
 
-    postgres_quote_repository = providers.Factory(
-        PostgresQuoteRepository,
-        rate_factory=rate_factory,
+    postgres_quote_repository = providers.Selector(
+        config.postgres_read_mode,
+        orm=providers.Factory(
+            PostgresQuoteRepository,
+            rate_factory=rate_factory,
+            session_factory=db_session_factory,
+            freshness_policy=freshness_policy,
+        ),
+        # Owns its connection pool, so there's only one
+        asyncpg=providers.Singleton(
+            AsyncpgQuoteRepository,
+            dsn=config.postgres_read_dsn,
+            rate_factory=rate_factory,
+            max_pool_size=config.db_pool_size,
+            freshness_policy=freshness_policy,
+        ),
+    )
+
+    # Caches symbol ids for the whole process
+    symbol_registry = providers.Singleton(
+        SymbolRegistry,
         session_factory=db_session_factory,
     )
 
-    postgres_quote_writer = providers.Factory(
-        PostgresQuoteWriter,
+    postgres_quote_writer = providers.Selector(
+        config.postgres_writer_mode,
+        insert=providers.Factory(
+            PostgresQuoteWriter,
+            rate_factory=rate_factory,
+            session_factory=db_session_factory,
+            symbol_registry=symbol_registry,
+        ),
+        copy=providers.Factory(
+            PostgresCopyQuoteWriter,
+            session_factory=db_session_factory,
+            symbol_registry=symbol_registry,
+        ),
+    )
+
+    # Holds the open group, so there's only one
+    group_committed_quote_writer = providers.Selector(
+        config.group_commit_mode,
+        enabled=providers.Singleton(
+            GroupCommitQuoteWriter,
+            inner=postgres_quote_writer,
+            max_delay_ms=config.group_commit_max_delay_ms,
+            max_rows=config.group_commit_max_rows,
+            max_batches=config.consumer_store_concurrency,
+        ),
+        disabled=postgres_quote_writer,
+    )
+
+    # Remembers what was last written, so it has to outlive a single batch
+    change_detecting_quote_writer = providers.Singleton(
+        ChangeDetectingQuoteWriter,
+        inner=group_committed_quote_writer,
+        heartbeat_seconds=config.postgres_heartbeat_seconds,
+        max_gap_seconds=config.quote_max_age_seconds,
+        interval_seconds=config.fetch_interval_seconds,
+        latest=providers.Factory(
+            PostgresLatestQuoteWriter,
+            session_factory=db_session_factory,
+            rate_factory=rate_factory,
+        ),
+    )
+
+    candle_repository = providers.Factory(
+        PostgresCandleRepository,
+        session_factory=db_session_factory,
         rate_factory=rate_factory,
+    )
+
+    candle_writer = providers.Factory(
+        PostgresCandleWriter,
         session_factory=db_session_factory,
+        symbol_registry=symbol_registry,
+    )
+
+    historical_quote_repository = providers.Selector(
+        config.rollup_mode,
+        enabled=providers.Factory(
+            RollupQuoteRepository,
+            inner=postgres_quote_repository,
+            candle_repository=candle_repository,
+            freshness_policy=freshness_policy,
+            raw_retention_days=config.raw_quote_retention_days,
+        ),
+        disabled=postgres_quote_repository,
+    )
+
+    # Rollups see every quote, change detection only applies to raw history.
+    # A failed rollup write is logged, it doesn't fail the batch.
+    postgres_storage_writer = providers.Selector(
+        config.rollup_mode,
+        enabled=providers.Factory(
+            CompositeQuoteWriter,
+            primary=change_detecting_quote_writer,
+            secondary=candle_writer,
+            secondary_storage="candles",
+        ),
+        disabled=change_detecting_quote_writer,
+    )
+
+    # Owns the spool files and the replay task, so there's only one
+    spooling_quote_writer = providers.Singleton(
+        SpoolingQuoteWriter,
+        inner=postgres_storage_writer,
+        spool=providers.Singleton(
+            QuoteSpool,
+            directory=config.spool_dir,
+            max_bytes=config.spool_max_bytes,
+            segment_bytes=config.spool_segment_bytes,
+        ),
+        unavailable_errors=UNAVAILABLE_ERRORS,
+        max_retry_seconds=config.spool_max_retry_seconds,
+    )
+
+    durable_storage_writer = providers.Selector(
+        config.spool_mode,
+        enabled=spooling_quote_writer,
+        disabled=postgres_storage_writer,
+    )
+
+    # Lookups older than the archive cutoff skip PostgreSQL, newer ones
+    # go to the archive only when PostgreSQL has nothing
+    archived_quote_repository = providers.Selector(
+        config.archive_mode,
+        enabled=providers.Factory(
+            CompositeQuoteRepository,
+            primary=historical_quote_repository,
+            fallback=providers.Factory(
+                ParquetQuoteRepository,
+                directory=config.archive_dir,
+                rate_factory=rate_factory,
+                freshness_policy=freshness_policy,
+            ),
+            primary_history_window_seconds=config.archive_read_after_seconds,
+        ),
+        disabled=historical_quote_repository,
     )
 
     composite_quote_repository = providers.Factory(
         CompositeQuoteRepository,
         primary=redis_quote_repository,
-        fallback=postgres_quote_repository,
+        fallback=archived_quote_repository,
+        primary_history_window_seconds=config.redis_history_window_seconds,
+    )
+
+    # Shared by every request, so identical concurrent lookups collapse into one
+    coalescing_quote_repository = providers.Singleton(
+        CoalescingQuoteRepository,
+        inner=composite_quote_repository,
     )
 
     composite_quote_writer = providers.Factory(
         CompositeQuoteWriter,
-        primary=postgres_quote_writer,
+        primary=durable_storage_writer,
         secondary=redis_quote_writer,
     )
 
+    # Owns the durable write queue and its task, so there's only one
+    write_behind_quote_writer = providers.Singleton(
+        WriteBehindQuoteWriter,
+        fast=redis_quote_writer,
+        durable=durable_storage_writer,
+        queue_size=config.write_behind_queue_batches,
+    )
+
+    quote_writer = providers.Selector(
+        config.quote_write_mode,
+        sync=composite_quote_writer,
+        write_behind=write_behind_quote_writer,
+    )
+
+    quote_snapshot_cache = providers.Singleton(
+        RedisQuoteSnapshotCache,
+        redis_client=redis_client,
+        rate_factory=rate_factory,
+        fallback=coalescing_quote_repository,
+        max_staleness_seconds=config.l1_cache_max_staleness_seconds,
+        layout=config.redis_layout,
+        codec=redis_ticker_codec,
+    )
+
+    api_quote_repository = providers.Selector(
+        config.quote_cache_mode,
+        l1=quote_snapshot_cache,
+        none=coalescing_quote_repository,
+    )
+
+    routing_quote_repository = providers.Factory(
+        RoutingQuoteRepository,
+        inner=api_quote_repository,
+        route_index=route_index,
+        cross_rate_service=cross_rate_service,
+    )
+
     conversion_query_handler = providers.Factory(
         GetConversionQueryHandler,
-        quote_repository=composite_quote_repository,
+        quote_repository=routing_quote_repository,
+        conversion_service=conversion_service,
+    )
+
+    batch_conversion_query_handler = providers.Factory(
+        GetBatchConversionQueryHandler,
+        quote_repository=routing_quote_repository,
         conversion_service=conversion_service,
     )
 
+    candles_query_handler = providers.Factory(
+        GetCandlesQueryHandler,
+        candle_repository=candle_repository,
+        settle_seconds=config.candle_settle_seconds,
+    )
+
+    # Owns its connection pool, sized to cap concurrent exports
+    quote_exporter = providers.Singleton(
+        AsyncpgQuoteExporter,
+        dsn=config.postgres_read_dsn,
+        max_concurrency=config.export_max_concurrency,
+        fetch_rows=config.export_fetch_rows,
+    )
+
+    export_quotes_query_handler = providers.Factory(
+        ExportQuotesQueryHandler,
+        quote_exporter=quote_exporter,
+    )
+
+    archive_quotes_command_handler = providers.Factory(
+        ArchiveQuotesCommandHandler,
+        history_source=quote_exporter,
+        archive=providers.Factory(
+            ParquetQuoteArchive,
+            directory=config.archive_dir,
+            row_group_rows=config.archive_row_group_rows,
+        ),
+    )
+
     store_quotes_command_handler = providers.Factory(
         StoreQuotesCommandHandler,
-        quote_writer_factory=composite_quote_writer,
+        quote_writer_factory=quote_writer,
     )
 
     quote_consumer = providers.Singleton(
         QuoteConsumer,
         rate_source=rate_source,
         handler=store_quotes_command_handler,
+        store_concurrency=config.consumer_store_concurrency,
     )
 
 
 async def cleanup_resources(container: Container) -> None:
     logger.info("container_cleanup_starting")
 
+    try:
+        snapshot_cache = container.quote_snapshot_cache()
+        await snapshot_cache.stop()
+        logger.info("quote_snapshot_cache_shutdown_complete")
+    except Exception as e:
+        logger.warning("quote_snapshot_cache_shutdown_error", error=str(e))
+
+    try:
+        await container.route_index_refresher().stop()
+        logger.info("route_index_refresher_shutdown_complete")
+    except Exception as e:
+        logger.warning("route_index_refresher_shutdown_error", error=str(e))
+
     try:
         scheduler_instance = container.scheduler()
         await scheduler_instance.shutdown()
@@ -209,6 +554,27 @@ async def cleanup_resources(container: Container) -> None:
     except Exception as e:
         logger.warning("quote_consumer_shutdown_error", error=str(e))
 
+    try:
+        if container.config.quote_write_mode() == "write_behind":
+            await container.write_behind_quote_writer().close()
+            logger.info("durable_write_queue_drained")
+    except Exception as e:
+        logger.warning("durable_write_queue_close_error", error=str(e))
+
+    try:
+        if container.config.spool_mode() == "enabled":
+            await container.spooling_quote_writer().close()
+            logger.info("quote_spool_replay_stopped")
+    except Exception as e:
+        logger.warning("quote_spool_close_error", error=str(e))
+
+    try:
+        if container.config.group_commit_mode() == "enabled":
+            await container.group_committed_quote_writer().close()
+            logger.info("group_commit_drained")
+    except Exception as e:
+        logger.warning("group_commit_close_error", error=str(e))
+
     try:
         rate_source_instance = container.rate_source()
         await rate_source_instance.close()
@@ -223,6 +589,17 @@ async def cleanup_resources(container: Container) -> None:
     except Exception as e:
         logger.warning("binance_client_close_error", error=str(e))
 
+    try:
+        if container.config.postgres_read_mode() == "asyncpg":
+            await container.postgres_quote_repository().close()
+    except Exception as e:
+        logger.warning("asyncpg_pool_close_error", error=str(e))
+
+    try:
+        await container.quote_exporter().close()
+    except Exception as e:
+        logger.warning("export_pool_close_error", error=str(e))
+
     try:
         redis_instance = container.redis_client()
         await redis_instance.aclose()
@@ -260,15 +637,57 @@ def get_container(app_type: str = "api") -> Container:
             "redis_url": redis_url,
             "db_pool_size": db_pool_size,
             "db_max_overflow": db_max_overflow,
+            "postgres_writer_mode": settings.POSTGRES_WRITER_MODE,
+            "postgres_read_mode": settings.POSTGRES_READ_MODE,
+            "consumer_store_concurrency": settings.CONSUMER_STORE_CONCURRENCY,
+            "group_commit_mode": (
+                "enabled" if settings.GROUP_COMMIT_ENABLED else "disabled"
+            ),
+            "group_commit_max_delay_ms": settings.GROUP_COMMIT_MAX_DELAY_MS,
+            "group_commit_max_rows": settings.GROUP_COMMIT_MAX_ROWS,
+            "quote_write_mode": settings.QUOTE_WRITE_MODE,
+            "write_behind_queue_batches": settings.WRITE_BEHIND_QUEUE_BATCHES,
+            "postgres_read_dsn": str(settings.DATABASE_URL).replace(
+                "postgresql+asyncpg://", "postgresql://", 1
+            ),
+            "postgres_heartbeat_seconds": settings.POSTGRES_HEARTBEAT_SECONDS,
+            "rollup_mode": "enabled" if settings.ROLLUPS_ENABLED else "disabled",
+            "export_max_concurrency": settings.EXPORT_MAX_CONCURRENCY,
+            "export_fetch_rows": settings.EXPORT_FETCH_ROWS,
+            "archive_mode": "enabled" if settings.ARCHIVE_ENABLED else "disabled",
+            "archive_dir": settings.ARCHIVE_DIR,
+            "archive_row_group_rows": settings.ARCHIVE_ROW_GROUP_ROWS,
+            "raw_quote_retention_days": settings.RAW_QUOTE_RETENTION_DAYS,
+            "archive_read_after_seconds": settings.ARCHIVE_READ_AFTER_DAYS * 86400,
+            "spool_mode": "enabled" if settings.SPOOL_ENABLED else "disabled",
+            "spool_dir": settings.SPOOL_DIR,
+            "spool_max_bytes": settings.SPOOL_MAX_BYTES,
+            "spool_segment_bytes": settings.SPOOL_SEGMENT_BYTES,
+            "spool_max_retry_seconds": float(settings.SPOOL_MAX_RETRY_SECONDS),
             "redis_quote_ttl_seconds": settings.REDIS_QUOTE_TTL_SECONDS,
+            "redis_history_window_seconds": settings.REDIS_HISTORY_WINDOW_SECONDS,
+            "redis_layout": settings.REDIS_LAYOUT,
+            "redis_codec": settings.REDIS_CODEC,
             "quote_max_age_seconds": settings.QUOTE_MAX_AGE_SECONDS,
+            "quote_cache_mode": "l1" if settings.L1_CACHE_ENABLED else "none",
+            "l1_cache_max_staleness_seconds": float(
+                settings.L1_CACHE_MAX_STALENESS_SECONDS
+            ),
+            "route_index_refresh_seconds": float(settings.ROUTE_INDEX_REFRESH_SECONDS),
+            "candle_settle_seconds": float(settings.CANDLE_SETTLE_SECONDS),
             "fetch_interval_seconds": float(settings.FETCH_INTERVAL_SECONDS),
             "symbol_refresh_interval_seconds": float(
                 settings.SYMBOL_FETCH_INTERVAL_SECONDS
             ),
+            "rate_source": settings.RATE_SOURCE,
+            "binance_ws_url": settings.BINANCE_WS_URL,
+            "ws_flush_interval_seconds": settings.WS_FLUSH_INTERVAL_SECONDS,
+            "ws_flush_max_quotes": settings.WS_FLUSH_MAX_QUOTES,
             "binance_api_timeout": settings.BINANCE_API_TIMEOUT,
             "binance_max_connections": settings.BINANCE_MAX_CONNECTIONS,
             "binance_max_connections_per_host": settings.BINANCE_MAX_CONNECTIONS_PER_HOST,
+            "clock_sync_interval_seconds": settings.CLOCK_SYNC_INTERVAL_SECONDS,
+            "clock_sync_max_uncertainty_ms": settings.CLOCK_SYNC_MAX_UNCERTAINTY_MS,
             "binance_enable_circuit_breaker": settings.BINANCE_ENABLE_CIRCUIT_BREAKER,
             "binance_circuit_breaker_failure_threshold": settings.BINANCE_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
             "binance_circuit_breaker_recovery_timeout": settings.BINANCE_CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
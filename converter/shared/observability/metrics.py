@@ -45,6 +45,13 @@ class Metrics:
             registry=self.registry,
         )
 
+        self.quote_routes_total = Counter(
+            "quote_routes_total",
+            "Quote lookups by route type (direct, inverse, cross, none)",
+            ["route_type"],
+            registry=self.registry,
+        )
+
         self.quotes_fetched_total = Counter(
             "quotes_fetched_total",
             "Total quotes fetched from external source",
@@ -57,6 +64,172 @@ class Metrics:
             ["storage"],
             registry=self.registry,
         )
+        self.quotes_store_failed_total = Counter(
+            "quotes_store_failed_total",
+            "Quotes a best-effort writer failed to store",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.quotes_exported_total = Counter(
+            "quotes_exported_total",
+            "Quote history rows streamed out by exports",
+            ["format"],
+            registry=self.registry,
+        )
+        self.quotes_unchanged_skipped_total = Counter(
+            "quotes_unchanged_skipped_total",
+            "Quotes not written because the price hadn't moved since the last write",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.quotes_spooled_total = Counter(
+            "quotes_spooled_total",
+            "Quotes kept in the on-disk spool while their storage was unavailable",
+            registry=self.registry,
+        )
+        self.quotes_spool_replayed_total = Counter(
+            "quotes_spool_replayed_total",
+            "Spooled quotes stored once their storage was back",
+            registry=self.registry,
+        )
+        self.quotes_spool_dropped_total = Counter(
+            "quotes_spool_dropped_total",
+            "Spooled quotes dropped, as the spool was full or the batch rejected",
+            ["reason"],
+            registry=self.registry,
+        )
+        self.quote_spool_batches = Gauge(
+            "quote_spool_batches",
+            "Batches waiting in the on-disk spool",
+            registry=self.registry,
+        )
+        self.quote_spool_bytes = Gauge(
+            "quote_spool_bytes",
+            "Disk space taken by the on-disk spool",
+            registry=self.registry,
+        )
+        self.durable_write_queue_batches = Gauge(
+            "durable_write_queue_batches",
+            "Published batches waiting for their durable write",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.durable_write_backpressure_seconds = Histogram(
+            "durable_write_backpressure_seconds",
+            "Time a batch waited for room in the durable write queue",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.durable_write_lag_seconds = Histogram(
+            "durable_write_lag_seconds",
+            "Time from a batch being queued to its durable write completing",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.group_commit_batches = Histogram(
+            "group_commit_batches",
+            "Batches committed together in one group",
+            ["storage"],
+            buckets=(1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64),
+            registry=self.registry,
+        )
+        self.group_commit_rows = Histogram(
+            "group_commit_rows",
+            "Quotes committed together in one group",
+            ["storage"],
+            buckets=(100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000),
+            registry=self.registry,
+        )
+        self.group_commit_duration_seconds = Histogram(
+            "group_commit_duration_seconds",
+            "Time to write and commit one group",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.group_commit_latency_seconds = Histogram(
+            "group_commit_latency_seconds",
+            "Time from a batch joining a group to the group being committed",
+            ["storage"],
+            registry=self.registry,
+        )
+        self.quote_servable_latency_seconds = Histogram(
+            "quote_servable_latency_seconds",
+            "Exchange time of a batch's newest quote to it being servable from Redis",
+            buckets=(0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 15, 30, 60, 120),
+            registry=self.registry,
+        )
+        self.pipeline_queue_batches = Gauge(
+            "pipeline_queue_batches",
+            "Batches waiting for a consumer stage",
+            ["stage"],
+            registry=self.registry,
+        )
+        self.pipeline_batches_total = Counter(
+            "pipeline_batches_total",
+            "Batches a consumer stage passed on",
+            ["stage"],
+            registry=self.registry,
+        )
+        self.quote_buffer_pending_quotes = Gauge(
+            "quote_buffer_pending_quotes",
+            "Quotes a rate source holds for the consumer, at most one per symbol",
+            ["source"],
+            registry=self.registry,
+        )
+        self.quote_buffer_merges_total = Counter(
+            "quote_buffer_merges_total",
+            "Batches merged into one the consumer hadn't taken yet",
+            ["source"],
+            registry=self.registry,
+        )
+        self.quote_buffer_overwritten_total = Counter(
+            "quote_buffer_overwritten_total",
+            "Pending quotes superseded by another quote of the same symbol",
+            ["source"],
+            registry=self.registry,
+        )
+        self.pipeline_stall_seconds_total = Counter(
+            "pipeline_stall_seconds_total",
+            "Time received batches waited for a consumer stage to take them",
+            ["stage"],
+            registry=self.registry,
+        )
+        self.pipeline_stage_duration_seconds = Histogram(
+            "pipeline_stage_duration_seconds",
+            "Time a consumer stage spent on one batch",
+            ["stage"],
+            registry=self.registry,
+        )
+        self.scheduled_runs_skipped_total = Counter(
+            "scheduled_runs_skipped_total",
+            "Scheduled runs skipped because the previous run hadn't finished",
+            ["task"],
+            registry=self.registry,
+        )
+        self.clock_offset_seconds = Gauge(
+            "clock_offset_seconds",
+            "Provider clock minus local wall clock, as of the last sample",
+            ["provider"],
+            registry=self.registry,
+        )
+        self.clock_offset_uncertainty_seconds = Gauge(
+            "clock_offset_uncertainty_seconds",
+            "Error bound of the last provider time estimate",
+            ["provider"],
+            registry=self.registry,
+        )
+        self.clock_drift_ppm = Gauge(
+            "clock_drift_ppm",
+            "Estimated drift between the provider clock and the local monotonic clock",
+            ["provider"],
+            registry=self.registry,
+        )
+        self.clock_sync_fallbacks_total = Counter(
+            "clock_sync_fallbacks_total",
+            "Provider time asked for directly because no estimate was certain enough",
+            ["provider"],
+            registry=self.registry,
+        )
         self.quote_age_seconds = Gauge(
             "quote_age_seconds",
             "Age of the most recent quote",
@@ -76,6 +249,32 @@ class Metrics:
             ["cache_type"],
             registry=self.registry,
         )
+        self.cache_snapshot_entries = Gauge(
+            "cache_snapshot_entries",
+            "Number of entries in the in-process snapshot cache",
+            ["cache_type"],
+            registry=self.registry,
+        )
+        self.cache_snapshot_refreshed_timestamp_seconds = Gauge(
+            "cache_snapshot_refreshed_timestamp_seconds",
+            "Unix time of the last successful snapshot cache refresh",
+            ["cache_type"],
+            registry=self.registry,
+        )
+
+        self.quote_lookups_coalesced_total = Counter(
+            "quote_lookups_coalesced_total",
+            "Quote lookups served by joining an identical in-flight lookup",
+            ["operation"],
+            registry=self.registry,
+        )
+
+        self.historical_lookups_total = Counter(
+            "historical_lookups_total",
+            "Historical lookups by the resolution that answered them",
+            ["resolution"],
+            registry=self.registry,
+        )
 
         self.db_queries_total = Counter(
             "db_queries_total",
@@ -103,6 +302,25 @@ class Metrics:
             registry=self.registry,
         )
 
+        self.symbol_registry_refreshes_total = Counter(
+            "symbol_registry_refreshes_total",
+            "Symbol refreshes, by whether the exchange info response changed",
+            ["provider", "result"],
+            registry=self.registry,
+        )
+        self.symbol_registry_changes_total = Counter(
+            "symbol_registry_changes_total",
+            "Pairs listed and delisted by symbol refreshes",
+            ["provider", "change"],
+            registry=self.registry,
+        )
+        self.symbol_registry_pairs = Gauge(
+            "symbol_registry_pairs",
+            "Pairs currently in the symbol registry",
+            ["provider"],
+            registry=self.registry,
+        )
+
         logger.info("metrics_initialized")
 
 
@@ -2,17 +2,22 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from converter.shared.config import get_settings
 from converter.shared.logging import get_logger
+from converter.shared.observability import get_metrics_registry
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 class FixedRateScheduler:
     def __init__(self) -> None:
         self._scheduler = AsyncIOScheduler()
+        self._scheduler.add_listener(self._on_run_skipped, EVENT_JOB_MAX_INSTANCES)
         self._started = False
 
     def schedule(
@@ -76,6 +81,15 @@ class FixedRateScheduler:
         self._scheduler.shutdown(wait=True)
         logger.info("scheduler_shutdown_complete")
 
+    @staticmethod
+    def _on_run_skipped(event: Any) -> None:
+        # A run still going when the next one is due makes APScheduler skip the next
+        logger.warning("scheduled_task_skipped", task_name=event.job_id)
+
+        if settings.ENABLE_METRICS:
+            metrics = get_metrics_registry()
+            metrics.scheduled_runs_skipped_total.labels(task=event.job_id).inc()
+
     def get_job_info(self) -> list[dict[str, Any]]:
         return [
             {
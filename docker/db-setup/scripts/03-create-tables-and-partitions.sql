@@ -1,5 +1,19 @@
 \c crypto_converter
 
+-- Every symbol ever stored, numbered. Quotes carry the 2-byte id instead of
+-- the symbol and its currencies, which keeps their rows and keys narrow.
+-- Ids are only ever added, so quotes don't need a foreign key checked per insert.
+CREATE TABLE IF NOT EXISTS public.symbols (
+    id                SMALLINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    symbol            VARCHAR(40) NOT NULL UNIQUE,
+    base_currency     VARCHAR(20) NOT NULL,
+    quote_currency    VARCHAR(20) NOT NULL
+);
+
+ALTER TABLE public.symbols OWNER TO converter_consumer;
+
+-- Rates are quantized to 8 decimals before they're stored, NUMERIC(24, 8) holds
+-- them exactly (up to 16 integer digits)
 DO $$
 BEGIN
     IF NOT EXISTS (
@@ -8,14 +22,12 @@ BEGIN
         AND tablename = 'quotes'
     ) THEN
         CREATE TABLE public.quotes (
-            symbol            VARCHAR(40) NOT NULL,
-            base_currency     VARCHAR(20) NOT NULL,
-            quote_currency    VARCHAR(20) NOT NULL,
-            rate              NUMERIC(36, 18) NOT NULL,
+            symbol_id         SMALLINT NOT NULL,
             quote_timestamp   TIMESTAMPTZ NOT NULL,
+            rate              NUMERIC(24, 8) NOT NULL,
             created_at        TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
 
-            PRIMARY KEY (symbol, quote_timestamp)
+            PRIMARY KEY (symbol_id, quote_timestamp)
         ) PARTITION BY RANGE (quote_timestamp);
 
         ALTER TABLE public.quotes OWNER TO converter_consumer;
@@ -23,12 +35,52 @@ BEGIN
 END
 $$;
 
-CREATE INDEX IF NOT EXISTS idx_quotes_symbol_timestamp
-    ON public.quotes (symbol, quote_timestamp DESC);
+-- Migrates quotes from the earlier layout, keyed by the symbol string with
+-- both currencies on every row. Retention keeps at most a week of quotes,
+-- so rewriting them in place is bounded.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT FROM information_schema.columns
+        WHERE table_schema = 'public'
+        AND table_name = 'quotes'
+        AND column_name = 'symbol'
+    ) THEN
+        INSERT INTO public.symbols (symbol, base_currency, quote_currency)
+        SELECT DISTINCT ON (symbol) symbol, base_currency, quote_currency
+        FROM public.quotes
+        ORDER BY symbol
+        ON CONFLICT (symbol) DO NOTHING;
+
+        ALTER TABLE public.quotes ADD COLUMN IF NOT EXISTS symbol_id SMALLINT;
+
+        UPDATE public.quotes q
+        SET symbol_id = s.id
+        FROM public.symbols s
+        WHERE s.symbol = q.symbol;
+
+        ALTER TABLE public.quotes ALTER COLUMN symbol_id SET NOT NULL;
+
+        DROP INDEX IF EXISTS public.idx_quotes_symbol_timestamp;
+        DROP INDEX IF EXISTS public.idx_quotes_base_quote_timestamp;
+
+        ALTER TABLE public.quotes DROP CONSTRAINT quotes_pkey;
+        ALTER TABLE public.quotes ADD PRIMARY KEY (symbol_id, quote_timestamp);
+
+        ALTER TABLE public.quotes
+            DROP COLUMN symbol,
+            DROP COLUMN base_currency,
+            DROP COLUMN quote_currency,
+            ALTER COLUMN rate TYPE NUMERIC(24, 8);
+
+        RAISE NOTICE 'Migrated public.quotes to symbol ids';
+    END IF;
+END
+$$;
+
+-- The primary key already serves (symbol_id, quote_timestamp) lookups both ways
 CREATE INDEX IF NOT EXISTS idx_quotes_timestamp
     ON public.quotes (quote_timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_quotes_base_quote_timestamp
-    ON public.quotes (base_currency, quote_currency, quote_timestamp DESC);
 
 DO $$
 DECLARE
@@ -0,0 +1,28 @@
+\c crypto_converter
+
+-- One row per symbol, kept up to date by the consumer in the same
+-- transaction as the insert into quotes. Not partitioned, on purpose:
+-- latest lookups are a primary key probe instead of a plan over every partition.
+-- Keeps the symbol and its currencies rather than a symbols id: it never holds
+-- more than a row per symbol, and lookups by name need no join.
+CREATE TABLE IF NOT EXISTS public.quotes_latest (
+    symbol            VARCHAR(40) PRIMARY KEY,
+    base_currency     VARCHAR(20) NOT NULL,
+    quote_currency    VARCHAR(20) NOT NULL,
+    rate              NUMERIC(24, 8) NOT NULL,
+    quote_timestamp   TIMESTAMPTZ NOT NULL,
+    updated_at        TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+ALTER TABLE public.quotes_latest OWNER TO converter_consumer;
+
+-- Existing databases already have history, start from it
+INSERT INTO public.quotes_latest (symbol, base_currency, quote_currency, rate, quote_timestamp)
+SELECT DISTINCT ON (s.symbol) s.symbol, s.base_currency, s.quote_currency, q.rate, q.quote_timestamp
+FROM public.quotes q
+JOIN public.symbols s ON s.id = q.symbol_id
+ORDER BY s.symbol, q.quote_timestamp DESC
+ON CONFLICT (symbol) DO NOTHING;
+
+GRANT SELECT ON public.quotes_latest TO converter_api;
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.quotes_latest TO converter_consumer;
@@ -0,0 +1,97 @@
+\c crypto_converter
+
+-- OHLC rollups, maintained by the consumer from every stored batch.
+-- Far fewer rows than the raw quotes, so they're kept much longer:
+-- 1m candles for 30 days, 1h candles for two years.
+-- Keyed by symbols id and sized like quotes, since prices are stored rates.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT FROM pg_tables
+        WHERE schemaname = 'public'
+        AND tablename = 'candles_1m'
+    ) THEN
+        CREATE TABLE public.candles_1m (
+            symbol_id         SMALLINT NOT NULL,
+            bucket_start      TIMESTAMPTZ NOT NULL,
+            open              NUMERIC(24, 8) NOT NULL,
+            high              NUMERIC(24, 8) NOT NULL,
+            low               NUMERIC(24, 8) NOT NULL,
+            close             NUMERIC(24, 8) NOT NULL,
+            open_time         TIMESTAMPTZ NOT NULL,
+            close_time        TIMESTAMPTZ NOT NULL,
+
+            PRIMARY KEY (symbol_id, bucket_start)
+        ) PARTITION BY RANGE (bucket_start);
+
+        ALTER TABLE public.candles_1m OWNER TO converter_consumer;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT FROM pg_tables
+        WHERE schemaname = 'public'
+        AND tablename = 'candles_1h'
+    ) THEN
+        CREATE TABLE public.candles_1h (
+            symbol_id         SMALLINT NOT NULL,
+            bucket_start      TIMESTAMPTZ NOT NULL,
+            open              NUMERIC(24, 8) NOT NULL,
+            high              NUMERIC(24, 8) NOT NULL,
+            low               NUMERIC(24, 8) NOT NULL,
+            close             NUMERIC(24, 8) NOT NULL,
+            open_time         TIMESTAMPTZ NOT NULL,
+            close_time        TIMESTAMPTZ NOT NULL,
+
+            PRIMARY KEY (symbol_id, bucket_start)
+        ) PARTITION BY RANGE (bucket_start);
+
+        ALTER TABLE public.candles_1h OWNER TO converter_consumer;
+    END IF;
+END
+$$;
+
+DO $$
+DECLARE
+    r record;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_partman') THEN
+        RAISE WARNING 'pg_partman extension not installed';
+        RETURN;
+    END IF;
+
+    FOR r IN
+        SELECT * FROM (VALUES
+            ('public.candles_1m', '1 day', 7, '30 days'),
+            ('public.candles_1h', '1 month', 2, '24 months')
+        ) AS t(parent_table, part_interval, premake, retention)
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM part_config
+            WHERE parent_table = r.parent_table
+        ) THEN
+            PERFORM create_parent(
+                p_parent_table => r.parent_table,
+                p_control => 'bucket_start',
+                p_type => 'range',
+                p_interval => r.part_interval,
+                p_premake => r.premake
+            );
+
+            UPDATE part_config
+            SET retention = r.retention,
+                retention_keep_table = false,
+                retention_keep_index = false,
+                infinite_time_partitions = true,
+                inherit_privileges = true
+            WHERE parent_table = r.parent_table;
+
+            RAISE NOTICE 'pg_partman configured successfully for %', r.parent_table;
+        END IF;
+
+        PERFORM run_maintenance(r.parent_table, p_jobmon := false);
+    END LOOP;
+END
+$$;
+
+GRANT SELECT ON public.candles_1m, public.candles_1h TO converter_api;
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.candles_1m, public.candles_1h TO converter_consumer;
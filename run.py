@@ -3,8 +3,13 @@ import signal
 import sys
 from argparse import ArgumentParser, RawTextHelpFormatter
 from contextlib import suppress
+from datetime import datetime
 from functools import partial
 
+from converter.app.commands.archive_quotes import ArchiveQuotesCommand
+from converter.app.ports.outbound.quote_exporter import ExportFormat
+from converter.app.queries.export_quotes import ExportQuotesQuery
+from converter.domain.values import TimestampUTC
 from converter.shared.config import get_settings
 from converter.shared.di import get_container
 from converter.shared.logging import configure_logging, get_logger
@@ -37,6 +42,55 @@ def setup_arg_parser() -> ArgumentParser:
     )
     consumer_parser.set_defaults(func=run_consumer)
 
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Stream quote history to a CSV or NDJSON file.",
+    )
+    export_parser.add_argument(
+        "--from",
+        dest="start",
+        required=True,
+        type=datetime.fromisoformat,
+        help="Range start, ISO 8601 (UTC if no offset is given).",
+    )
+    export_parser.add_argument(
+        "--to",
+        dest="end",
+        required=True,
+        type=datetime.fromisoformat,
+        help="Range end (exclusive), ISO 8601 (UTC if no offset is given).",
+    )
+    export_parser.add_argument(
+        "--format",
+        dest="export_format",
+        choices=[f.value for f in ExportFormat],
+        default=ExportFormat.CSV.value,
+    )
+    export_parser.add_argument(
+        "--pair",
+        dest="pairs",
+        action="append",
+        default=[],
+        help="Symbol to export, repeatable. All symbols if left out.",
+    )
+    export_parser.add_argument(
+        "--output",
+        required=True,
+        help="File to write to.",
+    )
+    export_parser.set_defaults(func=run_export)
+
+    archive_parser = subparsers.add_parser(
+        "archive",
+        help="Archive closed quote partitions to Parquet.",
+    )
+    archive_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list the partitions that would be archived.",
+    )
+    archive_parser.set_defaults(func=run_archive)
+
     return parser
 
 
@@ -88,6 +142,27 @@ async def run_consumer_async(args) -> None:
     with suppress(asyncio.CancelledError):
         await consumer_task
 
+    try:
+        if container.config.quote_write_mode() == "write_behind":
+            await container.write_behind_quote_writer().close()
+            logger.info("durable_write_queue_drained")
+    except Exception as e:
+        logger.warning("durable_write_queue_close_error", error=str(e))
+
+    try:
+        if container.config.spool_mode() == "enabled":
+            await container.spooling_quote_writer().close()
+            logger.info("quote_spool_replay_stopped")
+    except Exception as e:
+        logger.warning("quote_spool_close_error", error=str(e))
+
+    try:
+        if container.config.group_commit_mode() == "enabled":
+            await container.group_committed_quote_writer().close()
+            logger.info("group_commit_drained")
+    except Exception as e:
+        logger.warning("group_commit_close_error", error=str(e))
+
     try:
         redis_client = container.redis_client()
         await redis_client.aclose()
@@ -112,6 +187,57 @@ def run_consumer(args) -> None:
         logger.info("consumer_interrupted")
 
 
+async def run_export_async(args) -> None:
+    container = get_container(app_type="export")
+    handler = container.export_quotes_query_handler()
+
+    query = ExportQuotesQuery(
+        start=TimestampUTC(args.start),
+        end=TimestampUTC(args.end),
+        export_format=ExportFormat(args.export_format),
+        symbols=args.pairs,
+    )
+
+    # Not stdout, that's where the logs go
+    try:
+        with open(args.output, "wb") as output:
+            async for chunk in handler.handle(query):
+                output.write(chunk)
+    finally:
+        await container.quote_exporter().close()
+
+    logger.info("export_written", output=args.output)
+
+
+def run_export(args) -> None:
+    asyncio.run(run_export_async(args))
+
+
+async def run_archive_async(args) -> None:
+    container = get_container(app_type="archive")
+    handler = container.archive_quotes_command_handler()
+
+    command = ArchiveQuotesCommand(
+        settle_seconds=settings.ARCHIVE_SETTLE_SECONDS,
+        dry_run=args.dry_run,
+    )
+
+    try:
+        result = await handler.handle(command)
+    finally:
+        await container.quote_exporter().close()
+
+    logger.info(
+        "archive_completed",
+        partitions=[p.name for p in result.archived],
+        rows=result.rows,
+    )
+
+
+def run_archive(args) -> None:
+    asyncio.run(run_archive_async(args))
+
+
 def main() -> None:
     parser = setup_arg_parser()
     args = parser.parse_args()
@@ -0,0 +1,177 @@
+import importlib
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
+
+from converter.app.queries.get_candles import CandlesPage
+from converter.domain.models import Candle
+from converter.domain.values import (
+    Currency,
+    Interval,
+    Pair,
+    Rate,
+    Resolution,
+    TimestampUTC,
+)
+from fastapi.testclient import TestClient
+
+from .test_conversion_api import MockContainer, MockHandler
+
+T0 = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+MINUTE = Interval.parse("1m")
+
+
+def _app_with_handler(monkeypatch, handler: MockHandler):
+    import converter.adapters.inbound.api.app as app_module
+    from converter.shared import di as di_module
+
+    monkeypatch.setattr(
+        di_module, "get_container", lambda *args, **kwargs: MockContainer()
+    )
+
+    app = importlib.reload(app_module).app
+
+    from converter.adapters.inbound.api.dependencies.services import (
+        get_candles_query_handler,
+    )
+
+    app.dependency_overrides[get_candles_query_handler] = lambda: handler
+
+    return app
+
+
+def _candle(minute: int) -> Candle:
+    bucket = T0 + timedelta(minutes=minute)
+
+    return Candle(
+        pair=Pair(Currency("BTC"), Currency("USDT")),
+        interval=MINUTE,
+        bucket_start=TimestampUTC(bucket),
+        open=Rate(Decimal("100")),
+        high=Rate(Decimal("110")),
+        low=Rate(Decimal("95")),
+        close=Rate(Decimal("105")),
+        open_time=TimestampUTC(bucket + timedelta(seconds=1)),
+        close_time=TimestampUTC(bucket + timedelta(seconds=59)),
+    )
+
+
+def _page(closed: bool, next_start=None) -> CandlesPage:
+    return CandlesPage(
+        symbol="BTCUSDT",
+        interval=MINUTE,
+        source=Resolution.MINUTE,
+        start=TimestampUTC(T0),
+        end=TimestampUTC(T0 + timedelta(minutes=2)),
+        candles=[_candle(0), _candle(1)],
+        next_start=next_start,
+        closed=closed,
+    )
+
+
+def test_candles_closed_page_is_immutable(monkeypatch):
+    # Given
+    handler = MockHandler(result=_page(closed=True), capture_query=True)
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/candles",
+            params={
+                "pair": "btcusdt",
+                "interval": "1M",
+                "from": "2025-10-02T12:00:30Z",
+                "to": "2025-10-02T12:02:00Z",
+            },
+        )
+
+    # Then
+    assert resp.status_code == 200
+    assert "immutable" in resp.headers["cache-control"]
+
+    data = resp.json()
+    assert data["pair"] == "BTCUSDT"
+    assert data["interval"] == "1m"
+    assert data["next"] is None
+    assert [c["close"] for c in data["candles"]] == ["105", "105"]
+    assert datetime.fromisoformat(data["candles"][1]["time"]) == T0 + timedelta(
+        minutes=1
+    )
+
+    query = handler.last_query
+    assert query.symbol == "BTCUSDT"
+    assert query.interval == MINUTE
+    assert query.start.value == T0 + timedelta(seconds=30)
+
+
+def test_candles_open_page_links_aligned_next_page(monkeypatch):
+    # Given
+    next_start = TimestampUTC(T0 + timedelta(minutes=2))
+    handler = MockHandler(result=_page(closed=False, next_start=next_start))
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/candles",
+            params={
+                "pair": "BTCUSDT",
+                "interval": "1m",
+                "from": "2025-10-02T12:00:00Z",
+                "to": "2025-10-02T12:10:30Z",
+                "limit": "2",
+            },
+        )
+
+    # Then
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "no-cache"
+
+    params = parse_qs(urlparse(resp.json()["next"]).query)
+    assert datetime.fromisoformat(params["from"][0]) == next_start.value
+    assert datetime.fromisoformat(params["to"][0]) == T0 + timedelta(minutes=11)
+    assert params["limit"] == ["2"]
+
+
+def test_candles_rejects_invalid_interval(monkeypatch):
+    # Given
+    app = _app_with_handler(monkeypatch, MockHandler(result=_page(closed=True)))
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/candles",
+            params={
+                "pair": "BTCUSDT",
+                "interval": "7m",
+                "from": "2025-10-02T12:00:00Z",
+                "to": "2025-10-02T13:00:00Z",
+            },
+        )
+
+    # Then
+    assert resp.status_code == 422
+    assert "divide a day" in resp.json()["detail"]
+
+
+def test_candles_value_error_returns_400(monkeypatch):
+    # Given
+    handler = MockHandler(error=ValueError("Page size must be positive: 0"))
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/candles",
+            params={
+                "pair": "BTCUSDT",
+                "interval": "1m",
+                "from": "2025-10-02T12:00:00Z",
+                "to": "2025-10-02T13:00:00Z",
+            },
+        )
+
+    # Then
+    assert resp.status_code == 400
+    assert "Page size" in resp.json()["detail"]
@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import Optional
 
 import pytest
+from converter.app.queries.get_batch_conversion import BatchConversionItemResult
 from converter.app.queries.get_conversion import ConversionResult as AppConversionResult
 from converter.domain.exceptions.conversion import (
     QuoteNotFoundError,
@@ -25,10 +26,24 @@ class MockRedis:
         return True
 
 
+class MockSnapshotCache:
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
 class MockContainer:
     def redis_client(self):
         return MockRedis()
 
+    def quote_snapshot_cache(self):
+        return MockSnapshotCache()
+
+    def route_index_refresher(self):
+        return MockSnapshotCache()
+
     async def cleanup_resources(self):
         pass
 
@@ -53,6 +68,15 @@ class MockHandler:
         return self._result
 
 
+def _keep_history(monkeypatch, raw_days: int, rollups: bool, archive: bool) -> None:
+    from converter.adapters.inbound.api.schemas import conversion as schema_module
+
+    monkeypatch.setattr(schema_module.settings, "RAW_QUOTE_RETENTION_DAYS", raw_days)
+    monkeypatch.setattr(schema_module.settings, "ROLLUP_RETENTION_DAYS", 30)
+    monkeypatch.setattr(schema_module.settings, "ROLLUPS_ENABLED", rollups)
+    monkeypatch.setattr(schema_module.settings, "ARCHIVE_ENABLED", archive)
+
+
 def _app_with_overrides(monkeypatch, app_module, handler: MockHandler):
     from converter.shared import di as di_module
 
@@ -65,12 +89,14 @@ def _app_with_overrides(monkeypatch, app_module, handler: MockHandler):
 
     from converter.adapters.inbound.api.dependencies.services import (
         get_amount_factory,
+        get_batch_conversion_query_handler,
         get_conversion_query_handler,
     )
     from converter.domain.services.factory import AmountFactory
     from converter.domain.services.precision_service import PrecisionService
 
     app.dependency_overrides[get_conversion_query_handler] = lambda: handler
+    app.dependency_overrides[get_batch_conversion_query_handler] = lambda: handler
     app.dependency_overrides[get_amount_factory] = lambda: AmountFactory(
         PrecisionService()
     )
@@ -123,18 +149,55 @@ def test_convert_historical_timestamp_passed_to_handler(monkeypatch):
 
     app = _app_with_overrides(monkeypatch, app_module, handler)
 
-    hist = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc).isoformat()
+    # Past the raw retention, answered from the rollups
+    _keep_history(monkeypatch, raw_days=7, rollups=True, archive=False)
+    hist = (datetime.now(timezone.utc) - timedelta(days=20)).replace(microsecond=0)
     with TestClient(app) as client:
         resp = client.get(
             "/convert",
-            params={"amount": "1", "from": "BTC", "to": "USDT", "timestamp": hist},
+            params={
+                "amount": "1",
+                "from": "BTC",
+                "to": "USDT",
+                "timestamp": hist.isoformat(),
+            },
         )
         assert resp.status_code == 200
         assert handler.last_query is not None
         assert handler.last_query.at_timestamp is not None
-        assert handler.last_query.at_timestamp.value == datetime(
-            2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc
-        )
+        assert handler.last_query.at_timestamp.value == hist
+
+
+def test_convert_timestamp_limited_by_history_kept(monkeypatch):
+    import converter.adapters.inbound.api.app as app_module
+
+    app_result = AppConversionResult(
+        amount=Amount(Decimal("1")),
+        original_amount=Amount(Decimal("1")),
+        rate=Rate(Decimal("1")),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc)),
+    )
+    app = _app_with_overrides(monkeypatch, app_module, MockHandler(result=app_result))
+    year_ago = datetime.now(timezone.utc) - timedelta(days=365)
+    params = {
+        "amount": "1",
+        "from": "BTC",
+        "to": "USDT",
+        "timestamp": year_ago.isoformat(),
+    }
+
+    with TestClient(app) as client:
+        # When
+        _keep_history(monkeypatch, raw_days=7, rollups=True, archive=False)
+        beyond_rollups = client.get("/convert", params=params)
+
+        _keep_history(monkeypatch, raw_days=7, rollups=True, archive=True)
+        from_archive = client.get("/convert", params=params)
+
+        # Then
+        assert beyond_rollups.status_code == 422
+        assert "30 days" in beyond_rollups.json()["detail"]
+        assert from_archive.status_code == 200
 
 
 def test_convert_quote_not_found(monkeypatch):
@@ -273,6 +336,7 @@ def test_convert_timestamp_too_old_422(monkeypatch):
         )
     )
     app = _app_with_overrides(monkeypatch, app_module, handler)
+    _keep_history(monkeypatch, raw_days=7, rollups=False, archive=False)
 
     old = datetime.now(timezone.utc) - timedelta(days=8)
     with TestClient(app) as client:
@@ -287,3 +351,78 @@ def test_convert_timestamp_too_old_422(monkeypatch):
         )
         assert resp.status_code == 422
         assert "older than 7 days" in resp.json()["detail"]
+
+
+def test_convert_batch_reports_per_item_results(monkeypatch):
+    import converter.adapters.inbound.api.app as app_module
+
+    ts = TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc))
+    handler = MockHandler(capture_query=True)
+    app = _app_with_overrides(monkeypatch, app_module, handler)
+
+    def _handle_batch(query):
+        handler.last_query = query
+        ok, missing = query.items
+        return [
+            BatchConversionItemResult(
+                item=ok,
+                result=AppConversionResult(
+                    amount=Amount(Decimal("50000")),
+                    original_amount=ok.amount,
+                    rate=Rate(Decimal("25000")),
+                    timestamp=ts,
+                ),
+            ),
+            BatchConversionItemResult(
+                item=missing, error=QuoteNotFoundError(missing.pair)
+            ),
+        ]
+
+    async def handle(query):
+        return _handle_batch(query)
+
+    handler.handle = handle
+
+    with TestClient(app) as client:
+        resp = client.post(
+            "/convert/batch",
+            json={
+                "items": [
+                    {"amount": "2", "from": "btc", "to": "USDT"},
+                    {"amount": "1", "from": "XYZ", "to": "USDT"},
+                ]
+            },
+        )
+
+    assert resp.status_code == 200
+    ok, missing = resp.json()["results"]
+
+    assert handler.last_query.items[0].pair == Pair(Currency("BTC"), Currency("USDT"))
+    assert ok["from"] == "BTC"
+    assert ok["status"] == 200
+    assert ok["amount"] == "50000"
+    assert ok["rate"] == "25000"
+    assert missing["to"] == "USDT"
+    assert missing["status"] == 404
+    assert missing["amount"] is None
+    assert "No quote found for pair XYZUSDT" in missing["detail"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"items": []},
+        {"items": [{"amount": "0", "from": "BTC", "to": "USDT"}]},
+        {"items": [{"amount": "1", "from": "BTC", "to": "BTC"}]},
+        {"items": [{"amount": "1", "from": "BTC", "to": "USDT"}] * 1001},
+    ],
+)
+def test_convert_batch_validation_errors_422(monkeypatch, body):
+    import converter.adapters.inbound.api.app as app_module
+
+    handler = MockHandler(result=[])
+    app = _app_with_overrides(monkeypatch, app_module, handler)
+
+    with TestClient(app) as client:
+        resp = client.post("/convert/batch", json=body)
+        assert resp.status_code == 422
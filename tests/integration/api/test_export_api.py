@@ -0,0 +1,127 @@
+import importlib
+
+from converter.app.ports.outbound.quote_exporter import ExportFormat
+from fastapi.testclient import TestClient
+
+from .test_conversion_api import MockContainer
+
+
+class MockExportHandler:
+    def __init__(self, chunks=None, error=None):
+        self._chunks = chunks or []
+        self._error = error
+        self.last_query = None
+
+    def handle(self, query):
+        self.last_query = query
+
+        if self._error is not None:
+            raise self._error
+
+        async def stream():
+            for chunk in self._chunks:
+                yield chunk
+
+        return stream()
+
+
+def _app_with_handler(monkeypatch, handler: MockExportHandler):
+    import converter.adapters.inbound.api.app as app_module
+    from converter.shared import di as di_module
+
+    monkeypatch.setattr(
+        di_module, "get_container", lambda *args, **kwargs: MockContainer()
+    )
+
+    app = importlib.reload(app_module).app
+
+    from converter.adapters.inbound.api.dependencies.services import (
+        get_export_quotes_query_handler,
+    )
+
+    app.dependency_overrides[get_export_quotes_query_handler] = lambda: handler
+
+    return app
+
+
+def test_export_streams_csv_attachment(monkeypatch):
+    # Given
+    handler = MockExportHandler(chunks=[b"symbol,rate\n", b"BTCUSDT,1\n"])
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/export/quotes",
+            params=[
+                ("from", "2025-10-01T00:00:00Z"),
+                ("to", "2025-10-08T00:00:00Z"),
+                ("pair", "btcusdt"),
+                ("pair", "ETHUSDT"),
+            ],
+        )
+
+    # Then
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert (
+        "quotes_20251001T000000_20251008T000000.csv"
+        in (resp.headers["content-disposition"])
+    )
+    assert resp.content == b"symbol,rate\nBTCUSDT,1\n"
+    assert handler.last_query.symbols == ["BTCUSDT", "ETHUSDT"]
+    assert handler.last_query.export_format is ExportFormat.CSV
+
+
+def test_export_ndjson_media_type(monkeypatch):
+    # Given
+    handler = MockExportHandler(chunks=[b'{"symbol":"BTCUSDT"}\n'])
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/export/quotes",
+            params={
+                "from": "2025-10-01T00:00:00Z",
+                "to": "2025-10-02T00:00:00Z",
+                "format": "ndjson",
+            },
+        )
+
+    # Then
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert handler.last_query.symbols == []
+
+
+def test_export_rejects_inverted_range(monkeypatch):
+    # Given
+    app = _app_with_handler(monkeypatch, MockExportHandler())
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/export/quotes",
+            params={"from": "2025-10-02T00:00:00Z", "to": "2025-10-01T00:00:00Z"},
+        )
+
+    # Then
+    assert resp.status_code == 422
+    assert "after its start" in resp.json()["detail"]
+
+
+def test_export_value_error_returns_400(monkeypatch):
+    # Given
+    handler = MockExportHandler(error=ValueError("Range start is not before its end"))
+    app = _app_with_handler(monkeypatch, handler)
+
+    # When
+    with TestClient(app) as client:
+        resp = client.get(
+            "/export/quotes",
+            params={"from": "2025-10-01T00:00:00Z", "to": "2025-10-02T00:00:00Z"},
+        )
+
+    # Then
+    assert resp.status_code == 400
@@ -36,10 +36,24 @@ class MockRedis:
         return True
 
 
+class MockSnapshotCache:
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
 class MockContainer:
     def redis_client(self):
         return MockRedis(fail=False)
 
+    def quote_snapshot_cache(self):
+        return MockSnapshotCache()
+
+    def route_index_refresher(self):
+        return MockSnapshotCache()
+
     async def cleanup_resources(self):
         pass
 
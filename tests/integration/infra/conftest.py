@@ -50,71 +50,99 @@ async def _init_partitioned_schema(engine: AsyncEngine) -> None:
         return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
 
     today = datetime.now(timezone.utc).date()
-    tomorrow = today + timedelta(days=1)
-    day_after = tomorrow + timedelta(days=1)
 
-    start_today = day_start(today).isoformat()
-    start_tomorrow = day_start(tomorrow).isoformat()
-    start_day_after = day_start(day_after).isoformat()
-
-    part_today = f"quotes_{today.strftime('%Y%m%d')}"
-    part_tomorrow = f"quotes_{tomorrow.strftime('%Y%m%d')}"
+    # Same shape as pg_partman keeps it: retained days behind today, one ahead
+    days = [today + timedelta(days=offset) for offset in range(-7, 2)]
 
     async with engine.begin() as conn:
         await conn.execute(
             text(
                 """
-                CREATE TABLE IF NOT EXISTS public.quotes (
-                    symbol            VARCHAR(40) NOT NULL,
+                CREATE TABLE IF NOT EXISTS public.symbols (
+                    id                SMALLINT GENERATED BY DEFAULT AS IDENTITY
+                                      PRIMARY KEY,
+                    symbol            VARCHAR(40) NOT NULL UNIQUE,
                     base_currency     VARCHAR(20) NOT NULL,
-                    quote_currency    VARCHAR(20) NOT NULL,
-                    rate              NUMERIC(36, 8) NOT NULL,
-                    quote_timestamp   TIMESTAMPTZ NOT NULL,
-                    created_at        TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (symbol, quote_timestamp)
-                ) PARTITION BY RANGE (quote_timestamp)
+                    quote_currency    VARCHAR(20) NOT NULL
+                )
                 """
             )
         )
 
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS idx_quotes_symbol_timestamp "
-                "ON public.quotes (symbol, quote_timestamp DESC)"
+                """
+                CREATE TABLE IF NOT EXISTS public.quotes (
+                    symbol_id         SMALLINT NOT NULL,
+                    quote_timestamp   TIMESTAMPTZ NOT NULL,
+                    rate              NUMERIC(24, 8) NOT NULL,
+                    created_at        TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (symbol_id, quote_timestamp)
+                ) PARTITION BY RANGE (quote_timestamp)
+                """
             )
         )
+
         await conn.execute(
             text(
                 "CREATE INDEX IF NOT EXISTS idx_quotes_timestamp "
                 "ON public.quotes (quote_timestamp DESC)"
             )
         )
-        await conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_quotes_base_quote_timestamp "
-                "ON public.quotes (base_currency, quote_currency, quote_timestamp DESC)"
-            )
-        )
 
         await conn.execute(
             text(
-                f"""
-                CREATE TABLE IF NOT EXISTS public.{part_today}
-                PARTITION OF public.quotes
-                FOR VALUES FROM ('{start_today}') TO ('{start_tomorrow}')
+                """
+                CREATE TABLE IF NOT EXISTS public.quotes_latest (
+                    symbol            VARCHAR(40) PRIMARY KEY,
+                    base_currency     VARCHAR(20) NOT NULL,
+                    quote_currency    VARCHAR(20) NOT NULL,
+                    rate              NUMERIC(24, 8) NOT NULL,
+                    quote_timestamp   TIMESTAMPTZ NOT NULL,
+                    updated_at        TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+                )
                 """
             )
         )
 
-        await conn.execute(
-            text(
-                f"""
-                CREATE TABLE IF NOT EXISTS public.{part_tomorrow}
-                PARTITION OF public.quotes
-                FOR VALUES FROM ('{start_tomorrow}') TO ('{start_day_after}')
-                """
+        for table in ("candles_1m", "candles_1h"):
+            await conn.execute(
+                text(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS public.{table} (
+                        symbol_id         SMALLINT NOT NULL,
+                        bucket_start      TIMESTAMPTZ NOT NULL,
+                        open              NUMERIC(24, 8) NOT NULL,
+                        high              NUMERIC(24, 8) NOT NULL,
+                        low               NUMERIC(24, 8) NOT NULL,
+                        close             NUMERIC(24, 8) NOT NULL,
+                        open_time         TIMESTAMPTZ NOT NULL,
+                        close_time        TIMESTAMPTZ NOT NULL,
+                        PRIMARY KEY (symbol_id, bucket_start)
+                    ) PARTITION BY RANGE (bucket_start)
+                    """
+                )
+            )
+            await conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS public.{table}_default "
+                    f"PARTITION OF public.{table} DEFAULT"
+                )
+            )
+
+        for day in days:
+            next_day = day + timedelta(days=1)
+
+            await conn.execute(
+                text(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS public.quotes_{day.strftime("%Y%m%d")}
+                    PARTITION OF public.quotes
+                    FOR VALUES FROM ('{day_start(day).isoformat()}')
+                    TO ('{day_start(next_day).isoformat()}')
+                    """
+                )
             )
-        )
 
 
 @pytest.fixture(scope="function")
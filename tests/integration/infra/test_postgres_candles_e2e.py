@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.rollup_quote_repository import (
+    RollupQuoteRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.candle_repository import (
+    PostgresCandleRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.candle_writer import (
+    PostgresCandleWriter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.quote_repository import (
+    PostgresQuoteRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
+    PostgresQuoteWriter,
+)
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import (
+    Currency,
+    Interval,
+    Pair,
+    Rate,
+    Resolution,
+    TimestampUTC,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+PAIR = Pair(Currency("ADA"), Currency("USDT"))
+
+
+def _quote(ts: datetime, rate: str) -> Quote:
+    return Quote(pair=PAIR, rate=Rate(Decimal(rate)), timestamp=TimestampUTC(ts))
+
+
+@pytest.mark.asyncio
+async def test_candles_merge_batches_and_serve_historical_lookups(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    writer = PostgresCandleWriter(session_factory=session_factory)
+    candles = PostgresCandleRepository(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+    rollups = RollupQuoteRepository(
+        inner=PostgresQuoteRepository(
+            session_factory=session_factory, rate_factory=rate_factory
+        ),
+        candle_repository=candles,
+        freshness_policy=FreshnessPolicy(max_age_seconds=60),
+    )
+
+    # Far older than the raw partitions, only the rollups can answer
+    minute = datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)
+    first = [_quote(minute + timedelta(seconds=10), "0.50")]
+    second = [
+        _quote(minute + timedelta(seconds=40), "0.55"),
+        _quote(minute + timedelta(seconds=25), "0.45"),
+    ]
+
+    # When
+    await writer.save_batch(first)
+    await writer.save_batch(second)
+    # A retried batch must not change anything
+    await writer.save_batch(second)
+
+    stored = await candles.get_candles(
+        PAIR, Resolution.MINUTE, TimestampUTC(minute), TimestampUTC(minute)
+    )
+    hourly = await candles.get_candles(
+        PAIR,
+        Resolution.HOUR,
+        TimestampUTC(minute - timedelta(hours=1)),
+        TimestampUTC(minute),
+    )
+    latest_before = await rollups.get_latest_before(
+        PAIR, TimestampUTC(minute + timedelta(seconds=30))
+    )
+
+    # Then
+    assert len(stored) == 1
+    candle = stored[0]
+    assert (candle.open.value, candle.high.value) == (Decimal("0.50"), Decimal("0.55"))
+    assert (candle.low.value, candle.close.value) == (Decimal("0.45"), Decimal("0.55"))
+    assert candle.open_time.value == minute + timedelta(seconds=10)
+    assert candle.close_time.value == minute + timedelta(seconds=40)
+
+    assert len(hourly) == 1
+    assert hourly[0].bucket_start.value == minute.replace(minute=0)
+    assert hourly[0].close.value == Decimal("0.55")
+
+    assert latest_before is not None
+    assert latest_before.rate.value == Decimal("0.50")
+
+
+@pytest.mark.asyncio
+async def test_binned_candles_agree_between_rollups_and_raw_quotes(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    pair = Pair(Currency("DOT"), Currency("USDT"))
+    candles = PostgresCandleRepository(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+
+    # Within the raw partitions, so both sources can answer
+    start = Interval.parse("1d").bucket_start(TimestampUTC.now()).value
+    quotes = [
+        Quote(
+            pair=pair,
+            rate=Rate(Decimal(rate)),
+            timestamp=TimestampUTC(start + timedelta(seconds=seconds)),
+        )
+        for seconds, rate in [(5, "4.0"), (70, "4.4"), (200, "3.9"), (290, "4.1")]
+    ]
+
+    await PostgresQuoteWriter(
+        session_factory=session_factory, rate_factory=rate_factory
+    ).save_batch(quotes)
+    await PostgresCandleWriter(session_factory=session_factory).save_batch(quotes)
+
+    interval = Interval.parse("5m")
+    end = TimestampUTC(start + timedelta(hours=1))
+
+    # When
+    from_rollups = await candles.get_binned_candles(
+        pair.code(), interval, Resolution.MINUTE, TimestampUTC(start), end
+    )
+    from_raw = await candles.get_binned_candles(
+        pair.code(), interval, None, TimestampUTC(start), end
+    )
+
+    # Then
+    assert from_rollups == from_raw
+    assert len(from_raw) == 1
+    candle = from_raw[0]
+    assert candle.bucket_start.value == start
+    assert (candle.open.value, candle.high.value) == (Decimal("4.0"), Decimal("4.4"))
+    assert (candle.low.value, candle.close.value) == (Decimal("3.9"), Decimal("4.1"))
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.asyncpg.quote_exporter import (
+    AsyncpgQuoteExporter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
+    PostgresQuoteWriter,
+)
+from converter.app.ports.outbound.quote_exporter import ExportFormat
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Interval, Pair, Rate, TimestampUTC
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+@pytest.mark.asyncio
+async def test_exporter_streams_history_in_symbol_and_time_order(
+    session_factory: async_sessionmaker[AsyncSession],
+    postgres_async_url: str,
+):
+    # Given
+    day = Interval.parse("1d").bucket_start(TimestampUTC.now()).value
+    pairs = [Pair(Currency(c), Currency("EUR")) for c in ("XLM", "ATOM")]
+    quotes = [
+        Quote(
+            pair=pair,
+            rate=Rate(Decimal(f"{i + 1}.5")),
+            timestamp=TimestampUTC(day - timedelta(hours=i * 20)),
+        )
+        for pair in pairs
+        for i in range(3)
+    ]
+    await PostgresQuoteWriter(
+        session_factory=session_factory, rate_factory=RateFactory(PrecisionService())
+    ).save_batch(quotes)
+
+    exporter = AsyncpgQuoteExporter(
+        dsn=postgres_async_url.replace("postgresql+asyncpg://", "postgresql://"),
+        fetch_rows=2,
+        chunk_bytes=64,
+    )
+    start = TimestampUTC(day - timedelta(days=3))
+    end = TimestampUTC(day + timedelta(seconds=1))
+    symbols = ["ATOMEUR", "XLMEUR"]
+
+    try:
+        # When
+        csv_body = b"".join(
+            [c async for c in exporter.export(symbols, start, end, ExportFormat.CSV)]
+        )
+        ndjson_body = b"".join(
+            [
+                c
+                async for c in exporter.export(
+                    ["XLMEUR"], start, end, ExportFormat.NDJSON
+                )
+            ]
+        )
+    finally:
+        await exporter.close()
+
+    # Then
+    rows = list(csv.DictReader(io.StringIO(csv_body.decode())))
+    assert [r["symbol"] for r in rows] == ["ATOMEUR"] * 3 + ["XLMEUR"] * 3
+    assert [Decimal(r["rate"]) for r in rows[:3]] == [
+        Decimal("3.5"),
+        Decimal("2.5"),
+        Decimal("1.5"),
+    ]
+
+    lines = [json.loads(line) for line in ndjson_body.decode().splitlines()]
+    assert {line["symbol"] for line in lines} == {"XLMEUR"}
+    assert len(lines) == 3
@@ -0,0 +1,137 @@
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import asyncpg
+import pytest
+from converter.adapters.outbound.persistence.asyncpg.quote_repository import (
+    LATEST_BEFORE_SQL,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.quote_repository import (
+    PostgresQuoteRepository,
+)
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Currency, Pair, TimestampUTC
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+UNBOUNDED_SQL = """
+SELECT rate, quote_timestamp FROM quotes
+WHERE symbol_id = (SELECT id FROM symbols WHERE symbol = $1)
+AND quote_timestamp <= $2
+ORDER BY quote_timestamp DESC
+LIMIT 1
+"""
+
+
+def _scanned_partitions(node: Any) -> set[str]:
+    found: set[str] = set()
+
+    if isinstance(node, dict):
+        relation = node.get("Relation Name", "")
+
+        if relation.startswith("quotes_") and relation != "quotes_latest":
+            found.add(relation)
+
+        for child in node.values():
+            found |= _scanned_partitions(child)
+
+    elif isinstance(node, list):
+        for child in node:
+            found |= _scanned_partitions(child)
+
+    return found
+
+
+def _plan(raw: Any) -> Any:
+    return json.loads(raw) if isinstance(raw, str) else raw
+
+
+def _window_partitions(newest: datetime, oldest: datetime) -> set[str]:
+    return {f"quotes_{day.strftime('%Y%m%d')}" for day in {oldest, newest}}
+
+
+@pytest.mark.asyncio
+async def test_orm_latest_before_prunes_to_freshness_window(
+    postgres_engine: AsyncEngine,
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    policy = FreshnessPolicy(max_age_seconds=60)
+    repo = PostgresQuoteRepository(
+        session_factory=session_factory,
+        rate_factory=RateFactory(PrecisionService()),
+        freshness_policy=policy,
+    )
+    timestamp = TimestampUTC.now()
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM quotes" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(postgres_engine.sync_engine, "before_cursor_execute", capture)
+
+    try:
+        await repo.get_latest_before(Pair(Currency("BTC"), Currency("USDT")), timestamp)
+    finally:
+        event.remove(postgres_engine.sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[0]
+
+    # When
+    async with postgres_engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = _plan(result.scalar_one())
+
+    # Then
+    scanned = _scanned_partitions(plan)
+    oldest = policy.oldest_acceptable(timestamp)
+
+    assert scanned
+    assert scanned <= _window_partitions(timestamp.value, oldest.value)
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_latest_before_prunes_to_freshness_window(
+    postgres_engine: AsyncEngine,
+    postgres_async_url: str,
+):
+    # Given
+    policy = FreshnessPolicy(max_age_seconds=60)
+    timestamp = datetime.now(timezone.utc)
+    oldest = policy.oldest_acceptable(TimestampUTC(timestamp)).value
+
+    conn = await asyncpg.connect(
+        postgres_async_url.replace("postgresql+asyncpg://", "postgresql://")
+    )
+
+    try:
+        # When
+        bounded = _plan(
+            await conn.fetchval(
+                f"EXPLAIN (FORMAT JSON) {LATEST_BEFORE_SQL}",
+                "BTCUSDT",
+                timestamp,
+                oldest,
+            )
+        )
+        unbounded = _plan(
+            await conn.fetchval(
+                f"EXPLAIN (FORMAT JSON) {UNBOUNDED_SQL}", "BTCUSDT", timestamp
+            )
+        )
+    finally:
+        await conn.close()
+
+    # Then
+    scanned = _scanned_partitions(bounded)
+
+    assert scanned
+    assert scanned <= _window_partitions(timestamp, oldest)
+    # Without the lower bound every retained day is probed
+    assert len(_scanned_partitions(unbounded)) >= 7
@@ -2,16 +2,26 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
+from converter.adapters.outbound.persistence.asyncpg.quote_repository import (
+    AsyncpgQuoteRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.copy_quote_writer import (
+    PostgresCopyQuoteWriter,
+)
 from converter.adapters.outbound.persistence.sqlalchemy.quote_repository import (
     PostgresQuoteRepository,
 )
 from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
     PostgresQuoteWriter,
 )
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
 from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
 from converter.domain.services.precision_service import PrecisionService
 from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
@@ -55,3 +65,166 @@ async def test_postgres_writer_and_repository_roundtrip(
 
     assert before is not None
     assert before.timestamp.value == q1.timestamp.value
+
+
+@pytest.mark.asyncio
+async def test_postgres_copy_writer_keeps_conflict_semantics(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    writer = PostgresCopyQuoteWriter(session_factory=session_factory)
+    repo = PostgresQuoteRepository(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+
+    base_time = datetime.now(timezone.utc).replace(microsecond=0)
+    q1 = _quote(base_time - timedelta(seconds=5))
+    duplicate = Quote(pair=q1.pair, rate=Rate(Decimal("1.00")), timestamp=q1.timestamp)
+
+    # When
+    await writer.save_batch([q1, q1])
+    await writer.save_batch([duplicate])
+
+    latest = await repo.get_latest(q1.pair)
+
+    # Then
+    assert latest is not None
+    assert latest.timestamp.value == q1.timestamp.value
+    assert latest.rate.value == Decimal("25000.00")
+
+
+@pytest.mark.asyncio
+async def test_latest_table_never_moves_back_in_time(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    writers = [
+        PostgresQuoteWriter(session_factory=session_factory, rate_factory=rate_factory),
+        PostgresCopyQuoteWriter(session_factory=session_factory),
+    ]
+    repo = PostgresQuoteRepository(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+
+    base_time = datetime.now(timezone.utc).replace(microsecond=0)
+    newer = Quote(
+        pair=Pair(Currency("SOL"), Currency("USDT")),
+        rate=Rate(Decimal("150.00")),
+        timestamp=TimestampUTC(base_time - timedelta(seconds=10)),
+    )
+    late = Quote(
+        pair=newer.pair,
+        rate=Rate(Decimal("140.00")),
+        timestamp=TimestampUTC(base_time - timedelta(seconds=20)),
+    )
+
+    for writer in writers:
+        # When
+        await writer.save_batch([newer])
+        await writer.save_batch([late])
+
+        latest = await repo.get_latest(newer.pair)
+        before = await repo.get_latest_before(
+            newer.pair, TimestampUTC(base_time - timedelta(seconds=15))
+        )
+
+        # Then
+        assert latest is not None
+        assert latest.rate.value == Decimal("150.00")
+        assert before is not None
+        assert before.rate.value == Decimal("140.00")
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_repository_matches_orm_repository(
+    session_factory: async_sessionmaker[AsyncSession],
+    postgres_async_url: str,
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    writer = PostgresQuoteWriter(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+    orm_repo = PostgresQuoteRepository(
+        session_factory=session_factory, rate_factory=rate_factory
+    )
+    raw_repo = AsyncpgQuoteRepository(
+        dsn=postgres_async_url.replace("postgresql+asyncpg://", "postgresql://"),
+        rate_factory=rate_factory,
+    )
+
+    base_time = datetime.now(timezone.utc).replace(microsecond=0)
+    q1 = _quote(base_time - timedelta(seconds=40))
+    q2 = _quote(base_time - timedelta(seconds=20))
+    missing = Pair(Currency("NOPE"), Currency("USDT"))
+    before = TimestampUTC(base_time - timedelta(seconds=30))
+
+    await writer.save_batch([q1, q2])
+
+    try:
+        # When
+        latest = await raw_repo.get_latest(q2.pair)
+        latest_before = await raw_repo.get_latest_before(q2.pair, before)
+        many = await raw_repo.get_latest_many([q2.pair, missing])
+
+        # Then
+        assert latest == await orm_repo.get_latest(q2.pair)
+        assert latest_before == await orm_repo.get_latest_before(q2.pair, before)
+        assert many == {q2.pair: latest}
+        assert await raw_repo.get_latest(missing) is None
+    finally:
+        await raw_repo.close()
+
+
+@pytest.mark.asyncio
+async def test_writers_share_one_id_per_symbol(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    # Given
+    rate_factory = RateFactory(PrecisionService())
+    pair = Pair(Currency("DOGE"), Currency("TRY"))
+    base_time = datetime.now(timezone.utc).replace(microsecond=0)
+
+    def quote(seconds_ago: int) -> Quote:
+        return Quote(
+            pair=pair,
+            rate=Rate(Decimal("6.12345678")),
+            timestamp=TimestampUTC(base_time - timedelta(seconds=seconds_ago)),
+        )
+
+    # Fresh registries, as in two separate processes
+    insert_writer = PostgresQuoteWriter(
+        session_factory=session_factory,
+        rate_factory=rate_factory,
+        symbol_registry=SymbolRegistry(session_factory),
+    )
+    copy_writer = PostgresCopyQuoteWriter(
+        session_factory=session_factory,
+        symbol_registry=SymbolRegistry(session_factory),
+    )
+
+    # When
+    await insert_writer.save_batch([quote(30)])
+    await copy_writer.save_batch([quote(20)])
+
+    # Then
+    async with session_factory() as session:
+        symbols = (
+            await session.execute(
+                text("SELECT id FROM symbols WHERE symbol = 'DOGETRY'")
+            )
+        ).all()
+        rates = (
+            await session.execute(
+                text(
+                    "SELECT rate FROM quotes WHERE symbol_id = :id "
+                    "ORDER BY quote_timestamp"
+                ),
+                {"id": symbols[0].id},
+            )
+        ).scalars()
+
+        assert len(symbols) == 1
+        assert list(rates) == [Decimal("6.12345678")] * 2
@@ -42,11 +42,11 @@ class MockHandler(StoreQuotesCommandHandler):
         return R()
 
 
-def _q():
+def _q(base="BTC", rate="25000", minute=0):
     return Quote(
-        pair=Pair(Currency("BTC"), Currency("USDT")),
-        rate=Rate(Decimal("25000")),
-        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)),
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, minute, tzinfo=timezone.utc)),
     )
 
 
@@ -58,9 +58,9 @@ async def test_consumer_processes_non_empty_batches_and_skips_empty():
     consumer = QuoteConsumer(rate_source=src, handler=handler)
 
     # When
-    await src.queue.put(RateBatch(quotes=[_q()]))
+    await src.queue.put(RateBatch(quotes=[_q("BTC")]))
     await src.queue.put(RateBatch(quotes=[]))
-    await src.queue.put(RateBatch(quotes=[_q(), _q()]))
+    await src.queue.put(RateBatch(quotes=[_q("ETH"), _q("SOL")]))
 
     task = asyncio.create_task(consumer.start())
     await asyncio.sleep(0.2)
@@ -68,4 +68,85 @@ async def test_consumer_processes_non_empty_batches_and_skips_empty():
     await asyncio.wait_for(task, timeout=1.0)
 
     # Then
-    assert handler.calls == [1, 2]
+    # Batches may be merged on the way, but nothing is lost or stored empty
+    assert sum(handler.calls) == 3
+    assert 0 not in handler.calls
+
+
+class SlowHandler(StoreQuotesCommandHandler):
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches: list[dict[str, Quote]] = []
+        self.release = asyncio.Event()
+
+    async def handle(self, command):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await self.release.wait()
+        self.in_flight -= 1
+        self.batches.append({q.pair.code(): q for q in command.quotes})
+
+        class R:
+            total_received = len(command.quotes)
+
+        return R()
+
+
+@pytest.mark.asyncio
+async def test_consumer_merges_batches_received_while_a_store_is_slow():
+    # Given
+    src = MockRateSource()
+    handler = SlowHandler()
+    consumer = QuoteConsumer(rate_source=src, handler=handler)
+
+    task = asyncio.create_task(consumer.start())
+    await src.queue.put(RateBatch(quotes=[_q("BTC", "25000", minute=0)]))
+    await asyncio.sleep(0.05)
+
+    # When
+    await src.queue.put(RateBatch(quotes=[_q("BTC", "25100", minute=1), _q("ETH")]))
+    await src.queue.put(RateBatch(quotes=[_q("BTC", "25200", minute=2)]))
+    await asyncio.sleep(0.05)
+
+    # Then
+    # The first batch is being stored, the others were received behind it
+    assert src.queue.empty()
+    assert handler.batches == []
+
+    handler.release.set()
+    await consumer.stop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    # Received batches are stored before the consumer stops, the late ones as one
+    assert len(handler.batches) == 2
+    assert set(handler.batches[1]) == {"BTCUSDT", "ETHUSDT"}
+    assert handler.batches[1]["BTCUSDT"].rate.value == Decimal("25200")
+    assert handler.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_stores_up_to_store_concurrency_batches_at_once():
+    # Given
+    src = MockRateSource()
+    handler = SlowHandler()
+    consumer = QuoteConsumer(rate_source=src, handler=handler, store_concurrency=2)
+    task = asyncio.create_task(consumer.start())
+
+    # When
+    for base in ("BTC", "ETH", "SOL"):
+        await src.queue.put(RateBatch(quotes=[_q(base)]))
+        await asyncio.sleep(0.05)
+
+    handler.release.set()
+    await consumer.stop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    # Then
+    assert handler.max_in_flight == 2
+    # Each batch was taken as soon as a worker was free, none merged
+    assert sorted(tuple(batch) for batch in handler.batches) == [
+        ("BTCUSDT",),
+        ("ETHUSDT",),
+        ("SOLUSDT",),
+    ]
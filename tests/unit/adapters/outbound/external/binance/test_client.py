@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from converter.adapters.outbound.external.binance.client import (
     BinanceAPIClient,
@@ -81,3 +83,40 @@ async def test_binance_client_circuit_breaker_opens(monkeypatch):
 
     assert "Circuit breaker is open" in str(exc.value)
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_binance_client_skips_unchanged_exchange_info(monkeypatch):
+    client = BinanceAPIClient(enable_circuit_breaker=False)
+    server_times = iter([1700000000000, 1700000060000, 1700000120000])
+
+    async def fake_make_raw_request(self, endpoint, params, description):
+        assert endpoint == BinanceEndpoint.EXCHANGE_INFO
+        symbols = [{"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT"}]
+        server_time = next(server_times)
+        if server_time == 1700000120000:
+            symbols.append(
+                {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT"}
+            )
+        return json.dumps(
+            {"timezone": "UTC", "serverTime": server_time, "symbols": symbols}
+        ).encode()
+
+    monkeypatch.setattr(BinanceAPIClient, "_make_raw_request", fake_make_raw_request)
+    try:
+        # Given
+        digest, info = await client.get_exchange_info_if_changed()
+        assert info is not None
+
+        # When
+        same_digest, unchanged = await client.get_exchange_info_if_changed(digest)
+        new_digest, changed = await client.get_exchange_info_if_changed(digest)
+
+        # Then
+        assert same_digest == digest
+        assert unchanged is None
+        assert new_digest != digest
+        assert changed is not None
+        assert len(changed.symbols) == 2
+    finally:
+        await client.close()
@@ -0,0 +1,189 @@
+import pytest
+from converter.adapters.outbound.external.binance import clock as clock_module
+from converter.adapters.outbound.external.binance.clock import BinanceClock
+from converter.adapters.outbound.external.binance.models import BinanceServerTime
+
+
+class FakeTime:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+class MockTimeClient:
+    """
+    Server clock `offset` seconds ahead of the fake monotonic clock, running
+    `drift` seconds fast per second, answering after `round_trip` seconds.
+    """
+
+    def __init__(self, fake_time: FakeTime, offset: float, round_trip: float):
+        self.fake_time = fake_time
+        self.offset = offset
+        self.drift = 0.0
+        self.round_trip = round_trip
+        self.calls = 0
+
+    def server_seconds(self, at: float) -> float:
+        return at + self.offset + self.drift * at
+
+    async def get_server_time(self):
+        self.calls += 1
+
+        self.fake_time.now += self.round_trip / 2
+        server_time_ms = round(self.server_seconds(self.fake_time.now) * 1000)
+        self.fake_time.now += self.round_trip / 2
+
+        return BinanceServerTime(server_time_ms=server_time_ms)
+
+
+@pytest.fixture
+def fake_time(monkeypatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(clock_module, "time", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_clock_estimates_server_time_without_asking(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.04)
+    clock = BinanceClock(api_client=client)
+    await clock.sample()
+
+    # When
+    fake_time.now += 30
+    timestamp = await clock.now()
+
+    # Then
+    assert client.calls == 1
+    assert timestamp.value.timestamp() == pytest.approx(
+        client.server_seconds(fake_time.now), abs=0.001
+    )
+
+    estimate = clock.estimate()
+    assert estimate is not None
+    assert estimate.uncertainty == pytest.approx(0.02 + 30 * 50e-6, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_clock_prefers_the_sample_with_the_shortest_round_trip(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.01)
+    clock = BinanceClock(api_client=client)
+    await clock.sample()
+
+    client.round_trip = 0.4
+    fake_time.now += 10
+    await clock.sample()
+
+    # When
+    estimate = clock.estimate()
+
+    # Then
+    assert estimate is not None
+    assert estimate.uncertainty == pytest.approx(0.005 + 10.405 * 50e-6, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_clock_follows_drift_between_samples(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.002)
+    client.drift = 100e-6
+    clock = BinanceClock(api_client=client)
+
+    for _ in range(4):
+        await clock.sample()
+        fake_time.now += 60
+
+    # When
+    fake_time.now += 600
+    estimate = clock.estimate()
+
+    # Then
+    assert estimate is not None
+    assert estimate.timestamp.value.timestamp() == pytest.approx(
+        client.server_seconds(fake_time.now), abs=0.005
+    )
+
+
+@pytest.mark.asyncio
+async def test_clock_asks_server_when_estimate_too_uncertain(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.02)
+    clock = BinanceClock(api_client=client, max_uncertainty_ms=50)
+    await clock.sample()
+
+    # When
+    fake_time.now += 1000
+    await clock.now()
+
+    # Then
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_clock_asks_server_without_samples(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.02)
+    clock = BinanceClock(api_client=client)
+
+    # When
+    timestamp = await clock.now()
+
+    # Then
+    assert client.calls == 1
+    assert timestamp.value.timestamp() == pytest.approx(
+        client.server_seconds(fake_time.now), abs=0.001
+    )
+
+
+@pytest.mark.asyncio
+async def test_clock_round_trip_jitter_stays_within_uncertainty(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.1)
+    clock = BinanceClock(api_client=client, max_uncertainty_ms=1000)
+    await clock.sample()
+
+    # The server answered 50ms late, which the round trip allows
+    fake_time.now += 150
+    client.offset += 0.05
+    await clock.sample()
+    client.offset -= 0.05
+
+    # When
+    fake_time.now += 600
+    estimate = clock.estimate()
+
+    # Then
+    # Fitted as is, the jitter would be ~333ppm of drift, 0.2s off by now
+    assert estimate is not None
+    error = abs(
+        estimate.timestamp.value.timestamp() - client.server_seconds(fake_time.now)
+    )
+    assert error <= 0.05 + 200e-6 * 600 + 0.001
+    assert error <= estimate.uncertainty
+
+
+@pytest.mark.asyncio
+async def test_clock_fits_no_drift_over_a_short_span(fake_time):
+    # Given
+    client = MockTimeClient(fake_time, offset=1_700_000_000.0, round_trip=0.02)
+    clock = BinanceClock(api_client=client, min_drift_span_seconds=120)
+    await clock.sample()
+
+    fake_time.now += 30
+    client.offset += 0.01
+    await clock.sample()
+
+    # When
+    fake_time.now += 300
+    estimate = clock.estimate()
+
+    # Then
+    assert estimate is not None
+    assert estimate.offset == pytest.approx(client.offset, abs=0.001)
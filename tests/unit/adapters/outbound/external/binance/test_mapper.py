@@ -15,10 +15,10 @@ from converter.domain.values import Currency, Pair, TimestampUTC
 def test_mapper_tickers_to_quotes_filters_invalid_and_zero():
     # Given
     mapper = BinanceMapper(rate_factory=RateFactory(PrecisionService()))
-    pairs = [
-        Pair(Currency("BTC"), Currency("USDT")),
-        Pair(Currency("ETH"), Currency("USDT")),
-    ]
+    pairs = {
+        "BTCUSDT": Pair(Currency("BTC"), Currency("USDT")),
+        "ETHUSDT": Pair(Currency("ETH"), Currency("USDT")),
+    }
     tickers = [
         BinanceTicker(symbol="BTCUSDT", price=Decimal("25000")),
         BinanceTicker(symbol="ETHUSDT", price=Decimal("0")),  # zero excluded
@@ -30,7 +30,7 @@ def test_mapper_tickers_to_quotes_filters_invalid_and_zero():
 
     # Then
     assert len(quotes) == 1
-    assert quotes[0].pair == pairs[0]
+    assert quotes[0].pair == pairs["BTCUSDT"]
     assert quotes[0].rate.value == Decimal("25000")
 
 
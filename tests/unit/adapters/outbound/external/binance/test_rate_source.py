@@ -1,7 +1,10 @@
 import asyncio
+import types
 from decimal import Decimal
 
 import pytest
+from converter.adapters.outbound import latest_quote_buffer as buffer_module
+from converter.adapters.outbound.external.binance import rate_source as source_module
 from converter.adapters.outbound.external.binance.models import (
     BinanceExchangeInfo,
     BinanceServerTime,
@@ -11,8 +14,12 @@ from converter.adapters.outbound.external.binance.models import (
 from converter.adapters.outbound.external.binance.rate_source import (
     BinanceStreamingRateSource,
 )
+from converter.adapters.outbound.external.binance.symbol_registry import (
+    BinanceSymbolRegistry,
+)
 from converter.domain.services.factory import RateFactory
 from converter.domain.services.precision_service import PrecisionService
+from converter.shared.observability.metrics import Metrics
 
 
 class MockScheduler:
@@ -47,6 +54,10 @@ class MockClient:
             ]
         )
 
+    async def get_exchange_info_if_changed(self, digest=None):
+        info = await self.get_exchange_info()
+        return "v1", None if digest == "v1" else info
+
     async def get_server_time(self):
         self.calls["time"] += 1
         return BinanceServerTime(server_time_ms=1700000000000)
@@ -73,7 +84,6 @@ async def test_rate_source_stream_yields_batch_without_private_access():
         rate_factory=rate_factory,
         rates_interval_seconds=1,
         symbols_interval_seconds=5,
-        queue_maxsize=10,
         scheduler=scheduler,
     )
 
@@ -89,3 +99,83 @@ async def test_rate_source_stream_yields_batch_without_private_access():
 
     assert len(batch.quotes) == 1
     assert str(batch.quotes[0].pair) == "BTCUSDT"
+
+
+@pytest.mark.asyncio
+async def test_rate_source_stamps_ticks_without_asking_server_time():
+    # Given
+    client = MockClient()
+    src = BinanceStreamingRateSource(
+        api_client=client,
+        rate_factory=RateFactory(PrecisionService()),
+        scheduler=MockScheduler(),
+    )
+    await src._init_symbols()
+    await src._clock_tick()
+
+    # When
+    for _ in range(3):
+        await src._rates_tick()
+
+    # Then
+    assert client.calls["ticker"] == 3
+    assert client.calls["time"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_source_polls_pairs_of_an_already_populated_registry():
+    # Given
+    client = MockClient()
+    registry = BinanceSymbolRegistry(client)
+    await registry.refresh()
+
+    src = BinanceStreamingRateSource(
+        api_client=client,
+        rate_factory=RateFactory(PrecisionService()),
+        scheduler=MockScheduler(),
+        symbols=registry,
+    )
+
+    # When
+    # Hashes the same as before, so no change event reaches the source
+    await src._init_symbols()
+    await src._clock_tick()
+    await src._rates_tick()
+    batch = await asyncio.wait_for(src._buffer.get(), timeout=1.0)
+
+    # Then
+    assert [str(quote.pair) for quote in batch.quotes] == ["BTCUSDT"]
+
+
+@pytest.mark.asyncio
+async def test_rate_source_reports_fetch_and_receive_stage_metrics(monkeypatch):
+    # Given
+    metrics = Metrics()
+    for module in (source_module, buffer_module):
+        monkeypatch.setattr(
+            module, "settings", types.SimpleNamespace(ENABLE_METRICS=True)
+        )
+        monkeypatch.setattr(module, "get_metrics_registry", lambda: metrics)
+
+    src = BinanceStreamingRateSource(
+        api_client=MockClient(),
+        rate_factory=RateFactory(PrecisionService()),
+        rates_interval_seconds=1,
+        symbols_interval_seconds=5,
+        scheduler=MockScheduler(),
+    )
+
+    def sample(name: str, stage: str) -> float | None:
+        return metrics.registry.get_sample_value(name, {"stage": stage})
+
+    # When
+    agen = src.stream()
+    try:
+        await asyncio.wait_for(anext(agen), timeout=1.0)
+    finally:
+        await src.close()
+
+    # Then
+    assert sample("pipeline_batches_total", "fetch") == 1
+    assert sample("pipeline_queue_batches", "receive") == 0
+    assert sample("pipeline_stall_seconds_total", "receive") >= 0
@@ -0,0 +1,113 @@
+import pytest
+from converter.adapters.outbound.external.binance.models import (
+    BinanceExchangeInfo,
+    BinanceSymbolInfo,
+)
+from converter.adapters.outbound.external.binance.symbol_registry import (
+    BinanceSymbolRegistry,
+)
+
+
+class MockClient:
+    """
+    Serves `symbols` as exchange info, versioned by their content.
+    """
+
+    def __init__(self, *symbols: str):
+        self.symbols = list(symbols)
+        self.parsed = 0
+
+    async def get_exchange_info_if_changed(self, digest=None):
+        new_digest = ",".join(self.symbols)
+
+        if new_digest == digest:
+            return new_digest, None
+
+        self.parsed += 1
+        return new_digest, BinanceExchangeInfo(
+            symbols=[
+                BinanceSymbolInfo(
+                    symbol=symbol, base_asset=symbol[:-4], quote_asset=symbol[-4:]
+                )
+                for symbol in self.symbols
+            ]
+        )
+
+
+@pytest.mark.asyncio
+async def test_registry_first_refresh_adds_all_pairs():
+    # Given
+    registry = BinanceSymbolRegistry(MockClient("BTCUSDT", "ETHUSDT"))
+
+    # When
+    change = await registry.refresh()
+
+    # Then
+    assert change is not None
+    assert change.version == 1
+    assert set(change.added) == {"BTCUSDT", "ETHUSDT"}
+    assert not change.removed
+    assert str(registry.pairs["ETHUSDT"]) == "ETHUSDT"
+
+
+@pytest.mark.asyncio
+async def test_registry_skips_unchanged_exchange_info():
+    # Given
+    client = MockClient("BTCUSDT")
+    registry = BinanceSymbolRegistry(client)
+    await registry.refresh()
+
+    changes = []
+    registry.subscribe(changes.append)
+
+    # When
+    change = await registry.refresh()
+
+    # Then
+    assert change is None
+    assert changes == []
+    assert registry.version == 1
+    assert client.parsed == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_emits_added_and_removed_pairs():
+    # Given
+    client = MockClient("BTCUSDT", "ETHUSDT")
+    registry = BinanceSymbolRegistry(client)
+    await registry.refresh()
+    kept = registry.pairs["BTCUSDT"]
+
+    changes = []
+    registry.subscribe(changes.append)
+
+    # When
+    client.symbols = ["BTCUSDT", "SOLUSDT"]
+    await registry.refresh()
+
+    # Then
+    assert len(changes) == 1
+    assert changes[0].version == 2
+    assert set(changes[0].added) == {"SOLUSDT"}
+    assert set(changes[0].removed) == {"ETHUSDT"}
+    assert set(registry.pairs) == {"BTCUSDT", "SOLUSDT"}
+    assert registry.pairs["BTCUSDT"] is kept
+
+
+@pytest.mark.asyncio
+async def test_registry_failing_listener_does_not_stop_others():
+    # Given
+    registry = BinanceSymbolRegistry(MockClient("BTCUSDT"))
+    changes = []
+
+    def failing(change):
+        raise RuntimeError("boom")
+
+    registry.subscribe(failing)
+    registry.subscribe(changes.append)
+
+    # When
+    await registry.refresh()
+
+    # Then
+    assert len(changes) == 1
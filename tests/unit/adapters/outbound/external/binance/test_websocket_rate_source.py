@@ -0,0 +1,363 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from converter.adapters.outbound.external.binance.models import (
+    BinanceExchangeInfo,
+    BinanceSymbolInfo,
+    BinanceTicker,
+)
+from converter.adapters.outbound.external.binance.websocket_rate_source import (
+    BinanceWebSocketRateSource,
+)
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import TimestampUTC
+
+LAST_FRAME_TIME = datetime(2023, 11, 14, 22, 13, 21, tzinfo=timezone.utc)
+
+# Recorded from !miniTicker@arr, trimmed to a few symbols
+RECORDED_FRAMES = [
+    [
+        {
+            "e": "24hrMiniTicker",
+            "E": 1700000000000,
+            "s": "BTCUSDT",
+            "c": "37000.10",
+            "o": "36500.00",
+            "h": "37200.00",
+            "l": "36400.00",
+            "v": "1000.5",
+            "q": "37000000.0",
+        },
+        {
+            "e": "24hrMiniTicker",
+            "E": 1700000000000,
+            "s": "DOGEBTC",
+            "c": "0.00000210",
+            "o": "0.00000200",
+            "h": "0.00000220",
+            "l": "0.00000190",
+            "v": "100000",
+            "q": "0.21",
+        },
+    ],
+    [
+        {
+            "e": "24hrMiniTicker",
+            "E": 1700000001000,
+            "s": "ETHUSDT",
+            "c": "2050.55",
+            "o": "2000.00",
+            "h": "2100.00",
+            "l": "1990.00",
+            "v": "5000",
+            "q": "10250000",
+        },
+        {
+            "e": "24hrMiniTicker",
+            "E": 1700000001000,
+            "s": "BTCUSDT",
+            "c": "37001.20",
+            "o": "36500.00",
+            "h": "37200.00",
+            "l": "36400.00",
+            "v": "1000.6",
+            "q": "37000100.0",
+        },
+    ],
+]
+
+
+class MockClient:
+    """
+    Lists BTCUSDT and ETHUSDT, whose ticker prices match the last recorded frames
+    unless `prices` says otherwise.
+    """
+
+    def __init__(self, prices=None, extra_symbols=()):
+        self.closed = False
+        self.prices = {"BTCUSDT": "37001.20", "ETHUSDT": "2050.55", **(prices or {})}
+        self.extra_symbols = extra_symbols
+
+    async def get_exchange_info(self):
+        return BinanceExchangeInfo(
+            symbols=[
+                BinanceSymbolInfo(
+                    symbol="BTCUSDT", base_asset="BTC", quote_asset="USDT"
+                ),
+                BinanceSymbolInfo(
+                    symbol="ETHUSDT", base_asset="ETH", quote_asset="USDT"
+                ),
+                *self.extra_symbols,
+            ]
+        )
+
+    async def get_all_ticker_prices(self):
+        return [
+            BinanceTicker(symbol=symbol, price=Decimal(price))
+            for symbol, price in self.prices.items()
+        ]
+
+    async def get_exchange_info_if_changed(self, digest=None):
+        info = await self.get_exchange_info()
+        return "v1", None if digest == "v1" else info
+
+    async def close(self):
+        self.closed = True
+
+
+class MockClock:
+    def __init__(self, now: datetime = LAST_FRAME_TIME):
+        self.time = now
+
+    async def now(self, at=None):
+        return TimestampUTC(self.time)
+
+
+class ReplayServer:
+    """
+    Local WS server replaying recorded frames,
+    then closing the connection like Binance does on its 24h cut,
+    or keeping it open and silent with `hold_open`.
+    """
+
+    def __init__(self, frames, hold_open=False):
+        self.frames = frames
+        self.hold_open = hold_open
+        self.connections = 0
+
+        app = web.Application()
+        app.router.add_get(BinanceWebSocketRateSource.STREAM_PATH, self._handler)
+        self.server = TestServer(app)
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.server.host}:{self.server.port}"
+
+    async def _handler(self, request):
+        self.connections += 1
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        for frame in self.frames:
+            await ws.send_str(json.dumps(frame))
+
+        if self.hold_open:
+            async for _ in ws:
+                pass
+
+        await ws.close()
+        return ws
+
+
+class OutageServer(ReplayServer):
+    """
+    Replays the frames on the first connection only,
+    later ones stay open and silent, like a quiet market after an outage.
+    """
+
+    async def _handler(self, request):
+        if self.connections > 0:
+            self.frames, self.hold_open = [], True
+
+        return await super()._handler(request)
+
+
+@pytest.fixture
+async def replay_server():
+    server = ReplayServer(RECORDED_FRAMES)
+    await server.server.start_server()
+
+    yield server
+
+    await server.server.close()
+
+
+def make_source(url: str, **kwargs) -> BinanceWebSocketRateSource:
+    params = {
+        "api_client": MockClient(),
+        "clock": MockClock(),
+        "flush_interval_seconds": 0.05,
+        "flush_max_quotes": 5000,
+        "snapshot_interval_seconds": 60,
+        "symbols_interval_seconds": 60,
+        "reconnect_min_delay_seconds": 0.01,
+        "reconnect_max_delay_seconds": 0.05,
+    }
+    params.update(kwargs)
+
+    return BinanceWebSocketRateSource(
+        rate_factory=RateFactory(PrecisionService()),
+        ws_base_url=url,
+        **params,
+    )
+
+
+async def take(src: BinanceWebSocketRateSource, count: int):
+    agen = src.stream()
+
+    try:
+        return [await asyncio.wait_for(anext(agen), timeout=2.0) for _ in range(count)]
+    finally:
+        await agen.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_flushes_latest_quote_per_symbol(replay_server):
+    # Given
+    src = make_source(replay_server.url, flush_interval_seconds=0.2)
+
+    # When
+    (batch,) = await take(src, 1)
+
+    # Then
+    quotes = {q.pair.code(): q for q in batch.quotes}
+
+    assert set(quotes) == {"BTCUSDT", "ETHUSDT"}
+    assert quotes["BTCUSDT"].rate.value == Decimal("37001.20")
+    assert quotes["BTCUSDT"].timestamp.value == LAST_FRAME_TIME
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_flushes_early_when_size_reached(replay_server):
+    # Given
+    src = make_source(replay_server.url, flush_interval_seconds=30, flush_max_quotes=1)
+
+    # When
+    (batch,) = await take(src, 1)
+
+    # Then
+    # Flushed long before the interval, the flushes not yet taken merged into one
+    quotes = {q.pair.code(): q for q in batch.quotes}
+
+    assert set(quotes) == {"ETHUSDT", "BTCUSDT"}
+    assert quotes["BTCUSDT"].rate.value == Decimal("37001.20")
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_reconnects_after_server_close(replay_server):
+    # Given
+    src = make_source(replay_server.url, flush_interval_seconds=30, flush_max_quotes=1)
+
+    # When
+    batches = await take(src, 3)
+
+    # Then
+    assert replay_server.connections >= 2
+    assert all(
+        {q.pair.code() for q in batch.quotes} <= {"ETHUSDT", "BTCUSDT"}
+        for batch in batches
+    )
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_snapshot_reemits_known_quotes_at_stream_time():
+    # Given
+    server = ReplayServer(RECORDED_FRAMES, hold_open=True)
+    await server.server.start_server()
+
+    src = make_source(
+        server.url,
+        flush_interval_seconds=30,
+        flush_max_quotes=5000,
+        snapshot_interval_seconds=0.1,
+    )
+
+    # When
+    try:
+        (batch,) = await take(src, 1)
+    finally:
+        await server.server.close()
+
+    # Then
+    assert {q.pair.code() for q in batch.quotes} == {"BTCUSDT", "ETHUSDT"}
+    assert {q.timestamp.value for q in batch.quotes} == {LAST_FRAME_TIME}
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_reseeds_prices_that_moved_during_outage():
+    # Given
+    server = OutageServer(RECORDED_FRAMES)
+    await server.server.start_server()
+
+    outage_end = datetime(2023, 11, 14, 22, 20, tzinfo=timezone.utc)
+    client = MockClient(prices={"BTCUSDT": "36000.00"})
+    src = make_source(
+        server.url,
+        api_client=client,
+        clock=MockClock(outage_end),
+        flush_interval_seconds=30,
+        snapshot_interval_seconds=0.1,
+    )
+
+    # When
+    try:
+        batches = await take(src, 2)
+    finally:
+        await server.server.close()
+
+    # Then
+    snapshot = {q.pair.code(): q for q in batches[-1].quotes}
+
+    assert server.connections >= 2
+    assert snapshot["BTCUSDT"].rate.value == Decimal("36000.00")
+    assert {q.timestamp.value for q in snapshot.values()} == {outage_end}
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_seeds_pairs_that_never_tick():
+    # Given
+    server = OutageServer([])
+    await server.server.start_server()
+
+    client = MockClient(
+        prices={"XRPUSDT": "0.62"},
+        extra_symbols=(
+            BinanceSymbolInfo(symbol="XRPUSDT", base_asset="XRP", quote_asset="USDT"),
+        ),
+    )
+    src = make_source(server.url, api_client=client)
+
+    # When
+    try:
+        (batch,) = await take(src, 1)
+    finally:
+        await server.server.close()
+
+    # Then
+    quotes = {q.pair.code(): q for q in batch.quotes}
+
+    assert set(quotes) == {"BTCUSDT", "ETHUSDT", "XRPUSDT"}
+    assert quotes["XRPUSDT"].rate.value == Decimal("0.62")
+    assert quotes["XRPUSDT"].timestamp.value == LAST_FRAME_TIME
+
+
+@pytest.mark.asyncio
+async def test_ws_rate_source_keeps_retrying_when_unreachable():
+    # Given
+    server = ReplayServer(RECORDED_FRAMES)
+    await server.server.start_server()
+    url = server.url
+    await server.server.close()
+
+    client = MockClient()
+    src = make_source(url, api_client=client)
+
+    # When
+    agen = src.stream()
+    task = asyncio.ensure_future(anext(agen))
+    await asyncio.sleep(0.2)
+
+    # Then
+    assert not task.done()
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await src.close()
+    assert client.closed
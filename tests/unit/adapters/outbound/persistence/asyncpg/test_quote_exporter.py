@@ -0,0 +1,231 @@
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import converter.adapters.outbound.persistence.asyncpg.quote_exporter as exporter_module
+import pytest
+from converter.adapters.outbound.persistence.asyncpg.quote_exporter import (
+    EXPORT_ALL_SQL,
+    EXPORT_SYMBOLS_SQL,
+    AsyncpgQuoteExporter,
+)
+from converter.app.ports.outbound.quote_exporter import ExportFormat
+from converter.domain.values import TimestampUTC
+
+TS = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def _record(i: int) -> dict:
+    return {
+        "symbol": "BTCUSDT",
+        "base_currency": "BTC",
+        "quote_currency": "USDT",
+        "rate": Decimal("25000.5") + i,
+        "quote_timestamp": TS + timedelta(seconds=i),
+    }
+
+
+class FakeCursor:
+    def __init__(self, records, conn):
+        self._records = list(records)
+        self._conn = conn
+
+    async def fetch(self, n):
+        batch, self._records = self._records[:n], self._records[n:]
+        self._conn.fetched += len(batch)
+        return batch
+
+
+class FakeTransaction:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        self._conn.in_transaction = True
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._conn.in_transaction = False
+        return False
+
+
+class FakeConnection:
+    def __init__(self, records):
+        self.records = records
+        self.fetched = 0
+        self.in_transaction = False
+        self.cursor_calls = []
+        self.transaction_kwargs = None
+        self.partitions = []
+
+    def transaction(self, **kwargs):
+        self.transaction_kwargs = kwargs
+        return FakeTransaction(self)
+
+    async def cursor(self, query, *args):
+        assert self.in_transaction, "cursors only live inside a transaction"
+        self.cursor_calls.append((query, args))
+        return FakeCursor(self.records, self)
+
+
+class FakeAcquire:
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    def acquire(self):
+        return FakeAcquire(self.conn)
+
+    async def fetch(self, query):
+        return self.conn.partitions
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = FakeConnection([_record(i) for i in range(100)])
+
+    async def create_pool(dsn, **kwargs):
+        return FakePool(conn)
+
+    monkeypatch.setattr(exporter_module.asyncpg, "create_pool", create_pool)
+
+    return conn
+
+
+def _range():
+    return TimestampUTC(TS), TimestampUTC(TS + timedelta(days=7))
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_chunks_as_rows_arrive(conn):
+    # Given
+    exporter = AsyncpgQuoteExporter(
+        dsn="postgresql://u:p@localhost/db", fetch_rows=10, chunk_bytes=512
+    )
+    start, end = _range()
+    fetched_per_chunk = []
+
+    # When
+    chunks = []
+    async for chunk in exporter.export([], start, end, ExportFormat.CSV):
+        fetched_per_chunk.append(conn.fetched)
+        chunks.append(chunk)
+
+    # Then
+    lines = b"".join(chunks).decode().splitlines()
+    assert lines[0] == "symbol,base_currency,quote_currency,rate,timestamp"
+    assert lines[1] == "BTCUSDT,BTC,USDT,25000.5,2025-10-02T00:00:00+00:00"
+    assert len(lines) == 101
+
+    # Chunks go out before the cursor is exhausted
+    assert len(chunks) > 1
+    assert fetched_per_chunk[0] < len(conn.records)
+    assert all(len(chunk) < 512 + 100 for chunk in chunks)
+
+    query, args = conn.cursor_calls[0]
+    assert query == EXPORT_ALL_SQL
+    assert args == (start.value, end.value)
+    assert conn.transaction_kwargs == {"readonly": True}
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_filters_symbols(conn):
+    # Given
+    exporter = AsyncpgQuoteExporter(dsn="postgresql://u:p@localhost/db")
+    start, end = _range()
+
+    # When
+    body = b"".join(
+        [
+            chunk
+            async for chunk in exporter.export(
+                ["BTCUSDT", "ETHUSDT"], start, end, ExportFormat.NDJSON
+            )
+        ]
+    )
+
+    # Then
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert len(rows) == 100
+    assert rows[0] == {
+        "symbol": "BTCUSDT",
+        "base_currency": "BTC",
+        "quote_currency": "USDT",
+        "rate": "25000.5",
+        "timestamp": "2025-10-02T00:00:00+00:00",
+    }
+
+    query, args = conn.cursor_calls[0]
+    assert query == EXPORT_SYMBOLS_SQL
+    assert args == (start.value, end.value, ["BTCUSDT", "ETHUSDT"])
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_export_still_has_header(conn):
+    # Given
+    conn.records = []
+    exporter = AsyncpgQuoteExporter(dsn="postgresql://u:p@localhost/db")
+    start, end = _range()
+
+    # When
+    chunks = [c async for c in exporter.export([], start, end, ExportFormat.CSV)]
+
+    # Then
+    assert chunks == [b"symbol,base_currency,quote_currency,rate,timestamp\n"]
+
+
+@pytest.mark.asyncio
+async def test_list_partitions_parses_range_bounds(conn):
+    # Given
+    conn.partitions = [
+        {
+            "name": "quotes_p20251002",
+            "bound": "FOR VALUES FROM ('2025-10-02 00:00:00+00') "
+            "TO ('2025-10-03 00:00:00+00')",
+        },
+        {"name": "quotes_default", "bound": "DEFAULT"},
+        {
+            "name": "quotes_p20251001",
+            "bound": "FOR VALUES FROM ('2025-10-01 00:00:00+00') "
+            "TO ('2025-10-02 00:00:00+00')",
+        },
+    ]
+    exporter = AsyncpgQuoteExporter(dsn="postgresql://u:p@localhost/db")
+
+    # When
+    partitions = await exporter.list_partitions()
+
+    # Then
+    assert [p.name for p in partitions] == ["quotes_p20251001", "quotes_p20251002"]
+    assert partitions[1].start.value == TS
+    assert partitions[1].end.value == TS + timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_stream_batches_yields_columns_per_fetch(conn):
+    # Given
+    exporter = AsyncpgQuoteExporter(dsn="postgresql://u:p@localhost/db", fetch_rows=30)
+    start, end = _range()
+
+    # When
+    batches = [b async for b in exporter.stream_batches(start, end)]
+
+    # Then
+    assert [len(b) for b in batches] == [30, 30, 30, 10]
+    assert batches[0].symbols[0] == "BTCUSDT"
+    assert batches[0].rates[1] == Decimal("25001.5")
+    assert batches[3].timestamps[-1] == TS + timedelta(seconds=99)
+    assert conn.cursor_calls[0] == (EXPORT_ALL_SQL, (start.value, end.value))
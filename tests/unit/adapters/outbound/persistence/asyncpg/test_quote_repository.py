@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import converter.adapters.outbound.persistence.asyncpg.quote_repository as repo_module
+import pytest
+from converter.adapters.outbound.persistence.asyncpg.quote_repository import (
+    AsyncpgQuoteRepository,
+)
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Currency, Pair, TimestampUTC
+
+TS = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+        self.closed = False
+
+    async def fetchrow(self, query, *args):
+        self.calls.append((query, args))
+        symbol = args[0]
+        row = self.rows.get(symbol)
+
+        if row is not None and len(args) > 1:
+            newest, oldest = args[1:]
+            if not oldest <= row["quote_timestamp"] <= newest:
+                return None
+
+        return row
+
+    async def fetch(self, query, symbols):
+        self.calls.append((query, (symbols,)))
+        return [{"symbol": s, **self.rows[s]} for s in symbols if s in self.rows]
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool({"BTCUSDT": {"rate": Decimal("25000.5"), "quote_timestamp": TS}})
+    created = []
+
+    async def create_pool(dsn, **kwargs):
+        created.append((dsn, kwargs))
+        return pool
+
+    monkeypatch.setattr(repo_module.asyncpg, "create_pool", create_pool)
+    pool.created = created
+
+    return pool
+
+
+def _repo():
+    return AsyncpgQuoteRepository(
+        dsn="postgresql://u:p@localhost/db",
+        rate_factory=RateFactory(PrecisionService()),
+        freshness_policy=FreshnessPolicy(max_age_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_latest_builds_quote_from_record(pool):
+    # Given
+    repo = _repo()
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+
+    # When
+    quote = await repo.get_latest(btc)
+    missing = await repo.get_latest(Pair(Currency("ETH"), Currency("USDT")))
+
+    # Then
+    assert quote is not None
+    assert quote.pair == btc
+    assert quote.rate.value == Decimal("25000.5")
+    assert quote.timestamp.value == TS
+    assert missing is None
+    assert len(pool.created) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_latest_before_passes_freshness_window(pool):
+    # Given
+    repo = _repo()
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    too_late = TimestampUTC(TS + timedelta(seconds=61))
+
+    # When
+    quote = await repo.get_latest_before(btc, TimestampUTC(TS))
+    stale = await repo.get_latest_before(btc, too_late)
+
+    # Then
+    assert quote is not None
+    assert pool.calls[0][1] == ("BTCUSDT", TS, TS - timedelta(seconds=60))
+    assert "quote_timestamp >= $3" in pool.calls[0][0]
+    assert stale is None
+
+
+@pytest.mark.asyncio
+async def test_get_latest_many_single_query_keyed_by_requested_pair(pool):
+    # Given
+    repo = _repo()
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    eth = Pair(Currency("ETH"), Currency("USDT"))
+
+    # When
+    quotes = await repo.get_latest_many([btc, eth, btc])
+    await repo.close()
+
+    # Then
+    assert len(pool.calls) == 1
+    assert pool.calls[0][1] == (["BTCUSDT", "ETHUSDT"],)
+    assert list(quotes) == [btc]
+    assert pool.closed
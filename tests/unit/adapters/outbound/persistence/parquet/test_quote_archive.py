@@ -0,0 +1,176 @@
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+from converter.adapters.outbound.persistence.parquet.files import (
+    SYMBOL_COLUMN,
+    archive_path,
+    archived_ranges,
+    column_range,
+)
+from converter.adapters.outbound.persistence.parquet.quote_archive import (
+    ParquetQuoteArchive,
+)
+from converter.adapters.outbound.persistence.parquet.quote_repository import (
+    ParquetQuoteRepository,
+)
+from converter.app.ports.outbound.quote_archive import ArchiveBatch, QuotePartition
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Currency, Pair, TimestampUTC
+
+DAY = datetime(2025, 10, 1, tzinfo=timezone.utc)
+PARTITION = QuotePartition(
+    name="quotes_p20251001",
+    start=TimestampUTC(DAY),
+    end=TimestampUTC(DAY + timedelta(days=1)),
+)
+SYMBOLS = [("BTC", "USDT"), ("ETH", "USDT"), ("SOL", "USDT")]
+
+
+def _batches(rows_per_symbol: int, batch_rows: int):
+    rows = [
+        (base + quote, base, quote, Decimal(i + 1) / 8, DAY + timedelta(minutes=i))
+        for base, quote in SYMBOLS
+        for i in range(rows_per_symbol)
+    ]
+
+    async def stream():
+        for offset in range(0, len(rows), batch_rows):
+            chunk = rows[offset : offset + batch_rows]
+            yield ArchiveBatch(
+                symbols=[r[0] for r in chunk],
+                base_currencies=[r[1] for r in chunk],
+                quote_currencies=[r[2] for r in chunk],
+                rates=[r[3] for r in chunk],
+                timestamps=[r[4] for r in chunk],
+            )
+
+    return stream()
+
+
+def _repository(directory) -> ParquetQuoteRepository:
+    return ParquetQuoteRepository(
+        directory=str(directory),
+        rate_factory=RateFactory(PrecisionService()),
+        freshness_policy=FreshnessPolicy(max_age_seconds=300),
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_cuts_sorted_rows_into_full_row_groups(tmp_path):
+    # Given
+    archive = ParquetQuoteArchive(directory=str(tmp_path), row_group_rows=100)
+
+    # When
+    rows = await archive.write(PARTITION, _batches(rows_per_symbol=150, batch_rows=70))
+
+    # Then
+    assert rows == 450
+    assert archive.contains(PARTITION)
+    assert os.listdir(tmp_path) == [
+        os.path.basename(archive_path(str(tmp_path), PARTITION))
+    ]
+
+    metadata = pq.ParquetFile(archive_path(str(tmp_path), PARTITION)).metadata
+    assert metadata.num_rows == 450
+    assert [metadata.row_group(i).num_rows for i in range(5)] == [100] * 4 + [50]
+
+    # Sorted input keeps each row group to a narrow symbol range
+    assert column_range(metadata.row_group(0), SYMBOL_COLUMN) == ("BTCUSDT", "BTCUSDT")
+    assert column_range(metadata.row_group(1), SYMBOL_COLUMN) == ("BTCUSDT", "ETHUSDT")
+
+    [(start, end, _)] = archived_ranges(str(tmp_path))
+    assert (start, end) == (PARTITION.start, PARTITION.end)
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_nothing_behind(tmp_path):
+    # Given
+    archive = ParquetQuoteArchive(directory=str(tmp_path), row_group_rows=100)
+
+    async def failing():
+        async for batch in _batches(rows_per_symbol=150, batch_rows=70):
+            yield batch
+        raise ConnectionError("connection lost")
+
+    # When
+    with pytest.raises(ConnectionError):
+        await archive.write(PARTITION, failing())
+
+    # Then
+    assert not archive.contains(PARTITION)
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_get_latest_before_reads_the_matching_row_groups(tmp_path, monkeypatch):
+    # Given
+    archive = ParquetQuoteArchive(directory=str(tmp_path), row_group_rows=100)
+    await archive.write(PARTITION, _batches(rows_per_symbol=150, batch_rows=70))
+    repository = _repository(tmp_path)
+
+    read_row_groups = pq.ParquetFile.read_row_groups
+    read = []
+
+    def spy(self, row_groups, **kwargs):
+        read.append(list(row_groups))
+        return read_row_groups(self, row_groups, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+
+    # When
+    quote = await repository.get_latest_before(
+        Pair(Currency("ETH"), Currency("USDT")),
+        TimestampUTC(DAY + timedelta(minutes=120, seconds=30)),
+    )
+
+    # Then
+    assert quote is not None
+    assert quote.rate.value == Decimal(121) / 8
+    assert quote.timestamp.value == DAY + timedelta(minutes=120)
+
+    # Group 1 straddles BTCUSDT and ETHUSDT, so its statistics can't rule it out,
+    # the BTCUSDT and SOLUSDT groups are never read
+    assert read == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_get_latest_before_respects_the_freshness_window(tmp_path):
+    # Given
+    archive = ParquetQuoteArchive(directory=str(tmp_path), row_group_rows=100)
+    await archive.write(PARTITION, _batches(rows_per_symbol=150, batch_rows=70))
+    repository = _repository(tmp_path)
+    pair = Pair(Currency("SOL"), Currency("USDT"))
+
+    # When
+    stale = await repository.get_latest_before(
+        pair, TimestampUTC(DAY + timedelta(minutes=160))
+    )
+    before = await repository.get_latest_before(
+        pair, TimestampUTC(DAY - timedelta(seconds=1))
+    )
+    unknown = await repository.get_latest_before(
+        Pair(Currency("ADA"), Currency("USDT")),
+        TimestampUTC(DAY + timedelta(minutes=10)),
+    )
+
+    # Then
+    assert stale is None
+    assert before is None
+    assert unknown is None
+
+
+@pytest.mark.asyncio
+async def test_get_latest_is_never_answered_from_the_archive(tmp_path):
+    # Given
+    repository = _repository(tmp_path / "missing")
+
+    # When
+    quote = await repository.get_latest(Pair(Currency("BTC"), Currency("USDT")))
+
+    # Then
+    assert quote is None
@@ -0,0 +1,88 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.redis.codec import (
+    BinaryTickerCodec,
+    JsonTickerCodec,
+)
+from converter.adapters.outbound.persistence.redis.models import RedisTicker
+
+
+def _ticker(rate="25000.12345678", **kwargs):
+    params = {
+        "symbol": "BTCUSDT",
+        "rate": Decimal(rate),
+        "timestamp": datetime(2025, 10, 2, 0, 0, 1, 123000, tzinfo=timezone.utc),
+        "base_currency": "BTC",
+        "quote_currency": "USDT",
+    }
+    params.update(kwargs)
+    return RedisTicker(**params)
+
+
+@pytest.mark.parametrize("codec", [JsonTickerCodec(), BinaryTickerCodec()])
+@pytest.mark.parametrize(
+    "rate", ["25000.12345678", "0.00000001", "1E+3", "123456789012345678901234.5"]
+)
+def test_codec_roundtrip_is_exact(codec, rate):
+    # Given
+    ticker = _ticker(rate)
+
+    # When
+    decoded = codec.decode(codec.encode(ticker))
+
+    # Then
+    assert decoded == ticker
+    assert str(decoded.rate) == str(ticker.rate)
+
+
+def test_binary_codec_is_smaller_than_json():
+    # Given
+    ticker = _ticker()
+
+    # When
+    binary = BinaryTickerCodec().encode(ticker)
+    legacy = JsonTickerCodec().encode(ticker)
+
+    # Then
+    assert binary[0] == 1
+    assert len(binary) * 3 < len(legacy)
+
+
+def test_binary_codec_reads_legacy_json():
+    # Given
+    legacy = json.dumps(
+        {
+            "symbol": "BTCUSDT",
+            "rate": "25000.5",
+            "timestamp": "2025-10-02T00:00:00+00:00",
+        }
+    )
+
+    # When
+    ticker = BinaryTickerCodec().decode(legacy)
+
+    # Then
+    assert ticker.symbol == "BTCUSDT"
+    assert ticker.rate == Decimal("25000.5")
+    assert ticker.base_currency is None
+
+
+def test_binary_codec_keeps_tickers_without_currencies():
+    # Given
+    codec = BinaryTickerCodec()
+    ticker = _ticker(base_currency=None, quote_currency=None)
+
+    # When
+    decoded = codec.decode(codec.encode(ticker))
+
+    # Then
+    assert decoded == ticker
+
+
+@pytest.mark.parametrize("payload", [b"", b"\x07abc", b"\x01\x00", b"[1, 2]"])
+def test_codec_rejects_unknown_or_malformed_payloads(payload):
+    with pytest.raises(ValueError):
+        BinaryTickerCodec().decode(payload)
@@ -9,12 +9,15 @@ try:
 except Exception:
     FakeRedis = None
 
+from converter.adapters.outbound.persistence.redis.codec import BinaryTickerCodec
 from converter.adapters.outbound.persistence.redis.quote_repository import (
     RedisQuoteRepository,
 )
+from converter.adapters.outbound.persistence.redis.quote_writer import RedisQuoteWriter
+from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
 from converter.domain.services.precision_service import PrecisionService
-from converter.domain.values import Currency, Pair, TimestampUTC
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
 
 pytestmark = pytest.mark.skipif(FakeRedis is None, reason="fakeredis not available")
 
@@ -65,3 +68,138 @@ async def test_get_latest_before_not_supported():
 
     # Then
     assert q is None
+
+
+@pytest.mark.asyncio
+async def test_get_latest_many_uses_single_mget():
+    # Given
+    redis = FakeRedis()
+    repo = RedisQuoteRepository(
+        redis_client=redis, rate_factory=RateFactory(PrecisionService())
+    )
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    eth = Pair(Currency("ETH"), Currency("USDT"))
+    ts = datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc).isoformat()
+
+    await redis.set(
+        f"quote:latest:{btc}",
+        json.dumps({"symbol": "BTCUSDT", "rate": "25000.5", "timestamp": ts}),
+    )
+
+    mget_calls = []
+    original_mget = redis.mget
+
+    async def counting_mget(*args, **kwargs):
+        mget_calls.append(args)
+        return await original_mget(*args, **kwargs)
+
+    redis.mget = counting_mget
+
+    # When
+    quotes = await repo.get_latest_many([btc, eth, btc])
+
+    # Then
+    assert len(mget_calls) == 1
+    assert list(quotes) == [btc]
+    assert quotes[btc].rate.value == Decimal("25000.5")
+
+
+@pytest.mark.asyncio
+async def test_get_latest_before_reads_history():
+    # Given
+    redis = FakeRedis()
+    rate_factory = RateFactory(PrecisionService())
+    repo = RedisQuoteRepository(redis_client=redis, rate_factory=rate_factory)
+    writer = RedisQuoteWriter(
+        redis_client=redis, rate_factory=rate_factory, history_window_seconds=3600
+    )
+    pair = Pair(Currency("BTC"), Currency("USDT"))
+
+    await writer.save_batch(
+        [
+            Quote(
+                pair=pair,
+                rate=Rate(Decimal(rate)),
+                timestamp=TimestampUTC(
+                    datetime(2025, 10, 2, 0, minute, tzinfo=timezone.utc)
+                ),
+            )
+            for minute, rate in [(0, "100"), (10, "110"), (20, "120")]
+        ]
+    )
+
+    def _ts(minute, second=0):
+        return TimestampUTC(
+            datetime(2025, 10, 2, 0, minute, second, tzinfo=timezone.utc)
+        )
+
+    # When
+    exact = await repo.get_latest_before(pair, _ts(10))
+    between = await repo.get_latest_before(pair, _ts(19, 59))
+    before_all = await repo.get_latest_before(
+        pair, TimestampUTC(datetime(2025, 10, 1, tzinfo=timezone.utc))
+    )
+
+    # Then
+    assert exact is not None and exact.rate.value == Decimal("110")
+    assert between is not None and between.rate.value == Decimal("110")
+    assert between.timestamp == _ts(10)
+    assert before_all is None
+
+
+@pytest.mark.asyncio
+async def test_hash_layout_reads_snapshot_hash():
+    # Given
+    redis = FakeRedis()
+    rate_factory = RateFactory(PrecisionService())
+    writer = RedisQuoteWriter(redis, rate_factory, ttl_seconds=90, layout="hash")
+    repo = RedisQuoteRepository(redis, rate_factory, layout="hash")
+
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    eth = Pair(Currency("ETH"), Currency("USDT"))
+    ts = TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc))
+
+    await writer.save_batch(
+        [Quote(pair=btc, rate=Rate(Decimal("25000")), timestamp=ts)]
+    )
+
+    # When
+    latest = await repo.get_latest(btc)
+    missing = await repo.get_latest(eth)
+    many = await repo.get_latest_many([btc, eth])
+
+    # Then
+    assert latest is not None
+    assert latest.rate.value == Decimal("25000")
+    assert missing is None
+    assert list(many) == [btc]
+
+
+@pytest.mark.asyncio
+async def test_reads_binary_and_legacy_json_entries_side_by_side():
+    # Given
+    redis = FakeRedis()
+    rate_factory = RateFactory(PrecisionService())
+    writer = RedisQuoteWriter(redis, rate_factory, codec=BinaryTickerCodec())
+    repo = RedisQuoteRepository(redis, rate_factory)
+
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    eth = Pair(Currency("ETH"), Currency("USDT"))
+    ts = TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc))
+
+    await writer.save_batch(
+        [Quote(pair=btc, rate=Rate(Decimal("25000")), timestamp=ts)]
+    )
+    await redis.set(
+        "quote:latest:ETHUSDT",
+        json.dumps(
+            {"symbol": "ETHUSDT", "rate": "4000", "timestamp": ts.value.isoformat()}
+        ),
+    )
+
+    # When
+    quotes = await repo.get_latest_many([btc, eth])
+
+    # Then
+    assert quotes[btc].rate.value == Decimal("25000")
+    assert quotes[eth].rate.value == Decimal("4000")
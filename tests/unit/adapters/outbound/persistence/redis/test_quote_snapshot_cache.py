@@ -0,0 +1,164 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+try:
+    from fakeredis.aioredis import FakeRedis
+except Exception:
+    FakeRedis = None
+
+from converter.adapters.outbound.persistence.redis.quote_snapshot_cache import (
+    RedisQuoteSnapshotCache,
+)
+from converter.adapters.outbound.persistence.redis.quote_writer import RedisQuoteWriter
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+pytestmark = pytest.mark.skipif(FakeRedis is None, reason="fakeredis not available")
+
+
+class MockRepo(QuoteRepository):
+    def __init__(self, latest=None):
+        self.latest = latest
+        self.calls = []
+
+    async def get_latest(self, pair: Pair):
+        self.calls.append(("get_latest", pair))
+        return self.latest
+
+    async def get_latest_before(self, pair: Pair, timestamp: TimestampUTC):
+        self.calls.append(("get_latest_before", pair, timestamp))
+        return None
+
+
+def _q(base="BTC", quote="USDT", rate="25000"):
+    return Quote(
+        pair=Pair(Currency(base), Currency(quote)),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc)),
+    )
+
+
+def _build(redis, fallback, max_staleness_seconds=45.0, layout="keys"):
+    rate_factory = RateFactory(PrecisionService())
+    cache = RedisQuoteSnapshotCache(
+        redis_client=redis,
+        rate_factory=rate_factory,
+        fallback=fallback,
+        max_staleness_seconds=max_staleness_seconds,
+        layout=layout,
+    )
+    writer = RedisQuoteWriter(
+        redis_client=redis, rate_factory=rate_factory, ttl_seconds=90, layout=layout
+    )
+    return cache, writer
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("layout", ["keys", "hash"])
+async def test_snapshot_serves_latest_from_memory(layout):
+    # Given
+    redis = FakeRedis()
+    fallback = MockRepo()
+    cache, writer = _build(redis, fallback, layout=layout)
+    q = _q()
+
+    await writer.save_batch([q, _q("ETH", "USDT", "4000")])
+
+    # When
+    await cache.refresh()
+    await redis.flushall()
+    got = await cache.get_latest(q.pair)
+
+    # Then
+    assert got == q
+    assert not fallback.calls
+
+
+@pytest.mark.asyncio
+async def test_snapshot_miss_goes_to_fallback():
+    # Given
+    redis = FakeRedis()
+    fallback_quote = _q("SOL", "USDT", "150")
+    fallback = MockRepo(latest=fallback_quote)
+    cache, writer = _build(redis, fallback)
+
+    await writer.save_batch([_q()])
+    await cache.refresh()
+
+    # When
+    got = await cache.get_latest(fallback_quote.pair)
+
+    # Then
+    assert got == fallback_quote
+    assert fallback.calls == [("get_latest", fallback_quote.pair)]
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_bypassed():
+    # Given
+    redis = FakeRedis()
+    fallback = MockRepo()
+    cache, writer = _build(redis, fallback)
+    q = _q()
+    await writer.save_batch([q])
+
+    # When (never refreshed)
+    got = await cache.get_latest(q.pair)
+
+    # Then
+    assert cache.is_stale()
+    assert got is None
+    assert fallback.calls == [("get_latest", q.pair)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_skips_entries_without_currencies():
+    # Given
+    redis = FakeRedis()
+    cache, _ = _build(redis, MockRepo())
+    legacy = {
+        "symbol": "BTCUSDT",
+        "rate": "25000",
+        "timestamp": datetime(2025, 10, 2, tzinfo=timezone.utc).isoformat(),
+    }
+    await redis.set("quote:latest:BTCUSDT", json.dumps(legacy))
+
+    # When
+    await cache.refresh()
+
+    # Then
+    assert await cache.get_latest(_q().pair) is None
+    assert not cache.is_stale()
+
+
+@pytest.mark.asyncio
+async def test_listener_reloads_on_new_generation():
+    # Given
+    redis = FakeRedis()
+    cache, writer = _build(redis, MockRepo())
+    q = _q(rate="30000")
+
+    await cache.start()
+
+    try:
+        # When
+        await asyncio.sleep(0.05)
+        await writer.save_batch([q])
+
+        for _ in range(50):
+            if cache.generation is not None:
+                break
+            await asyncio.sleep(0.05)
+
+        # Then
+        assert cache.generation == 1
+        assert await cache.get_latest(q.pair) == q
+    finally:
+        await cache.stop()
@@ -62,3 +62,108 @@ async def test_redis_writer_empty_batch_noop():
 
     # When & Then
     await writer.save_batch([])
+
+
+@pytest.mark.asyncio
+async def test_redis_writer_bumps_generation_and_stores_currencies():
+    # Given
+    redis = FakeRedis()
+    writer = RedisQuoteWriter(
+        redis_client=redis, rate_factory=RateFactory(PrecisionService()), ttl_seconds=90
+    )
+
+    # When
+    await writer.save_batch([_q()])
+    await writer.save_batch([_q()])
+
+    payload = json.loads(await redis.get("quote:latest:BTCUSDT"))
+
+    # Then
+    assert int(await redis.get("quote:generation")) == 2
+    assert payload["base_currency"] == "BTC"
+    assert payload["quote_currency"] == "USDT"
+
+
+@pytest.mark.asyncio
+async def test_redis_writer_appends_history_and_trims_window():
+    # Given
+    redis = FakeRedis()
+    writer = RedisQuoteWriter(
+        redis_client=redis,
+        rate_factory=RateFactory(PrecisionService()),
+        ttl_seconds=90,
+        history_window_seconds=600,
+    )
+    pair = Pair(Currency("BTC"), Currency("USDT"))
+
+    def _at(minute, rate):
+        return Quote(
+            pair=pair,
+            rate=Rate(Decimal(rate)),
+            timestamp=TimestampUTC(
+                datetime(2025, 10, 2, 0, minute, tzinfo=timezone.utc)
+            ),
+        )
+
+    # When
+    await writer.save_batch([_at(0, "100")])
+    await writer.save_batch([_at(5, "105")])
+    await writer.save_batch([_at(5, "105")])
+    await writer.save_batch([_at(12, "112")])
+
+    entries = await redis.zrange("quote:history:BTCUSDT", 0, -1)
+    ttl = await redis.ttl("quote:history:BTCUSDT")
+
+    # Then
+    assert [json.loads(e)["rate"] for e in entries] == ["105", "112"]
+    assert 0 < ttl <= 690
+
+
+@pytest.mark.asyncio
+async def test_redis_writer_hash_layout_swaps_in_full_snapshot():
+    # Given
+    redis = FakeRedis()
+    writer = RedisQuoteWriter(
+        redis_client=redis,
+        rate_factory=RateFactory(PrecisionService()),
+        ttl_seconds=90,
+        layout="hash",
+    )
+    eth = Quote(
+        pair=Pair(Currency("ETH"), Currency("USDT")),
+        rate=Rate(Decimal("2000")),
+        timestamp=_q().timestamp,
+    )
+
+    # When
+    await writer.save_batch([_q(), eth])
+    await writer.save_batch([_q()])
+
+    snapshot = await redis.hgetall("quote:snapshot")
+    ttl = await redis.ttl("quote:snapshot")
+
+    # Then
+    assert set(snapshot) == {b"BTCUSDT", b"ETHUSDT"}
+    assert json.loads(snapshot[b"ETHUSDT"])["rate"] == "2000"
+    assert not await redis.exists("quote:snapshot:staging", "quote:latest:BTCUSDT")
+    assert int(await redis.get("quote:generation")) == 2
+    assert 0 < ttl <= 90
+
+
+@pytest.mark.asyncio
+async def test_redis_writer_hash_layout_keeps_pairs_from_previous_writer():
+    # Given
+    redis = FakeRedis()
+    rate_factory = RateFactory(PrecisionService())
+    eth = Quote(
+        pair=Pair(Currency("ETH"), Currency("USDT")),
+        rate=Rate(Decimal("2000")),
+        timestamp=_q().timestamp,
+    )
+    await RedisQuoteWriter(redis, rate_factory, layout="hash").save_batch([eth])
+
+    # When
+    await RedisQuoteWriter(redis, rate_factory, layout="hash").save_batch([_q()])
+
+    # Then
+    assert set(await redis.hkeys("quote:snapshot")) == {b"BTCUSDT", b"ETHUSDT"}
@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+try:
+    from fakeredis.aioredis import FakeRedis
+except Exception:
+    FakeRedis = None
+
+from converter.adapters.outbound.persistence.redis.quote_repository import (
+    RedisQuoteRepository,
+)
+from converter.adapters.outbound.persistence.redis.quote_writer import RedisQuoteWriter
+from converter.adapters.outbound.persistence.redis.route_index_refresher import (
+    RouteIndexRefresher,
+)
+from converter.domain.models import Quote
+from converter.domain.services import RouteIndex
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+pytestmark = pytest.mark.skipif(FakeRedis is None, reason="fakeredis not available")
+
+
+class UnreachableRepository:
+    async def get_tracked_pairs(self):
+        raise ConnectionError("redis down")
+
+
+def _q(base, quote, rate):
+    return Quote(
+        pair=Pair(Currency(base), Currency(quote)),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc)),
+    )
+
+
+def _build(redis, index, layout="keys"):
+    rate_factory = RateFactory(PrecisionService())
+    repository = RedisQuoteRepository(
+        redis_client=redis, rate_factory=rate_factory, layout=layout
+    )
+    writer = RedisQuoteWriter(
+        redis_client=redis, rate_factory=rate_factory, ttl_seconds=90, layout=layout
+    )
+    return RouteIndexRefresher(repository=repository, route_index=index), writer
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("layout", ["keys", "hash"])
+async def test_refresh_rebuilds_index_from_pairs_in_redis(layout):
+    # Given
+    redis = FakeRedis()
+    index = RouteIndex()
+    refresher, writer = _build(redis, index, layout=layout)
+    sol_eur = Pair(Currency("SOL"), Currency("EUR"))
+
+    await writer.save_batch([_q("SOL", "USDT", "150")])
+    await refresher.refresh()
+    assert index.find(sol_eur) is None
+
+    # When
+    await writer.save_batch([_q("EUR", "USDT", "1.2")])
+    changed = await refresher.refresh()
+
+    # Then
+    assert changed
+    assert index.size == 2
+    assert str(index.find(sol_eur)) == "SOL->USDT->EUR"
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_changes_keeps_index():
+    # Given
+    redis = FakeRedis()
+    index = RouteIndex()
+    refresher, writer = _build(redis, index)
+
+    await writer.save_batch([_q("SOL", "USDT", "150")])
+    await refresher.refresh()
+
+    # When
+    changed = await refresher.refresh()
+
+    # Then
+    assert not changed
+    assert index.size == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_index():
+    # Given
+    index = RouteIndex()
+    index.rebuild([Pair(Currency("SOL"), Currency("USDT"))])
+    refresher = RouteIndexRefresher(
+        repository=UnreachableRepository(),  # type: ignore [arg-type]
+        route_index=index,
+    )
+
+    # When
+    changed = await refresher.refresh()
+
+    # Then
+    assert not changed
+    assert index.size == 1
+
+
+@pytest.mark.asyncio
+async def test_start_builds_index_before_returning():
+    # Given
+    redis = FakeRedis()
+    index = RouteIndex()
+    refresher, writer = _build(redis, index)
+    await writer.save_batch([_q("SOL", "USDT", "150"), _q("EUR", "USDT", "1.2")])
+
+    # When
+    await refresher.start()
+
+    # Then
+    try:
+        assert index.size == 2
+    finally:
+        await refresher.stop()
@@ -0,0 +1,169 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.change_detecting_quote_writer import (
+    ChangeDetectingQuoteWriter,
+)
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from converter.shared.config.settings import Settings
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class MockWriter(QuoteWriter):
+    def __init__(self, should_fail=False):
+        self.should_fail = should_fail
+        self.saved: list[list[Quote]] = []
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if self.should_fail:
+            raise RuntimeError("write failed")
+        self.saved.append(quotes)
+
+
+def _q(base: str, rate: str, seconds: int = 0) -> Quote:
+    return Quote(
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_forwards_only_moved_prices():
+    # Given
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=60)
+    await writer.save_batch([_q("BTC", "100"), _q("ETH", "10")])
+
+    # When
+    await writer.save_batch([_q("BTC", "101", 30), _q("ETH", "10", 30)])
+
+    # Then
+    assert [q.pair.code() for q in inner.saved[1]] == ["BTCUSDT"]
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_writes_unchanged_after_heartbeat():
+    # Given
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=60)
+
+    # When
+    for tick in range(4):
+        await writer.save_batch([_q("ETH", "10", tick * 30)])
+
+    # Then
+    written = [batch[0].timestamp.value for batch in inner.saved]
+    assert written == [T0, T0 + timedelta(seconds=60)]
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_skips_unchanged_at_default_settings():
+    # Given
+    defaults = {name: field.default for name, field in Settings.model_fields.items()}
+    interval = defaults["FETCH_INTERVAL_SECONDS"]
+    max_age = defaults["QUOTE_MAX_AGE_SECONDS"]
+
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(
+        inner,
+        heartbeat_seconds=defaults["POSTGRES_HEARTBEAT_SECONDS"],
+        max_gap_seconds=max_age,
+        interval_seconds=interval,
+    )
+
+    # When
+    for tick in range(10):
+        await writer.save_batch([_q("ETH", "10", tick * interval)])
+
+    # Then
+    written = [batch[0].timestamp.value for batch in inner.saved]
+    assert len(written) < 10
+    # Every moment is still covered by a row no older than the max age
+    assert all(
+        (later - earlier).total_seconds() <= max_age
+        for earlier, later in zip(written, written[1:])
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_writes_unchanged_before_a_gap_opens():
+    # Given
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(
+        inner, heartbeat_seconds=300, max_gap_seconds=60, interval_seconds=30
+    )
+
+    # When
+    # Skipping at 31s would leave no row between 60s and 61s
+    for seconds in (0, 31, 61):
+        await writer.save_batch([_q("ETH", "10", seconds)])
+
+    # Then
+    written = [batch[0].timestamp.value for batch in inner.saved]
+    assert written == [T0, T0 + timedelta(seconds=31)]
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_writes_unchanged_exactly_at_heartbeat():
+    # Given
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=30)
+
+    # When
+    for tick in range(3):
+        await writer.save_batch([_q("ETH", "10", tick * 30)])
+
+    # Then
+    assert len(inner.saved) == 3
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_hands_skipped_quotes_to_latest():
+    # Given
+    inner = MockWriter()
+    latest = MockWriter()
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=60, latest=latest)
+    await writer.save_batch([_q("BTC", "100"), _q("ETH", "10")])
+
+    # When
+    await writer.save_batch([_q("BTC", "101", 30), _q("ETH", "10", 30)])
+
+    # Then
+    assert [q.pair.code() for q in inner.saved[1]] == ["BTCUSDT"]
+    assert [q.pair.code() for q in latest.saved[0]] == ["ETHUSDT"]
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_zero_heartbeat_writes_everything():
+    # Given
+    inner = MockWriter()
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=0)
+
+    # When
+    await writer.save_batch([_q("ETH", "10")])
+    await writer.save_batch([_q("ETH", "10", 30)])
+
+    # Then
+    assert len(inner.saved) == 2
+
+
+@pytest.mark.asyncio
+async def test_change_detecting_writer_retries_failed_batch_in_full():
+    # Given
+    inner = MockWriter(should_fail=True)
+    writer = ChangeDetectingQuoteWriter(inner, heartbeat_seconds=60)
+
+    with pytest.raises(RuntimeError):
+        await writer.save_batch([_q("ETH", "10")])
+
+    # When
+    inner.should_fail = False
+    await writer.save_batch([_q("ETH", "10")])
+
+    # Then
+    assert len(inner.saved) == 1
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.coalescing_quote_repository import (
+    CoalescingQuoteRepository,
+)
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+
+class SlowRepo(QuoteRepository):
+    def __init__(self, quotes, error=None):
+        self.quotes = {q.pair: q for q in quotes}
+        self.error = error
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def get_latest(self, pair: Pair):
+        self.calls.append(("get_latest", pair))
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.quotes.get(pair)
+
+    async def get_latest_many(self, pairs):
+        self.calls.append(("get_latest_many", pairs))
+        await self.release.wait()
+        return {p: self.quotes[p] for p in pairs if p in self.quotes}
+
+    async def get_latest_before(self, pair: Pair, timestamp: TimestampUTC):
+        self.calls.append(("get_latest_before", pair, timestamp))
+        await self.release.wait()
+        return self.quotes.get(pair)
+
+
+def _q(base="BTC", quote="USDT", rate="25000"):
+    return Quote(
+        pair=Pair(Currency(base), Currency(quote)),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)),
+    )
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_latest_lookups_share_one_call():
+    # Given
+    q = _q()
+    inner = SlowRepo([q])
+    repo = CoalescingQuoteRepository(inner)
+
+    # When
+    tasks = [asyncio.create_task(repo.get_latest(q.pair)) for _ in range(100)]
+    await _settle()
+    inner.release.set()
+    results = await asyncio.gather(*tasks)
+
+    # Then
+    assert results == [q] * 100
+    assert inner.calls == [("get_latest", q.pair)]
+
+
+@pytest.mark.asyncio
+async def test_latest_and_historical_are_not_mixed():
+    # Given
+    q = _q()
+    ts = TimestampUTC(datetime(2025, 10, 2, 1, 0, tzinfo=timezone.utc))
+    inner = SlowRepo([q])
+    repo = CoalescingQuoteRepository(inner)
+
+    # When
+    tasks = [
+        asyncio.create_task(repo.get_latest(q.pair)),
+        asyncio.create_task(repo.get_latest_before(q.pair, ts)),
+        asyncio.create_task(repo.get_latest_before(q.pair, ts)),
+    ]
+    await _settle()
+    inner.release.set()
+    await asyncio.gather(*tasks)
+
+    # Then
+    assert inner.calls == [
+        ("get_latest", q.pair),
+        ("get_latest_before", q.pair, ts),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_many_joins_in_flight_lookups_and_batches_the_rest():
+    # Given
+    btc, eth = _q(), _q("ETH", "USDT", "4000")
+    inner = SlowRepo([btc, eth])
+    repo = CoalescingQuoteRepository(inner)
+
+    # When
+    single = asyncio.create_task(repo.get_latest(btc.pair))
+    await _settle()
+    many = asyncio.create_task(repo.get_latest_many([btc.pair, eth.pair]))
+    again = asyncio.create_task(repo.get_latest(eth.pair))
+    await _settle()
+    inner.release.set()
+
+    # Then
+    assert await single == btc
+    assert await many == {btc.pair: btc, eth.pair: eth}
+    assert await again == eth
+    assert inner.calls == [
+        ("get_latest", btc.pair),
+        ("get_latest_many", [eth.pair]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached():
+    # Given
+    q = _q()
+    inner = SlowRepo([q], error=RuntimeError("redis down"))
+    repo = CoalescingQuoteRepository(inner)
+
+    # When
+    tasks = [asyncio.create_task(repo.get_latest(q.pair)) for _ in range(3)]
+    await _settle()
+    inner.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    inner.error = None
+    retried = await repo.get_latest(q.pair)
+
+    # Then
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert retried == q
+    assert len(inner.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_lookup():
+    # Given
+    q = _q()
+    inner = SlowRepo([q])
+    repo = CoalescingQuoteRepository(inner)
+
+    first = asyncio.create_task(repo.get_latest(q.pair))
+    second = asyncio.create_task(repo.get_latest(q.pair))
+    await _settle()
+
+    # When
+    first.cancel()
+    await _settle()
+    inner.release.set()
+
+    # Then
+    assert await second == q
+    assert first.cancelled()
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
@@ -82,3 +82,90 @@ async def test_composite_repo_historical_uses_fallback_only():
     # Then
     assert res == q
     assert fallback.calls and fallback.calls[0][0] == "get_latest_before"
+
+
+@pytest.mark.asyncio
+async def test_composite_repo_many_only_falls_back_for_misses():
+    # Given
+    q = _quote()
+    other = Pair(Currency("ETH"), Currency("USDT"))
+    primary = MockRepo()
+    primary.latest = None
+    fallback = MockRepo(latest=q)
+
+    async def primary_many(pairs):
+        primary.calls.append(("get_latest_many", pairs))
+        return {q.pair: q}
+
+    async def fallback_many(pairs):
+        fallback.calls.append(("get_latest_many", pairs))
+        return {}
+
+    primary.get_latest_many = primary_many
+    fallback.get_latest_many = fallback_many
+    repo = CompositeQuoteRepository(primary, fallback)
+
+    # When
+    res = await repo.get_latest_many([q.pair, other, q.pair])
+
+    # Then
+    assert res == {q.pair: q}
+    assert fallback.calls == [("get_latest_many", [other])]
+
+
+@pytest.mark.asyncio
+async def test_composite_repo_historical_within_window_uses_primary():
+    # Given
+    q = _quote()
+    ts = TimestampUTC(datetime.now(timezone.utc) - timedelta(minutes=10))
+    primary = MockRepo(latest_before=q)
+    fallback = MockRepo()
+    repo = CompositeQuoteRepository(
+        primary, fallback, primary_history_window_seconds=3600
+    )
+
+    # When
+    res = await repo.get_latest_before(q.pair, ts)
+
+    # Then
+    assert res == q
+    assert not fallback.calls
+
+
+@pytest.mark.asyncio
+async def test_composite_repo_historical_outside_window_skips_primary():
+    # Given
+    q = _quote()
+    ts = TimestampUTC(datetime.now(timezone.utc) - timedelta(hours=2))
+    primary = MockRepo(latest_before=q)
+    fallback = MockRepo(latest_before=q)
+    repo = CompositeQuoteRepository(
+        primary, fallback, primary_history_window_seconds=3600
+    )
+
+    # When
+    res = await repo.get_latest_before(q.pair, ts)
+
+    # Then
+    assert res == q
+    assert not primary.calls
+    assert fallback.calls[0][0] == "get_latest_before"
+
+
+@pytest.mark.asyncio
+async def test_composite_repo_historical_primary_miss_falls_back():
+    # Given
+    q = _quote()
+    ts = TimestampUTC(datetime.now(timezone.utc) - timedelta(minutes=10))
+    primary = MockRepo()
+    fallback = MockRepo(latest_before=q)
+    repo = CompositeQuoteRepository(
+        primary, fallback, primary_history_window_seconds=3600
+    )
+
+    # When
+    res = await repo.get_latest_before(q.pair, ts)
+
+    # Then
+    assert res == q
+    assert primary.calls and fallback.calls
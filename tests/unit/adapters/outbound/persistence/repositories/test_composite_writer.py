@@ -9,6 +9,7 @@ from converter.adapters.outbound.persistence.repositories.composite_quote_writer
 )
 from converter.domain.models import Quote
 from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from converter.shared.observability.metrics import Metrics
 
 
 class MockWriter:
@@ -69,3 +70,30 @@ async def test_composite_writer_swallows_secondary_errors(monkeypatch):
     # THen
     assert len(primary.saved) == 1
     assert len(secondary.saved) == 0
+
+
+@pytest.mark.asyncio
+async def test_composite_writer_counts_secondary_failures_by_storage(monkeypatch):
+    # Given
+    metrics = Metrics()
+    monkeypatch.setattr(
+        writer_module,
+        "settings",
+        types.SimpleNamespace(ENABLE_METRICS=True),
+        raising=False,
+    )
+    monkeypatch.setattr(writer_module, "get_metrics_registry", lambda: metrics)
+    writer = CompositeQuoteWriter(
+        MockWriter(), MockWriter(should_fail=True), secondary_storage="candles"
+    )
+
+    # When
+    await writer.save_batch([_q(), _q()])
+
+    # Then
+    assert (
+        metrics.registry.get_sample_value(
+            "quotes_store_failed_total", {"storage": "candles"}
+        )
+        == 2
+    )
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.group_commit_quote_writer import (
+    GroupCommitQuoteWriter,
+)
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class MockWriter(QuoteWriter):
+    def __init__(self, rejected_base: str | None = None):
+        self.rejected_base = rejected_base
+        self.saved: list[list[Quote]] = []
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        if any(q.pair.base.code == self.rejected_base for q in quotes):
+            raise ValueError("batch rejected")
+        self.saved.append(quotes)
+
+
+def _batch(base: str, n: int, size: int = 1) -> list[Quote]:
+    return [
+        Quote(
+            pair=Pair(Currency(base), Currency("USDT")),
+            rate=Rate(Decimal(100 + n)),
+            timestamp=TimestampUTC(T0 + timedelta(seconds=n, milliseconds=i)),
+        )
+        for i in range(size)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_one_write():
+    # Given
+    inner = MockWriter()
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=20, max_rows=1000)
+    batches = [_batch("BTC", n) for n in range(3)]
+
+    # When
+    await asyncio.gather(*(writer.save_batch(b) for b in batches))
+
+    # Then
+    assert inner.saved == [[q for b in batches for q in b]]
+
+
+@pytest.mark.asyncio
+async def test_group_is_flushed_once_it_holds_max_rows():
+    # Given
+    inner = MockWriter()
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=5000, max_rows=4)
+
+    # When
+    await asyncio.wait_for(
+        asyncio.gather(
+            writer.save_batch(_batch("BTC", 0, size=2)),
+            writer.save_batch(_batch("ETH", 0, size=2)),
+        ),
+        timeout=1,
+    )
+
+    # Then
+    assert [len(group) for group in inner.saved] == [4]
+
+
+@pytest.mark.asyncio
+async def test_group_is_flushed_once_every_caller_has_joined():
+    # Given
+    inner = MockWriter()
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=5000, max_batches=2)
+
+    # When
+    await asyncio.wait_for(
+        asyncio.gather(
+            writer.save_batch(_batch("BTC", 0)),
+            writer.save_batch(_batch("ETH", 0)),
+        ),
+        timeout=1,
+    )
+
+    # Then
+    assert inner.saved == [_batch("BTC", 0) + _batch("ETH", 0)]
+
+
+@pytest.mark.asyncio
+async def test_failed_group_reports_each_batch_on_its_own():
+    # Given
+    inner = MockWriter(rejected_base="BAD")
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=20, max_rows=1000)
+
+    # When
+    results = await asyncio.gather(
+        writer.save_batch(_batch("BTC", 0)),
+        writer.save_batch(_batch("BAD", 0)),
+        writer.save_batch(_batch("ETH", 0)),
+        return_exceptions=True,
+    )
+
+    # Then
+    assert results[0] is None
+    assert isinstance(results[1], ValueError)
+    assert results[2] is None
+    assert inner.saved == [_batch("BTC", 0), _batch("ETH", 0)]
+
+
+@pytest.mark.asyncio
+async def test_groups_are_written_in_order():
+    # Given
+    inner = MockWriter()
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=1, max_rows=1)
+
+    # When
+    await asyncio.gather(*(writer.save_batch(_batch("BTC", n)) for n in range(5)))
+
+    # Then
+    assert inner.saved == [_batch("BTC", n) for n in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_the_open_group():
+    # Given
+    inner = MockWriter()
+    writer = GroupCommitQuoteWriter(inner, max_delay_ms=60000, max_rows=1000)
+    pending = asyncio.create_task(writer.save_batch(_batch("BTC", 0)))
+    await asyncio.sleep(0)
+
+    # When
+    await writer.close()
+
+    # Then
+    await asyncio.wait_for(pending, timeout=1.0)
+    assert inner.saved == [_batch("BTC", 0)]
@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.rollup_quote_repository import (
+    RollupQuoteRepository,
+)
+from converter.app.ports.outbound.candle_repository import CandleRepository
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Candle, Quote
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
+from converter.domain.values import Currency, Pair, Rate, Resolution, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+BTC = Pair(Currency("BTC"), Currency("USDT"))
+
+
+class MockRepo(QuoteRepository):
+    def __init__(self, latest_before=None):
+        self.latest_before = latest_before
+        self.calls = []
+
+    async def get_latest(self, pair: Pair):
+        self.calls.append(("get_latest", pair))
+        return None
+
+    async def get_latest_before(self, pair: Pair, timestamp: TimestampUTC):
+        self.calls.append(("get_latest_before", pair, timestamp))
+        return self.latest_before
+
+
+class MockCandles(CandleRepository):
+    def __init__(self, candles):
+        self.candles = candles
+        self.calls = []
+
+    async def get_candles(self, pair, resolution, start, end):
+        self.calls.append((pair, resolution, start.value, end.value))
+        return [
+            c for c in self.candles if start.value <= c.bucket_start.value <= end.value
+        ]
+
+    async def get_binned_candles(self, symbol, interval, source, start, end):
+        raise NotImplementedError()
+
+
+def _quote(seconds: int, rate: str) -> Quote:
+    return Quote(
+        pair=BTC,
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds)),
+    )
+
+
+def _minute(*quotes: Quote) -> Candle:
+    candle = Candle.from_quote(quotes[0], Resolution.MINUTE)
+
+    for quote in quotes[1:]:
+        candle = candle.merge(Candle.from_quote(quote, Resolution.MINUTE))
+
+    return candle
+
+
+@pytest.mark.asyncio
+async def test_latest_before_served_from_minute_candles():
+    # Given
+    inner = MockRepo()
+    candles = MockCandles(
+        [_minute(_quote(10, "100"), _quote(50, "101")), _minute(_quote(70, "102"))]
+    )
+    repo = RollupQuoteRepository(inner, candles, FreshnessPolicy(max_age_seconds=60))
+
+    # When
+    in_second_bucket = await repo.get_latest_before(
+        BTC, TimestampUTC(T0 + timedelta(seconds=80))
+    )
+    before_second_open = await repo.get_latest_before(
+        BTC, TimestampUTC(T0 + timedelta(seconds=65))
+    )
+
+    # Then
+    assert in_second_bucket == _quote(70, "102")
+    assert before_second_open == _quote(50, "101")
+    assert not inner.calls
+    # Window starts at the bucket of the oldest acceptable quote
+    assert candles.calls[0][1] is Resolution.MINUTE
+    assert candles.calls[0][2] == T0
+
+
+@pytest.mark.asyncio
+async def test_latest_before_falls_back_to_raw_when_no_candles():
+    # Given
+    raw = _quote(0, "100")
+    inner = MockRepo(latest_before=raw)
+    repo = RollupQuoteRepository(
+        inner, MockCandles([]), FreshnessPolicy(max_age_seconds=60)
+    )
+    ts = TimestampUTC(T0 + timedelta(seconds=30))
+
+    # When
+    quote = await repo.get_latest_before(BTC, ts)
+
+    # Then
+    assert quote == raw
+    assert inner.calls == [("get_latest_before", BTC, ts)]
+
+
+@pytest.mark.asyncio
+async def test_precision_finer_than_any_resolution_reads_raw_only():
+    # Given
+    inner = MockRepo(latest_before=_quote(0, "100"))
+    candles = MockCandles([_minute(_quote(0, "100"))])
+    repo = RollupQuoteRepository(inner, candles, FreshnessPolicy(max_age_seconds=30))
+
+    # When
+    await repo.get_latest_before(BTC, TimestampUTC(T0 + timedelta(seconds=10)))
+
+    # Then
+    assert not candles.calls
+    assert len(inner.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_latest_lookups_go_to_inner():
+    # Given
+    inner = MockRepo()
+    repo = RollupQuoteRepository(inner, MockCandles([]))
+
+    # When
+    await repo.get_latest(BTC)
+
+    # Then
+    assert inner.calls == [("get_latest", BTC)]
+
+
+@pytest.mark.asyncio
+async def test_latest_before_within_raw_retention_reads_raw_first():
+    # Given
+    now = datetime.now(timezone.utc)
+    raw = Quote(pair=BTC, rate=Rate(Decimal("101")), timestamp=TimestampUTC(now))
+    inner = MockRepo(latest_before=raw)
+    candles = MockCandles([])
+    repo = RollupQuoteRepository(inner, candles, FreshnessPolicy(max_age_seconds=60))
+
+    # When
+    quote = await repo.get_latest_before(BTC, TimestampUTC(now))
+
+    # Then
+    assert quote == raw
+    assert not candles.calls
+
+
+@pytest.mark.asyncio
+async def test_latest_before_within_raw_retention_falls_back_to_candles():
+    # Given
+    now = datetime.now(timezone.utc).replace(second=30, microsecond=0)
+    tick = Quote(
+        pair=BTC,
+        rate=Rate(Decimal("101")),
+        timestamp=TimestampUTC(now - timedelta(seconds=10)),
+    )
+    inner = MockRepo()
+    candles = MockCandles([_minute(tick)])
+    repo = RollupQuoteRepository(inner, candles, FreshnessPolicy(max_age_seconds=60))
+
+    # When
+    quote = await repo.get_latest_before(BTC, TimestampUTC(now))
+
+    # Then
+    assert quote == tick
+    assert len(inner.calls) == 1
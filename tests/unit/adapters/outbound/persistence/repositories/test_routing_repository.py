@@ -0,0 +1,142 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.routing_quote_repository import (
+    RoutingQuoteRepository,
+)
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.domain.models import Quote
+from converter.domain.services import CrossRateService, RouteIndex
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+
+class MockRepo(QuoteRepository):
+    def __init__(self, quotes):
+        self.quotes = {q.pair: q for q in quotes}
+        self.calls = []
+
+    async def get_latest(self, pair: Pair):
+        self.calls.append(("get_latest", pair))
+        return self.quotes.get(pair)
+
+    async def get_latest_many(self, pairs):
+        self.calls.append(("get_latest_many", pairs))
+        return {p: self.quotes[p] for p in pairs if p in self.quotes}
+
+    async def get_latest_before(self, pair: Pair, timestamp: TimestampUTC):
+        self.calls.append(("get_latest_before", pair, timestamp))
+        return self.quotes.get(pair)
+
+
+def _p(base: str, quote: str) -> Pair:
+    return Pair(Currency(base), Currency(quote))
+
+
+def _q(base: str, quote: str, rate: str) -> Quote:
+    return Quote(
+        pair=_p(base, quote),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)),
+    )
+
+
+QUOTES = [
+    _q("BTC", "USDT", "25000"),
+    _q("SOL", "USDT", "150"),
+    _q("EUR", "USDT", "1.25"),
+]
+
+
+def _build(quotes=QUOTES, indexed=True):
+    inner = MockRepo(quotes)
+    index = RouteIndex()
+
+    if indexed:
+        index.rebuild(q.pair for q in quotes)
+
+    repo = RoutingQuoteRepository(
+        inner=inner,
+        route_index=index,
+        cross_rate_service=CrossRateService(RateFactory(PrecisionService())),
+    )
+    return repo, inner
+
+
+@pytest.mark.asyncio
+async def test_direct_pair_keeps_single_lookup():
+    # Given
+    repo, inner = _build()
+
+    # When
+    q = await repo.get_latest(_p("BTC", "USDT"))
+
+    # Then
+    assert q == QUOTES[0]
+    assert inner.calls == [("get_latest", _p("BTC", "USDT"))]
+
+
+@pytest.mark.asyncio
+async def test_cross_pair_fetches_legs_in_one_call():
+    # Given
+    repo, inner = _build()
+
+    # When
+    q = await repo.get_latest(_p("SOL", "EUR"))
+
+    # Then
+    assert q is not None
+    assert q.pair == _p("SOL", "EUR")
+    assert q.rate.value == Decimal("120.00000000")
+    assert inner.calls == [("get_latest_many", [_p("SOL", "USDT"), _p("EUR", "USDT")])]
+
+
+@pytest.mark.asyncio
+async def test_many_batches_legs_of_all_routes():
+    # Given
+    repo, inner = _build()
+    requested = [_p("USDT", "BTC"), _p("SOL", "EUR"), _p("SOL", "USDT")]
+
+    # When
+    quotes = await repo.get_latest_many(requested)
+
+    # Then
+    assert len(inner.calls) == 1
+    assert inner.calls[0][0] == "get_latest_many"
+    assert set(inner.calls[0][1]) == {
+        _p("BTC", "USDT"),
+        _p("SOL", "USDT"),
+        _p("EUR", "USDT"),
+    }
+    assert quotes[_p("USDT", "BTC")].rate.value == Decimal("0.00004000")
+    assert quotes[_p("SOL", "EUR")].rate.value == Decimal("120.00000000")
+    assert quotes[_p("SOL", "USDT")] == QUOTES[1]
+
+
+@pytest.mark.asyncio
+async def test_historical_cross_pair_composes_legs():
+    # Given
+    repo, _ = _build()
+    ts = TimestampUTC(datetime(2025, 10, 2, 1, 0, tzinfo=timezone.utc))
+
+    # When
+    q = await repo.get_latest_before(_p("USDT", "SOL"), ts)
+
+    # Then
+    assert q is not None
+    assert q.pair == _p("USDT", "SOL")
+
+
+@pytest.mark.asyncio
+async def test_empty_index_passes_through():
+    # Given
+    repo, inner = _build(indexed=False)
+
+    # When
+    q = await repo.get_latest(_p("SOL", "EUR"))
+
+    # Then
+    assert q is None
+    assert inner.calls == [("get_latest", _p("SOL", "EUR"))]
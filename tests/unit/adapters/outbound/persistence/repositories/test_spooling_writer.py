@@ -0,0 +1,161 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from converter.adapters.outbound.persistence.repositories.spooling_quote_writer import (
+    SpoolingQuoteWriter,
+)
+from converter.adapters.outbound.persistence.spool.quote_spool import QuoteSpool
+from converter.adapters.outbound.persistence.sqlalchemy.errors import (
+    UNAVAILABLE_ERRORS,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
+    PostgresQuoteWriter,
+)
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class MockWriter(QuoteWriter):
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.attempts = 0
+        self.saved: list[list[Quote]] = []
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        self.attempts += 1
+        if self.error is not None:
+            raise self.error
+        self.saved.append(quotes)
+
+
+def _batch(n: int) -> list[Quote]:
+    return [
+        Quote(
+            pair=Pair(Currency("BTC"), Currency("USDT")),
+            rate=Rate(Decimal(100 + n)),
+            timestamp=TimestampUTC(T0 + timedelta(seconds=n)),
+        )
+    ]
+
+
+def _writer(inner: MockWriter, tmp_path) -> SpoolingQuoteWriter:
+    return SpoolingQuoteWriter(
+        inner,
+        QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16),
+        unavailable_errors=(ConnectionError,),
+        retry_seconds=0.01,
+        max_retry_seconds=0.01,
+    )
+
+
+async def _wait_for(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+@pytest.mark.asyncio
+async def test_unavailable_storage_spools_without_raising(tmp_path):
+    # Given
+    inner = MockWriter(error=ConnectionError("connection refused"))
+    writer = _writer(inner, tmp_path)
+
+    # When
+    await writer.save_batch(_batch(0))
+
+    # Then
+    assert inner.saved == []
+    assert not writer._spool.is_empty
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_batches_behind_a_backlog_skip_the_storage(tmp_path):
+    # Given
+    inner = MockWriter(error=ConnectionError("connection refused"))
+    writer = _writer(inner, tmp_path)
+    await writer.save_batch(_batch(0))
+    await writer.close()
+    attempts = inner.attempts
+
+    # When
+    await writer.save_batch(_batch(1))
+
+    # Then
+    # Only the replay task tries the storage, never the caller
+    assert writer._spool.batches == 2
+    assert inner.attempts <= attempts + 1
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_spooled_batches_are_replayed_in_order_after_recovery(tmp_path):
+    # Given
+    inner = MockWriter(error=ConnectionError("connection refused"))
+    writer = _writer(inner, tmp_path)
+    for n in range(3):
+        await writer.save_batch(_batch(n))
+
+    # When
+    inner.error = None
+    await _wait_for(lambda: writer._spool.is_empty)
+    await writer.save_batch(_batch(3))
+
+    # Then
+    assert inner.saved == [_batch(n) for n in range(4)]
+
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_batch_is_raised_not_spooled(tmp_path):
+    # Given
+    inner = MockWriter(error=ValueError("bad quote"))
+    writer = _writer(inner, tmp_path)
+
+    # When / Then
+    with pytest.raises(ValueError):
+        await writer.save_batch(_batch(0))
+
+    assert writer._spool.is_empty
+
+
+class UnreachableSymbolRegistry:
+    async def ids(self, pairs):
+        raise OperationalError("SELECT", {}, ConnectionRefusedError())
+
+
+@pytest.mark.asyncio
+async def test_postgres_writer_errors_are_spooled(tmp_path):
+    # Given
+    inner = PostgresQuoteWriter(
+        session_factory=None,
+        rate_factory=RateFactory(PrecisionService()),
+        symbol_registry=UnreachableSymbolRegistry(),
+    )
+    writer = SpoolingQuoteWriter(
+        inner,
+        QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16),
+        unavailable_errors=UNAVAILABLE_ERRORS,
+        retry_seconds=10,
+    )
+
+    # When
+    await writer.save_batch(_batch(0))
+
+    # Then
+    assert writer._spool.batches == 1
+
+    await writer.close()
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.repositories.write_behind_quote_writer import (
+    WriteBehindQuoteWriter,
+)
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class MockWriter(QuoteWriter):
+    def __init__(self, should_fail=False):
+        self.should_fail = should_fail
+        self.saved: list[list[Quote]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        await self.release.wait()
+        if self.should_fail:
+            raise RuntimeError("write failed")
+        self.saved.append(quotes)
+
+
+def _batch(n: int) -> list[Quote]:
+    return [
+        Quote(
+            pair=Pair(Currency("BTC"), Currency("USDT")),
+            rate=Rate(Decimal(100 + n)),
+            timestamp=TimestampUTC(T0 + timedelta(seconds=n)),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fast_writer_is_not_held_up_by_the_durable_writer():
+    # Given
+    fast, durable = MockWriter(), MockWriter()
+    durable.release.clear()
+    writer = WriteBehindQuoteWriter(fast, durable, queue_size=4)
+
+    # When
+    await writer.save_batch(_batch(0))
+
+    # Then
+    assert fast.saved == [_batch(0)]
+    assert durable.saved == []
+
+    durable.release.set()
+    await writer.close()
+    assert durable.saved == [_batch(0)]
+
+
+@pytest.mark.asyncio
+async def test_durable_writes_keep_their_order():
+    # Given
+    fast, durable = MockWriter(), MockWriter()
+    writer = WriteBehindQuoteWriter(fast, durable, queue_size=2)
+
+    # When
+    for n in range(5):
+        await writer.save_batch(_batch(n))
+    await writer.close()
+
+    # Then
+    assert durable.saved == [_batch(n) for n in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_the_producer_back():
+    # Given
+    fast, durable = MockWriter(), MockWriter()
+    durable.release.clear()
+    writer = WriteBehindQuoteWriter(fast, durable, queue_size=1)
+    await writer.save_batch(_batch(0))
+    await asyncio.sleep(0)  # the worker takes batch 0 and blocks on it
+    await writer.save_batch(_batch(1))
+
+    # When
+    blocked = asyncio.create_task(writer.save_batch(_batch(2)))
+    await asyncio.sleep(0.01)
+
+    # Then
+    assert not blocked.done()
+
+    durable.release.set()
+    await blocked
+    await writer.close()
+    assert durable.saved == [_batch(n) for n in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_failed_durable_write_is_not_raised():
+    # Given
+    fast, durable = MockWriter(), MockWriter(should_fail=True)
+    writer = WriteBehindQuoteWriter(fast, durable)
+
+    # When
+    await writer.save_batch(_batch(0))
+    await writer.save_batch(_batch(1))
+    await writer.close()
+
+    # Then
+    assert fast.saved == [_batch(0), _batch(1)]
+    assert durable.saved == []
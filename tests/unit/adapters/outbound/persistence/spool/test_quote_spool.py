@@ -0,0 +1,118 @@
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.spool.codec import (
+    decode_batch,
+    encode_batch,
+)
+from converter.adapters.outbound.persistence.spool.quote_spool import QuoteSpool
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def _q(base: str, rate: str, seconds: int = 0) -> Quote:
+    return Quote(
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds, microseconds=123)),
+    )
+
+
+def _batch(n: int) -> list[Quote]:
+    return [_q("BTC", f"{100 + n}.5", n), _q("ETH", "0.00000001", n)]
+
+
+def _drain(spool: QuoteSpool) -> list[list[Quote]]:
+    batches = []
+
+    while (batch := spool.peek()) is not None:
+        batches.append(batch.quotes)
+        spool.commit(batch)
+
+    return batches
+
+
+def test_encoded_batch_round_trips_exactly():
+    # Given
+    quotes = [_q("BTC", "67890.12345678"), _q("SHIB", "0.000012340000", 1)]
+
+    # When
+    decoded = decode_batch(encode_batch(quotes))
+
+    # Then
+    assert decoded == quotes
+    assert str(decoded[1].rate.value) == "0.000012340000"
+
+
+def test_batches_are_read_in_append_order_across_segments(tmp_path):
+    # Given
+    spool = QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1)
+
+    # When
+    for n in range(5):
+        spool.append(_batch(n))
+
+    # Then
+    assert len(os.listdir(tmp_path)) == 5
+    assert spool.batches == 5
+    assert _drain(spool) == [_batch(n) for n in range(5)]
+    assert spool.is_empty
+    assert os.listdir(tmp_path) == []
+
+
+def test_uncommitted_batches_survive_a_restart(tmp_path):
+    # Given
+    spool = QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16)
+    for n in range(3):
+        spool.append(_batch(n))
+    spool.commit(spool.peek())
+
+    # When
+    reopened = QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16)
+
+    # Then
+    # The read position isn't persisted, replay is at least once
+    assert _drain(reopened) == [_batch(n) for n in range(3)]
+
+
+def test_torn_tail_record_is_truncated_on_recovery(tmp_path):
+    # Given
+    spool = QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16)
+    spool.append(_batch(0))
+    spool.append(_batch(1))
+    [name] = os.listdir(tmp_path)
+    path = tmp_path / name
+    path.write_bytes(path.read_bytes()[:-3])
+
+    # When
+    reopened = QuoteSpool(str(tmp_path), max_bytes=1 << 20, segment_bytes=1 << 16)
+
+    # Then
+    assert reopened.batches == 1
+    assert _drain(reopened) == [_batch(0)]
+
+
+def test_full_spool_drops_oldest_segments(tmp_path):
+    # Given
+    record_size = len(encode_batch(_batch(0))) + 8
+    spool = QuoteSpool(
+        str(tmp_path), max_bytes=3 * record_size, segment_bytes=record_size
+    )
+    for n in range(3):
+        spool.append(_batch(n))
+    stale = spool.peek()
+
+    # When
+    dropped = spool.append(_batch(3))
+
+    # Then
+    assert dropped == 2
+    assert spool.size_bytes <= 3 * record_size
+
+    # Committing a batch whose segment is gone doesn't skip anything
+    spool.commit(stale)
+    assert _drain(spool) == [_batch(n) for n in (1, 2, 3)]
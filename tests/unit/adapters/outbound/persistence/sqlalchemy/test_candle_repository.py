@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from converter.adapters.outbound.persistence.sqlalchemy.candle_repository import (
+    PostgresCandleRepository,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.models import CandleHourModel
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import (
+    Currency,
+    Interval,
+    Pair,
+    Resolution,
+    TimestampUTC,
+)
+from sqlalchemy.dialects import postgresql
+
+T0 = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class MockResult:
+    def __init__(self, models):
+        self._models = models
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._models
+
+
+class MockSession:
+    def __init__(self, models):
+        self._models = models
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, stmt):
+        self.executed.append(stmt)
+        return MockResult(self._models)
+
+
+@pytest.mark.asyncio
+async def test_get_candles_reads_resolution_table_within_range():
+    # Given
+    model = CandleHourModel(
+        symbol_id=1,
+        bucket_start=T0,
+        open=Decimal("100"),
+        high=Decimal("120"),
+        low=Decimal("90"),
+        close=Decimal("110"),
+        open_time=T0 + timedelta(seconds=3),
+        close_time=T0 + timedelta(minutes=59),
+    )
+    session = MockSession([model])
+    repo = PostgresCandleRepository(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+    )
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+
+    # When
+    candles = await repo.get_candles(
+        btc,
+        Resolution.HOUR,
+        TimestampUTC(T0),
+        TimestampUTC(T0 + timedelta(hours=5)),
+    )
+
+    # Then
+    assert len(candles) == 1
+    assert candles[0].pair == btc
+    assert candles[0].interval == Resolution.HOUR.interval
+    assert candles[0].high.value == Decimal("120")
+    assert candles[0].close_time.value == T0 + timedelta(minutes=59)
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "FROM candles_1h" in sql
+    assert "candles_1h.symbol_id = (SELECT symbols.id" in sql
+    assert "candles_1h.bucket_start >=" in sql
+    assert "candles_1h.bucket_start <=" in sql
+
+
+class MockRowsResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class MockRowsSession(MockSession):
+    async def execute(self, stmt):
+        self.executed.append(stmt)
+        return MockRowsResult(self._models)
+
+
+@pytest.mark.asyncio
+async def test_get_binned_candles_aggregates_with_date_bin_in_one_query():
+    # Given
+    row = SimpleNamespace(
+        bucket=T0,
+        base_currency="BTC",
+        quote_currency="USDT",
+        open=Decimal("100"),
+        high=Decimal("130"),
+        low=Decimal("80"),
+        close=Decimal("125"),
+        open_time=T0 + timedelta(seconds=1),
+        close_time=T0 + timedelta(minutes=14, seconds=59),
+    )
+    session = MockRowsSession([row])
+    repo = PostgresCandleRepository(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+    )
+    interval = Interval.parse("15m")
+
+    # When
+    candles = await repo.get_binned_candles(
+        "BTCUSDT",
+        interval,
+        Resolution.MINUTE,
+        TimestampUTC(T0),
+        TimestampUTC(T0 + timedelta(hours=1)),
+    )
+
+    # Then
+    assert len(candles) == 1
+    assert candles[0].pair == Pair(Currency("BTC"), Currency("USDT"))
+    assert candles[0].interval == interval
+    assert candles[0].close.value == Decimal("125")
+    assert len(session.executed) == 1
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "date_bin(" in sql
+    assert "FROM candles_1m JOIN symbols ON symbols.id = candles_1m.symbol_id" in sql
+    assert "symbols.symbol =" in sql
+    assert "candles_1m.bucket_start >=" in sql
+    assert "candles_1m.bucket_start <" in sql
+    assert "GROUP BY bucket ORDER BY bucket" in sql
+
+
+def test_binned_statement_reads_raw_quotes_without_source():
+    # When
+    stmt = PostgresCandleRepository.binned_statement(
+        "BTCUSDT",
+        Interval.parse("30s"),
+        None,
+        TimestampUTC(T0),
+        TimestampUTC(T0 + timedelta(minutes=5)),
+    )
+
+    # Then
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "FROM quotes JOIN symbols ON symbols.id = quotes.symbol_id" in sql
+    assert "symbols.symbol =" in sql
+    assert "quotes.quote_timestamp >=" in sql
+    assert "quotes.quote_timestamp <" in sql
+    assert "ORDER BY quotes.quote_timestamp ASC" in sql
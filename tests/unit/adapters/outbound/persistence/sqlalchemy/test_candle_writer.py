@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.sqlalchemy.candle_writer import (
+    PostgresCandleWriter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
+from converter.domain.exceptions.quote import QuoteStorageError
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, Resolution, TimestampUTC
+from sqlalchemy.dialects import postgresql
+
+T0 = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class StubSymbolRegistry(SymbolRegistry):
+    def __init__(self):
+        self._ids = {}
+
+    async def ids(self, pairs):
+        for pair in pairs:
+            self._ids.setdefault(pair.code(), len(self._ids) + 1)
+        return self._ids
+
+
+class DummyBegin:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class DummySession:
+    def __init__(self, fail=False):
+        self.executed = []
+        self.begins = 0
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def begin(self):
+        self.begins += 1
+        return DummyBegin()
+
+    async def execute(self, stmt):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.executed.append(stmt)
+
+
+def _q(base="BTC", rate="100", seconds=0):
+    return Quote(
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds)),
+    )
+
+
+def test_aggregate_folds_batch_per_symbol_and_bucket():
+    # Given
+    quotes = [
+        _q("ETH", "10", 0),
+        _q("BTC", "100", 10),
+        _q("BTC", "120", 30),
+        _q("BTC", "90", 70),
+    ]
+
+    # When
+    minutes = PostgresCandleWriter.aggregate(quotes, Resolution.MINUTE)
+    hours = PostgresCandleWriter.aggregate(quotes, Resolution.HOUR)
+
+    # Then
+    assert [(c.pair.code(), c.bucket_start.value) for c in minutes] == [
+        ("BTCUSDT", T0),
+        ("BTCUSDT", T0 + timedelta(minutes=1)),
+        ("ETHUSDT", T0),
+    ]
+    assert minutes[0].high.value == Decimal("120")
+    assert minutes[0].close.value == Decimal("120")
+    assert len(hours) == 2
+    assert hours[0].open.value == Decimal("100")
+    assert hours[0].low.value == Decimal("90")
+    assert hours[0].close.value == Decimal("90")
+
+
+@pytest.mark.asyncio
+async def test_save_batch_upserts_every_resolution_in_one_transaction():
+    # Given
+    session = DummySession()
+    writer = PostgresCandleWriter(
+        session_factory=lambda: session, symbol_registry=StubSymbolRegistry()
+    )
+
+    # When
+    await writer.save_batch([_q(seconds=10), _q(rate="110", seconds=40)])
+
+    # Then
+    assert session.begins == 1
+    sql = [str(stmt.compile(dialect=postgresql.dialect())) for stmt in session.executed]
+    assert [s.split("(")[0] for s in sql] == [
+        "INSERT INTO candles_1m ",
+        "INSERT INTO candles_1h ",
+    ]
+    assert "ON CONFLICT (symbol_id, bucket_start) DO UPDATE" in sql[0]
+    assert "greatest(candles_1m.high, excluded.high)" in sql[0]
+    assert "least(candles_1m.low, excluded.low)" in sql[0]
+
+
+@pytest.mark.asyncio
+async def test_save_batch_chunks_upserts_under_bind_param_cap():
+    # Given
+    session = DummySession()
+    writer = PostgresCandleWriter(
+        session_factory=lambda: session, symbol_registry=StubSymbolRegistry()
+    )
+    quotes = [_q(base=f"C{i}") for i in range(5000)]
+
+    # When
+    await writer.save_batch(quotes)
+
+    # Then
+    assert session.begins == 1
+    assert len(session.executed) == 4
+    for stmt in session.executed:
+        assert len(stmt.compile(dialect=postgresql.dialect()).params) <= 32767
+
+
+@pytest.mark.asyncio
+async def test_save_batch_empty_is_noop_and_errors_are_wrapped():
+    # Given
+    session = DummySession(fail=True)
+    writer = PostgresCandleWriter(
+        session_factory=lambda: session, symbol_registry=StubSymbolRegistry()
+    )
+
+    # When
+    await writer.save_batch([])
+
+    # Then
+    assert session.begins == 0
+    with pytest.raises(QuoteStorageError):
+        await writer.save_batch([_q()])
@@ -0,0 +1,143 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound.persistence.sqlalchemy.copy_quote_writer import (
+    PostgresCopyQuoteWriter,
+)
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
+from converter.domain.exceptions.quote import QuoteStorageError
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+
+SYMBOL_IDS = {"BTCUSDT": 1, "ETHUSDT": 2}
+
+
+class StubSymbolRegistry(SymbolRegistry):
+    def __init__(self, ids):
+        self._ids = ids
+
+    async def ids(self, pairs):
+        return self._ids
+
+
+class DummyDriverConnection:
+    def __init__(self, fail_on_copy=False):
+        self.statements = []
+        self.copies = []
+        self.fail_on_copy = fail_on_copy
+
+    async def execute(self, sql):
+        self.statements.append(" ".join(sql.split()))
+        return "INSERT 0 1"
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.fail_on_copy:
+            raise RuntimeError("copy failed")
+        self.copies.append((table, list(records), columns))
+
+
+class DummyRawConnection:
+    def __init__(self, driver_connection):
+        self.driver_connection = driver_connection
+
+
+class DummyConnection:
+    def __init__(self, driver_connection):
+        self._driver_connection = driver_connection
+
+    async def get_raw_connection(self):
+        return DummyRawConnection(self._driver_connection)
+
+
+class DummyBegin:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class DummySession:
+    def __init__(self, driver_connection):
+        self._driver_connection = driver_connection
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def begin(self):
+        return DummyBegin()
+
+    async def connection(self):
+        return DummyConnection(self._driver_connection)
+
+
+def _q(base="BTC", rate="25000.00"):
+    return Quote(
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_writer_stages_then_merges_once():
+    # Given
+    driver = DummyDriverConnection()
+    writer = PostgresCopyQuoteWriter(
+        session_factory=lambda: DummySession(driver),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
+    )
+
+    # When
+    await writer.save_batch([_q(), _q("ETH", "4000")])
+
+    # Then
+    assert driver.statements[0].startswith("CREATE TEMP TABLE quotes_staging")
+    assert driver.statements[0].endswith("ON COMMIT DROP")
+    assert len(driver.copies) == 1
+    table, records, columns = driver.copies[0]
+    assert table == "quotes_staging"
+    assert columns == ("symbol_id", "quote_timestamp", "rate")
+    assert [r[0] for r in records] == [1, 2]
+    assert records[1][-1] == Decimal("4000")
+    assert len(driver.statements) == 3
+    assert "ON CONFLICT (symbol_id, quote_timestamp) DO NOTHING" in driver.statements[1]
+    assert driver.statements[2].startswith("INSERT INTO quotes_latest")
+    assert "DISTINCT ON (symbol_id)" in driver.statements[2]
+    assert "JOIN symbols s ON s.id = staged.symbol_id" in driver.statements[2]
+
+
+@pytest.mark.asyncio
+async def test_copy_writer_empty_batch_noop():
+    # Given
+    driver = DummyDriverConnection()
+    writer = PostgresCopyQuoteWriter(
+        session_factory=lambda: DummySession(driver),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
+    )
+
+    # When
+    await writer.save_batch([])
+
+    # Then
+    assert not driver.statements
+
+
+@pytest.mark.asyncio
+async def test_copy_writer_wraps_errors():
+    # Given
+    driver = DummyDriverConnection(fail_on_copy=True)
+    writer = PostgresCopyQuoteWriter(
+        session_factory=lambda: DummySession(driver),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
+    )
+
+    # When & Then
+    with pytest.raises(QuoteStorageError):
+        await writer.save_batch([_q()])
@@ -24,8 +24,8 @@ def test_quote_to_dict_and_model_roundtrip():
 
     # When
     d = mapper.quote_to_dict(q)
-    model = mapper.quote_to_db_model(q)
-    q2 = mapper.db_model_to_quote(model)
+    model = mapper.quote_to_db_model(q, symbol_id=7)
+    q2 = mapper.row_to_quote(q.pair, model)
 
     # The
     assert d["symbol"] == "BTCUSDT"
@@ -34,7 +34,12 @@ def test_quote_to_dict_and_model_roundtrip():
     assert d["rate"] == Decimal("123.45678901")
 
     assert isinstance(model, QuoteModel)
-    assert model.symbol == "BTCUSDT"
+    assert model.symbol_id == 7
+    assert mapper.quote_to_row(q, symbol_id=7) == {
+        "symbol_id": 7,
+        "quote_timestamp": q.timestamp.value,
+        "rate": Decimal("123.45678901"),
+    }
     assert q2.pair == q.pair
     assert q2.rate.value == q.rate.value
     assert q2.timestamp.value == q.timestamp.value
@@ -2,13 +2,15 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
-from converter.adapters.outbound.persistence.sqlalchemy.models import QuoteModel
+from converter.adapters.outbound.persistence.sqlalchemy.models import QuoteLatestModel
 from converter.adapters.outbound.persistence.sqlalchemy.quote_repository import (
     PostgresQuoteRepository,
 )
 from converter.domain.services.factory import RateFactory
 from converter.domain.services.precision_service import PrecisionService
+from converter.domain.services.quote_freshness_service import FreshnessPolicy
 from converter.domain.values import Currency, Pair, TimestampUTC
+from sqlalchemy.dialects import postgresql
 
 
 class MockResult:
@@ -18,6 +20,15 @@ class MockResult:
     def scalar_one_or_none(self):
         return self._model
 
+    def one_or_none(self):
+        return self._model
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return [self._model] if self._model is not None else []
+
 
 class MockSession:
     def __init__(self, model):
@@ -45,7 +56,7 @@ def _session_factory_with(model):
 @pytest.mark.asyncio
 async def test_get_latest_returns_mapped_quote():
     # Given
-    model = QuoteModel(
+    model = QuoteLatestModel(
         symbol="BTCUSDT",
         quote_timestamp=datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc),
         base_currency="BTC",
@@ -82,3 +93,79 @@ async def test_get_latest_before_none_when_not_found():
 
     # Then
     assert q is None
+
+
+@pytest.mark.asyncio
+async def test_get_latest_many_reads_latest_table_in_one_query():
+    # Given
+    model = QuoteLatestModel(
+        symbol="BTCUSDT",
+        quote_timestamp=datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc),
+        base_currency="BTC",
+        quote_currency="USDT",
+        rate=Decimal("25000.00"),
+    )
+    session = MockSession(model)
+    repo = PostgresQuoteRepository(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+    )
+    btc = Pair(Currency("BTC"), Currency("USDT"))
+    eth = Pair(Currency("ETH"), Currency("USDT"))
+
+    # When
+    quotes = await repo.get_latest_many([btc, eth])
+
+    # Then
+    assert list(quotes) == [btc]
+    assert quotes[btc].rate.value == Decimal("25000.00")
+    assert len(session.executed) == 1
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "FROM quotes_latest" in sql
+    assert "ORDER BY" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_latest_is_primary_key_lookup():
+    # Given
+    session = MockSession(None)
+    repo = PostgresQuoteRepository(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+    )
+
+    # When
+    await repo.get_latest(Pair(Currency("BTC"), Currency("USDT")))
+
+    # Then
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "FROM quotes_latest" in sql
+    assert "WHERE quotes_latest.symbol =" in sql
+    assert "LIMIT" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_latest_before_bounds_window_by_freshness_policy():
+    # Given
+    session = MockSession(None)
+    repo = PostgresQuoteRepository(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+        freshness_policy=FreshnessPolicy(max_age_seconds=60),
+    )
+    ts = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+    # When
+    await repo.get_latest_before(
+        Pair(Currency("BTC"), Currency("USDT")), TimestampUTC(ts)
+    )
+
+    # Then
+    compiled = session.executed[0].compile(dialect=postgresql.dialect())
+    bounds = sorted(
+        value for value in compiled.params.values() if isinstance(value, datetime)
+    )
+    assert "quotes.quote_timestamp <=" in str(compiled)
+    assert "quotes.quote_timestamp >=" in str(compiled)
+    assert "quotes.symbol_id = (SELECT symbols.id" in str(compiled)
+    assert bounds == [datetime(2025, 10, 2, 11, 59, 0, tzinfo=timezone.utc), ts]
@@ -1,14 +1,28 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
 from converter.adapters.outbound.persistence.sqlalchemy.quote_writer import (
     PostgresQuoteWriter,
 )
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
 from converter.domain.models import Quote
 from converter.domain.services.factory import RateFactory
 from converter.domain.services.precision_service import PrecisionService
 from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from sqlalchemy.dialects import postgresql
+
+SYMBOL_IDS = {"BTCUSDT": 1, "ETHUSDT": 2}
+
+
+class StubSymbolRegistry(SymbolRegistry):
+    def __init__(self, ids):
+        self._ids = ids
+
+    async def ids(self, pairs):
+        return self._ids
 
 
 class DummyResult:
@@ -50,11 +64,13 @@ def _session_factory():
     return _factory
 
 
-def _q():
+def _q(base="BTC", rate="25000.00", second=0):
     return Quote(
-        pair=Pair(Currency("BTC"), Currency("USDT")),
-        rate=Rate(Decimal("25000.00")),
-        timestamp=TimestampUTC(datetime(2025, 10, 2, 0, 0, 0, tzinfo=timezone.utc)),
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(
+            datetime(2025, 10, 2, 0, 0, second, tzinfo=timezone.utc)
+        ),
     )
 
 
@@ -63,7 +79,71 @@ async def test_save_batch_executes_insert_once():
     writer = PostgresQuoteWriter(
         session_factory=_session_factory(),
         rate_factory=RateFactory(PrecisionService()),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
     )
 
     quotes = [_q(), _q()]
     await writer.save_batch(quotes)
+
+
+@pytest.mark.asyncio
+async def test_save_batch_upserts_latest_in_same_transaction():
+    # Given
+    session = DummySession()
+    writer = PostgresQuoteWriter(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
+    )
+
+    # When
+    await writer.save_batch(
+        [_q("ETH", "4000", second=5), _q(second=10), _q("BTC", "24000", second=1)]
+    )
+
+    # Then
+    assert session._begins == 1
+    assert len(session.executed) == 2
+    insert = session.executed[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (symbol_id, quote_timestamp) DO NOTHING" in str(insert)
+    assert [insert.params[f"symbol_id_m{i}"] for i in range(3)] == [2, 1, 1]
+    upsert = session.executed[1].compile(dialect=postgresql.dialect())
+    sql = str(upsert)
+    assert "INSERT INTO quotes_latest" in sql
+    assert "ON CONFLICT (symbol) DO UPDATE" in sql
+    assert "WHERE quotes_latest.quote_timestamp < excluded.quote_timestamp" in sql
+    # One row per symbol, the newest one, in symbol order
+    rows = [
+        (upsert.params[f"symbol_m{i}"], upsert.params[f"rate_m{i}"]) for i in range(2)
+    ]
+    assert rows == [("BTCUSDT", Decimal("25000.00")), ("ETHUSDT", Decimal("4000"))]
+
+
+@pytest.mark.asyncio
+async def test_save_batch_chunks_inserts_under_bind_param_cap():
+    # Given
+    session = DummySession()
+    writer = PostgresQuoteWriter(
+        session_factory=lambda: session,
+        rate_factory=RateFactory(PrecisionService()),
+        symbol_registry=StubSymbolRegistry(SYMBOL_IDS),
+    )
+    quotes = [
+        Quote(
+            pair=Pair(Currency("BTC"), Currency("USDT")),
+            rate=Rate(Decimal("25000")),
+            timestamp=TimestampUTC(
+                datetime(2025, 10, 2, tzinfo=timezone.utc) + timedelta(seconds=i)
+            ),
+        )
+        for i in range(20000)
+    ]
+
+    # When
+    await writer.save_batch(quotes)
+
+    # Then
+    assert session._begins == 1
+    assert len(session.executed) == 3
+    for stmt in session.executed:
+        assert len(stmt.compile(dialect=postgresql.dialect()).params) <= 32767
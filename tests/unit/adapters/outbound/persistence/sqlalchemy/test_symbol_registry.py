@@ -0,0 +1,118 @@
+import pytest
+from converter.adapters.outbound.persistence.sqlalchemy.symbol_registry import (
+    SymbolRegistry,
+)
+from converter.domain.values import Currency, Pair
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert
+
+
+class MockResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def tuples(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class MockBegin:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class MockSession:
+    """Stands in for `symbols`, ids are handed out in insert order."""
+
+    def __init__(self, table):
+        self.table = table
+        self.executed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def begin(self):
+        return MockBegin()
+
+    async def execute(self, stmt):
+        self.executed.append(stmt)
+        compiled = stmt.compile(dialect=postgresql.dialect())
+
+        if isinstance(stmt, Insert):
+            for key, value in sorted(compiled.params.items()):
+                if key.startswith("symbol_m"):
+                    self.table.setdefault(value, len(self.table) + 1)
+            return MockResult([])
+
+        requested = next(iter(compiled.params.values()))
+        return MockResult([(s, i) for s, i in self.table.items() if s in requested])
+
+
+def _pair(base: str) -> Pair:
+    return Pair(Currency(base), Currency("USDT"))
+
+
+@pytest.mark.asyncio
+async def test_known_symbols_are_looked_up_not_inserted():
+    # Given
+    session = MockSession({"BTCUSDT": 1, "ETHUSDT": 2})
+    registry = SymbolRegistry(session_factory=lambda: session)
+
+    # When
+    ids = await registry.ids([_pair("ETH"), _pair("BTC")])
+
+    # Then
+    assert ids["BTCUSDT"] == 1
+    assert ids["ETHUSDT"] == 2
+    assert len(session.executed) == 1
+    assert not isinstance(session.executed[0], Insert)
+
+
+@pytest.mark.asyncio
+async def test_new_symbols_are_registered_once_and_cached():
+    # Given
+    session = MockSession({"BTCUSDT": 1})
+    registry = SymbolRegistry(session_factory=lambda: session)
+
+    # When
+    ids = await registry.ids([_pair("BTC"), _pair("SOL"), _pair("SOL")])
+    executed = len(session.executed)
+    await registry.ids([_pair("SOL"), _pair("BTC")])
+
+    # Then
+    assert ids["SOLUSDT"] == 2
+    assert executed == 3
+
+    insert = session.executed[1].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (symbol) DO NOTHING" in str(insert)
+    assert insert.params["symbol_m0"] == "SOLUSDT"
+    assert insert.params["base_currency_m0"] == "SOL"
+    assert "symbol_m1" not in insert.params
+
+    # Everything was cached by the first call
+    assert len(session.executed) == executed
+
+
+@pytest.mark.asyncio
+async def test_large_first_batch_is_registered_in_chunks():
+    # Given
+    session = MockSession({})
+    registry = SymbolRegistry(session_factory=lambda: session)
+    pairs = [_pair(f"C{i}") for i in range(40000)]
+
+    # When
+    ids = await registry.ids(pairs)
+
+    # Then
+    assert len(ids) == 40000
+    inserts = [stmt for stmt in session.executed if isinstance(stmt, Insert)]
+    assert len(inserts) == 4
+    assert len(session.executed) - len(inserts) == 4
@@ -0,0 +1,122 @@
+import asyncio
+import types
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.adapters.outbound import latest_quote_buffer as buffer_module
+from converter.adapters.outbound.latest_quote_buffer import LatestQuoteBuffer
+from converter.adapters.outbound.rate_source import RateBatch
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from converter.shared.observability.metrics import Metrics
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def _q(base: str, rate: str, seconds: int = 0) -> Quote:
+    return Quote(
+        pair=Pair(Currency(base), Currency("USDT")),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pending_batches_merge_keeping_the_newest_quote_per_symbol():
+    # Given
+    buffer = LatestQuoteBuffer(source="test")
+    buffer.offer(RateBatch(quotes=[_q("BTC", "100", 0), _q("ETH", "10", 0)]))
+    buffer.offer(RateBatch(quotes=[_q("BTC", "101", 1)]))
+
+    # When
+    batch = await buffer.get()
+
+    # Then
+    assert {q.pair.code(): q.rate.value for q in batch.quotes} == {
+        "BTCUSDT": Decimal("101"),
+        "ETHUSDT": Decimal("10"),
+    }
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_late_quote_does_not_replace_a_newer_one():
+    # Given
+    buffer = LatestQuoteBuffer(source="test")
+    buffer.offer(RateBatch(quotes=[_q("BTC", "101", 5)]))
+
+    # When
+    buffer.offer(RateBatch(quotes=[_q("BTC", "100", 1)]))
+
+    # Then
+    batch = await buffer.get()
+    assert [q.rate.value for q in batch.quotes] == [Decimal("101")]
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_quotes():
+    # Given
+    buffer = LatestQuoteBuffer(source="test")
+    waiting = asyncio.create_task(buffer.get())
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    # When
+    buffer.offer(RateBatch(quotes=[]))
+    await asyncio.sleep(0.01)
+    empty_offer_woke = waiting.done()
+    buffer.offer(RateBatch(quotes=[_q("BTC", "100")]))
+
+    # Then
+    assert not empty_offer_woke
+    assert len((await asyncio.wait_for(waiting, timeout=1)).quotes) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_getters_never_take_an_empty_batch():
+    # Given
+    buffer = LatestQuoteBuffer(source="test")
+    first = asyncio.create_task(buffer.get())
+    second = asyncio.create_task(buffer.get())
+    await asyncio.sleep(0)
+
+    # When
+    buffer.offer(RateBatch(quotes=[_q("BTC", "100")]))
+    await asyncio.sleep(0.01)
+
+    # Then
+    done = [task for task in (first, second) if task.done()]
+    assert len(done) == 1
+    assert len(done[0].result()) == 1
+
+    buffer.offer(RateBatch(quotes=[_q("ETH", "10")]))
+    await asyncio.wait_for(asyncio.gather(first, second), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_stage_buffer_reports_pending_batches_and_their_wait(monkeypatch):
+    # Given
+    metrics = Metrics()
+    monkeypatch.setattr(
+        buffer_module, "settings", types.SimpleNamespace(ENABLE_METRICS=True)
+    )
+    monkeypatch.setattr(buffer_module, "get_metrics_registry", lambda: metrics)
+    buffer = LatestQuoteBuffer(source="test", stage="store")
+
+    def sample(name: str) -> float:
+        return metrics.registry.get_sample_value(name, {"stage": "store"}) or 0.0
+
+    # When
+    buffer.offer(RateBatch(quotes=[_q("BTC", "100", 0)]))
+    buffer.offer(RateBatch(quotes=[_q("BTC", "101", 1)]))
+    buffer.offer(RateBatch(quotes=[_q("ETH", "10", 1)]))
+    depth = sample("pipeline_queue_batches")
+    await asyncio.sleep(0.05)
+    await buffer.get()
+
+    # Then
+    assert depth == 3
+    assert buffer.pending_batches == 0
+    assert sample("pipeline_queue_batches") == 0
+    assert sample("pipeline_stall_seconds_total") >= 0.05
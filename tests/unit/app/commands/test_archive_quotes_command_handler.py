@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+import pytest
+from converter.app.commands.archive_quotes import (
+    ArchiveQuotesCommand,
+    ArchiveQuotesCommandHandler,
+)
+from converter.app.ports.outbound.quote_archive import (
+    ArchiveBatch,
+    QuoteArchive,
+    QuoteHistorySource,
+    QuotePartition,
+)
+from converter.domain.values import TimestampUTC
+
+
+def _partition(days_ago: int) -> QuotePartition:
+    today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    start = today - timedelta(days=days_ago)
+
+    return QuotePartition(
+        name=f"quotes_p{start:%Y%m%d}",
+        start=TimestampUTC(start),
+        end=TimestampUTC(start + timedelta(days=1)),
+    )
+
+
+class MockHistorySource(QuoteHistorySource):
+    def __init__(self, partitions: list[QuotePartition]):
+        self.partitions = partitions
+        self.streamed: list[tuple[TimestampUTC, TimestampUTC]] = []
+
+    async def list_partitions(self) -> list[QuotePartition]:
+        return self.partitions
+
+    async def stream_batches(
+        self, start: TimestampUTC, end: TimestampUTC
+    ) -> AsyncIterator[ArchiveBatch]:
+        self.streamed.append((start, end))
+        yield ArchiveBatch(
+            symbols=["BTCUSDT"],
+            base_currencies=["BTC"],
+            quote_currencies=["USDT"],
+            rates=[],
+            timestamps=[],
+        )
+
+
+class MockArchive(QuoteArchive):
+    def __init__(self, archived: list[QuotePartition]):
+        self.archived = list(archived)
+
+    def contains(self, partition: QuotePartition) -> bool:
+        return partition in self.archived
+
+    async def write(
+        self, partition: QuotePartition, batches: AsyncIterator[ArchiveBatch]
+    ) -> int:
+        rows = sum([len(b) async for b in batches])
+        self.archived.append(partition)
+        return rows
+
+
+@pytest.mark.asyncio
+async def test_archives_closed_partitions_not_yet_archived():
+    # Given
+    old, yesterday, today = _partition(2), _partition(1), _partition(0)
+    source = MockHistorySource([old, yesterday, today])
+    archive = MockArchive(archived=[old])
+    handler = ArchiveQuotesCommandHandler(history_source=source, archive=archive)
+
+    # When
+    result = await handler.handle(ArchiveQuotesCommand(settle_seconds=0))
+
+    # Then
+    assert result.archived == [yesterday]
+    assert result.skipped == 2
+    assert result.rows == 1
+    assert source.streamed == [(yesterday.start, yesterday.end)]
+    assert archive.archived == [old, yesterday]
+
+
+@pytest.mark.asyncio
+async def test_recently_closed_partition_is_left_to_settle():
+    # Given
+    yesterday = _partition(1)
+    source = MockHistorySource([yesterday])
+    handler = ArchiveQuotesCommandHandler(
+        history_source=source, archive=MockArchive(archived=[])
+    )
+    settle_seconds = int(TimestampUTC.now().value.timestamp()) % 86400 + 60
+
+    # When
+    result = await handler.handle(ArchiveQuotesCommand(settle_seconds=settle_seconds))
+
+    # Then
+    assert result.archived == []
+    assert source.streamed == []
+
+
+@pytest.mark.asyncio
+async def test_dry_run_writes_nothing():
+    # Given
+    yesterday = _partition(1)
+    source = MockHistorySource([yesterday])
+    archive = MockArchive(archived=[])
+    handler = ArchiveQuotesCommandHandler(history_source=source, archive=archive)
+
+    # When
+    result = await handler.handle(ArchiveQuotesCommand(settle_seconds=0, dry_run=True))
+
+    # Then
+    assert result.archived == [yesterday]
+    assert result.rows == 0
+    assert archive.archived == []
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from converter.app.ports.outbound.quote_exporter import ExportFormat, QuoteExporter
+from converter.app.queries.export_quotes import (
+    ExportQuotesQuery,
+    ExportQuotesQueryHandler,
+)
+from converter.domain.values import TimestampUTC
+
+T0 = datetime(2025, 10, 2, tzinfo=timezone.utc)
+
+
+class MockExporter(QuoteExporter):
+    def __init__(self):
+        self.calls = []
+
+    async def export(self, symbols, start, end, export_format):
+        self.calls.append((symbols, start, end, export_format))
+        yield b"chunk"
+
+
+@pytest.mark.asyncio
+async def test_passes_normalized_symbols_to_exporter():
+    # Given
+    exporter = MockExporter()
+    handler = ExportQuotesQueryHandler(exporter)
+    query = ExportQuotesQuery(
+        start=TimestampUTC(T0),
+        end=TimestampUTC(T0 + timedelta(days=7)),
+        export_format=ExportFormat.NDJSON,
+        symbols=["ethusdt", "BTCUSDT", "ETHUSDT"],
+    )
+
+    # When
+    chunks = [chunk async for chunk in handler.handle(query)]
+
+    # Then
+    assert chunks == [b"chunk"]
+    assert exporter.calls[0][0] == ["BTCUSDT", "ETHUSDT"]
+    assert exporter.calls[0][3] is ExportFormat.NDJSON
+
+
+def test_rejects_empty_range_before_streaming():
+    # Given
+    exporter = MockExporter()
+    handler = ExportQuotesQueryHandler(exporter)
+    query = ExportQuotesQuery(start=TimestampUTC(T0), end=TimestampUTC(T0))
+
+    # When & Then
+    with pytest.raises(ValueError, match="not before its end"):
+        handler.handle(query)
+
+    assert exporter.calls == []
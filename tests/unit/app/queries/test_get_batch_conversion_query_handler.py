@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.app.ports.outbound.quote_repository import QuoteRepository
+from converter.app.queries.get_batch_conversion import (
+    BatchConversionItem,
+    GetBatchConversionQuery,
+    GetBatchConversionQueryHandler,
+)
+from converter.domain.exceptions.conversion import QuoteNotFoundError, QuoteTooOldError
+from converter.domain.models import Quote
+from converter.domain.services import ConversionService
+from converter.domain.services.quote_freshness_service import QuoteFreshnessService
+from converter.domain.values import Amount, Currency, Pair, Rate, TimestampUTC
+
+
+class MockQuoteRepository(QuoteRepository):
+    def __init__(self, quotes: list[Quote]):
+        self.quotes = {q.pair: q for q in quotes}
+        self.calls = []
+
+    async def get_latest(self, pair: Pair):
+        self.calls.append(("get_latest", pair))
+        return self.quotes.get(pair)
+
+    async def get_latest_many(self, pairs: list[Pair]):
+        self.calls.append(("get_latest_many", pairs))
+        return {p: self.quotes[p] for p in pairs if p in self.quotes}
+
+    async def get_latest_before(self, pair: Pair, timestamp: TimestampUTC):
+        self.calls.append(("get_latest_before", pair, timestamp))
+        return None
+
+
+def _pair(base: str, quote: str) -> Pair:
+    return Pair(Currency(base), Currency(quote))
+
+
+def _quote(base: str, quote: str, rate: str, age_seconds: float = 0) -> Quote:
+    ts = datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+    return Quote(
+        pair=_pair(base, quote),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(ts),
+    )
+
+
+def _item(base: str, quote: str, amount: str) -> BatchConversionItem:
+    return BatchConversionItem(amount=Amount(Decimal(amount)), pair=_pair(base, quote))
+
+
+def _handler(repo: QuoteRepository) -> GetBatchConversionQueryHandler:
+    return GetBatchConversionQueryHandler(
+        quote_repository=repo,
+        conversion_service=ConversionService(QuoteFreshnessService()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_fetches_each_pair_once_in_single_call():
+    # Given
+    repo = MockQuoteRepository(
+        [_quote("BTC", "USDT", "25000"), _quote("ETH", "USDT", "4000")]
+    )
+    query = GetBatchConversionQuery(
+        items=[
+            _item("BTC", "USDT", "2"),
+            _item("ETH", "USDT", "1"),
+            _item("BTC", "USDT", "0.5"),
+        ]
+    )
+
+    # When
+    results = await _handler(repo).handle(query)
+
+    # Then
+    assert repo.calls == [
+        ("get_latest_many", [_pair("BTC", "USDT"), _pair("ETH", "USDT")])
+    ]
+    assert [r.result.amount.value for r in results] == [
+        Decimal("50000"),
+        Decimal("4000"),
+        Decimal("12500"),
+    ]
+    assert all(r.error is None for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_item():
+    # Given
+    repo = MockQuoteRepository(
+        [_quote("BTC", "USDT", "25000"), _quote("ETH", "USDT", "4000", age_seconds=600)]
+    )
+    query = GetBatchConversionQuery(
+        items=[
+            _item("SOL", "USDT", "1"),
+            _item("BTC", "USDT", "1"),
+            _item("ETH", "USDT", "1"),
+        ]
+    )
+
+    # When
+    results = await _handler(repo).handle(query)
+
+    # Then
+    assert isinstance(results[0].error, QuoteNotFoundError)
+    assert results[0].result is None
+    assert results[1].result is not None
+    assert results[1].result.rate.value == Decimal("25000")
+    assert isinstance(results[2].error, QuoteTooOldError)
+    assert [r.item for r in results] == query.items
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_skips_repository():
+    # Given
+    repo = MockQuoteRepository([])
+
+    # When
+    results = await _handler(repo).handle(GetBatchConversionQuery(items=[]))
+
+    # Then
+    assert results == []
+    assert repo.calls == []
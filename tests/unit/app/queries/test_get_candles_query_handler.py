@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from converter.app.ports.outbound.candle_repository import CandleRepository
+from converter.app.queries.get_candles import GetCandlesQuery, GetCandlesQueryHandler
+from converter.domain.values import Interval, Resolution, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 12, 34, 56, tzinfo=timezone.utc)
+
+
+class MockCandleRepository(CandleRepository):
+    def __init__(self):
+        self.calls = []
+
+    async def get_candles(self, pair, resolution, start, end):
+        raise NotImplementedError()
+
+    async def get_binned_candles(self, symbol, interval, source, start, end):
+        self.calls.append((symbol, interval, source, start.value, end.value))
+        return []
+
+
+def _query(interval: str, hours: float = 2, limit: int = 1000) -> GetCandlesQuery:
+    return GetCandlesQuery(
+        symbol="BTCUSDT",
+        interval=Interval.parse(interval),
+        start=TimestampUTC(T0),
+        end=TimestampUTC(T0 + timedelta(hours=hours)),
+        limit=limit,
+    )
+
+
+@pytest.mark.asyncio
+async def test_aligns_range_and_picks_coarsest_tiling_source():
+    # Given
+    repo = MockCandleRepository()
+    handler = GetCandlesQueryHandler(repo)
+
+    # When
+    seconds = await handler.handle(_query("30s"))
+    minutes = await handler.handle(_query("15m"))
+    hours = await handler.handle(_query("4h", hours=10))
+
+    # Then
+    assert seconds.source is None
+    assert minutes.source is Resolution.MINUTE
+    assert hours.source is Resolution.HOUR
+
+    _, _, _, start, end = repo.calls[1]
+    assert start == datetime(2025, 10, 2, 12, 30, tzinfo=timezone.utc)
+    assert end == datetime(2025, 10, 2, 14, 45, tzinfo=timezone.utc)
+    assert minutes.next_start is None
+
+    _, _, _, start, end = repo.calls[2]
+    assert start == datetime(2025, 10, 2, 12, tzinfo=timezone.utc)
+    assert end == datetime(2025, 10, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_pages_are_bounded_and_chained_by_next_start():
+    # Given
+    repo = MockCandleRepository()
+    handler = GetCandlesQueryHandler(repo)
+
+    # When
+    page = await handler.handle(_query("1m", hours=1, limit=25))
+
+    # Then
+    expected_end = datetime(2025, 10, 2, 12, 59, tzinfo=timezone.utc)
+    assert page.start.value == datetime(2025, 10, 2, 12, 34, tzinfo=timezone.utc)
+    assert page.end.value == expected_end
+    assert page.next_start is not None
+    assert page.next_start.value == expected_end
+    # Long past, nothing on this page can change anymore
+    assert page.closed
+
+
+@pytest.mark.asyncio
+async def test_page_reaching_current_bucket_is_not_closed():
+    # Given
+    handler = GetCandlesQueryHandler(MockCandleRepository())
+    now = datetime.now(timezone.utc)
+    query = GetCandlesQuery(
+        symbol="BTCUSDT",
+        interval=Interval.parse("1m"),
+        start=TimestampUTC(now - timedelta(minutes=10)),
+        end=TimestampUTC(now),
+    )
+
+    # When
+    page = await handler.handle(query)
+
+    # Then
+    assert not page.closed
+
+
+@pytest.mark.asyncio
+async def test_page_is_not_closed_until_it_has_settled():
+    # Given
+    now = datetime.now(timezone.utc)
+    query = GetCandlesQuery(
+        symbol="BTCUSDT",
+        interval=Interval.parse("1m"),
+        start=TimestampUTC(now - timedelta(minutes=30)),
+        end=TimestampUTC(now - timedelta(minutes=15)),
+    )
+
+    # When
+    settling = await GetCandlesQueryHandler(
+        MockCandleRepository(), settle_seconds=3600
+    ).handle(query)
+    settled = await GetCandlesQueryHandler(
+        MockCandleRepository(), settle_seconds=600
+    ).handle(query)
+
+    # Then
+    assert not settling.closed
+    assert settled.closed
+
+
+@pytest.mark.asyncio
+async def test_rejects_empty_range_and_non_positive_limit():
+    # Given
+    handler = GetCandlesQueryHandler(MockCandleRepository())
+
+    # When & Then
+    with pytest.raises(ValueError, match="not before its end"):
+        await handler.handle(_query("1m", hours=-1))
+
+    with pytest.raises(ValueError, match="Page size"):
+        await handler.handle(_query("1m", limit=0))
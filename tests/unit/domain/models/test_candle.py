@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from converter.domain.models import Candle, Quote
+from converter.domain.values import Currency, Pair, Rate, Resolution, TimestampUTC
+
+T0 = datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc)
+BTC = Pair(Currency("BTC"), Currency("USDT"))
+
+
+def _candle(seconds: int, rate: str, resolution=Resolution.MINUTE) -> Candle:
+    quote = Quote(
+        pair=BTC,
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(T0 + timedelta(seconds=seconds)),
+    )
+
+    return Candle.from_quote(quote, resolution)
+
+
+def test_merge_builds_ohlc_regardless_of_order():
+    # Given
+    candles = [
+        _candle(30, "101"),
+        _candle(5, "100"),
+        _candle(50, "99"),
+        _candle(20, "105"),
+    ]
+
+    # When
+    forward = candles[0]
+    for candle in candles[1:]:
+        forward = forward.merge(candle)
+
+    backward = candles[-1]
+    for candle in reversed(candles[:-1]):
+        backward = backward.merge(candle)
+
+    # Then
+    assert forward == backward
+    assert forward.bucket_start.value == T0
+    assert forward.open.value == Decimal("100")
+    assert forward.high.value == Decimal("105")
+    assert forward.low.value == Decimal("99")
+    assert forward.close.value == Decimal("99")
+    assert forward.open_time.value == T0 + timedelta(seconds=5)
+    assert forward.close_time.value == T0 + timedelta(seconds=50)
+
+
+def test_merge_is_idempotent():
+    candle = _candle(5, "100").merge(_candle(30, "101"))
+
+    assert candle.merge(candle) == candle
+
+
+def test_merge_rejects_other_buckets():
+    with pytest.raises(ValueError):
+        _candle(5, "100").merge(_candle(65, "100"))
+
+
+def test_latest_quote_before_uses_close_then_open():
+    # Given
+    candle = _candle(10, "100").merge(_candle(40, "110"))
+
+    # When
+    after_close = candle.latest_quote_before(TimestampUTC(T0 + timedelta(seconds=45)))
+    between = candle.latest_quote_before(TimestampUTC(T0 + timedelta(seconds=20)))
+    before_open = candle.latest_quote_before(TimestampUTC(T0 + timedelta(seconds=5)))
+
+    # Then
+    assert after_close is not None
+    assert after_close.rate.value == Decimal("110")
+    assert between is not None
+    assert between.rate.value == Decimal("100")
+    assert between.timestamp.value == T0 + timedelta(seconds=10)
+    assert before_open is None
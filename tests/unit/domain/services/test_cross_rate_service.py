@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from converter.domain.models import Quote
+from converter.domain.services.cross_rate_service import CrossRateService
+from converter.domain.services.factory import RateFactory
+from converter.domain.services.precision_service import PrecisionService
+from converter.domain.values import (
+    Currency,
+    Pair,
+    Rate,
+    Route,
+    RouteLeg,
+    TimestampUTC,
+)
+
+
+def _p(base: str, quote: str) -> Pair:
+    return Pair(Currency(base), Currency(quote))
+
+
+def _q(base: str, quote: str, rate: str, minute: int = 0) -> Quote:
+    return Quote(
+        pair=_p(base, quote),
+        rate=Rate(Decimal(rate)),
+        timestamp=TimestampUTC(datetime(2025, 10, 2, 12, minute, tzinfo=timezone.utc)),
+    )
+
+
+def _svc() -> CrossRateService:
+    return CrossRateService(RateFactory(PrecisionService()))
+
+
+def test_compose_two_hop_route_uses_oldest_leg_timestamp():
+    # Given
+    sol_usdt = _q("SOL", "USDT", "150", minute=5)
+    eur_usdt = _q("EUR", "USDT", "1.2", minute=3)
+    route = Route(
+        pair=_p("SOL", "EUR"),
+        legs=(RouteLeg(sol_usdt.pair), RouteLeg(eur_usdt.pair, inverted=True)),
+    )
+
+    # When
+    quote = _svc().compose(route, {sol_usdt.pair: sol_usdt, eur_usdt.pair: eur_usdt})
+
+    # Then
+    assert quote is not None
+    assert quote.pair == _p("SOL", "EUR")
+    assert quote.rate.value == Decimal("125.00000000")
+    assert quote.timestamp == eur_usdt.timestamp
+
+
+def test_compose_inverse_route():
+    # Given
+    btc_usdt = _q("BTC", "USDT", "25000")
+    route = Route(pair=_p("USDT", "BTC"), legs=(RouteLeg(btc_usdt.pair, True),))
+
+    # When
+    quote = _svc().compose(route, {btc_usdt.pair: btc_usdt})
+
+    # Then
+    assert quote is not None
+    assert quote.rate.value == Decimal("0.00004000")
+
+
+def test_compose_returns_none_when_leg_missing():
+    # Given
+    route = Route(
+        pair=_p("SOL", "EUR"),
+        legs=(RouteLeg(_p("SOL", "USDT")), RouteLeg(_p("EUR", "USDT"), True)),
+    )
+
+    # When / Then
+    assert _svc().compose(route, {}) is None
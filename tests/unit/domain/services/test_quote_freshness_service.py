@@ -57,3 +57,15 @@ def test_is_fresh_and_filter_fresh_quotes():
     assert svc.is_fresh(fresh_q, TimestampUTC(base + timedelta(seconds=30))) is True
     assert svc.is_fresh(stale_q, ref) is False
     assert filtered == [fresh_q]
+
+
+def test_oldest_acceptable_is_the_freshness_boundary():
+    policy = FreshnessPolicy(max_age_seconds=60)
+    svc = QuoteFreshnessService(policy)
+
+    ref = TimestampUTC(datetime(2025, 10, 2, 12, 0, 0, tzinfo=timezone.utc))
+    oldest = policy.oldest_acceptable(ref)
+
+    assert oldest.value == ref.value - timedelta(seconds=60)
+    assert svc.is_fresh(_quote_at(oldest.value), ref) is True
+    assert svc.is_fresh(_quote_at(oldest.value - timedelta(seconds=1)), ref) is False
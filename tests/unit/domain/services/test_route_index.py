@@ -0,0 +1,84 @@
+from converter.domain.services.route_index import RouteIndex
+from converter.domain.values import Currency, Pair, RouteLeg
+
+
+def _p(base: str, quote: str) -> Pair:
+    return Pair(Currency(base), Currency(quote))
+
+
+def _index(*pairs: Pair) -> RouteIndex:
+    index = RouteIndex()
+    index.rebuild(pairs)
+    return index
+
+
+def test_direct_pair_is_single_leg():
+    # Given
+    index = _index(_p("BTC", "USDT"), _p("USDT", "BTC"))
+
+    # When
+    route = index.find(_p("BTC", "USDT"))
+
+    # Then
+    assert route is not None
+    assert route.is_direct
+    assert route.legs == (RouteLeg(_p("BTC", "USDT")),)
+
+
+def test_inverse_pair_uses_listed_pair_reversed():
+    # Given
+    index = _index(_p("BTC", "USDT"))
+
+    # When
+    route = index.find(_p("USDT", "BTC"))
+
+    # Then
+    assert route is not None
+    assert not route.is_direct
+    assert route.legs == (RouteLeg(_p("BTC", "USDT"), inverted=True),)
+
+
+def test_cross_pair_goes_through_most_liquid_hub():
+    # Given
+    index = _index(
+        _p("SOL", "BTC"),
+        _p("SOL", "USDT"),
+        _p("EUR", "USDT"),
+        _p("EUR", "BTC"),
+    )
+
+    # When
+    route = index.find(_p("SOL", "EUR"))
+
+    # Then
+    assert route is not None
+    assert str(route) == "SOL->USDT->EUR"
+    assert route.legs == (
+        RouteLeg(_p("SOL", "USDT")),
+        RouteLeg(_p("EUR", "USDT"), inverted=True),
+    )
+
+
+def test_unconnected_or_unknown_currencies_have_no_route():
+    # Given
+    index = _index(_p("SOL", "USDT"), _p("XYZ", "ABC"))
+
+    # When / Then
+    assert index.find(_p("SOL", "XYZ")) is None
+    assert index.find(_p("SOL", "NOPE")) is None
+
+
+def test_rebuild_only_when_symbol_set_changes():
+    # Given
+    index = _index(_p("BTC", "USDT"))
+    assert index.find(_p("ETH", "BTC")) is None
+
+    # When
+    unchanged = index.rebuild([_p("BTC", "USDT")])
+    changed = index.rebuild([_p("BTC", "USDT"), _p("ETH", "USDT")])
+
+    # Then
+    assert not unchanged
+    assert changed
+    assert index.size == 2
+    assert str(index.find(_p("ETH", "BTC"))) == "ETH->USDT->BTC"
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+import pytest
+from converter.domain.values import Interval, TimestampUTC
+
+
+def test_parse_and_label_round_trip():
+    assert Interval.parse("30s").seconds == 30
+    assert Interval.parse("5m").seconds == 300
+    assert Interval.parse("4H").seconds == 14400
+    assert Interval.parse("1d").seconds == 86400
+
+    assert Interval(120).label == "2m"
+    assert Interval(90).label == "90s"
+    assert Interval(86400).label == "1d"
+
+
+@pytest.mark.parametrize("label", ["", "m", "0m", "-1h", "1w", "1.5h", "5 m"])
+def test_parse_rejects_invalid_labels(label):
+    with pytest.raises(ValueError):
+        Interval.parse(label)
+
+
+def test_bucket_bounds_align_to_epoch():
+    interval = Interval.parse("15m")
+    ts = TimestampUTC(datetime(2025, 10, 2, 12, 34, 56, tzinfo=timezone.utc))
+    aligned = TimestampUTC(datetime(2025, 10, 2, 12, 30, tzinfo=timezone.utc))
+
+    assert interval.bucket_start(ts) == aligned
+    assert interval.bucket_end(ts).value == datetime(
+        2025, 10, 2, 12, 45, tzinfo=timezone.utc
+    )
+    # A timestamp already on a boundary is its own end
+    assert interval.bucket_end(aligned) == aligned
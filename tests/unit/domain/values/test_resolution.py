@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from converter.domain.values import Interval, Resolution, TimestampUTC
+
+
+def test_bucket_start_floors_to_resolution():
+    ts = TimestampUTC(datetime(2025, 10, 2, 12, 34, 56, 789000, tzinfo=timezone.utc))
+
+    minute = Resolution.MINUTE.bucket_start(ts)
+    hour = Resolution.HOUR.bucket_start(ts)
+
+    assert minute.value == datetime(2025, 10, 2, 12, 34, tzinfo=timezone.utc)
+    assert hour.value == datetime(2025, 10, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def test_coarsest_within_picks_widest_fitting_resolution():
+    assert Resolution.coarsest_within(30) is None
+    assert Resolution.coarsest_within(60) is Resolution.MINUTE
+    assert Resolution.coarsest_within(3599) is Resolution.MINUTE
+    assert Resolution.coarsest_within(86400) is Resolution.HOUR
+
+
+def test_coarsest_dividing_picks_widest_tiling_resolution():
+    assert Resolution.coarsest_dividing(Interval.parse("30s")) is None
+    assert Resolution.coarsest_dividing(Interval.parse("90s")) is None
+    assert Resolution.coarsest_dividing(Interval.parse("15m")) is Resolution.MINUTE
+    assert Resolution.coarsest_dividing(Interval.parse("90m")) is Resolution.MINUTE
+    assert Resolution.coarsest_dividing(Interval.parse("4h")) is Resolution.HOUR
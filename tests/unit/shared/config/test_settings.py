@@ -48,3 +48,35 @@ def test_settings_ttl_must_be_greater_than_max_age(monkeypatch):
     # When & Then
     with pytest.raises(Exception):
         get_settings()
+
+
+def test_settings_candle_settle_must_cover_write_behind_lag(monkeypatch):
+    # Given
+    _reset_settings_cache()
+    monkeypatch.setenv("JSON_LOGS", "false")
+    monkeypatch.setenv("REDIS_QUOTE_TTL_SECONDS", "120")
+    monkeypatch.setenv("QUOTE_MAX_AGE_SECONDS", "60")
+    monkeypatch.setenv("FETCH_INTERVAL_SECONDS", "30")
+    monkeypatch.setenv("QUOTE_WRITE_MODE", "write_behind")
+    monkeypatch.setenv("WRITE_BEHIND_QUEUE_BATCHES", "32")
+    monkeypatch.setenv("CANDLE_SETTLE_SECONDS", "600")
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@h/db")
+
+    # When & Then
+    with pytest.raises(Exception, match="CANDLE_SETTLE_SECONDS"):
+        get_settings()
+
+
+def test_settings_group_commit_needs_concurrent_stores(monkeypatch):
+    # Given
+    _reset_settings_cache()
+    monkeypatch.setenv("JSON_LOGS", "false")
+    monkeypatch.setenv("REDIS_QUOTE_TTL_SECONDS", "120")
+    monkeypatch.setenv("QUOTE_MAX_AGE_SECONDS", "60")
+    monkeypatch.setenv("GROUP_COMMIT_ENABLED", "true")
+    monkeypatch.setenv("CONSUMER_STORE_CONCURRENCY", "1")
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://u:p@h/db")
+
+    # When & Then
+    with pytest.raises(Exception, match="CONSUMER_STORE_CONCURRENCY"):
+        get_settings()
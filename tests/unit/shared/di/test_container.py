@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import AsyncIterator
+
+import pytest
+from converter.adapters.outbound.rate_source import RateBatch
+from converter.app.ports.outbound.quote_repository import QuoteWriter
+from converter.domain.models import Quote
+from converter.domain.values import Currency, Pair, Rate, TimestampUTC
+from converter.shared.config import get_settings
+from converter.shared.di import container as container_module
+from dependency_injector import providers
+
+T0 = datetime(2025, 10, 2, 0, 0, tzinfo=timezone.utc)
+
+
+class MockWriter(QuoteWriter):
+    def __init__(self):
+        self.saved: list[list[Quote]] = []
+
+    async def save_batch(self, quotes: list[Quote]) -> None:
+        self.saved.append(quotes)
+
+
+class MockRateSource:
+    def __init__(self, batches: list[RateBatch]):
+        self._batches = batches
+
+    async def stream(self) -> AsyncIterator[RateBatch]:
+        for batch in self._batches:
+            yield batch
+            # Ticks arrive apart, so the consumer doesn't merge them
+            await asyncio.sleep(0.01)
+
+    async def close(self) -> None:
+        return
+
+
+def _batch(base: str) -> RateBatch:
+    return RateBatch(
+        quotes=[
+            Quote(
+                pair=Pair(Currency(base), Currency("USDT")),
+                rate=Rate(Decimal("100")),
+                timestamp=TimestampUTC(T0 + timedelta(seconds=1)),
+            )
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_group_commit_commits_concurrent_batches_together(monkeypatch):
+    # Given
+    settings = get_settings().model_copy(
+        update={
+            "GROUP_COMMIT_ENABLED": True,
+            "GROUP_COMMIT_MAX_DELAY_MS": 5000,
+            "CONSUMER_STORE_CONCURRENCY": 2,
+        }
+    )
+    monkeypatch.setattr(container_module, "get_settings", lambda: settings)
+    container = container_module.get_container(app_type="consumer")
+
+    postgres = MockWriter()
+    container.postgres_quote_writer.override(providers.Object(postgres))
+    container.redis_quote_writer.override(providers.Object(MockWriter()))
+    container.candle_writer.override(providers.Object(MockWriter()))
+    container.rate_source.override(
+        providers.Object(MockRateSource([_batch("BTC"), _batch("ETH")]))
+    )
+
+    # When
+    await asyncio.wait_for(container.quote_consumer().start(), timeout=2)
+
+    # Then
+    assert [sorted(q.pair.code() for q in group) for group in postgres.saved] == [
+        ["BTCUSDT", "ETHUSDT"]
+    ]
@@ -1,6 +1,7 @@
 import asyncio
 
 import pytest
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES
 from converter.shared.utils.scheduler import FixedRateScheduler
 
 
@@ -30,3 +31,33 @@ async def test_scheduler_prevents_scheduling_after_start():
 
     task.cancel()
     await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_counts_runs_skipped_while_the_previous_one_runs():
+    # Given
+    sched = FixedRateScheduler()
+    release = asyncio.Event()
+    runs = []
+
+    async def slow():
+        runs.append(1)
+        await release.wait()
+
+    sched.schedule(slow, 1, "slow_job")
+    skipped = []
+    sched._scheduler.add_listener(
+        lambda event: skipped.append(event.job_id), EVENT_JOB_MAX_INSTANCES
+    )
+
+    # When
+    task = asyncio.create_task(sched.run_until_shutdown())
+    await asyncio.sleep(2.2)
+
+    # Then
+    assert runs == [1]
+    assert skipped == ["slow_job"]
+
+    release.set()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)